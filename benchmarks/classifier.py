@@ -0,0 +1,77 @@
+"""Micro-benchmark of the per line cost of the compiled line classifiers.
+
+Compares the compiled classifiers with the previous counting loop, which looked up the
+configuration markers on every line, on synthetic sources of a few languages.
+
+    uv run python benchmarks/classifier.py --lines 200000
+"""
+import random
+import timeit
+
+import click
+
+from pylocc.language import Language
+from pylocc.processor import ProcessorConfiguration, ProcessorConfigurationFactory, Report, count_locs
+
+LANGUAGES = [Language.PLAIN_TEXT, Language.PYTHON, Language.JAVA, Language.LUA]
+
+
+def legacy_count_locs(text, file_configuration: ProcessorConfiguration) -> Report:
+    """The counting loop preceding the compiled classifiers, kept as the benchmark reference."""
+    report = Report(file_configuration.file_type)
+    in_multi_line_comment = False
+    max = -1
+    for i, line in enumerate(text):
+        stripped_line = line.strip()
+        if not stripped_line:
+            report.increment_blanks()
+        elif file_configuration.line_comment and stripped_line.startswith(file_configuration.line_comment[0]):
+            report.increment_comments()
+        elif file_configuration.multiline_comment and \
+                (in_multi_line_comment or
+                 stripped_line.startswith(file_configuration.multiline_comment[0][0])):
+            in_multi_line_comment = not stripped_line.endswith(
+                file_configuration.multiline_comment[0][1])
+            report.increment_comments()
+        max = i
+    report.increment_code(max + 1 - report.total)
+    return report
+
+
+def generate_lines(config: ProcessorConfiguration, count: int, seed: int = 42):
+    rnd = random.Random(seed)
+    line_comment = config.line_comment[0] if config.line_comment else None
+    multiline_comment = config.multiline_comment[0] if config.multiline_comment else None
+    lines = []
+    while len(lines) < count:
+        kind = rnd.random()
+        if kind < 0.15:
+            lines.append("\n")
+        elif kind < 0.30 and line_comment:
+            lines.append(f"    {line_comment} a line comment\n")
+        elif kind < 0.35 and multiline_comment:
+            lines.extend([f"{multiline_comment[0]} a block\n", "   of comments\n", f"{multiline_comment[1]}\n"])
+        else:
+            lines.append("    value = compute(value, %d) + other_value\n" % rnd.randint(0, 1000))
+    return lines[:count]
+
+
+@click.command()
+@click.option('--lines', default=100_000, show_default=True, help='Number of lines of each synthetic source.')
+@click.option('--repeat', default=5, show_default=True, help='Number of timed runs, the best one is reported.')
+def benchmark(lines, repeat):
+    """Reports the nanoseconds per line spent by the legacy loop and by the compiled classifiers."""
+    factory = ProcessorConfigurationFactory.get_default_factory()
+    click.echo(f"{'Language':<12} {'legacy ns/line':>15} {'compiled ns/line':>17} {'speedup':>8}")
+    for language in LANGUAGES:
+        config = factory.get_configuration(file_type=language)
+        assert config is not None
+        text = generate_lines(config, lines)
+        legacy = min(timeit.repeat(lambda: legacy_count_locs(text, config), number=1, repeat=repeat))
+        compiled = min(timeit.repeat(lambda: count_locs(text, config), number=1, repeat=repeat))
+        click.echo(f"{language.value:<12} {legacy / lines * 1e9:>15.1f} {compiled / lines * 1e9:>17.1f} "
+                   f"{legacy / compiled:>7.2f}x")
+
+
+if __name__ == '__main__':
+    benchmark()
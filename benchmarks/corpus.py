@@ -0,0 +1,138 @@
+"""Generator of deterministic synthetic source trees, to benchmark pylocc without network access.
+
+The same parameters and seed always produce byte for byte the same corpus, so timings can be
+compared across machines and commits.
+
+    uv run python benchmarks/corpus.py /tmp/corpus --files 20000 --languages Python:3,Java:2,C:1
+"""
+import json
+import math
+import os
+import random
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List
+
+import click
+
+from pylocc.language import Language
+from pylocc.processor import ProcessorConfiguration, ProcessorConfigurationFactory
+
+MANIFEST_FILE_NAME = 'corpus.json'
+# Language mix of the default corpus, as relative weights
+DEFAULT_LANGUAGES = {'Python': 3, 'Java': 2, 'C': 2, 'JavaScript': 2, 'Go': 1, 'Lua': 1, 'Plain Text': 1}
+CODE_LINES = [
+    "    value = compute(value, {n}) + other_value",
+    "    if (count > {n}) {{ return count; }}",
+    "    items.append(transform(item, {n}))",
+    "    result[{n}] = lookup(table, key)",
+    "    call_something(first_argument, second_argument, {n})",
+]
+
+
+@dataclass
+class CorpusSpec:
+    """Parameters of a synthetic corpus.
+
+    Attributes:
+        files: Number of files.
+        median_lines: Median number of lines of a file, sizes follow a log-normal distribution.
+        sigma: Spread of the log-normal distribution of the file sizes.
+        languages: Relative weight of each language in the corpus.
+        comment_density: Fraction of the lines that are comments.
+        blank_density: Fraction of the lines that are blank.
+        long_line_ratio: Fraction of the files containing a pathological long line.
+        long_line_length: Length in bytes of the pathological long lines.
+        files_per_dir: Number of files in each directory, directories are nested two levels deep.
+        seed: Seed of the random generator.
+    """
+    files: int = 2000
+    median_lines: int = 120
+    sigma: float = 1.0
+    languages: Dict[str, int] = field(default_factory=lambda: dict(DEFAULT_LANGUAGES))
+    comment_density: float = 0.2
+    blank_density: float = 0.1
+    long_line_ratio: float = 0.01
+    long_line_length: int = 20_000
+    files_per_dir: int = 50
+    seed: int = 42
+
+
+def _generate_file(rnd: random.Random, config: ProcessorConfiguration, spec: CorpusSpec) -> str:
+    lines_count = max(1, int(rnd.lognormvariate(math.log(spec.median_lines), spec.sigma)))
+    line_comment = config.line_comment[0] if config.line_comment else None
+    multiline_comment = config.multiline_comment[0] if config.multiline_comment else None
+    lines: List[str] = []
+    while len(lines) < lines_count:
+        kind = rnd.random()
+        if kind < spec.blank_density:
+            lines.append("")
+        elif kind < spec.blank_density + spec.comment_density and (line_comment or multiline_comment):
+            if multiline_comment and (not line_comment or rnd.random() < 0.2):
+                lines.extend([f"{multiline_comment[0]} block comment", "   describing the code",
+                              f"{multiline_comment[1]}"])
+            else:
+                lines.append(f"    {line_comment} a line comment {rnd.randint(0, 1000)}")
+        else:
+            lines.append(rnd.choice(CODE_LINES).format(n=rnd.randint(0, 1000)))
+    if rnd.random() < spec.long_line_ratio:
+        lines.insert(rnd.randrange(len(lines)), "x" * spec.long_line_length)
+    return "\n".join(lines) + "\n"
+
+
+def generate_corpus(folder: str, spec: CorpusSpec) -> Dict:
+    """Writes the corpus described by spec to folder and returns its manifest, also stored in the folder."""
+    factory = ProcessorConfigurationFactory.get_default_factory()
+    configs = [factory.get_configuration(file_type=Language(name)) for name in spec.languages]
+    weights = list(spec.languages.values())
+    rnd = random.Random(spec.seed)
+    total_bytes = 0
+    total_lines = 0
+    for i in range(spec.files):
+        config = rnd.choices(configs, weights=weights)[0]
+        assert config is not None
+        directory = os.path.join(folder, f"d{i // (spec.files_per_dir * 10)}", f"s{i // spec.files_per_dir}")
+        os.makedirs(directory, exist_ok=True)
+        content = _generate_file(rnd, config, spec).encode('utf-8')
+        with open(os.path.join(directory, f"file{i}.{config.file_extensions[0]}"), 'wb') as f:
+            f.write(content)
+        total_bytes += len(content)
+        total_lines += content.count(b'\n')
+    manifest = {'spec': asdict(spec), 'bytes': total_bytes, 'lines': total_lines}
+    with open(os.path.join(folder, MANIFEST_FILE_NAME), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def parse_languages(value: str) -> Dict[str, int]:
+    """Parses a language mix such as "Python:3,Java:2,C"."""
+    languages = {}
+    for item in value.split(','):
+        name, _, weight = item.partition(':')
+        languages[name.strip()] = int(weight or 1)
+    return languages
+
+
+@click.command()
+@click.argument('folder', type=click.Path(file_okay=False))
+@click.option('--files', default=CorpusSpec.files, show_default=True, help='Number of files.')
+@click.option('--median-lines', default=CorpusSpec.median_lines, show_default=True,
+              help='Median number of lines of a file.')
+@click.option('--sigma', default=CorpusSpec.sigma, show_default=True,
+              help='Spread of the log-normal distribution of the file sizes.')
+@click.option('--languages', default=','.join(f"{k}:{v}" for k, v in DEFAULT_LANGUAGES.items()), show_default=True,
+              help='Comma separated languages, each optionally followed by its weight.')
+@click.option('--comment-density', default=CorpusSpec.comment_density, show_default=True,
+              help='Fraction of the lines that are comments.')
+@click.option('--long-line-ratio', default=CorpusSpec.long_line_ratio, show_default=True,
+              help='Fraction of the files containing a pathological long line.')
+@click.option('--seed', default=CorpusSpec.seed, show_default=True, help='Seed of the random generator.')
+def corpus(folder, files, median_lines, sigma, languages, comment_density, long_line_ratio, seed):
+    """Generates a synthetic corpus in FOLDER."""
+    spec = CorpusSpec(files=files, median_lines=median_lines, sigma=sigma, languages=parse_languages(languages),
+                      comment_density=comment_density, long_line_ratio=long_line_ratio, seed=seed)
+    manifest = generate_corpus(folder, spec)
+    click.echo(f"Generated {spec.files:,} files, {manifest['lines']:,} lines, {manifest['bytes']:,} bytes in {folder}")
+
+
+if __name__ == '__main__':
+    corpus()
@@ -0,0 +1,91 @@
+"""Benchmark of the memory held by the reports of many files, as a dictionary of Report and as a ReportStore.
+
+Synthetic paths spread over nested directories are given random reports, both structures are filled with
+the same ones while tracemalloc measures the memory they hold, then the aggregation per language and the
+by file rows are timed. The command fails when the store takes more than the allowed share of the memory
+of the dictionary.
+
+    uv run python benchmarks/memory.py --files 1000000 --max-ratio 0.3
+"""
+import gc
+import random
+import timeit
+import tracemalloc
+from typing import Callable, List, Tuple
+
+import click
+
+from pylocc.language import Language
+from pylocc.processor import Report
+from pylocc.reporter import aggregate_reports, prepare_by_file_report
+from pylocc.store import ReportStore, _numpy
+
+LANGUAGES = [Language.PYTHON, Language.JAVA, Language.C, Language.C_HEADER, Language.JAVASCRIPT, Language.MARKDOWN]
+EXTENSIONS = {Language.PYTHON: 'py', Language.JAVA: 'java', Language.C: 'c', Language.C_HEADER: 'h',
+              Language.JAVASCRIPT: 'js', Language.MARKDOWN: 'md'}
+
+
+def generate_reports(count: int, files_per_directory: int = 20, seed: int = 42) -> List[Tuple[str, Report]]:
+    rnd = random.Random(seed)
+    reports = []
+    directory = 'project'
+    for i in range(count):
+        if i % files_per_directory == 0:
+            depth = rnd.randint(1, 6)
+            directory = '/'.join(['project'] + [f"module_{rnd.randint(0, 50)}" for _ in range(depth)])
+        language = rnd.choice(LANGUAGES)
+        path = f"{directory}/source_file_{i}.{EXTENSIONS[language]}"
+        reports.append((path, Report(language, code=rnd.randint(0, 2000), comments=rnd.randint(0, 500),
+                                     blanks=rnd.randint(0, 300))))
+    return reports
+
+
+def measure_memory(build: Callable[[], object]) -> Tuple[object, int]:
+    """Returns the built structure along with the memory it holds, in bytes."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        structure = build()
+        gc.collect()
+        return structure, tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+@click.command()
+@click.option('--files', default=200_000, show_default=True, help='Number of synthetic files.')
+@click.option('--repeat', default=3, show_default=True, help='Number of timed runs, the best one is reported.')
+@click.option('--max-ratio', default=None, type=float,
+              help='Fails when the store holds more than this share of the memory of the dictionary.')
+def benchmark(files, repeat, max_ratio):
+    """Reports the bytes per file and the aggregation times of both structures."""
+    generated = generate_reports(files)
+
+    def build_dict():
+        # The paths and reports are copied, so that the dictionary owns them as the counting would
+        return {''.join(path): Report(report.file_type, report.code, report.comments, report.blanks)
+                for path, report in generated}
+
+    def build_store():
+        report_store = ReportStore()
+        for path, report in generated:
+            report_store.add(path, report)
+        return report_store
+
+    reports, dict_bytes = measure_memory(build_dict)
+    report_store, store_bytes = measure_memory(build_store)
+    click.echo(f"numpy: {'yes' if _numpy() is not None else 'no'}")
+    click.echo(f"{'Structure':<16} {'bytes/file':>11} {'aggregate ms':>13} {'by file ms':>11}")
+    for name, structure, size in [('Dict[str, Report]', reports, dict_bytes), ('ReportStore', report_store, store_bytes)]:
+        aggregate = min(timeit.repeat(lambda: aggregate_reports(structure), number=1, repeat=repeat))
+        by_file = min(timeit.repeat(lambda: prepare_by_file_report(structure), number=1, repeat=repeat))
+        click.echo(f"{name:<16} {size / files:>11.1f} {aggregate * 1e3:>13.2f} {by_file * 1e3:>11.2f}")
+    ratio = store_bytes / dict_bytes
+    click.echo(f"The store holds {ratio:.0%} of the memory of the dictionary")
+    if max_ratio is not None and ratio > max_ratio:
+        raise click.ClickException(f"The store holds {ratio:.0%} of the memory of the dictionary, "
+                                   f"more than {max_ratio:.0%}")
+
+
+if __name__ == '__main__':
+    benchmark()
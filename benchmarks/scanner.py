@@ -0,0 +1,85 @@
+"""Micro-benchmark of the accurate scanning classifier, with and without complexity, against the default one.
+
+Both classifiers count the same synthetic sources, holding strings as well as comments, as undecoded
+lines like the bytes engine does. The accurate scanner is expected to stay within a small factor
+of the default classifier, the command fails when it gets slower than the allowed factor. Counting the
+complexity as well is reported for comparison but not checked.
+
+    uv run python benchmarks/scanner.py --lines 200000 --max-factor 3
+"""
+import random
+import timeit
+from typing import List
+
+import click
+
+from pylocc.language import Language
+from pylocc.processor import ProcessorConfiguration, ProcessorConfigurationFactory, count_locs_bytes
+
+LANGUAGES = [Language.PYTHON, Language.JAVA, Language.C, Language.JAVASCRIPT, Language.RUST, Language.LUA]
+CODE_LINES = [
+    "    value = compute(value, {n}) + other_value",
+    "    items.append(transform(item, {n}))",
+    "    result[{n}] = lookup(table, key)",
+    "    message = \"{n} items processed\" + suffix",
+    "    path = \"src/*/{n}\" + separator + \"*.txt\"",
+    "    call_something(first_argument, \"with \\\"escaped\\\" quotes\", {n})",
+    "    if (value == {n} && other_value != 0) {{",
+    "    for (item in items) {{ total = total + {n}; }}",
+]
+
+
+def generate_lines(config: ProcessorConfiguration, count: int, seed: int = 42) -> List[bytes]:
+    rnd = random.Random(seed)
+    line_comment = config.line_comment[0] if config.line_comment else None
+    multiline_comment = config.multiline_comment[0] if config.multiline_comment else None
+    docstring = next((start for start, _, _, is_docstring in config.quotes if is_docstring), None)
+    lines = []
+    while len(lines) < count:
+        kind = rnd.random()
+        if kind < 0.15:
+            lines.append("")
+        elif kind < 0.25 and line_comment:
+            lines.append(f"    {line_comment} a line comment")
+        elif kind < 0.30 and multiline_comment:
+            lines.extend([f"    {multiline_comment[0]} a block", "       of comments", f"    {multiline_comment[1]}"])
+        elif kind < 0.33 and multiline_comment:
+            lines.append(f"    value = 1; {multiline_comment[0]} trailing {multiline_comment[1]}")
+        elif kind < 0.35 and docstring:
+            lines.extend([f"    {docstring}Documents", "    the code", f"    {docstring}"])
+        else:
+            lines.append(rnd.choice(CODE_LINES).format(n=rnd.randint(0, 1000)))
+    return [f"{line}\n".encode('utf-8') for line in lines[:count]]
+
+
+@click.command()
+@click.option('--lines', default=100_000, show_default=True, help='Number of lines of each synthetic source.')
+@click.option('--repeat', default=5, show_default=True, help='Number of timed runs, the best one is reported.')
+@click.option('--max-factor', default=None, type=float,
+              help='Fails when the accurate scanner is slower than the default classifier by more than this factor.')
+def benchmark(lines, repeat, max_factor):
+    """Reports the nanoseconds per line spent by the default and the accurate classifiers."""
+    factory = ProcessorConfigurationFactory.get_default_factory()
+    click.echo(f"{'Language':<12} {'default ns/line':>16} {'accurate ns/line':>17} {'factor':>7} "
+               f"{'complexity ns/line':>19}")
+    slow = []
+    for language in LANGUAGES:
+        config = factory.get_configuration(file_type=language)
+        assert config is not None
+        content = generate_lines(config, lines)
+        default = min(timeit.repeat(lambda: count_locs_bytes(content, config), number=1, repeat=repeat))
+        accurate = min(timeit.repeat(lambda: count_locs_bytes(content, config, accurate=True),
+                                     number=1, repeat=repeat))
+        complexity = min(timeit.repeat(lambda: count_locs_bytes(content, config, complexity=True),
+                                       number=1, repeat=repeat))
+        factor = accurate / default
+        click.echo(f"{language.value:<12} {default / lines * 1e9:>16.1f} {accurate / lines * 1e9:>17.1f} "
+                   f"{factor:>6.2f}x {complexity / lines * 1e9:>19.1f}")
+        if max_factor is not None and factor > max_factor:
+            slow.append(f"{language.value}: {factor:.2f}x")
+    if slow:
+        raise click.ClickException("Accurate scanner slower than allowed: " + ", ".join(slow))
+
+
+if __name__ == '__main__':
+    benchmark()
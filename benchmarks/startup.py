@@ -0,0 +1,84 @@
+"""Benchmark of the start up time of the command line, which dominates when counting a handful of files.
+
+Times fresh interpreters importing the command line, printing the version and counting a few files,
+and, in process, the loading of the language configurations from language.json and from the
+precompiled language index.
+
+    uv run python benchmarks/startup.py --repeat 20
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+
+import click
+
+from pylocc.processor import ProcessorConfigurationFactory, load_default_language_config
+
+# A pre-commit hook typically counts the few files staged for the commit
+STAGED_FILES = {
+    'main.py': "import sys\n\n# entry point\nprint(sys.argv)\n",
+    'lib.js': "// helpers\nexport const add = (a, b) => a + b;\n",
+    'style.css': "/* theme */\nbody { margin: 0; }\n",
+    'README.md': "# Title\n\nSome text.\n",
+    'build.sh': "#!/bin/sh\n# build\nmake all\n",
+}
+
+
+def time_command(args, repeat, env):
+    """Returns the wall clock timings of repeated runs of the given command, after a warm up run."""
+    subprocess.run(args, env=env, check=True, capture_output=True)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(args, env=env, check=True, capture_output=True)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def load_json_factory():
+    factory = ProcessorConfigurationFactory(load_default_language_config())
+    for name in STAGED_FILES:
+        factory.get_configuration(file_extension=os.path.splitext(name)[1][1:])
+
+
+def load_indexed_factory():
+    factory = ProcessorConfigurationFactory.get_default_factory()
+    for name in STAGED_FILES:
+        factory.get_configuration(file_extension=os.path.splitext(name)[1][1:])
+
+
+@click.command()
+@click.option('--repeat', default=10, show_default=True, help='Number of timed runs of each command.')
+def benchmark(repeat):
+    """Reports the median and best start up times, in milliseconds."""
+    # Compiled modules are written by the warm up run, as they would be by an installation
+    env = {k: v for k, v in os.environ.items() if k != 'PYTHONDONTWRITEBYTECODE'}
+    with tempfile.TemporaryDirectory() as folder:
+        for name, content in STAGED_FILES.items():
+            with open(os.path.join(folder, name), 'w') as f:
+                f.write(content)
+        commands = {
+            'python': [sys.executable, '-c', 'pass'],
+            'import pylocc.cli': [sys.executable, '-c', 'import pylocc.cli'],
+            'pylocc --version': [sys.executable, '-m', 'pylocc.cli', '--version'],
+            'pylocc (5 files)': [sys.executable, '-m', 'pylocc.cli', '--no-cache', folder],
+        }
+        click.echo(f"{'Command':<20} {'median ms':>10} {'best ms':>10}")
+        for label, args in commands.items():
+            timings = time_command(args, repeat, env)
+            click.echo(f"{label:<20} {statistics.median(timings) * 1e3:>10.1f} {min(timings) * 1e3:>10.1f}")
+
+    click.echo()
+    click.echo(f"{'Configurations':<20} {'best ms':>10}")
+    json_time = min(timeit.repeat(load_json_factory, number=1, repeat=repeat))
+    indexed_time = min(timeit.repeat(load_indexed_factory, number=1, repeat=repeat))
+    click.echo(f"{'language.json':<20} {json_time * 1e3:>10.2f}")
+    click.echo(f"{'language index':<20} {indexed_time * 1e3:>10.2f}")
+
+
+if __name__ == '__main__':
+    benchmark()
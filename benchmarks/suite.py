@@ -0,0 +1,171 @@
+"""Benchmark suite timing each stage of pylocc on a synthetic corpus, fully offline.
+
+Stages are timed separately and repeatedly on the same corpus:
+
+    walk       walking the corpus directory
+    read       reading the lines of every file
+    count      classifying the lines already read, with count_locs_bytes
+    aggregate  summing the reports per language
+    render     rendering the aggregate and by file tables
+    pipeline   count_files on the whole corpus, in a single process and without cache
+
+Results are written as JSON and can be compared with a previously saved baseline,
+the command fails when a stage got slower than the allowed tolerance.
+
+    uv run python benchmarks/suite.py --output results.json
+    uv run python benchmarks/suite.py --baseline results.json --tolerance 0.1
+"""
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+import click
+
+from corpus import MANIFEST_FILE_NAME, CorpusSpec, generate_corpus, parse_languages
+from pylocc.file_utils import open_binary_lines, walk_files
+from pylocc.processor import ProcessorConfigurationFactory, count_locs_bytes
+from pylocc.reporter import (ReportAggregator, create_aggregate_table, create_by_file_table,
+                             prepare_by_file_report)
+from pylocc.runner import count_files
+
+RESULTS_VERSION = 1
+
+
+def measure(stage: Callable[[], object], repeat: int) -> Dict[str, float]:
+    """Runs the stage once to warm up, then repeat times, and returns the statistics of the timings in seconds."""
+    stage()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        stage()
+        timings.append(time.perf_counter() - start)
+    return {
+        'min': min(timings),
+        'median': statistics.median(timings),
+        'mean': statistics.fmean(timings),
+        'stdev': statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        'max': max(timings),
+    }
+
+
+def run_stages(folder: str, repeat: int) -> Dict[str, Dict[str, float]]:
+    factory = ProcessorConfigurationFactory.get_default_factory()
+    extensions = factory.supported_extensions
+    paths = [entry.path for entry in walk_files(folder, supported_extensions=extensions)]
+    configs = [factory.get_configuration(file_extension=os.path.splitext(p)[1][1:]) for p in paths]
+
+    def read() -> List[List[bytes]]:
+        contents = []
+        for path in paths:
+            with open_binary_lines(path) as lines:
+                contents.append(list(lines))
+        return contents
+
+    contents = read()
+    reports = {path: count_locs_bytes(lines, config) for path, lines, config in zip(paths, contents, configs)}
+
+    def aggregate():
+        aggregator = ReportAggregator()
+        for report in reports.values():
+            aggregator.add(report)
+        return aggregator.to_report_data()
+
+    def render():
+        from rich.console import Console
+        console = Console(file=io.StringIO(), width=200)
+        console.print(create_aggregate_table(aggregate()))
+        console.print(create_by_file_table(prepare_by_file_report(reports)))
+
+    stages = {
+        'walk': lambda: list(walk_files(folder, supported_extensions=extensions)),
+        'read': read,
+        'count': lambda: [count_locs_bytes(lines, config) for lines, config in zip(contents, configs)],
+        'aggregate': aggregate,
+        'render': render,
+        'pipeline': lambda: list(count_files(paths, factory, jobs=1)),
+    }
+    results = {}
+    for name, stage in stages.items():
+        results[name] = measure(stage, repeat)
+        click.echo(f"{name:<10} median {results[name]['median'] * 1e3:>10.2f} ms   "
+                   f"min {results[name]['min'] * 1e3:>10.2f} ms   stdev {results[name]['stdev'] * 1e3:>8.2f} ms")
+    return results
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Returns the description of the stages whose median got slower than the baseline by more than tolerance."""
+    regressions = []
+    if results['corpus'] != baseline.get('corpus'):
+        click.echo("Warning: the baseline was measured on a different corpus", err=True)
+    for name, stats in results['stages'].items():
+        reference = baseline.get('stages', {}).get(name)
+        if reference is None:
+            continue
+        ratio = stats['median'] / reference['median']
+        click.echo(f"{name:<10} {ratio:>6.2f}x the baseline median")
+        if ratio > 1 + tolerance:
+            regressions.append(f"{name}: {reference['median'] * 1e3:.2f} ms -> {stats['median'] * 1e3:.2f} ms")
+    return regressions
+
+
+@click.command()
+@click.option('--corpus', 'corpus_dir', type=click.Path(exists=True, file_okay=False),
+              help='Existing corpus to benchmark, by default a synthetic corpus is generated in a temporary directory.')
+@click.option('--files', default=CorpusSpec.files, show_default=True, help='Number of files of the generated corpus.')
+@click.option('--median-lines', default=CorpusSpec.median_lines, show_default=True,
+              help='Median number of lines of the generated files.')
+@click.option('--languages', default=None, help='Language mix of the generated corpus, e.g. Python:3,Java:2,C.')
+@click.option('--long-line-ratio', default=CorpusSpec.long_line_ratio, show_default=True,
+              help='Fraction of the generated files containing a pathological long line.')
+@click.option('--seed', default=CorpusSpec.seed, show_default=True, help='Seed of the corpus generator.')
+@click.option('--repeat', default=5, show_default=True, help='Number of timed runs of each stage.')
+@click.option('--output', type=click.Path(dir_okay=False, writable=True), help='Writes the results as JSON to the given path.')
+@click.option('--baseline', type=click.Path(exists=True, dir_okay=False),
+              help='Results of a previous run to compare with, the command fails on regressions.')
+@click.option('--tolerance', default=0.1, show_default=True,
+              help='Allowed slowdown of the median of each stage compared with the baseline.')
+def suite(corpus_dir, files, median_lines, languages, long_line_ratio, seed, repeat, output, baseline, tolerance):
+    """Benchmarks each stage of pylocc on a synthetic corpus."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if corpus_dir:
+            manifest_path = os.path.join(corpus_dir, MANIFEST_FILE_NAME)
+            corpus = {'path': corpus_dir}
+            if os.path.exists(manifest_path):
+                with open(manifest_path) as f:
+                    corpus = json.load(f)
+        else:
+            spec = CorpusSpec(files=files, median_lines=median_lines, long_line_ratio=long_line_ratio, seed=seed)
+            if languages:
+                spec.languages = parse_languages(languages)
+            corpus_dir = temp_dir
+            corpus = generate_corpus(corpus_dir, spec)
+            click.echo(f"Generated {files:,} files, {corpus['lines']:,} lines, {corpus['bytes']:,} bytes")
+        stages = run_stages(corpus_dir, repeat)
+
+    results = {
+        'version': RESULTS_VERSION,
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'corpus': corpus,
+        'repeat': repeat,
+        'stages': stages,
+    }
+    if output:
+        with open(output, 'w') as f:
+            json.dump(results, f, indent=2)
+        click.echo(f"Results saved to {output}")
+    if baseline:
+        with open(baseline) as f:
+            regressions = compare(results, json.load(f), tolerance)
+        if regressions:
+            raise click.ClickException("Regressions above the tolerance: " + "; ".join(regressions))
+
+
+if __name__ == '__main__':
+    suite()
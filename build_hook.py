@@ -14,10 +14,70 @@ def sanitize_name(name):
         name = '_' + name
     return name.upper()
 
+def parse_quote(quote):
+    # Strings are defined by a mapping, or by the delimiter of both ends
+    if isinstance(quote, str):
+        return (quote, quote, False, False)
+    return (quote['start'], quote['end'], quote.get('ignoreEscape', False), quote.get('docString', False))
+
+def generate_index(languages):
+    """Generates the module indexing the counting rules of the languages.
+
+    The rules are written as literals, so they are stored as constants in the compiled module and loaded
+    without parsing language.json. When several languages share an extension, a file name or an
+    interpreter, the last one wins, as in ProcessorConfigurationFactory."""
+    extensions = {}
+    filenames = {}
+    shebangs = {}
+    rules = {}
+    for lang_name, lang_config in languages.items():
+        for extension in lang_config['extensions']:
+            extensions[extension] = lang_name
+        for filename in lang_config.get('filenames', []):
+            filenames[filename.lower()] = lang_name
+        for interpreter in lang_config.get('shebangs', []):
+            shebangs[interpreter] = lang_name
+        rules[lang_name] = (
+            tuple(lang_config['extensions']),
+            tuple(lang_config.get('line_comment', [])),
+            tuple(tuple(markers) for markers in lang_config.get('multi_line', [])),
+            tuple(parse_quote(quote) for quote in lang_config.get('quotes', [])),
+            lang_config.get('nestedmultiline', False),
+            tuple(lang_config.get('complexitychecks', [])),
+            tuple(lang_config.get('filenames', [])),
+            tuple(lang_config.get('shebangs', [])),
+        )
+
+    content = "# This file is auto-generated by the build system.\n"
+    content += "# DO NOT EDIT THIS FILE MANUALLY.\n\n"
+    content += "# Language of each file extension\n"
+    content += "EXTENSIONS = {\n"
+    for extension, lang_name in extensions.items():
+        content += f"    {extension!r}: {lang_name!r},\n"
+    content += "}\n\n"
+    content += "# Language of each lower case file name\n"
+    content += "FILENAMES = {\n"
+    for filename, lang_name in filenames.items():
+        content += f"    {filename!r}: {lang_name!r},\n"
+    content += "}\n\n"
+    content += "# Language of each interpreter named by a shebang\n"
+    content += "SHEBANGS = {\n"
+    for interpreter, lang_name in shebangs.items():
+        content += f"    {interpreter!r}: {lang_name!r},\n"
+    content += "}\n\n"
+    content += "# Extensions, line comment, multi line comment and string markers, nesting of the comments,\n"
+    content += "# complexity checks, file names and shebang interpreters of each language\n"
+    content += "RULES = {\n"
+    for lang_name, lang_rules in rules.items():
+        content += f"    {lang_name!r}: {lang_rules!r},\n"
+    content += "}\n"
+    return content
+
 class CustomBuildHook(BuildHookInterface):
     def initialize(self, version, build_data):
         lang_json_path = "src/pylocc/language.json"
         output_py_path = "src/pylocc/language.py"
+        index_py_path = "src/pylocc/language_index.py"
 
         with open(lang_json_path, "r", encoding="utf-8") as f:
             languages = json.load(f)
@@ -25,8 +85,9 @@ class CustomBuildHook(BuildHookInterface):
         enum_content = "# This file is auto-generated by the build system.\n"
         enum_content += "# DO NOT EDIT THIS FILE MANUALLY.\n\n"
         enum_content += "import json\n"
+        enum_content += "import os\n"
         enum_content += "from enum import Enum\n"
-        enum_content += "from pathlib import Path\n\n"
+        enum_content += "from functools import lru_cache\n\n"
         enum_content += "class Language(Enum):\n"
 
         for lang_name in sorted(languages.keys()):
@@ -36,13 +97,22 @@ class CustomBuildHook(BuildHookInterface):
         enum_content += """
 
     def get_config(self):
-        config_path = Path(__file__).parent / "language.json"
-        with open(config_path, "r", encoding="utf-8") as f:
-            all_configs = json.load(f)
-        return all_configs.get(self.value)
+        return _load_configs().get(self.value)
+
+
+@lru_cache(maxsize=None)
+def _load_configs():
+    config_path = os.path.join(os.path.dirname(__file__), "language.json")
+    with open(config_path, "r", encoding="utf-8") as f:
+        return json.load(f)
 """
 
         with open(output_py_path, "w", encoding="utf-8") as f:
             f.write(enum_content)
 
         print(f"Generated {output_py_path} from {lang_json_path}")
+
+        with open(index_py_path, "w", encoding="utf-8") as f:
+            f.write(generate_index(languages))
+
+        print(f"Generated {index_py_path} from {lang_json_path}")
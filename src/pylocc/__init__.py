@@ -1,4 +1,13 @@
+from pylocc.api import count_path, count_path_async, default_configuration_factory
 from pylocc.cli import pylocc
+from pylocc.file_utils import PathFilter
+from pylocc.processor import Report
+from pylocc.runner import CountOptions, FileResult, ReadAhead
+from pylocc.store import ReportStore
+from pylocc.uloc import ApproximateUniqueLines, UniqueLines
+
+__all__ = ['count_path', 'count_path_async', 'default_configuration_factory', 'ApproximateUniqueLines', 'CountOptions',
+           'FileResult', 'PathFilter', 'ReadAhead', 'Report', 'ReportStore', 'UniqueLines', 'main']
 
 
 def main():
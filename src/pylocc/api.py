@@ -0,0 +1,138 @@
+import os
+from functools import lru_cache
+from typing import AsyncIterator, Generator, Iterable, List, Optional, Tuple, Union
+
+from pylocc.archive_utils import is_archive, iter_archive_members
+from pylocc.cache import ReportCache
+from pylocc.file_utils import FileEntry, PathFilter, walk_files
+from pylocc.processor import ProcessorConfigurationFactory
+from pylocc.runner import DEFAULT_OPTIONS, CountOptions, FileResult, ReadAhead, count_blobs, count_contents, count_files
+
+# Number of results handed over at once by the thread feeding count_path_async
+ASYNC_BATCH_SIZE = 256
+
+
+@lru_cache(maxsize=None)
+def default_configuration_factory() -> ProcessorConfigurationFactory:
+    """Returns the factory of the built-in language configurations, shared by every call of this module.
+    The configurations are built once, on first use, and reused by the following calls."""
+    return ProcessorConfigurationFactory.get_default_factory()
+
+
+def list_files(path: str,
+               configuration_factory: Optional[ProcessorConfigurationFactory] = None,
+               filters: Optional[PathFilter] = None,
+               use_ignore_rules: bool = True) -> Iterable[Union[str, FileEntry]]:
+    """Returns the files to count under path, lazily walked when path is a directory.
+    Only the files whose language is known from their name or shebang are walked, a single file is returned as it is."""
+    if not os.path.isdir(path):
+        return [path]
+    configuration_factory = configuration_factory or default_configuration_factory()
+    return walk_files(path, path_filter=filters, use_ignore_rules=use_ignore_rules,
+                      language_index=configuration_factory.language_index)
+
+
+def list_git_files(path: str,
+                   configuration_factory: Optional[ProcessorConfigurationFactory] = None,
+                   filters: Optional[PathFilter] = None) -> List[Tuple[str, str]]:
+    """Returns the path and blob id of the files whose language is known from their name or shebang tracked by
+    the git repository of the directory. Raises GitError when the files can't be listed."""
+    from pylocc.git_utils import list_tracked_files
+
+    configuration_factory = configuration_factory or default_configuration_factory()
+    language_index = configuration_factory.language_index
+    return [(f, blob_id) for f, blob_id in list_tracked_files(path)
+            if (filters is None or filters.accepts_path(os.path.relpath(f, path).replace(os.sep, '/'))) and
+            language_index.language_of_file(f) is not None]
+
+
+def count_path(path: str,
+               jobs: Optional[int] = None,
+               filters: Optional[PathFilter] = None,
+               use_ignore_rules: bool = True,
+               git: bool = False,
+               options: CountOptions = DEFAULT_OPTIONS,
+               cache: Optional[ReportCache] = None,
+               configuration_factory: Optional[ProcessorConfigurationFactory] = None,
+               read_ahead: Optional[ReadAhead] = None,
+               duplicates: bool = False) -> Generator[FileResult, None, None]:
+    """Counts the lines of a file, or of the files under a directory or in a tar or zip archive, yielding a result per
+    file as it is counted.
+
+    Errors are not raised but reported in the results, as the files that can't be counted. The members of an archive
+    are reported as archive!member, and ArchiveError is raised when the archive can't be read.
+
+    Args:
+        path: File, directory or archive to count, see is_archive.
+        jobs: Number of worker processes, defaults to the number of CPUs.
+        filters: Globs selecting the files and directories to count.
+        use_ignore_rules: Whether to honor the .gitignore and .ignore files and skip the VCS and dependency directories.
+        git: Whether to count the files tracked by the git repository of the directory, counting identical blobs once.
+            Raises GitError when the files can't be listed.
+        options: Settings of the counting.
+        cache: Cache of the reports, the caller is in charge of closing it.
+        configuration_factory: Language configurations, defaults to the shared built-in ones.
+        read_ahead: Whether and how to read the files of a directory ahead of their counting, see ReadAhead.
+        duplicates: Whether to look for the files of the same content, counted once and reported with the path of
+            the first one as FileResult.duplicate_of, see count_files. Not supported for archives.
+    """
+    configuration_factory = configuration_factory or default_configuration_factory()
+    if duplicates and not git and is_archive(path):
+        raise ValueError(f"Duplicates are not looked for in archives, got {path}")
+    if git:
+        if not os.path.isdir(path):
+            raise ValueError(f"Counting the files tracked by git requires a directory, got {path}")
+        tracked_files = list_git_files(path, configuration_factory, filters)
+        yield from count_blobs(tracked_files, configuration_factory, jobs=jobs, options=options, cache=cache,
+                               duplicates=duplicates)
+    elif is_archive(path):
+        members = iter_archive_members(path, filters, use_ignore_rules, configuration_factory.language_index,
+                                       options.max_file_size)
+        yield from count_contents(((member.path, member.content) for member in members), configuration_factory,
+                                  jobs=jobs, options=options)
+    else:
+        files = list_files(path, configuration_factory, filters, use_ignore_rules)
+        yield from count_files(files, configuration_factory, jobs=jobs, options=options, cache=cache,
+                               read_ahead=read_ahead, duplicates=duplicates)
+
+
+async def count_path_async(path: str,
+                           jobs: Optional[int] = None,
+                           filters: Optional[PathFilter] = None,
+                           use_ignore_rules: bool = True,
+                           git: bool = False,
+                           options: CountOptions = DEFAULT_OPTIONS,
+                           cache: Optional[ReportCache] = None,
+                           configuration_factory: Optional[ProcessorConfigurationFactory] = None,
+                           read_ahead: Optional[ReadAhead] = None,
+                           duplicates: bool = False) -> AsyncIterator[FileResult]:
+    """Asynchronous version of count_path, to count from an asyncio event loop without blocking it.
+
+    Walking, reading and counting run in a thread of the default executor, which hands the results over
+    in batches, while the counting itself is spread over the worker processes as in count_path.
+    The cache, if any, is used from the executor threads, one call at a time."""
+    # asyncio is slow to import, only the asynchronous callers pay for it
+    import asyncio
+    loop = asyncio.get_running_loop()
+    results = count_path(path, jobs=jobs, filters=filters, use_ignore_rules=use_ignore_rules, git=git,
+                         options=options, cache=cache, configuration_factory=configuration_factory,
+                         read_ahead=read_ahead, duplicates=duplicates)
+
+    def next_batch() -> List[FileResult]:
+        batch = []
+        for result in results:
+            batch.append(result)
+            if len(batch) >= ASYNC_BATCH_SIZE:
+                break
+        return batch
+
+    try:
+        while True:
+            batch = await loop.run_in_executor(None, next_batch)
+            if not batch:
+                return
+            for result in batch:
+                yield result
+    finally:
+        # Stops the worker processes, if any, when the caller stops iterating early
+        await loop.run_in_executor(None, results.close)
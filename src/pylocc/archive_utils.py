@@ -0,0 +1,114 @@
+import os
+import stat
+from typing import TYPE_CHECKING, Callable, Iterator, NamedTuple, Optional, Set, Tuple
+
+from pylocc.file_utils import DEFAULT_EXCLUDED_DIRS, SHEBANG_SIZE, PathFilter
+
+if TYPE_CHECKING:
+    from pylocc.detection import LanguageIndex
+
+# Suffixes of the archives counted without extracting them, matched regardless of their case
+TAR_SUFFIXES = ('.tar', '.tar.gz', '.tgz', '.tar.xz', '.txz', '.tar.bz2', '.tbz2')
+ZIP_SUFFIXES = ('.zip',)
+# Separates the path of the archive from the path of the member in the reported paths, e.g. release.tar.gz!src/main.c
+MEMBER_SEPARATOR = '!'
+
+
+class ArchiveError(Exception):
+    """Raised when an archive can't be opened or read."""
+
+
+class ArchiveMember(NamedTuple):
+    """A file of an archive to count, its path being the archive path and the member name joined by MEMBER_SEPARATOR.
+    The content is None when the file is bigger than the maximum size to read, it is then left unread."""
+    path: str
+    size: int
+    content: Optional[bytes]
+
+
+def is_archive(path: str) -> bool:
+    """Tells whether the path is a tar or zip archive to count the members of, from its name."""
+    return path.lower().endswith(TAR_SUFFIXES + ZIP_SUFFIXES) and os.path.isfile(path)
+
+
+def iter_archive_members(archive_path: str, path_filter: Optional[PathFilter] = None, use_ignore_rules: bool = True,
+                         language_index: Optional['LanguageIndex'] = None,
+                         max_size: Optional[int] = None) -> Iterator[ArchiveMember]:
+    """Yields the files of a tar archive, possibly compressed with gzip, xz or bzip2, or of a zip archive,
+    reading the archive sequentially, in a single pass, without extracting anything to disk.
+
+    The members are selected as DirectoryScanner selects the files of a directory, from their name relative to
+    the root of the archive: only the regular files whose language is known are yielded, the path filter applies,
+    and DEFAULT_EXCLUDED_DIRS are skipped unless use_ignore_rules is false. The ignore files of the archive are not
+    honored though, since a member can come before the ignore files applying to it.
+
+    Args:
+        archive_path: Path of the archive, see is_archive.
+        path_filter: The include and exclude globs to apply.
+        use_ignore_rules: Whether to skip the members under DEFAULT_EXCLUDED_DIRS.
+        language_index: When given, only the members whose language it resolves are yielded, from their name or,
+            for the files without an extension, from their shebang.
+        max_size: Members bigger than this number of bytes are yielded without their content.
+
+    Raises ArchiveError when the archive can't be read, possibly after yielding its first members."""
+    excluded_dirs = set(DEFAULT_EXCLUDED_DIRS) if use_ignore_rules else set()
+    # The archive modules are only imported when an archive is counted
+    import tarfile
+    import zipfile
+    import zlib
+    errors: Tuple[type, ...] = (OSError, EOFError, tarfile.TarError, zipfile.BadZipFile, zlib.error)
+    try:
+        import lzma
+        errors += (lzma.LZMAError,)
+    except ImportError:
+        pass
+    try:
+        if archive_path.lower().endswith(ZIP_SUFFIXES):
+            members = _zip_members(zipfile.ZipFile(archive_path))
+        else:
+            # Streaming mode, the archive is decompressed and read once, from the start to the end
+            members = _tar_members(tarfile.open(archive_path, mode='r|*'))
+        for name, size, read in members:
+            name = name.lstrip('/')
+            if name.startswith('./'):
+                name = name[2:]
+            if not _is_selected(name, path_filter, excluded_dirs, language_index):
+                continue
+            path = archive_path + MEMBER_SEPARATOR + name
+            if max_size is not None and size > max_size:
+                yield ArchiveMember(path, size, None)
+                continue
+            content = read()
+            if language_index is not None and language_index.language_of_name(name.rsplit('/', 1)[-1]) is None and \
+                    language_index.language_of_shebang(content[:SHEBANG_SIZE]) is None:
+                continue
+            yield ArchiveMember(path, size, content)
+    except errors as e:
+        raise ArchiveError(f"Unable to read the archive {archive_path}: {e}") from None
+
+
+def _tar_members(archive) -> Iterator[Tuple[str, int, Callable[[], bytes]]]:
+    with archive:
+        for member in archive:
+            if member.isfile():
+                yield member.name, member.size, archive.extractfile(member).read
+
+
+def _zip_members(archive) -> Iterator[Tuple[str, int, Callable[[], bytes]]]:
+    with archive:
+        # Members are read in the order of the central directory, usually the order they are stored in
+        for info in archive.infolist():
+            if info.is_dir() or stat.S_ISLNK(info.external_attr >> 16):
+                continue
+            yield info.filename, info.file_size, lambda info=info: archive.read(info)
+
+
+def _is_selected(name: str, path_filter: Optional[PathFilter], excluded_dirs: Set[str],
+                 language_index: Optional['LanguageIndex']) -> bool:
+    parts = name.split('/')
+    if excluded_dirs and any(part in excluded_dirs for part in parts[:-1]):
+        return False
+    if language_index is not None and language_index.language_of_name(parts[-1]) is None and \
+            not language_index.is_shebang_candidate(parts[-1]):
+        return False
+    return path_filter is None or path_filter.accepts_path(name)
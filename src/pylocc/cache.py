@@ -0,0 +1,184 @@
+import os
+import time
+from typing import List, Optional, Tuple, Union
+
+from pylocc.language import Language
+from pylocc.processor import Report
+
+CACHE_FILE_NAME = 'reports.sqlite3'
+# Bumped whenever the counting rules change in a way the configuration fingerprint can't tell
+CACHE_VERSION = 1
+# Bumped whenever the layout of the tables changes, the tables of another layout are dropped on open
+SCHEMA_VERSION = 3
+# Size of the database above which the least recently used entries are evicted, about a million files
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+# Share of max_size the database is brought back to when evicting, so that it is only compacted once in a while
+EVICTION_TARGET = 0.8
+# Number of pending writes kept in memory before flushing them to the database
+FLUSH_SIZE = 10_000
+
+
+def default_cache_dir() -> str:
+    """Returns the user cache directory for pylocc, following the platform conventions."""
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'pylocc')
+
+
+class ReportCache:
+    """Persistent cache of the file reports, stored in a single SQLite database.
+
+    Entries are keyed on the absolute path of the file and are valid as long as the size, modification time
+    and inode of the file, and the hash of the configuration it was counted with, are unchanged.
+    Hence a cache hit only costs a stat of the file. The files skipped for their content, e.g. binary or generated
+    ones, are stored along with the reason, so that they are not read again either.
+    The cache also stores the reports of git blobs: since they are keyed on the blob id, they stay valid
+    across branches and clones of the repository.
+    When the database grows beyond max_size bytes, the least recently used entries of both tables are evicted on
+    close, down to EVICTION_TARGET of max_size, and the database is compacted."""
+
+    def __init__(self, cache_dir: str, max_size: int = DEFAULT_MAX_SIZE):
+        # Imported once a cache is opened, so that the runs without cache don't pay for it
+        import sqlite3
+        os.makedirs(cache_dir, exist_ok=True)
+        self.max_size = max_size
+        # Every entry read or written during this run is marked with the run timestamp
+        self._run = time.time_ns()
+        self._hits: List[Tuple[int, str]] = []
+        self._pending: List[Tuple] = []
+        self._blob_hits: List[Tuple[int, str, str]] = []
+        self._pending_blobs: List[Tuple] = []
+        # The cache may be used from other threads than its own, as by count_path_async, but never concurrently
+        self._connection = sqlite3.connect(os.path.join(cache_dir, CACHE_FILE_NAME), timeout=30,
+                                           check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        (schema_version,) = self._connection.execute('PRAGMA user_version').fetchone()
+        if schema_version != SCHEMA_VERSION:
+            with self._connection:
+                self._connection.execute('DROP TABLE IF EXISTS reports')
+                self._connection.execute('DROP TABLE IF EXISTS blobs')
+                self._connection.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS reports ('
+            'path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, inode INTEGER, config_hash TEXT, '
+            'language TEXT, code INTEGER, comments INTEGER, blanks INTEGER, complexity INTEGER, skipped TEXT, '
+            'last_used INTEGER)')
+        self._connection.execute('CREATE INDEX IF NOT EXISTS reports_last_used ON reports (last_used)')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS blobs ('
+            'blob_id TEXT, config_hash TEXT, language TEXT, code INTEGER, comments INTEGER, blanks INTEGER, '
+            'complexity INTEGER, last_used INTEGER, PRIMARY KEY (blob_id, config_hash))')
+        self._connection.execute('CREATE INDEX IF NOT EXISTS blobs_last_used ON blobs (last_used)')
+
+    @staticmethod
+    def config_hash(fingerprint: str, options_key: str) -> str:
+        """Combines the fingerprint of a configuration with the other settings affecting the counts."""
+        return f"{CACHE_VERSION}:{options_key}:{fingerprint}"
+
+    def get(self, file_path: str, stat: os.stat_result, config_hash: str) -> Union[Report, str, None]:
+        """Returns the cached report of the file, the reason it was skipped for, such as BINARY, or None if missing
+        or stale."""
+        path = os.path.abspath(file_path)
+        row = self._connection.execute(
+            'SELECT size, mtime_ns, inode, config_hash, language, code, comments, blanks, complexity, skipped '
+            'FROM reports WHERE path = ?', (path,)).fetchone()
+        if row is None or row[:4] != (stat.st_size, stat.st_mtime_ns, stat.st_ino, config_hash):
+            return None
+        self._hits.append((self._run, path))
+        if row[9] is not None:
+            return row[9]
+        return Report(Language(row[4]), code=row[5], comments=row[6], blanks=row[7], complexity=row[8])
+
+    def put(self, file_path: str, stat: os.stat_result, config_hash: str, report: Report):
+        """Stores the report of the file, counted from the content described by the given stat."""
+        self._put(file_path, stat, config_hash, report.file_type.value, report.code, report.comments, report.blanks,
+                  report.complexity, None)
+
+    def put_skipped(self, file_path: str, stat: os.stat_result, config_hash: str, skipped: str):
+        """Stores the reason the file was skipped for, found in the content described by the given stat."""
+        self._put(file_path, stat, config_hash, None, 0, 0, 0, 0, skipped)
+
+    def _put(self, file_path: str, stat: os.stat_result, config_hash: str, *values):
+        self._pending.append((os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns, stat.st_ino, config_hash,
+                              *values, self._run))
+        if len(self._pending) >= FLUSH_SIZE:
+            self.flush()
+
+    def get_blob(self, blob_id: str, config_hash: str) -> Optional[Report]:
+        """Returns the cached report of the git blob, or None if missing."""
+        row = self._connection.execute(
+            'SELECT language, code, comments, blanks, complexity FROM blobs WHERE blob_id = ? AND config_hash = ?',
+            (blob_id, config_hash)).fetchone()
+        if row is None:
+            return None
+        self._blob_hits.append((self._run, blob_id, config_hash))
+        return Report(Language(row[0]), code=row[1], comments=row[2], blanks=row[3], complexity=row[4])
+
+    def put_blob(self, blob_id: str, config_hash: str, report: Report):
+        """Stores the report of the git blob."""
+        self._pending_blobs.append((blob_id, config_hash, report.file_type.value,
+                                    report.code, report.comments, report.blanks, report.complexity, self._run))
+        if len(self._pending_blobs) >= FLUSH_SIZE:
+            self.flush()
+
+    def flush(self):
+        """Writes the pending entries to the database."""
+        with self._connection:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO reports VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', self._pending)
+            self._connection.executemany('UPDATE reports SET last_used = ? WHERE path = ?', self._hits)
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO blobs VALUES (?, ?, ?, ?, ?, ?, ?, ?)', self._pending_blobs)
+            self._connection.executemany(
+                'UPDATE blobs SET last_used = ? WHERE blob_id = ? AND config_hash = ?', self._blob_hits)
+        self._pending.clear()
+        self._hits.clear()
+        self._pending_blobs.clear()
+        self._blob_hits.clear()
+
+    def size(self) -> int:
+        """Returns the size of the database in bytes, the pages freed by the deleted entries included."""
+        (page_count,) = self._connection.execute('PRAGMA page_count').fetchone()
+        (page_size,) = self._connection.execute('PRAGMA page_size').fetchone()
+        return page_count * page_size
+
+    def evict(self):
+        """Drops the least recently used entries of both tables when the database exceeds max_size, then compacts
+        it. The entries being about the same size, their share to drop is the share of the size to free."""
+        size = self.size()
+        if size <= self.max_size:
+            return
+        with self._connection:
+            (entries,) = self._connection.execute(
+                'SELECT (SELECT COUNT(*) FROM reports) + (SELECT COUNT(*) FROM blobs)').fetchone()
+            dropped = entries - int(entries * EVICTION_TARGET * self.max_size / size)
+            if dropped <= 0:
+                return
+            # Last use of the most recent entry to drop, the older ones are all dropped and the ones used at the
+            # same time only as many as needed
+            (last_used,) = self._connection.execute(
+                'SELECT last_used FROM (SELECT last_used FROM reports UNION ALL SELECT last_used FROM blobs) '
+                'ORDER BY last_used LIMIT 1 OFFSET ?', (dropped - 1,)).fetchone()
+            for table in ('reports', 'blobs'):
+                dropped -= self._connection.execute(
+                    f'DELETE FROM {table} WHERE last_used < ?', (last_used,)).rowcount
+            for table in ('reports', 'blobs'):
+                dropped -= self._connection.execute(
+                    f'DELETE FROM {table} WHERE rowid IN (SELECT rowid FROM {table} WHERE last_used = ? LIMIT ?)',
+                    (last_used, dropped)).rowcount
+        # The deleted entries leave pages partly used, only rewriting the database gives them back
+        self._connection.execute('VACUUM')
+
+    def close(self):
+        self.flush()
+        self.evict()
+        self._connection.close()
+
+    def __enter__(self) -> 'ReportCache':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -1,72 +1,495 @@
 import os
+from collections import Counter
+from contextlib import nullcontext
 import click
-from rich.console import Console
 
-from pylocc.file_utils import get_all_file_paths
-from pylocc.processor import ProcessorConfigurationFactory, count_locs, load_default_language_config
-from pylocc.reporter import aggregate_reports, create_aggregate_table, prepare_by_file_report, create_by_file_table
+from pylocc.api import default_configuration_factory, list_files, list_git_files
+from pylocc.archive_utils import ArchiveError, is_archive, iter_archive_members
+from pylocc.file_utils import PathFilter
+from pylocc.partial import PartialResult, PartialResultError, merge_partials, read_partial, write_partial
+from pylocc.reporter import (CSV_FORMAT, JSON_FORMAT, JSON_LINES_FORMAT, OUTPUT_FORMATS, ReportAggregator, ReportData,
+                             create_aggregate_table, create_by_file_table, format_of_path, history_headers,
+                             history_values, open_report_writer, prepare_by_file_report)
+from pylocc.cache import default_cache_dir
+from pylocc.runner import (BYTES_ENGINE, ENGINES, READ_AHEAD_BYTES, CountOptions, ReadAhead, count_blobs,
+                           count_contents, count_files)
+from pylocc.stats import RENDER_STAGE, WALK_STAGE, RunStats
+from pylocc.store import ReportStore
+from pylocc.watch import DEFAULT_INTERVAL, DEFAULT_PORT, LiveCounts, PollingWatcher, create_watcher, serve
 
-import importlib.metadata
 
-__version__ = importlib.metadata.version('pylocc')
+# How the duplicate files are reported: counted in the totals, or left out of them and of the by file reports
+DUPLICATES_COUNT = 'count'
+DUPLICATES_EXCLUDE = 'exclude'
+DUPLICATES_MODES = [DUPLICATES_COUNT, DUPLICATES_EXCLUDE]
 
 
-@click.command()
+def __getattr__(name):
+    # importlib.metadata is slow to import, the version is only looked up when asked for
+    if name == '__version__':
+        import importlib.metadata
+        return importlib.metadata.version('pylocc')
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class ByteSize(click.ParamType):
+    """A number of bytes, optionally followed by a K, M or G multiplier."""
+    name = 'size'
+    MULTIPLIERS = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, int):
+            return value
+        text = str(value).strip().upper().removesuffix('B')
+        multiplier = self.MULTIPLIERS.get(text[-1:])
+        if multiplier:
+            text = text[:-1]
+        if not text.isdigit():
+            self.fail(f"{value!r} is not a valid size, use a number of bytes such as 512, 64K or 10M", param, ctx)
+        return int(text) * (multiplier or 1)
+
+
+class Shard(click.ParamType):
+    """A shard of the files, written INDEX/COUNT with a 1-based index, e.g. 2/8."""
+    name = 'shard'
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, tuple):
+            return value
+        index, _, count = str(value).strip().partition('/')
+        if not (index.isdigit() and count.isdigit() and 1 <= int(index) <= int(count)):
+            self.fail(f"{value!r} is not a valid shard, use INDEX/COUNT with 1 <= INDEX <= COUNT, such as 2/8",
+                      param, ctx)
+        return int(index), int(count)
+
+
+def _apply(*options):
+    def decorator(function):
+        for option in reversed(options):
+            function = option(function)
+        return function
+    return decorator
+
+
+# Options shared by the commands counting files
+counting_options = _apply(
+    click.option('--jobs', '-j', type=click.IntRange(min=1), default=None,
+                 help='Number of worker processes used to count the files. Defaults to the number of CPUs.'),
+    click.option('--engine', type=click.Choice(ENGINES), default=BYTES_ENGINE, show_default=True,
+                 help='Counting engine: bytes classifies the raw file content, text decodes it as UTF-8 first.'),
+    click.option('--accurate', is_flag=True,
+                 help='Follow the strings, the nested comments and the docstrings along the lines, '
+                      'instead of only looking at how each line starts and ends. Slower.'),
+    click.option('--complexity', is_flag=True,
+                 help='Count the cyclomatic complexity of the code as well, i.e. its branching keywords and '
+                      'operators outside of the comments and the strings. Implies --accurate.'),
+)
+# Options of the commands printing a report
+output_options = _apply(
+    click.option('--by-file', is_flag=True,
+                 help='Generate report by file.'),
+    click.option('--output', type=click.Path(exists=False, dir_okay=False, readable=True, writable=True),
+                 help='Stores the output report to the given path, in csv format unless --format is given or the path '
+                      'ends with .json, .jsonl or .ndjson. By file reports are written as the files are counted.'),
+    click.option('--format', 'output_format', type=click.Choice(OUTPUT_FORMATS), default=None,
+                 help='Format of the report, with the counts as plain numbers. Written to the standard output '
+                      'instead of the table when no --output is given.'),
+)
+cache_options = _apply(
+    click.option('--cache-dir', type=click.Path(file_okay=False, writable=True), envvar='PYLOCC_CACHE_DIR',
+                 help='Directory of the cache of the file reports. Defaults to the user cache directory.'),
+    click.option('--no-cache', is_flag=True,
+                 help='Count every file, without reading or updating the cache.'),
+)
+# Options selecting the files to count, from their path and from their content
+path_options = _apply(
+    click.option('--include', multiple=True, metavar='GLOB',
+                 help='Only count the files matching the glob. Can be repeated.'),
+    click.option('--exclude', multiple=True, metavar='GLOB',
+                 help='Skip the files matching the glob. Can be repeated.'),
+    click.option('--exclude-dir', multiple=True, metavar='GLOB',
+                 help='Skip the directories matching the glob. Can be repeated.'),
+)
+content_options = _apply(
+    click.option('--no-sniff', is_flag=True,
+                 help='Count the binary, minified and generated files as well. By default they are skipped, '
+                      'and only their number is printed.'),
+    click.option('--max-file-size', type=ByteSize(), default=None,
+                 help='Skip the files bigger than the given size, e.g. 512K or 10M.'),
+    click.option('--max-line-length', type=click.IntRange(min=1), default=None,
+                 help='Skip the files with a line longer than the given number of bytes.'),
+)
+selection_options = _apply(
+    path_options,
+    click.option('--no-ignore', is_flag=True,
+                 help='Do not honor the .gitignore and .ignore files and walk the VCS and dependency directories as well.'),
+    content_options,
+)
+
+
+class DefaultCommandGroup(click.Group):
+    """Group of commands running the count command when the first argument is not a command name,
+    so that `pylocc FILE` keeps counting FILE. The options of the group itself, --help and --version, are left to it."""
+    default_command = 'count'
+
+    def parse_args(self, ctx, args):
+        group_options = {opt for param in self.get_params(ctx) for opt in param.opts}
+        if not args or (args[0] not in self.commands and args[0] not in group_options):
+            args = [self.default_command, *args]
+        return super().parse_args(ctx, args)
+
+
+@click.group(cls=DefaultCommandGroup)
+@click.version_option(package_name='pylocc', prog_name='pylocc')
+def pylocc():
+    """Count the lines of code, comments and blanks of files and directories.
+
+    Without a command, the arguments are passed to count, e.g. pylocc FILE counts FILE."""
+
+
+@pylocc.command('count')
 @click.argument('file', type=click.Path(exists=True, dir_okay=True, readable=True), required=False)
-@click.option('--by-file', is_flag=True,
-              help='Generate report by file.')
-@click.option('--output', type=click.Path(exists=False, dir_okay=False, readable=True, writable=True),
-              help='Stores the output report in csv format to the given path')
-@click.version_option(version=__version__, prog_name='pylocc')
-def pylocc(file, by_file, output):
-    """Run pylocc on the specified file or directory."""
-    configs = load_default_language_config()
-    supported_extensions = [
-        ext for config in configs for ext in config.file_extensions]
-
-    configuration_factory = ProcessorConfigurationFactory(configs)
-
-    if os.path.isdir(file):
-        files_gen = get_all_file_paths(
-            file, supported_extensions=supported_extensions)
-        files = list(files_gen)
-    else:
-        files = [file]
+@output_options
+@counting_options
+@cache_options
+@click.option('--git', 'git_mode', is_flag=True,
+              help='Count the files tracked by the git repository of the directory, counting identical blobs once.')
+@selection_options
+@click.option('--read-ahead', type=click.IntRange(min=1), default=None, metavar='THREADS',
+              help='Read the files with the given number of threads ahead of their counting, so that the latency of '
+                   'a network file system overlaps with the counting.')
+@click.option('--read-ahead-size', type=ByteSize(), default=f'{READ_AHEAD_BYTES // (1024 * 1024)}M', show_default=True,
+              help='Maximum size of the files read ahead and not counted yet, bigger files are not read ahead.')
+@click.option('--duplicates', type=click.Choice(DUPLICATES_MODES), default=None,
+              help='Count the files of the same content and language only once, adding the number of duplicate files '
+                   'per language to the aggregate report. The duplicates are either counted in the totals or excluded '
+                   'from them and from the by file report. Not supported for archives.')
+@click.option('--uloc', is_flag=True,
+              help='Count the unique lines of code as well, i.e. the distinct non blank lines, once stripped, of each '
+                   'language and of the whole run. The cache is not used.')
+@click.option('--approximate-uloc', is_flag=True,
+              help='Estimate the unique lines with HyperLogLog, in a fixed memory whatever the size of the tree, '
+                   'within about 1%. Implies --uloc.')
+@click.option('--shard', type=Shard(), default=None,
+              help='Only count the files of the given shard, e.g. 2/8, files being spread over the shards by a hash '
+                   'of their relative path. Meant to be used with --partial, on as many machines as shards.')
+@click.option('--partial', type=click.Path(dir_okay=False, writable=True),
+              help='Save the reports of the counted files to the given partial result file instead of printing them, '
+                   'to be merged with pylocc merge.')
+@click.option('--stats', is_flag=True,
+              help='Print the time spent in each stage, the throughput and the slowest files.')
+@click.option('--profile', type=click.Path(dir_okay=False, writable=True),
+              help='Profile the run with cProfile and save the stats to the given path. '
+                   'The worker processes are not profiled, use --jobs 1 to profile the counting.')
+@click.version_option(package_name='pylocc', prog_name='pylocc')
+def count(file, by_file, output, output_format, jobs, engine, accurate, complexity, cache_dir, no_cache, git_mode, include,
+          exclude, exclude_dir, no_ignore, no_sniff, max_file_size, max_line_length, read_ahead, read_ahead_size,
+          duplicates, uloc, approximate_uloc, shard, partial, stats, profile):
+    """Run pylocc on the specified file, directory, or tar or zip archive.
+
+    Other commands: pylocc watch DIRECTORY keeps the counts of a directory up to date,
+    pylocc merge PARTIALS... merges the partial results saved with --partial,
+    pylocc history REPOSITORY RANGE counts every commit of a git repository.
+    """
+    if file is None:
+        raise click.UsageError("Missing argument 'FILE'.")
+    if partial and (output or output_format):
+        raise click.BadParameter("--partial can't be used with --output or --format", param_hint="--partial")
+    uloc = uloc or approximate_uloc
+    if partial and uloc:
+        raise click.BadParameter("--partial doesn't keep the unique lines, it can't be used with --uloc",
+                                 param_hint="--partial")
+    if partial and duplicates:
+        raise click.BadParameter("--partial doesn't keep the duplicates, it can't be used with --duplicates",
+                                 param_hint="--partial")
+    output_format = output_format or (format_of_path(output) if output else None)
+    # When the report is written to the standard output, the messages are written to the standard error
+    to_stdout = output_format is not None and not output
+    configuration_factory = default_configuration_factory()
 
-    per_file_reports = {}
-    for f in files:
+    run_stats = RunStats() if stats else None
+    profiler = None
+    if profile:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    path_filter = PathFilter(include=include, exclude=exclude, exclude_dir=exclude_dir, shard=shard)
+    tracked_files = None
+    archive_members = None
+    files = ()
+    if git_mode:
+        if not os.path.isdir(file):
+            raise click.BadParameter("--git requires a directory", param_hint="FILE")
+        from pylocc.git_utils import GitError
         try:
-            file_extension = os.path.splitext(f)[1][1:]
-            file_configuration = configuration_factory.get_configuration(
-                file_extension=file_extension)
+            with run_stats.stage(WALK_STAGE) if run_stats else nullcontext():
+                tracked_files = list_git_files(file, configuration_factory, path_filter)
+        except GitError as e:
+            raise click.ClickException(f"Unable to list the files tracked by git: {e}")
+    elif is_archive(file):
+        if duplicates:
+            raise click.BadParameter("--duplicates can't be used with archives", param_hint="--duplicates")
+        # The members are read and counted in a single pass over the archive
+        archive_members = ((member.path, member.content) for member in iter_archive_members(
+            file, path_filter, use_ignore_rules=not no_ignore,
+            language_index=configuration_factory.language_index, max_size=max_file_size))
+        if run_stats:
+            archive_members = run_stats.timed(archive_members, WALK_STAGE)
+    else:
+        # Files are counted while the directory is walked
+        files = list_files(file, configuration_factory, path_filter, use_ignore_rules=not no_ignore)
+        if run_stats:
+            files = run_stats.timed(files, WALK_STAGE)
 
-            if not file_configuration:
-                click.echo(
-                    f"No configuration found for file type '{file_extension}' in file {f}. Skipping...")
+    cache = None if no_cache else _open_cache(cache_dir, err=to_stdout)
+    options = CountOptions(engine=engine, sniff=not no_sniff, max_file_size=max_file_size,
+                           max_line_length=max_line_length, timed=stats, accurate=accurate,
+                           complexity=complexity, uloc=uloc)
+    # Only the by file table and the partial results need every report, the other outputs are computed as the files
+    # are counted
+    per_file_reports = ReportStore() if (by_file and not output_format) or partial else None
+    aggregator = ReportAggregator(complexity, duplicates=duplicates is not None, uloc=uloc,
+                                  approximate_uloc=approximate_uloc)
+    writer = open_report_writer(output, complexity, output_format) if by_file and output_format else None
+    skipped = Counter()
+    try:
+        if tracked_files is not None:
+            results = count_blobs(tracked_files, configuration_factory, jobs=jobs, options=options, cache=cache,
+                                  duplicates=duplicates is not None)
+        elif archive_members is not None:
+            results = count_contents(archive_members, configuration_factory, jobs=jobs, options=options)
+        else:
+            results = count_files(files, configuration_factory, jobs=jobs, options=options, cache=cache,
+                                  read_ahead=ReadAhead(read_ahead, read_ahead_size) if read_ahead else None,
+                                  duplicates=duplicates is not None)
+        if run_stats:
+            results = run_stats.track(results)
+        for result in results:
+            if result.skipped:
+                skipped[result.skipped] += 1
                 continue
+            if result.report is None:
+                click.echo(result.message, err=to_stdout)
+                continue
+            if result.duplicate_of is not None:
+                aggregator.add_duplicate(result.report)
+                if duplicates == DUPLICATES_EXCLUDE:
+                    continue
+            aggregator.add(result.report, fingerprints=result.fingerprints)
+            if writer:
+                writer.write(result.path, result.report)
+            elif per_file_reports is not None:
+                per_file_reports.add(result.path, result.report)
+    except ArchiveError as e:
+        raise click.ClickException(str(e))
+    finally:
+        if cache:
+            cache.close()
+        if writer:
+            writer.close()
+    _echo_skipped(skipped, err=to_stdout)
+    if partial:
+        assert per_file_reports is not None, "Every report is kept for the partial result"
+        write_partial(partial, PartialResult(per_file_reports, skipped, options.cache_key, complexity,
+                                             ([shard[0]], shard[1]) if shard else None))
+        click.echo(f"Partial result of {len(per_file_reports):,} files saved to {partial}")
+        aggregator = None
+    if not (aggregator or profiler or run_stats):
+        return
+    # rich is slow to import, it's only imported when there is something to print
+    from rich.console import Console
+    console = Console(stderr=to_stdout)
+    with run_stats.stage(RENDER_STAGE) if run_stats else nullcontext():
+        if aggregator:
+            _print_reports(console, aggregator, per_file_reports, by_file, output, output_format, writer, complexity)
+    if profiler:
+        profiler.disable()
+        profiler.dump_stats(profile)
+        console.print(f"Profile saved to {profile}")
+    if run_stats:
+        run_stats.stop()
+        for table in run_stats.create_tables():
+            console.print(table)
 
-            with open(f, 'r', encoding='utf-8', errors='ignore', buffering=8192) as f_handle:
-                report =count_locs(
-                    f_handle, file_configuration=file_configuration)
-                per_file_reports[f] = report
-        except Exception as e:
-            click.echo(f"Error processing file {f}: {e} Skipping...")
-            continue
-    if per_file_reports:
-        console = Console()
-        report_data = None
-        if by_file:
-            report_data = prepare_by_file_report(per_file_reports)
-            report_table = create_by_file_table(report_data)
-        else:
-            report_data = aggregate_reports(per_file_reports)
-            report_table = create_aggregate_table(report_data)
 
+def _open_cache(cache_dir, err: bool = False):
+    import sqlite3
+    from pylocc.cache import ReportCache
+    try:
+        return ReportCache(cache_dir or default_cache_dir())
+    except (OSError, sqlite3.Error) as e:
+        click.echo(f"Unable to open the cache: {e} Counting without it...", err=err)
+        return None
+
+
+def _echo_skipped(skipped: Counter, err: bool = False):
+    if skipped:
+        reasons = ", ".join(f"{count:,} {reason}" for reason, count in sorted(skipped.items()))
+        click.echo(f"Skipped {sum(skipped.values()):,} files: {reasons}", err=err)
+
+
+def _print_reports(console, aggregator, per_file_reports, by_file, output, output_format, writer, complexity):
+    """Prints the aggregate or by file table, or writes the aggregate report in the output format,
+    the by file one being already written by the writer."""
+    if writer or (output_format and not by_file):
+        if not writer:
+            with open_report_writer(output, complexity, output_format, by_file=False,
+                                    duplicates=aggregator.duplicates, uloc=aggregator.uloc) as aggregate_writer:
+                aggregate_writer.write_aggregate(aggregator)
         if output:
-            report_data.to_csv(output)
             console.print(f"Report saved to {output}")
-        else:
-            console.print(report_table)
+    elif by_file:
+        console.print(create_by_file_table(prepare_by_file_report(per_file_reports, complexity)))
+    else:
+        console.print(create_aggregate_table(aggregator.to_report_data()))
+
+
+@pylocc.command('merge')
+@click.argument('partials', nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False, readable=True))
+@output_options
+def merge(partials, by_file, output, output_format):
+    """Merge the partial results saved by pylocc count --partial, e.g. by the shards of a run,
+    and print the report of the whole run.
+    """
+    try:
+        merged = merge_partials(read_partial(path) for path in partials)
+    except PartialResultError as e:
+        raise click.ClickException(str(e))
+    output_format = output_format or (format_of_path(output) if output else None)
+    to_stdout = output_format is not None and not output
+    missing = merged.missing_shards
+    if merged.shards is not None and missing:
+        count = merged.shards[1]
+        click.echo(f"Missing shards {', '.join(f'{index}/{count}' for index in missing)}: the counts are incomplete",
+                   err=to_stdout)
+    _echo_skipped(merged.skipped, err=to_stdout)
+    if not merged.reports:
+        return
+    aggregator = ReportAggregator(merged.complexity)
+    for files, report in merged.reports.aggregate().values():
+        aggregator.add(report, files)
+    writer = None
+    if by_file and output_format:
+        with open_report_writer(output, merged.complexity, output_format) as writer:
+            for path, report in merged.reports.items():
+                writer.write(path, report)
+    from rich.console import Console
+    _print_reports(Console(), aggregator, merged.reports, by_file, output, output_format, writer, merged.complexity)
+
+
+@pylocc.command('history')
+@click.argument('repository', type=click.Path(exists=True, file_okay=False, readable=True), default='.')
+@click.argument('revision_range', metavar='RANGE', default='HEAD')
+@click.option('--output', type=click.Path(exists=False, dir_okay=False, readable=True, writable=True),
+              help='Stores the totals to the given path, in csv format unless --format is given or the path '
+                   'ends with .json, .jsonl or .ndjson.')
+@click.option('--format', 'output_format', type=click.Choice([CSV_FORMAT, JSON_FORMAT, JSON_LINES_FORMAT]),
+              default=None,
+              help='Format of the totals, with the counts as plain numbers. Written to the standard output '
+                   'instead of the table when no --output is given.')
+@counting_options
+@cache_options
+@path_options
+@content_options
+def history(repository, revision_range, output, output_format, jobs, engine, accurate, complexity, cache_dir,
+            no_cache, include, exclude, exclude_dir, no_sniff, max_file_size, max_line_length):
+    """Count the files of each commit of RANGE in the git repository REPOSITORY, following the first parents,
+    and print the totals per language of every commit, oldest first.
+
+    RANGE is given to git log, e.g. HEAD (the default) or v1.0..main. Nothing is checked out: the blobs are read
+    from the repository and each distinct blob is counted once.
+    """
+    from pylocc.git_utils import GitError
+    from pylocc.history import count_history
+    output_format = output_format or (format_of_path(output) if output else None)
+    to_stdout = output_format is not None and not output
+    options = CountOptions(engine=engine, sniff=not no_sniff, max_file_size=max_file_size,
+                           max_line_length=max_line_length, accurate=accurate, complexity=complexity)
+    path_filter = PathFilter(include=include, exclude=exclude, exclude_dir=exclude_dir)
+    cache = None if no_cache else _open_cache(cache_dir, err=to_stdout)
+    writer = open_report_writer(output, complexity, output_format, headers=history_headers(complexity)) \
+        if output_format else None
+    rows = []
+    try:
+        for commit_counts in count_history(repository, revision_range, default_configuration_factory(), path_filter,
+                                           jobs=jobs, options=options, cache=cache):
+            for values in history_values(commit_counts.commit, commit_counts.date, commit_counts.reports,
+                                         complexity):
+                if writer:
+                    writer.write_row(values)
+                else:
+                    # The table shows the abbreviated commit ids and the days only
+                    rows.append([str(values[0])[:7], str(values[1])[:10], values[2]] + [f"{count:,}" for count in values[3:]])
+    except GitError as e:
+        raise click.ClickException(f"Unable to read the history of the repository: {e}")
+    finally:
+        if cache:
+            cache.close()
+        if writer:
+            writer.close()
+    if output:
+        click.echo(f"Report saved to {output}")
+    elif rows:
+        from rich.console import Console
+        Console().print(create_aggregate_table(ReportData(history_headers(complexity), rows)))
+
+
+@pylocc.command('watch')
+@click.argument('directory', type=click.Path(exists=True, file_okay=False, readable=True))
+@click.option('--port', type=click.IntRange(min=0, max=65535), default=DEFAULT_PORT, show_default=True,
+              help='Port of the HTTP endpoint serving the counts, on 127.0.0.1.')
+@click.option('--polling', is_flag=True,
+              help='Detect the changes by polling the file stats, instead of using inotify.')
+@click.option('--interval', type=click.FloatRange(min=0.01), default=DEFAULT_INTERVAL, show_default=True,
+              help='Seconds between two polls.')
+@counting_options
+@selection_options
+def watch(directory, port, polling, interval, jobs, engine, accurate, complexity, include, exclude, exclude_dir,
+          no_ignore, no_sniff, max_file_size, max_line_length):
+    """Count DIRECTORY, then keep the counts up to date as its files change.
+
+    The aggregate per language is served as JSON on http://127.0.0.1:PORT/.
+    Only the changed files are counted again.
+    """
+    watcher = create_watcher(polling=polling, interval=interval)
+    options = CountOptions(engine=engine, sniff=not no_sniff, max_file_size=max_file_size,
+                           max_line_length=max_line_length, accurate=accurate, complexity=complexity)
+    path_filter = PathFilter(include=include, exclude=exclude, exclude_dir=exclude_dir)
+    live_counts = LiveCounts(directory, default_configuration_factory(), watcher, options=options,
+                             path_filter=path_filter, use_ignore_rules=not no_ignore, jobs=jobs)
+    try:
+        live_counts.count()
+    except OSError as e:
+        if isinstance(watcher, PollingWatcher):
+            raise
+        # Some directory can't be watched with inotify, e.g. for lack of watches left
+        watcher.close()
+        click.echo(f"{e}, falling back to polling.", err=True)
+        watcher = PollingWatcher(interval)
+        live_counts = LiveCounts(directory, default_configuration_factory(), watcher, options=options,
+                                 path_filter=path_filter, use_ignore_rules=not no_ignore, jobs=jobs)
+        live_counts.count()
+    try:
+        server = serve(live_counts, port)
+    except OSError as e:
+        watcher.close()
+        raise click.ClickException(f"Unable to serve the counts on port {port}: {e}")
+    click.echo(f"Counted {len(live_counts.reports):,} files, serving the counts on "
+               f"http://127.0.0.1:{server.server_address[1]}/ ({type(watcher).__name__}). Press Ctrl+C to stop.")
+    try:
+        while True:
+            changed = watcher.wait()
+            if changed:
+                live_counts.refresh(changed)
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        # A new directory can't be watched, its changes would be missed
+        raise click.ClickException(f"{e}. Use --polling to watch the directory by polling.")
+    finally:
+        server.shutdown()
+        watcher.close()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,84 @@
+import hashlib
+from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar
+
+# Size of the start of the files hashed to tell apart the files of the same size, before hashing them whole
+PARTIAL_HASH_SIZE = 4096
+# Size of the blocks the files are hashed by
+_BLOCK_SIZE = 1024 * 1024
+
+T = TypeVar('T')
+
+
+class DuplicateEntry(Generic[T]):
+    """A file seen by a DuplicateFinder, along with a value the caller attaches to it, e.g. its result.
+    The hashes of its content are only computed when another file of the same size is seen."""
+    __slots__ = ('path', 'size', 'partial', 'digest', 'value')
+
+    def __init__(self, path: str, size: int):
+        self.path = path
+        self.size = size
+        # The hashes are empty when the file can't be read, which never matches another file
+        self.partial: Optional[bytes] = None
+        self.digest: Optional[bytes] = None
+        self.value: Optional[T] = None
+
+
+class DuplicateFinder(Generic[T]):
+    """Tells the files whose content is the same as the one of a file seen before, from a hash of their content.
+
+    The files are only read when needed: a file of a size seen for the first time can't be a duplicate, the files
+    of the same size are told apart by a hash of their first PARTIAL_HASH_SIZE bytes, and only the files whose
+    starts are the same are hashed whole. The entries are kept until the finder is dropped, a few dozens of bytes
+    per file plus their path."""
+
+    def __init__(self):
+        self._entries: Dict[Tuple[int, Any], List[DuplicateEntry[T]]] = {}
+
+    def add(self, path: str, size: int, key: Any = None) -> Tuple[DuplicateEntry[T], bool]:
+        """Adds a file, returning its entry and whether it is a duplicate, the entry being the one of the first file
+        of the same content in that case. Only the files of the same key are compared, e.g. of the same language,
+        since the same content may be counted differently depending on the name of the file."""
+        entry = DuplicateEntry(path, size)
+        candidates = self._entries.setdefault((size, key), [])
+        if candidates:
+            partial = _partial_hash(entry)
+            for candidate in candidates:
+                if partial and _partial_hash(candidate) == partial:
+                    digest = _full_hash(entry)
+                    if digest and _full_hash(candidate) == digest:
+                        return candidate, True
+        candidates.append(entry)
+        return entry, False
+
+    def __len__(self) -> int:
+        return sum(len(candidates) for candidates in self._entries.values())
+
+
+def _partial_hash(entry: DuplicateEntry) -> bytes:
+    if entry.partial is None:
+        entry.partial = _hash_file(entry.path, PARTIAL_HASH_SIZE)
+        # The start of a small file is the whole file
+        if entry.size <= PARTIAL_HASH_SIZE:
+            entry.digest = entry.partial
+    return entry.partial
+
+
+def _full_hash(entry: DuplicateEntry) -> bytes:
+    if entry.digest is None:
+        entry.digest = _hash_file(entry.path)
+    return entry.digest
+
+
+def _hash_file(path: str, size: Optional[int] = None) -> bytes:
+    """Returns the hash of the file, or of its first size bytes, empty when the file can't be read."""
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, 'rb') as f:
+            if size is not None:
+                digest.update(f.read(size))
+            else:
+                for block in iter(lambda: f.read(_BLOCK_SIZE), b''):
+                    digest.update(block)
+    except OSError:
+        return b''
+    return digest.digest()
@@ -0,0 +1,74 @@
+import mmap
+import os
+import posixpath
+from typing import Dict, Optional, Union
+
+from pylocc.file_utils import SHEBANG_SIZE, read_head
+
+
+class LanguageIndex:
+    """Dispatch index resolving the language of a file from its name, built once per configuration factory.
+
+    Exact file names (e.g. Makefile), multi-dot extensions (e.g. d.ts) and extensions share a single
+    dictionary keyed by lower case names. A name is looked up whole, then after each of its dots, longest
+    suffix first, so most files are resolved by one or two dictionary lookups and no system call.
+    The files without an extension can be resolved from the interpreter named by their shebang instead.
+
+    Args:
+        extensions: Language name of each extension, without the leading dot.
+        filenames: Language name of each lower case file name, taking precedence over the extensions.
+        shebangs: Language name of each interpreter, such as python3 or bash.
+    """
+
+    def __init__(self, extensions: Dict[str, str], filenames: Dict[str, str], shebangs: Dict[str, str]):
+        self.names = {extension.lower(): language for extension, language in extensions.items()}
+        self.names.update((filename.lower(), language) for filename, language in filenames.items())
+        self.shebangs = dict(shebangs)
+
+    def language_of_name(self, file_name: str) -> Optional[str]:
+        """Returns the language of the file name, or None if neither its name nor its extensions are known.
+        Like extensions, names are matched regardless of their case."""
+        name = file_name.lower()
+        names = self.names
+        language = names.get(name)
+        # As for os.path.splitext, the leading dot of a hidden file doesn't start an extension
+        dot = name.find('.', 1)
+        while language is None and dot != -1:
+            language = names.get(name[dot + 1:])
+            dot = name.find('.', dot + 1)
+        return language
+
+    def is_shebang_candidate(self, file_name: str) -> bool:
+        """Tells whether a file whose name is unknown may be resolved from its shebang, i.e. it has no extension."""
+        return bool(self.shebangs) and file_name.rfind('.') <= 0
+
+    def language_of_shebang(self, head: Union[bytes, mmap.mmap]) -> Optional[str]:
+        """Returns the language of the interpreter named by the shebang of the given file beginning, if any.
+
+        The interpreter is the program of the shebang, or the one it runs through env, e.g. python3 for
+        both #!/usr/bin/python3 and #!/usr/bin/env -S python3 -u. Versioned interpreters, such as python3.12,
+        are looked up without their version when they are not known as they are."""
+        if head[:2] != b'#!':
+            return None
+        line = bytes(head[2:SHEBANG_SIZE]).split(b'\n', 1)[0]
+        words = line.decode('utf-8', errors='ignore').split()
+        if words and posixpath.basename(words[0]) == 'env':
+            # Options and variable assignments of env come before the program
+            words = [word for word in words[1:] if not word.startswith('-') and '=' not in word]
+        if not words:
+            return None
+        interpreter = posixpath.basename(words[0])
+        language = self.shebangs.get(interpreter)
+        if language is None:
+            language = self.shebangs.get(interpreter.rstrip('0123456789.'))
+        return language
+
+    def language_of_file(self, file_path: str, file_name: Optional[str] = None) -> Optional[str]:
+        """Returns the language of the file from its name, reading its first bytes only when it has
+        no extension and an unknown name. file_name defaults to the base name of file_path."""
+        if file_name is None:
+            file_name = os.path.basename(file_path)
+        language = self.language_of_name(file_name)
+        if language is None and self.is_shebang_candidate(file_name):
+            language = self.language_of_shebang(read_head(file_path, SHEBANG_SIZE))
+        return language
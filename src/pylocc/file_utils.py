@@ -1,23 +1,430 @@
 
-from pathlib import Path
-from typing import Iterator, List
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, Iterator, List, NamedTuple, Optional, Pattern, Tuple, Union
+import mmap
 import os
+import re
+import zlib
 
-def get_all_file_paths(folder: str, supported_extensions: List[str] = [])-> Iterator[str]:
-    folder_path = Path(folder)
-    if not folder_path.exists():
-        raise FileNotFoundError(f"The path '{folder_path}' does not exist")
-    if not folder_path.is_dir():
+if TYPE_CHECKING:
+    from pylocc.detection import LanguageIndex
+
+# Files at least this big are memory mapped instead of being read in a single call
+MMAP_THRESHOLD = 1024 * 1024
+# Memory mapped files are split in lines by blocks of about this size, see binary_lines
+LINES_BLOCK_SIZE = 1024 * 1024
+# Only the beginning of an extensionless file is read to find its shebang
+SHEBANG_SIZE = 256
+
+# Directories never worth counting, pruned unless the ignore rules are disabled
+DEFAULT_EXCLUDED_DIRS = ['.git', '.hg', '.svn', '.bzr', 'node_modules', '__pycache__', '.venv', 'venv']
+IGNORE_FILES = ['.gitignore', '.ignore']
+
+
+class FileEntry(NamedTuple):
+    """A file found by walk_files, along with the stat taken while walking, so later stages don't need another one."""
+    path: str
+    stat: os.stat_result
+
+
+def glob_to_regex(pattern: str) -> str:
+    """Translates a gitignore style glob into a regular expression matching paths relative to the glob base.
+
+    Globs without a slash match the name at any depth, the others are anchored to the base.
+    * and ? never match a slash, while ** matches any number of directories."""
+    anchored = '/' in pattern.rstrip('/')
+    pattern = pattern.strip('/')
+    regex = '' if anchored else '(?:.*/)?'
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if pattern.startswith('**/', i):
+            regex += '(?:.*/)?'
+            i += 3
+            continue
+        if pattern.startswith('**', i):
+            regex += '.*'
+            i += 2
+            continue
+        if c == '*':
+            regex += '[^/]*'
+        elif c == '?':
+            regex += '[^/]'
+        elif c == '[':
+            end = pattern.find(']', i + 2)
+            if end == -1:
+                regex += re.escape(c)
+            else:
+                content = pattern[i + 1:end]
+                if content[0] in '!^':
+                    content = '^' + content[1:]
+                regex += '[' + content.replace('\\', '\\\\') + ']'
+                i = end
+        elif c == '\\' and i + 1 < len(pattern):
+            i += 1
+            regex += re.escape(pattern[i])
+        else:
+            regex += re.escape(c)
+        i += 1
+    return regex
+
+
+def _compile_globs(globs: Iterable[str]) -> Optional[Pattern[str]]:
+    """Compiles the globs in a single regular expression matching any of them."""
+    regexes = [glob_to_regex(g) for g in globs if g]
+    if not regexes:
+        return None
+    return re.compile('(?:' + '|'.join(regexes) + ')', re.DOTALL)
+
+
+def in_shard(relative_path: str, shard: Tuple[int, int]) -> bool:
+    """Tells whether the file belongs to the given shard, a 1-based index and the number of shards.
+    Files are spread over the shards by a stable hash of their path relative to the walked folder,
+    so that every run, on any machine, puts a file in the same shard."""
+    index, count = shard
+    return zlib.crc32(relative_path.encode('utf-8', 'surrogateescape')) % count == index - 1
+
+
+class PathFilter:
+    """Selects the files and directories to walk, from --include, --exclude and --exclude-dir like globs.
+
+    Each list of globs is compiled into a single regular expression matched against the path relative to the
+    walked folder, using / as separator. Given a shard, only the files belonging to it are selected, see in_shard."""
+
+    def __init__(self, include: Iterable[str] = (), exclude: Iterable[str] = (), exclude_dir: Iterable[str] = (),
+                 shard: Optional[Tuple[int, int]] = None):
+        self._include = _compile_globs(include)
+        self._exclude = _compile_globs(exclude)
+        self._exclude_dir = _compile_globs(exclude_dir)
+        self.shard = shard
+
+    def accepts_file(self, relative_path: str) -> bool:
+        if self.shard is not None and not in_shard(relative_path, self.shard):
+            return False
+        if self._include is not None and not self._include.fullmatch(relative_path):
+            return False
+        return self._exclude is None or not self._exclude.fullmatch(relative_path)
+
+    def accepts_dir(self, relative_path: str) -> bool:
+        return self._exclude_dir is None or not self._exclude_dir.fullmatch(relative_path)
+
+    def accepts_path(self, relative_path: str) -> bool:
+        """Checks a file found without walking, applying the directory globs to each of its parents."""
+        if self._exclude_dir is not None:
+            parts = relative_path.split('/')[:-1]
+            for i in range(len(parts)):
+                if not self.accepts_dir('/'.join(parts[:i + 1])):
+                    return False
+        return self.accepts_file(relative_path)
+
+
+class IgnoreRules:
+    """The rules of a single .gitignore like file, matching paths relative to the directory containing it.
+
+    All the rules are compiled in a single regular expression whose alternatives are in reverse order,
+    so that the first alternative matching is the last rule of the file, which is the one deciding."""
+
+    def __init__(self, lines: Iterable[str]):
+        rules = []
+        for line in lines:
+            line = line.rstrip('\n\r')
+            if not line.endswith('\\ '):
+                line = line.rstrip(' ')
+            if not line or line.startswith('#'):
+                continue
+            negated = line.startswith('!')
+            if negated or line.startswith('\\!') or line.startswith('\\#'):
+                line = line[1:]
+            dir_only = line.endswith('/')
+            if line.strip('/'):
+                rules.append((glob_to_regex(line), negated, dir_only))
+        rules.reverse()
+        self._dir_negated, self._dirs = self._compile(rules)
+        self._file_negated, self._files = self._compile([r for r in rules if not r[2]])
+
+    @staticmethod
+    def _compile(rules) -> Tuple[List[bool], Optional[Pattern[str]]]:
+        if not rules:
+            return [], None
+        return [negated for _, negated, _ in rules], \
+            re.compile('|'.join(f'({regex})' for regex, _, _ in rules), re.DOTALL)
+
+    def match(self, relative_path: str, is_dir: bool) -> Optional[bool]:
+        """Returns whether the path is ignored, or None if no rule matches it."""
+        negated, regex = (self._dir_negated, self._dirs) if is_dir else (self._file_negated, self._files)
+        if regex is None:
+            return None
+        m = regex.fullmatch(relative_path)
+        if m is None:
+            return None
+        # Each rule is a group, so the last matched group is the rule that matched
+        assert m.lastindex is not None
+        return not negated[m.lastindex - 1]
+
+    @staticmethod
+    def load(directory: str) -> List['IgnoreRules']:
+        """Loads the rules of the ignore files found in the directory."""
+        rules: List[IgnoreRules] = []
+        for name in IGNORE_FILES:
+            try:
+                with open(os.path.join(directory, name), 'r', encoding='utf-8', errors='ignore') as f:
+                    rules.append(IgnoreRules(f))
+            except OSError:
+                continue
+        return rules
+
+
+def _is_ignored(ignore_rules: List[Tuple[str, IgnoreRules]], relative_path: str, is_dir: bool) -> bool:
+    # The rules of the deepest ignore files take precedence
+    for base, rules in reversed(ignore_rules):
+        verdict = rules.match(relative_path[len(base):], is_dir)
+        if verdict is not None:
+            return verdict
+    return False
+
+
+class DirectoryScan(NamedTuple):
+    """Content of a single directory to count, see DirectoryScanner.scan."""
+    files: List[FileEntry]
+    # Subdirectories to descend into, with their path relative to the walked folder, ending with /
+    subdirs: List[Tuple[str, str, os.stat_result]]
+    # Ignore rules applying to the subdirectories
+    ignore_rules: List[Tuple[str, IgnoreRules]]
+
+
+class DirectoryScanner:
+    """Selects the files to count and the subdirectories to descend into, one directory at a time.
+
+    Args:
+        supported_extensions: When given, only the files with these extensions are selected.
+        path_filter: The include and exclude globs to apply.
+        use_ignore_rules: Whether to honor the .gitignore and .ignore files and to prune DEFAULT_EXCLUDED_DIRS.
+        language_index: When given, only the files whose language it resolves are selected, from their name or,
+            for the files without an extension, from their shebang. Takes precedence over supported_extensions.
+    """
+
+    def __init__(self, supported_extensions: Optional[Iterable[str]] = None,
+                 path_filter: Optional[PathFilter] = None, use_ignore_rules: bool = True,
+                 language_index: Optional['LanguageIndex'] = None):
+        self.extensions = set(supported_extensions) if supported_extensions else None
+        self.language_index = language_index
+        self.path_filter = path_filter
+        self.use_ignore_rules = use_ignore_rules
+        self.excluded_dirs = set(DEFAULT_EXCLUDED_DIRS) if use_ignore_rules else set()
+
+    def scan(self, directory: str, relative_dir: str = '',
+             ignore_rules: Optional[List[Tuple[str, IgnoreRules]]] = None) -> DirectoryScan:
+        """Scans a directory, whose path relative to the walked folder is relative_dir (ending with /
+        except for the folder itself), given the ignore rules defined by its parents."""
+        ignore_rules = ignore_rules or []
+        if self.use_ignore_rules:
+            ignore_rules = ignore_rules + [(relative_dir, rules) for rules in IgnoreRules.load(directory)]
+        files: List[FileEntry] = []
+        subdirs: List[Tuple[str, str, os.stat_result]] = []
+        try:
+            entries = sorted(os.scandir(directory), key=lambda e: e.name)
+        except OSError:
+            return DirectoryScan(files, subdirs, ignore_rules)
+        path_filter = self.path_filter
+        language_index = self.language_index
+        for entry in entries:
+            relative_path = relative_dir + entry.name
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+            if is_dir:
+                if entry.name in self.excluded_dirs or \
+                        (path_filter and not path_filter.accepts_dir(relative_path)) or \
+                        (ignore_rules and _is_ignored(ignore_rules, relative_path, True)):
+                    continue
+                try:
+                    subdirs.append((entry.path, relative_path + '/', entry.stat()))
+                except OSError:
+                    pass
+                continue
+            # The index to resolve the file from its shebang, which is read last, once it is known to be selected
+            shebang_index: Optional['LanguageIndex'] = None
+            if language_index is not None:
+                if language_index.language_of_name(entry.name) is None:
+                    if not language_index.is_shebang_candidate(entry.name):
+                        continue
+                    shebang_index = language_index
+            elif self.extensions is not None and os.path.splitext(entry.name)[1][1:] not in self.extensions:
+                continue
+            if (path_filter and not path_filter.accepts_file(relative_path)) or \
+                    (ignore_rules and _is_ignored(ignore_rules, relative_path, False)):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            if entry.is_file() and \
+                    (shebang_index is None or
+                     shebang_index.language_of_shebang(read_head(entry.path, SHEBANG_SIZE)) is not None):
+                files.append(FileEntry(entry.path, stat))
+        return DirectoryScan(files, subdirs, ignore_rules)
+
+
+def walk_files(folder: str, supported_extensions: Optional[Iterable[str]] = None,
+               path_filter: Optional[PathFilter] = None, use_ignore_rules: bool = True,
+               language_index: Optional['LanguageIndex'] = None) -> Iterator[FileEntry]:
+    """Walks the folder with os.scandir, yielding the files to count.
+
+    Excluded and ignored directories are pruned before descending into them. Files and directories reachable
+    from more than one path, through symlinks or hard links, are visited once, which also prevents cycles.
+
+    Args:
+        folder: The directory to walk.
+        supported_extensions: When given, only the files with these extensions are yielded.
+        path_filter: The include and exclude globs to apply.
+        use_ignore_rules: Whether to honor the .gitignore and .ignore files and to prune DEFAULT_EXCLUDED_DIRS.
+        language_index: When given, only the files whose language it resolves are yielded, see DirectoryScanner.
+    """
+    if not os.path.exists(folder):
+        raise FileNotFoundError(f"The path '{folder}' does not exist")
+    if not os.path.isdir(folder):
         raise NotADirectoryError(
-            f"The path '{folder_path}' is not a directory")
+            f"The path '{folder}' is not a directory")
+
+    scanner = DirectoryScanner(supported_extensions, path_filter, use_ignore_rules, language_index)
+    root_stat = os.stat(folder)
+    seen = {(root_stat.st_dev, root_stat.st_ino)}
+    # Directories to visit, with their path relative to folder (ending with / except for the root) and
+    # the ignore rules applying to them, along with the relative path of the directory defining them
+    stack: List[Tuple[str, str, List[Tuple[str, IgnoreRules]]]] = [(folder, '', [])]
+    while stack:
+        directory, relative_dir, ignore_rules = stack.pop()
+        scan = scanner.scan(directory, relative_dir, ignore_rules)
+        for entry in scan.files:
+            key = (entry.stat.st_dev, entry.stat.st_ino)
+            if key not in seen:
+                seen.add(key)
+                yield entry
+        # Reversed, so that directories are popped from the stack in name order
+        for path, relative_path, stat in reversed(scan.subdirs):
+            key = (stat.st_dev, stat.st_ino)
+            if key not in seen:
+                seen.add(key)
+                stack.append((path, relative_path, scan.ignore_rules))
+
+
+def walk_order_key(path: str) -> Tuple[Tuple[int, str], ...]:
+    """Sort key ordering paths of the same folder as walk_files yields them: the files of a directory by name,
+    then its subdirectories by name."""
+    parts = path.replace(os.sep, '/').split('/')
+    return tuple((1, part) for part in parts[:-1]) + ((0, parts[-1]),)
+
+
+def get_all_file_paths(folder: str, supported_extensions: List[str] = [],
+                       path_filter: Optional[PathFilter] = None, use_ignore_rules: bool = True) -> Iterator[str]:
+    """Yields the paths of the files to count in the folder, see walk_files."""
+    for entry in walk_files(folder, supported_extensions, path_filter, use_ignore_rules):
+        yield entry.path
+
+
+def read_head(file_path: str, size: int) -> bytes:
+    """Reads the first bytes of the file with a single unbuffered read, or returns nothing if it can't be read."""
+    try:
+        with open(file_path, 'rb', buffering=0) as f:
+            return f.read(size)
+    except OSError:
+        return b''
+
+
+@contextmanager
+def open_binary_content(file_path: str, mmap_threshold: int = MMAP_THRESHOLD) -> Iterator[Union[bytes, mmap.mmap]]:
+    """Opens the file in binary mode and provides its content.
+
+    Small files are read with a single call, bigger files are memory mapped, so they are never entirely copied in memory.
+    Both support len, slicing and the search methods of bytes."""
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < mmap_threshold or size == 0:
+            yield f.read()
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield mm
 
-    extensions_set = None
-    if supported_extensions:
-        extensions_set = set(supported_extensions)
 
-    for root, _, files in os.walk(folder):
-        for file in files:
-            if not extensions_set or Path(file).suffix[1:] in extensions_set:
-                # return the path
-                yield os.path.join(root, file)
+def binary_lines(content: Union[bytes, mmap.mmap]) -> Iterable[bytes]:
+    """Returns the undecoded lines of the content provided by open_binary_content, without their line terminator.
+
+    Lines end on LF, CRLF or a bare CR, the universal newlines the text engine reads files with, whatever the size of
+    the file. The lines of memory mapped files are split on demand, by blocks ending after a LF, so that no CRLF is
+    split in two."""
+    if isinstance(content, bytes):
+        return content.splitlines()
+    return _mapped_lines(content)
+
+
+def _mapped_lines(content: mmap.mmap) -> Iterator[bytes]:
+    size = len(content)
+    start = 0
+    while start < size:
+        end = content.rfind(b'\n', start, start + LINES_BLOCK_SIZE) + 1
+        if end <= start:
+            # No LF in the block, the line goes on until the next one
+            end = content.find(b'\n', start + LINES_BLOCK_SIZE) + 1 or size
+        yield from content[start:end].splitlines()
+        start = end
+
+
+@contextmanager
+def open_binary_lines(file_path: str, mmap_threshold: int = MMAP_THRESHOLD) -> Iterator[Iterable[bytes]]:
+    """Opens the file in binary mode and provides its undecoded lines, see open_binary_content and binary_lines."""
+    with open_binary_content(file_path, mmap_threshold) as content:
+        yield binary_lines(content)
+
+
+# Reasons for not counting a file, found by sniff_content or by the size guards
+BINARY = 'binary'
+MINIFIED = 'minified'
+GENERATED = 'generated'
+TOO_LARGE = 'too large'
+LONG_LINES = 'long lines'
+
+# Only the beginning of the file is inspected when sniffing it
+SNIFF_SIZE = 8192
+# Average line length above which a file is considered minified, when at least MINIFIED_MIN_SIZE bytes are sniffed
+MINIFIED_LINE_LENGTH = 300
+MINIFIED_MIN_SIZE = 1024
+# Generated files announce themselves in a comment of their first lines, markers are lower case
+GENERATED_HEADER_LINES = 5
+GENERATED_COMMENT_PREFIXES = (b'//', b'/*', b'*', b'#', b'--', b';', b'%', b'<!--')
+GENERATED_MARKERS = [b'@generated', b'auto-generated', b'autogenerated', b'code generated']
+# A warning common in hand written files as well, it only marks a generated file along with "generated"
+DO_NOT_EDIT_MARKER = b'do not edit'
+
+
+def sniff_content(head: bytes) -> Optional[str]:
+    """Inspects the beginning of a file and returns why it shouldn't be counted, or None if it's a regular source file.
+
+    Args:
+        head: The first SNIFF_SIZE bytes of the file.
+    Returns:
+        BINARY if it contains NUL bytes, MINIFIED if its lines are very long on average,
+        GENERATED if a comment of its first lines contains a known generated file marker, None otherwise."""
+    if b'\0' in head:
+        return BINARY
+    if len(head) >= MINIFIED_MIN_SIZE and len(head) / (head.count(b'\n') + 1) > MINIFIED_LINE_LENGTH:
+        return MINIFIED
+    for line in head.split(b'\n', GENERATED_HEADER_LINES)[:GENERATED_HEADER_LINES]:
+        line = line.lstrip().lower()
+        if line.startswith(GENERATED_COMMENT_PREFIXES) and \
+                (any(marker in line for marker in GENERATED_MARKERS) or
+                 (DO_NOT_EDIT_MARKER in line and b'generated' in line)):
+            return GENERATED
     return None
+
+
+@lru_cache(maxsize=None)
+def _long_line_pattern(max_line_length: int) -> Pattern[bytes]:
+    # Anchored to the line starts, so that every byte is scanned at most once
+    return re.compile(rb'^[^\n]{%d}' % (max_line_length + 1), re.MULTILINE)
+
+
+def has_long_line(content: Union[bytes, mmap.mmap], max_line_length: int) -> bool:
+    """Tells whether any line of the content is longer than max_line_length bytes, scanning it at C speed."""
+    return _long_line_pattern(max_line_length).search(content) is not None
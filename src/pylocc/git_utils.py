@@ -0,0 +1,163 @@
+import os
+import subprocess
+import threading
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+# Modes of the index entries pointing to regular files, symlinks and submodules are skipped
+REGULAR_FILE_MODES = {b'100644', b'100755'}
+
+
+class GitError(Exception):
+    """Raised when a git command can't be run or fails."""
+
+
+def run_git(repo_path: str, *args: str, input: Optional[bytes] = None) -> bytes:
+    """Runs a git command in the given work tree and returns its output."""
+    try:
+        completed = subprocess.run(['git', '-C', repo_path, *args], input=input,
+                                   capture_output=True, check=True)
+    except FileNotFoundError:
+        raise GitError("git executable not found")
+    except subprocess.CalledProcessError as e:
+        raise GitError(e.stderr.decode('utf-8', errors='replace').strip())
+    return completed.stdout
+
+
+def _split_paths(output: bytes) -> List[str]:
+    return [os.fsdecode(p) for p in output.split(b'\0') if p]
+
+
+def list_tracked_files(repo_path: str) -> List[Tuple[str, str]]:
+    """Returns the path and the blob id of the files tracked under the given work tree directory.
+
+    Blob ids are read from the repository index, so the files are not read, except for those modified
+    in the work tree, which are hashed again by git. Files deleted from the work tree are skipped.
+    Returned paths are joined to repo_path, as the ones of get_all_file_paths.
+    """
+    entries: Dict[str, str] = {}
+    for record in run_git(repo_path, 'ls-files', '--stage', '-z').split(b'\0'):
+        if not record:
+            continue
+        meta, raw_path = record.split(b'\t', 1)
+        mode, blob_id, _ = meta.split(b' ')
+        if mode in REGULAR_FILE_MODES:
+            entries[os.fsdecode(raw_path)] = blob_id.decode('ascii')
+
+    # Modified files include the deleted ones as well
+    deleted = set(_split_paths(run_git(repo_path, 'ls-files', '--deleted', '-z')))
+    modified = [p for p in _split_paths(run_git(repo_path, 'ls-files', '--modified', '-z'))
+                if p in entries and p not in deleted]
+    for path in deleted:
+        entries.pop(path, None)
+    # Paths are passed one per line, the rare ones containing a new line are hashed on their own
+    batch = [p for p in modified if '\n' not in p]
+    if batch:
+        blob_ids = run_git(repo_path, 'hash-object', '--stdin-paths',
+                           input=os.fsencode('\n'.join(batch) + '\n')).split()
+        entries.update(zip(batch, (b.decode('ascii') for b in blob_ids)))
+    for path in modified:
+        if '\n' in path:
+            entries[path] = run_git(repo_path, 'hash-object', '--', path).strip().decode('ascii')
+
+    return [(os.path.join(repo_path, path), blob_id) for path, blob_id in entries.items()]
+
+
+class CommitChanges(NamedTuple):
+    """The files changed by a commit, relative to its first parent.
+    The blob id of a deleted file, or of a file that is no longer a regular file, is None."""
+    commit: str
+    parent: Optional[str]
+    date: str
+    changes: List[Tuple[str, Optional[str]]]
+
+
+def list_tree_files(repo_path: str, tree_ish: str) -> List[Tuple[str, str]]:
+    """Returns the path, relative to the repository root, and the blob id of the regular files of a commit or tree."""
+    files = []
+    for record in run_git(repo_path, 'ls-tree', '-r', '-z', '--full-tree', tree_ish).split(b'\0'):
+        if not record:
+            continue
+        meta, path = record.split(b'\t', 1)
+        mode, _, blob_id = meta.split(b' ')
+        if mode in REGULAR_FILE_MODES:
+            files.append((os.fsdecode(path), blob_id.decode('ascii')))
+    return files
+
+
+def iter_commit_changes(repo_path: str, revision_range: str = 'HEAD') -> Iterator[CommitChanges]:
+    """Yields the commits of the range following the first parents, oldest first, along with the files they changed.
+
+    A single git log lists every commit with its raw diff against its first parent, merges included, so that
+    the files of each commit can be followed from the files of the previous one, at the cost of the changes only.
+    Paths are relative to the repository root. Raises GitError when the range can't be listed."""
+    output = run_git(repo_path, 'log', '--reverse', '--first-parent', '-m', '--raw', '--no-renames', '--no-abbrev',
+                     '-z', '--format=commit %H %P%x00%cI', revision_range, '--')
+    current: Optional[CommitChanges] = None
+    records = iter(output.split(b'\0'))
+    for record in records:
+        record = record.lstrip(b'\n')
+        if record.startswith(b'commit '):
+            if current is not None:
+                yield current
+            ids = record[7:].decode('ascii').split()
+            current = CommitChanges(ids[0], ids[1] if len(ids) > 1 else None,
+                                    next(records).decode('ascii').strip(), [])
+        elif record.startswith(b':') and current is not None:
+            # :<old mode> <new mode> <old blob> <new blob> <status>, followed by the path
+            _, new_mode, _, new_blob, _ = record[1:].split(b' ')
+            path = os.fsdecode(next(records))
+            current.changes.append((path, new_blob.decode('ascii') if new_mode in REGULAR_FILE_MODES else None))
+    if current is not None:
+        yield current
+
+
+def read_blobs(repo_path: str, blob_ids: Iterable[str]) -> Iterator[Tuple[str, bytes]]:
+    """Yields the id and the content of the given blobs, in the same order, read through a single long-lived
+    git cat-file --batch process. The ids are written by a thread while the contents are read, so that git never
+    waits for the next request. Raises GitError when a blob can't be read."""
+    try:
+        process = subprocess.Popen(['git', '-C', repo_path, 'cat-file', '--batch'],
+                                   stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    except FileNotFoundError:
+        raise GitError("git executable not found")
+    stdin, stdout = process.stdin, process.stdout
+    assert stdin is not None and stdout is not None, "Pipes requested above"
+    requested: List[str] = []
+    lock = threading.Lock()
+
+    def write_ids() -> None:
+        try:
+            for blob_id in blob_ids:
+                with lock:
+                    requested.append(blob_id)
+                stdin.write(blob_id.encode('ascii') + b'\n')
+        except (BrokenPipeError, ValueError):
+            pass
+        finally:
+            try:
+                stdin.close()
+            except BrokenPipeError:
+                pass
+
+    writer = threading.Thread(target=write_ids, daemon=True)
+    writer.start()
+    try:
+        index = 0
+        while True:
+            header = stdout.readline()
+            if not header:
+                break
+            fields = header.split()
+            if len(fields) != 3:
+                raise GitError(f"Unable to read the blob {header.decode('ascii', 'replace').strip()}")
+            content = stdout.read(int(fields[2]))
+            stdout.read(1)
+            with lock:
+                blob_id = requested[index]
+            index += 1
+            yield blob_id, content
+    finally:
+        stdout.close()
+        process.kill()
+        process.wait()
+        writer.join()
@@ -0,0 +1,122 @@
+import posixpath
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from pylocc.cache import ReportCache
+from pylocc.file_utils import PathFilter
+from pylocc.git_utils import iter_commit_changes, list_tree_files, read_blobs
+from pylocc.language import Language
+from pylocc.processor import ProcessorConfigurationFactory, Report
+from pylocc.reporter import ReportAggregator
+from pylocc.runner import DEFAULT_OPTIONS, CountOptions, count_contents
+
+# Blob id and language of a file, the language being None for the files only known from their shebang
+_BlobKey = Tuple[str, Optional[str]]
+
+
+class CommitCounts(NamedTuple):
+    """Number of files and summed report of each language of the files of a commit."""
+    commit: str
+    # ISO 8601 committer date
+    date: str
+    reports: Dict[Language, Tuple[int, Report]]
+
+
+def count_history(repo_path: str,
+                  revision_range: str = 'HEAD',
+                  configuration_factory: Optional[ProcessorConfigurationFactory] = None,
+                  filters: Optional[PathFilter] = None,
+                  jobs: Optional[int] = None,
+                  options: CountOptions = DEFAULT_OPTIONS,
+                  cache: Optional[ReportCache] = None) -> Iterator[CommitCounts]:
+    """Counts the files of each commit of the range, following the first parents, oldest first, without checking
+    anything out.
+
+    The changes of every commit are listed by a single git log, then each distinct blob is read once through a single
+    git cat-file process and counted once, in parallel as count_contents does, whatever the number of commits
+    sharing it. The totals of each commit are then updated from the ones of the previous commit with the reports
+    of the changed files only, so the cost follows the number of changed blobs, not the number of commits times the
+    number of files. The blob reports are cached as the ones of count_blobs, and reused across runs.
+
+    Args:
+        repo_path: Work tree of the repository.
+        revision_range: Commits to count, as given to git log, e.g. HEAD or v1.0..main.
+        configuration_factory: Language configurations, defaults to the built-in ones.
+        filters: Globs selecting the files to count, matched against the paths relative to the repository root.
+        jobs: Number of worker processes, defaults to the number of CPUs.
+        options: Settings of the counting.
+        cache: Cache of the blob reports, the caller is in charge of closing it.
+
+    Raises GitError when the history can't be read.
+    """
+    configuration_factory = configuration_factory or ProcessorConfigurationFactory.get_default_factory()
+    language_index = configuration_factory.language_index
+    commits = list(iter_commit_changes(repo_path, revision_range))
+    if not commits:
+        return
+    # The files of the parent of the first commit, which the changes of the first commit apply to
+    initial = list_tree_files(repo_path, commits[0].parent) if commits[0].parent else []
+
+    def blob_key(path: str, blob_id: Optional[str]) -> Optional[_BlobKey]:
+        if blob_id is None or (filters is not None and not filters.accepts_path(path)):
+            return None
+        file_name = posixpath.basename(path)
+        language = language_index.language_of_name(file_name)
+        if language is None and not language_index.is_shebang_candidate(file_name):
+            return None
+        return blob_id, language
+
+    # A file name of each distinct blob to count, in order of appearance
+    names: Dict[_BlobKey, str] = {}
+    for path, blob_id in initial + [change for commit in commits for change in commit.changes]:
+        key = blob_key(path, blob_id)
+        if key is not None and key not in names:
+            names[key] = posixpath.basename(path)
+
+    reports: Dict[_BlobKey, Optional[Report]] = {}
+    config_hashes: Dict[str, str] = {}
+    if cache is not None:
+        for key, file_name in names.items():
+            if key[1] is None:
+                continue
+            config_hash = config_hashes.get(key[1])
+            if config_hash is None:
+                file_configuration = configuration_factory.get_configuration(file_name=file_name)
+                assert file_configuration is not None, "The language of the blob is known from its name"
+                config_hash = config_hashes[key[1]] = ReportCache.config_hash(file_configuration.fingerprint,
+                                                                              options.cache_key)
+            report = cache.get_blob(key[0], config_hash)
+            if report is not None:
+                reports[key] = report
+    missing: List[_BlobKey] = [key for key in names if key not in reports]
+    if missing:
+        contents = ((names[key], content) for key, (_, content) in
+                    zip(missing, read_blobs(repo_path, [blob_id for blob_id, _ in missing])))
+        for key, result in zip(missing, count_contents(contents, configuration_factory, jobs=jobs, options=options)):
+            # Binary, generated or unknown files are left out of the counts
+            reports[key] = result.report
+            if cache is not None and result.report is not None and key[1] is not None:
+                cache.put_blob(key[0], config_hashes[key[1]], result.report)
+
+    aggregator = ReportAggregator(options.complexity)
+    files: Dict[str, _BlobKey] = {}
+
+    def apply(path: str, blob_id: Optional[str]):
+        previous = files.pop(path, None)
+        previous_report = reports[previous] if previous is not None else None
+        if previous_report is not None:
+            aggregator.remove(previous_report)
+        key = blob_key(path, blob_id)
+        if key is not None:
+            files[path] = key
+            report = reports[key]
+            if report is not None:
+                aggregator.add(report)
+
+    for path, blob_id in initial:
+        apply(path, blob_id)
+    for commit in commits:
+        for path, blob_id in commit.changes:
+            apply(path, blob_id)
+        yield CommitCounts(commit.commit, commit.date, {
+            language: (aggregator.files_per_type[language], report + Report(language))
+            for language, report in aggregator.reports.items()})
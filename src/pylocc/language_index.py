@@ -0,0 +1,986 @@
+# This file is auto-generated by the build system.
+# DO NOT EDIT THIS FILE MANUALLY.
+
+# Language of each file extension
+EXTENSIONS = {
+    'abap': 'ABAP',
+    'abnf': 'ABNF',
+    'apl': 'APL',
+    'aplf': 'APL',
+    'apln': 'APL',
+    'aplc': 'APL',
+    'dyalog': 'APL',
+    'asa': 'ASP',
+    'asp': 'ASP',
+    'asax': 'ASP.NET',
+    'ascx': 'ASP.NET',
+    'asmx': 'ASP.NET',
+    'aspx': 'ASP.NET',
+    'master': 'ASP.NET',
+    'sitemap': 'ASP.NET',
+    'webinfo': 'ASP.NET',
+    'dats': 'ATS',
+    'sats': 'ATS',
+    'ats': 'ATS',
+    'hats': 'ATS',
+    'awk': 'AWK',
+    'as': 'ActionScript',
+    'ada': 'Ada',
+    'adb': 'Ada',
+    'ads': 'Ada',
+    'pad': 'Ada',
+    'agda': 'Agda',
+    'crn': 'Alchemist',
+    'x': 'Alex',
+    'als': 'Alloy',
+    'aidl': 'Android Interface Definition Language',
+    'applescript': 'AppleScript',
+    'art': 'Arturo',
+    'adoc': 'AsciiDoc',
+    's': 'Assembly',
+    'asm': 'Assembly',
+    'astro': 'Astro',
+    'ahk': 'AutoHotKey',
+    'in': 'Autoconf',
+    'avdl': 'Avro',
+    'avpr': 'Avro',
+    'avsc': 'Avro',
+    'bash': 'BASH',
+    'bash_login': 'BASH',
+    'bash_logout': 'BASH',
+    'bash_profile': 'BASH',
+    'bashrc': 'BASH',
+    'bas': 'Basic',
+    'bat': 'Batch',
+    'btm': 'Batch',
+    'cmd': 'Batch',
+    'bzl': 'Bazel',
+    'build.bazel': 'Bazel',
+    'build': 'Bazel',
+    'workspace': 'Bazel',
+    'bean': 'Bean',
+    'beancount': 'Bean',
+    'bicep': 'Bicep',
+    'bb': 'Bitbake',
+    'bbappend': 'Bitbake',
+    'bbclass': 'Bitbake',
+    'bitbucket-pipelines.yml': 'Bitbucket Pipeline',
+    'blade.php': 'Blade template',
+    'blp': 'Blueprint',
+    'boo': 'Boo',
+    'bsq': 'Bosque',
+    'bf': 'Brainfuck',
+    'bst': 'BuildStream',
+    'c': 'C',
+    'ec': 'C',
+    'pgc': 'C',
+    'h': 'C Header',
+    'c3': 'C3',
+    'csh': 'C Shell',
+    'cs': 'C#',
+    'csx': 'C#',
+    'cc': 'C++',
+    'cpp': 'C++',
+    'cxx': 'C++',
+    'c++': 'C++',
+    'pcc': 'C++',
+    'ino': 'C++',
+    'ccm': 'C++',
+    'cppm': 'C++',
+    'cxxm': 'C++',
+    'c++m': 'C++',
+    'mxx': 'C++',
+    'hh': 'C++ Header',
+    'hpp': 'C++ Header',
+    'hxx': 'C++ Header',
+    'inl': 'C++ Header',
+    'ipp': 'C++ Header',
+    'ixx': 'C++ Header',
+    'cmake': 'CMake',
+    'cmakelists.txt': 'CMake',
+    'cob': 'COBOL',
+    'cbl': 'COBOL',
+    'ccp': 'COBOL',
+    'cobol': 'COBOL',
+    'cpy': 'COBOL',
+    'css': 'CSS',
+    'csv': 'CSV',
+    'cabal': 'Cabal',
+    'cairo': 'Cairo',
+    'cj': 'Cangjie',
+    'capnp': "Cap'n Proto",
+    'cassius': 'Cassius',
+    'ceylon': 'Ceylon',
+    'chpl': 'Chapel',
+    'circom': 'Circom',
+    'prg': 'Clipper',
+    'ch': 'Clipper',
+    'clj': 'Clojure',
+    'cljc': 'Clojure',
+    'cljs': 'ClojureScript',
+    'soy': 'Closure Template',
+    'json': 'JSON',
+    'yaml': 'YAML',
+    'yml': 'YAML',
+    'ql': 'CodeQL',
+    'qll': 'CodeQL',
+    'coffee': 'CoffeeScript',
+    'cogent': 'Cogent',
+    'cfm': 'ColdFusion',
+    'cfc': 'ColdFusion CFScript',
+    'v': 'Verilog',
+    'creole': 'Creole',
+    'cr': 'Crystal',
+    'cu': 'Cuda',
+    'pyx': 'Cython',
+    'pxi': 'Cython',
+    'pxd': 'Cython',
+    'd': 'D',
+    'daml': 'DAML',
+    'dm': 'DM',
+    'dot': 'DOT',
+    'gv': 'DOT',
+    'dart': 'Dart',
+    'dts': 'Device Tree',
+    'dtsi': 'Device Tree',
+    'dhall': 'Dhall',
+    'dockerfile': 'Dockerfile',
+    'dtd': 'Document Type Definition',
+    'ex': 'Elixir',
+    'exs': 'Elixir',
+    'eex': 'Elixir Template',
+    'heex': 'HEEx',
+    'leex': 'Phoenix LiveView',
+    'elm': 'Elm',
+    'ede': 'Emacs Dev Env',
+    'el': 'Emacs Lisp',
+    'emit': 'EmiT',
+    'erl': 'Erlang',
+    'hrl': 'Erlang',
+    'exp': 'Expect',
+    'xslt': 'Extensible Stylesheet Language Transformations',
+    'xsl': 'Extensible Stylesheet Language Transformations',
+    'fs': 'F#',
+    'fsi': 'F#',
+    'fsx': 'F#',
+    'fsscript': 'F#',
+    'fst': 'F*',
+    'fidl': 'FIDL',
+    'f': 'FORTRAN Legacy',
+    'for': 'FORTRAN Legacy',
+    'ftn': 'FORTRAN Legacy',
+    'f77': 'FORTRAN Legacy',
+    'pfo': 'FORTRAN Legacy',
+    'fsl': 'FSL',
+    'fxml': 'FXML',
+    'factor': 'Factor',
+    'fnl': 'Fennel',
+    'fish': 'Fish',
+    'flow': 'Flow9',
+    '4th': 'Forth',
+    'forth': 'Forth',
+    'fr': 'Forth',
+    'frt': 'Forth',
+    'fth': 'Forth',
+    'f83': 'Forth',
+    'fb': 'Forth',
+    'fpm': 'Forth',
+    'e4': 'Forth',
+    'rx': 'Forth',
+    'ft': 'Forth',
+    'f03': 'Fortran Modern',
+    'f08': 'Fortran Modern',
+    'f90': 'Fortran Modern',
+    'f95': 'Fortran Modern',
+    'fsh': 'Fragment Shader File',
+    'ftl': 'Freemarker Template',
+    'fut': 'Futhark',
+    'gd': 'GDScript',
+    'vert': 'GLSL',
+    'tesc': 'GLSL',
+    'tese': 'GLSL',
+    'geom': 'GLSL',
+    'frag': 'GLSL',
+    'comp': 'GLSL',
+    'glsl': 'GLSL',
+    'gn': 'GN',
+    'gni': 'GN',
+    'gml': 'Game Maker Language',
+    'yyp': 'Game Maker Project',
+    'feature': 'Gherkin Specification',
+    'gleam': 'Gleam',
+    'go': 'Go',
+    'gop': 'Go+',
+    'tmpl': 'Go Template',
+    'gohtml': 'Go Template',
+    'gotxt': 'Go Template',
+    'tscn': 'Godot Scene',
+    'gradle': 'Gradle',
+    'graphql': 'GraphQL',
+    'groovy': 'Groovy',
+    'grt': 'Groovy',
+    'gtpl': 'Groovy',
+    'gvy': 'Groovy',
+    'gw': 'Gwion',
+    'hcl': 'HCL',
+    'haml': 'HAML',
+    'hex': 'HEX',
+    'html': 'HTML',
+    'htm': 'HTML',
+    'hamlet': 'Hamlet',
+    'hbs': 'Handlebars',
+    'handlebars': 'Handlebars',
+    'y': 'Happy',
+    'ly': 'Happy',
+    'ha': 'Hare',
+    'hs': 'Haskell',
+    'hx': 'Haxe',
+    'idl': 'IDL',
+    'webidl': 'IDL',
+    'widl': 'IDL',
+    'ini': 'INI',
+    'idr': 'Idris',
+    'lidr': 'Idris',
+    'ihex': 'Intel HEX',
+    'thy': 'Isabelle',
+    'jai': 'JAI',
+    'jcl': 'JCL',
+    'jcls': 'JCL',
+    'fgmj': 'W.I.S.E. Jobfile',
+    'json5': 'JSON5',
+    'jsonc': 'JSONC',
+    'jsonl': 'JSONL',
+    'jsx': 'JSX',
+    'jade': 'Jade',
+    'janet': 'Janet',
+    'java': 'Java',
+    'js': 'JavaScript',
+    'cjs': 'JavaScript',
+    'mjs': 'JavaScript',
+    'jsp': 'JavaServer Pages',
+    'jenkinsfile': 'Jenkins Buildfile',
+    'jinja': 'Jinja',
+    'j2': 'Jinja',
+    'jinja2': 'Jinja',
+    'jsonnet': 'Jsonnet',
+    'libsonnet': 'Jsonnet',
+    'jl': 'Julia',
+    'julius': 'Julius',
+    'ipynb': 'Jupyter',
+    'jpynb': 'Jupyter',
+    'justfile': 'Just',
+    'k': 'K',
+    'ksh': 'Korn Shell',
+    'kt': 'Kotlin',
+    'kts': 'Kotlin',
+    'koto': 'Koto',
+    'lalrpop': 'LALRPOP',
+    'lds': 'LD Script',
+    'less': 'LESS',
+    'l': 'LEX',
+    'll': 'LLVM IR',
+    'lol': 'LOLCODE',
+    'lols': 'LOLCODE',
+    'tex': 'TeX',
+    'lean': 'Lean',
+    'hlean': 'Lean',
+    'lisp': 'Lisp',
+    'lsp': 'Lisp',
+    'ls': 'LiveScript',
+    'lua': 'Lua',
+    'luau': 'Luau',
+    'lucius': 'Lucius',
+    'luna': 'Luna',
+    'm': 'Objective C',
+    'mdx': 'MDX',
+    'mqh': 'MQL Header',
+    'mq4': 'MQL4',
+    'mq5': 'MQL5',
+    'csproj': 'MSBuild',
+    'vbproj': 'MSBuild',
+    'fsproj': 'MSBuild',
+    'vcproj': 'MSBuild',
+    'vcxproj': 'MSBuild',
+    'vcxproj.filters': 'MSBuild',
+    'ilproj': 'MSBuild',
+    'myapp': 'MSBuild',
+    'props': 'MSBuild',
+    'rdlc': 'MSBuild',
+    'resx': 'MSBuild',
+    'settings': 'MSBuild',
+    'sln': 'MSBuild',
+    'targets': 'MSBuild',
+    'mps': 'MUMPS',
+    'mxml': 'Macromedia eXtensible Markup Language',
+    'mad': 'Madlang',
+    'makefile': 'Makefile',
+    'mak': 'Makefile',
+    'mk': 'Makefile',
+    'bp': 'Makefile',
+    'mako': 'Mako',
+    'mao': 'Mako',
+    'md': 'Markdown',
+    'markdown': 'Markdown',
+    'maxpat': 'Max',
+    'metal': 'Metal',
+    'meson.build': 'Meson',
+    'meson_options.txt': 'Meson',
+    'm3': 'Modula3',
+    'mg': 'Modula3',
+    'ig': 'Modula3',
+    'i3': 'Modula3',
+    'def': 'Module-Definition',
+    'mc': 'Monkey C',
+    'mbt': 'Moonbit',
+    'mustache': 'Mustache',
+    'ndf': 'Nial',
+    'nim': 'Nim',
+    'nix': 'Nix',
+    'nu': 'Nushell',
+    'ml': 'OCaml',
+    'mli': 'OCaml',
+    'mm': 'Objective C++',
+    'odin': 'Odin',
+    'opa': 'Opalang',
+    'qasm': 'OpenQASM',
+    'tofu': 'OpenTofu',
+    'org': 'Org',
+    'oz': 'Oz',
+    'php': 'PHP',
+    'pkgbuild': 'PKGBUILD',
+    'fnc': 'PL/SQL',
+    'pkb': 'PL/SQL',
+    'pks': 'PL/SQL',
+    'prc': 'PL/SQL',
+    'trg': 'PL/SQL',
+    'vw': 'PL/SQL',
+    'prql': 'PRQL',
+    'psl': 'PSL Assertion',
+    'pas': 'Pascal',
+    'patch': 'Patch',
+    'pl': 'Perl',
+    'plx': 'Perl',
+    'pm': 'Perl',
+    'pi': 'Picat',
+    'pkl': 'Pkl',
+    'text': 'Plain Text',
+    'txt': 'Plain Text',
+    'polly': 'Polly',
+    'pony': 'Pony',
+    'ps': 'PostScript',
+    'ps1': 'Powershell',
+    'psm1': 'Powershell',
+    'pde': 'Processing',
+    'p': 'Prolog',
+    'pro': 'Prolog',
+    'properties': 'Properties File',
+    'proto': 'Protocol Buffers',
+    'pp': 'Puppet',
+    'purs': 'PureScript',
+    'py': 'Python',
+    'pyw': 'Python',
+    'pyi': 'Python',
+    'qs': 'Q#',
+    'qcl': 'QCL',
+    'qml': 'QML',
+    'r': 'R',
+    'rkt': 'Racket',
+    'raku': 'Raku',
+    'rakumod': 'Raku',
+    'rakutest': 'Raku',
+    'rakudoc': 'Raku',
+    't': 'Raku',
+    'cshtml': 'Razor',
+    'razor': 'Razor',
+    'res': 'ReScript',
+    'resi': 'ReScript',
+    'rst': 'ReStructuredText',
+    're': 'ReasonML',
+    'rei': 'ReasonML',
+    'reds': 'Redscript',
+    'rdl': 'Report Definition Language',
+    'robot': 'Robot Framework',
+    'rb': 'Ruby',
+    'rhtml': 'Ruby HTML',
+    'erb': 'Ruby HTML',
+    'rs': 'Rust',
+    'sas': 'SAS',
+    'il': 'SKILL',
+    'sno': 'SNOBOL',
+    'spdx': 'SPDX',
+    'spl': 'SPL',
+    'sql': 'SQL',
+    'dml': 'SQL',
+    'ddl': 'SQL',
+    'dql': 'SQL',
+    'srt': 'SRecode Template',
+    'svg': 'SVG',
+    'sass': 'Sass',
+    'scss': 'Sass',
+    'sc': 'Scala',
+    'scala': 'Scala',
+    'scl': 'Scallop',
+    'scm': 'Scheme',
+    'ss': 'Scheme',
+    'csig': 'Scons',
+    'sconstruct': 'Scons',
+    'sconscript': 'Scons',
+    'sh': 'Shell',
+    'sieve': 'Sieve',
+    'slang': 'Slang',
+    'slint': 'Slint',
+    'cs.st': 'Smalltalk',
+    'pck.st': 'Smalltalk',
+    'tpl': 'Smarty Template',
+    'smk': 'Snakemake',
+    'rules': 'Snakemake',
+    'sbl': 'Softbridge Basic',
+    'sol': 'Solidity',
+    'e': 'Specman e',
+    'ckt': 'Spice Netlist',
+    'stan': 'Stan',
+    'sml': 'Standard ML (SML)',
+    'do': 'Stata',
+    'ado': 'Stata',
+    'styl': 'Stylus',
+    'svelte': 'Svelte',
+    'swift': 'Swift',
+    'i': 'Swig',
+    'sv': 'SystemVerilog',
+    'svh': 'SystemVerilog',
+    'automount': 'Systemd',
+    'device': 'Systemd',
+    'link': 'Systemd',
+    'mount': 'Systemd',
+    'path': 'Systemd',
+    'scope': 'Systemd',
+    'service': 'Systemd',
+    'slice': 'Systemd',
+    'socket': 'Systemd',
+    'swap': 'Systemd',
+    'target': 'Systemd',
+    'timer': 'Systemd',
+    'tcl': 'TCL',
+    'tl': 'TL',
+    'toml': 'TOML',
+    'ttcn': 'TTCN-3',
+    'ttcn3': 'TTCN-3',
+    'ttcnpp': 'TTCN-3',
+    'tact': 'Tact',
+    'taskpaper': 'TaskPaper',
+    'sty': 'TeX',
+    'teal': 'Teal',
+    'templ': 'Templ',
+    'tt': 'Treetop',
+    'tt2': 'TemplateToolkit',
+    'tera': 'Tera',
+    'tf': 'Terraform',
+    'tfvars': 'Terraform',
+    'tf.json': 'Terraform',
+    'textile': 'Textile',
+    'thrift': 'Thrift',
+    'treetop': 'Treetop',
+    'twig': 'Twig Template',
+    'ts': 'TypeScript',
+    'tsx': 'TypeScript',
+    'd.ts': 'TypeScript Typings',
+    'tsp': 'TypeSpec',
+    'typ': 'Typst',
+    'uc': 'Unreal Script',
+    'uci': 'Unreal Script',
+    'upkg': 'Unreal Script',
+    'up': 'Up',
+    'ur': 'Ur/Web',
+    'urs': 'Ur/Web',
+    'urp': 'Ur/Web Project',
+    'vhd': 'VHDL',
+    'vhdl': 'VHDL',
+    'vala': 'Vala',
+    'vcl': 'Varnish Configuration',
+    'vg': 'Verilog',
+    'vh': 'Verilog',
+    'irunargs': 'Verilog Args File',
+    'xrunargs': 'Verilog Args File',
+    'vsh': 'Vertex Shader File',
+    'vim': 'Vim Script',
+    'vimrc': 'Vim Script',
+    'gvimrc': 'Vim Script',
+    'vb': 'Visual Basic',
+    'cls': 'Visual Basic for Applications',
+    'vue': 'Vue',
+    'wsdl': 'Web Services Description Language',
+    'wgsl': 'WebGPU Shading Language',
+    'rc': 'Windows Resource-Definition Script',
+    'nb': 'Wolfram',
+    'wl': 'Wolfram',
+    'wren': 'Wren',
+    'xaml': 'XAML',
+    'xml': 'XML',
+    'xsd': 'XML Schema',
+    'xcconfig': 'Xcode Config',
+    'xtend': 'Xtend',
+    'raml': 'RAML',
+    'rml': 'RAML',
+    'yarn': 'Yarn',
+    'zig': 'Zig',
+    'zok': 'ZoKrates',
+    'zsh': 'Zsh',
+    'zshenv': 'Zsh',
+    'zlogin': 'Zsh',
+    'zlogout': 'Zsh',
+    'zprofile': 'Zsh',
+    'zshrc': 'Zsh',
+    'bt': 'bait',
+    'hoon': 'hoon',
+    'jq': 'jq',
+    'm4': 'm4',
+    'nuspec': 'nuspec',
+    'sed': 'sed',
+    'wy': 'wenyan',
+    'rpg': 'RPG',
+    'rpgle': 'RPG',
+    'cl': 'RPG',
+    'mbr': 'RPG',
+    'ezt': 'EASYTRIEVE',
+    'ezy': 'EASYTRIEVE',
+    'ezp': 'EASYTRIEVE',
+    'etl': 'EASYTRIEVE',
+    'pli': 'PLI',
+    'pl1': 'PLI',
+    'pl/i': 'PLI',
+}
+
+# Language of each lower case file name
+FILENAMES = {
+    '.bash_login': 'BASH',
+    '.bash_logout': 'BASH',
+    '.bash_profile': 'BASH',
+    '.bashrc': 'BASH',
+    '.cshrc': 'C Shell',
+    '.dockerignore': 'Docker ignore',
+    'dockerfile': 'Dockerfile',
+    'gemfile': 'Gemfile',
+    '.kshrc': 'Korn Shell',
+    'license': 'License',
+    'licence': 'License',
+    'copying': 'License',
+    'copying3': 'License',
+    'unlicense': 'License',
+    'unlicence': 'License',
+    'license-apache': 'License',
+    'licence-apache': 'License',
+    'license-mit': 'License',
+    'licence-mit': 'License',
+    'copyright': 'License',
+    'makefile': 'Makefile',
+    'gnumakefile': 'Makefile',
+    'rake': 'Rakefile',
+    'rakefile': 'Rakefile',
+    '.tcshrc': 'Shell',
+    'snakefile': 'Snakemake',
+    '_vimrc': 'Vim Script',
+    '.vimrc': 'Vim Script',
+    '_gvimrc': 'Vim Script',
+    '.gvimrc': 'Vim Script',
+    'vimrc': 'Vim Script',
+    'gvimrc': 'Vim Script',
+    'xmake.lua': 'XMake',
+    'xpack.lua': 'XMake',
+    '.zshenv': 'Zsh',
+    '.zlogin': 'Zsh',
+    '.zlogout': 'Zsh',
+    '.zprofile': 'Zsh',
+    '.zshrc': 'Zsh',
+    '.gitignore': 'gitignore',
+    '.ignore': 'ignore',
+}
+
+# Language of each interpreter named by a shebang
+SHEBANGS = {
+    'awk': 'AWK',
+    'gawk': 'AWK',
+    'mawk': 'AWK',
+    'nawk': 'AWK',
+    'bash': 'BASH',
+    'csh': 'C Shell',
+    'tcsh': 'C Shell',
+    'dotnet': 'C#',
+    'rdmd': 'D',
+    'escript': 'Erlang',
+    'fish': 'Fish',
+    'gop': 'Go+',
+    'node': 'JavaScript',
+    'jsonnet': 'Jsonnet',
+    'ksh': 'Korn Shell',
+    'sbcl': 'Lisp',
+    'lua': 'Lua',
+    'luau': 'Luau',
+    'nu': 'Nushell',
+    'php': 'PHP',
+    'php5': 'PHP',
+    'perl': 'Perl',
+    'perl5': 'Perl',
+    'python': 'Python',
+    'python2': 'Python',
+    'python3': 'Python',
+    'Rscript': 'R',
+    'racket': 'Racket',
+    'raku': 'Raku',
+    'ruby': 'Ruby',
+    'spl': 'SPL',
+    'sh': 'Shell',
+    'tcl': 'TCL',
+    'zsh': 'Zsh',
+    'sed': 'sed',
+}
+
+# Extensions, line comment, multi line comment and string markers, nesting of the comments,
+# complexity checks, file names and shebang interpreters of each language
+RULES = {
+    'ABAP': (('abap',), ('*', '\\"'), (), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'ABNF': (('abnf',), (';',), (), (), False, ('=/ ', '/ ', '% ', '( '), (), ()),
+    'APL': (('apl', 'aplf', 'apln', 'aplc', 'dyalog'), ('⍝',), (), (("'", "'", False, False),), False, (':For ', ':If ', ':Case ', ':CaseList ', ':While ', ':Repeat ', ':Else ', '∨', '∧', '≠', '~', '¨', '=', ':'), (), ()),
+    'ASP': (('asa', 'asp'), ("'", 'REM'), (), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'ASP.NET': (('asax', 'ascx', 'asmx', 'aspx', 'master', 'sitemap', 'webinfo'), (), (('<!--', '-->'), ('<%--', '-->')), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'ATS': (('dats', 'sats', 'ats', 'hats'), ('//',), (('/*', '*/'), ('(*', '*)'), ('////', 'THISSHOULDNEVERAPPEARWEHOPE')), (('"', '"', False, False),), False, ('if ', 'if(', ' then ', ' else ', 'case+ ', 'ifcase', 'let ', 'and '), (), ()),
+    'AWK': (('awk',), ('#',), (), (('"', '"', False, False),), False, ('else ', 'for ', 'for(', 'if ', 'if(', 'switch ', 'switch(', 'while ', 'while(', '|| ', '&& ', '!= ', '== '), (), ('awk', 'gawk', 'mawk', 'nawk')),
+    'ActionScript': (('as',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Ada': (('ada', 'adb', 'ads', 'pad'), ('--',), (), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Agda': (('agda',), ('--',), (('{-', '-}'),), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Alchemist': (('crn',), ('#',), (), (), False, ('+', '->', '!'), (), ()),
+    'Alex': (('x',), (), (), (), False, (), (), ()),
+    'Alloy': (('als',), ('//', '--'), (('/*', '*/'),), (), False, ('implies ', 'else ', 'for ', '|| ', '&& ', '!= ', '== ', '<= ', '>= '), (), ()),
+    'Android Interface Definition Language': (('aidl',), ('//',), (('/**', '*/'), ('/*', '*/')), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'AppleScript': (('applescript',), ('#', '--'), (('(*', '*)'),), (('"', '"', False, False),), False, ('considering ', 'ignoring ', 'repeat ', 'while ', 'if ', 'else ', 'else if ', 'try ', 'on error ', 'and ', 'or '), (), ()),
+    'Arturo': (('art',), (';',), (), (('\\"', '\\"', False, False), ("'", "'", False, False)), False, ('loop ', 'map ', 'select ', 'if ', 'if? ', 'while ', 'function ', 'or? ', 'and? ', 'not? ', '<> ', '= '), (), ()),
+    'AsciiDoc': (('adoc',), (), (), (), False, (), (), ()),
+    'Assembly': (('s', 'asm'), (';',), (('/*', '*/'),), (('\\"', '\\"', False, False), ("'", "'", False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Astro': (('astro',), ('//',), (('<!--', '-->'), ('/*', '*/')), (('"', '"', False, False), ("'", "'", False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== ', '.map'), (), ()),
+    'AutoHotKey': (('ahk',), (';',), (('/*', '*/'),), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Autoconf': (('in',), ('#', 'dnl'), (), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Avro': (('avdl', 'avpr', 'avsc'), (), (), (), False, (), (), ()),
+    'BASH': (('bash', 'bash_login', 'bash_logout', 'bash_profile', 'bashrc'), ('#',), (), (('\\"', '\\"', False, False), ("'", "'", False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), ('.bash_login', '.bash_logout', '.bash_profile', '.bashrc'), ('bash',)),
+    'Basic': (('bas',), ("'",), (), (('\\"', '\\"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'elseif ', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Batch': (('bat', 'btm', 'cmd'), ('REM', '::'), (), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Bazel': (('bzl', 'build.bazel', 'build', 'workspace'), ('#',), (), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Bean': (('bean', 'beancount'), (';',), (), (('"', '"', False, False),), False, (), (), ()),
+    'Bicep': (('bicep',), ('//',), (('/*', '*/'),), (("'", "'", False, False),), False, ('@minLength(', '@maxLength(', '@secure(', '[for ', 'if(', 'if (', ' == ', ' != ', ' ? ', 'using ', 'range(', 'type ', 'func '), (), ()),
+    'Bitbake': (('bb', 'bbappend', 'bbclass'), ('#',), (), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Bitbucket Pipeline': (('bitbucket-pipelines.yml',), ('#',), (), (), False, (), (), ()),
+    'Blade template': (('blade.php',), (), (('{{--', '--}}'), ('<!--', '-->')), (), False, ('@for ', '@for(', '@foreach ', '@foreach(', '@forelse ', '@forelse(', '@each ', '@each (', '@while ', '@while(', '@if ', '@if(', '@unless ', '@unless(', '@isset ', '@isset(', '@empty ', '@empty(', '@else ', '@elseif ', '@elseif(', '@while ', '@while(', '@switch ', '@switch (', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Blueprint': (('blp',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, (), (), ()),
+    'Boo': (('boo',), ('//',), (('/*', '*/'),), (('"', '"', False, False), ("'", "'", False, False), ('"""', '"""', False, False)), False, ('for ', 'if ', 'elif ', 'unless ', ' and ', 'for ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Bosque': (('bsq',), ('//',), (), (('"', '"', False, False), ("'", "'", False, False)), False, ('if ', 'if(', 'switch ', 'match ', 'case ', '| ', '|| ', '& ', '&& ', '!= ', '!== ', '== ', '=== '), (), ()),
+    'Brainfuck': (('bf',), (), (), (), False, ('[', ']', '<', '>', '+', '-', '.', ','), (), ()),
+    'BuildStream': (('bst',), ('#',), (), (), False, (), (), ()),
+    'C': (('c', 'ec', 'pgc'), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'switch(', 'while ', 'while(', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'C Header': (('h',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'switch(', 'case ', 'while ', 'while(', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'C3': (('c3',), ('//',), (('/*', '*/'), ('<*', '*>')), (('"', '"', False, False), ('`', '`', True, False)), False, ('for ', 'for(', 'foreach ', 'foreach(', 'if ', 'if(', 'switch ', 'switch(', 'case ', 'while ', 'while(', 'else ', '|| ', '&& ', '!= ', '== ', 'defer ', 'macro '), (), ()),
+    'C Shell': (('csh',), ('#',), (), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), ('.cshrc',), ('csh', 'tcsh')),
+    'C#': (('cs', 'csx'), ('//',), (('/*', '*/'),), (('@"', '"', True, False), ('"', '"', False, False)), False, ('for ', 'for(', 'if ', 'if(', 'foreach ', 'foreach(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ('dotnet',)),
+    'C++': (('cc', 'cpp', 'cxx', 'c++', 'pcc', 'ino', 'ccm', 'cppm', 'cxxm', 'c++m', 'mxx'), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'switch(', 'while ', 'while(', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'C++ Header': (('hh', 'hpp', 'hxx', 'inl', 'ipp', 'ixx'), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'switch(', 'while ', 'while(', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'CMake': (('cmake', 'cmakelists.txt'), ('#',), (('#[[', ']]'),), (('"', '"', False, False),), False, ('foreach ', 'foreach(', 'if ', 'if(', 'elseif ', 'elseif(', 'while ', 'while(', 'else ', 'else(', 'OR ', 'AND ', 'EQUAL ', 'STREQUAL ', 'VERSION_EQUAL ', 'PATH_EQUAL '), (), ()),
+    'COBOL': (('cob', 'cbl', 'ccp', 'cobol', 'cpy'), ('*',), (), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'CSS': (('css',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'CSV': (('csv',), (), (), (), False, (), (), ()),
+    'Cabal': (('cabal',), ('--',), (('{-', '-}'),), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Cairo': (('cairo',), ('//',), (), (("'", "'", False, False),), False, ('loop ', 'if ', 'if(', 'match ', 'match(', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Cangjie': (('cj',), ('//',), (('/*', '*/'),), (("'", "'", False, False), ('"', '"', False, False), ('"""', '"""', False, False), ("'''", "'''", False, False)), False, ('for ', 'for(', 'if ', 'if(', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    "Cap'n Proto": (('capnp',), ('#',), (), (), False, (), (), ()),
+    'Cassius': (('cassius',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Ceylon': (('ceylon',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Chapel': (('chpl',), ('//',), (('/*', '*/'),), (('"', '"', False, False), ("'", "'", False, False)), False, ('for ', 'if ', 'switch ', 'while ', 'else ', 'do ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Circom': (('circom',), ('//',), (('/*', '*/'),), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'while(', 'else ', 'else(', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Clipper': (('prg', 'ch'), ('//', '&&'), (('/*', '*/'),), (('"', '"', False, False), ("'", "'", False, False)), False, ('for ', 'for(', 'if ', 'if(', 'do while ', 'while ', 'else ', 'elseif ', 'else(', 'switch ', 'case ', 'otherwise ', 'begin sequence ', 'end sequence ', 'begin sequence(', 'try ', 'catch ', 'finally ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Clojure': (('clj', 'cljc'), (';',), (), (), False, ('(for ', '(when ', '(loop ', '(doseq ', '(cond ', '(if', '(if-not ', '(and ', '(or ', '(not ', '(= ', '(not= ', '(recur '), (), ()),
+    'ClojureScript': (('cljs',), (';',), (), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Closure Template': (('soy',), ('//',), (('/**', '*/'), ('/*', '*/')), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== ', '>= ', '<= ', '?: ', '? : '), (), ()),
+    'CloudFormation (JSON)': (('json',), (), (), (), False, ('!GetAtt', '!Sub', '!Select', '!Equals', '!If', 'DependsOn:', '!Select', '!Equals', '!If', 'Fn::If', 'Fn::And', 'Fn::Equals', 'Fn::Not', 'Fn::Or', 'Fn::Base64', 'Fn::Cidr', 'Fn::FindInMap', 'Fn::GetAtt', 'Fn::GetAZs', 'Fn::ImportValue', 'Fn::Join', 'Fn::Select', 'Fn::Split', 'Fn::Sub', 'Fn::Transform'), (), ()),
+    'CloudFormation (YAML)': (('yaml', 'yml'), ('#',), (), (), False, ('!GetAtt', '!Sub', '!Select', '!Equals', '!If', 'DependsOn:', '!Select', '!Equals', '!If', 'Fn::If', 'Fn::And', 'Fn::Equals', 'Fn::Not', 'Fn::Or', 'Fn::Base64', 'Fn::Cidr', 'Fn::FindInMap', 'Fn::GetAtt', 'Fn::GetAZs', 'Fn::ImportValue', 'Fn::Join', 'Fn::Select', 'Fn::Split', 'Fn::Sub', 'Fn::Transform'), (), ()),
+    'CodeQL': (('ql', 'qll'), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('and ', 'or ', 'implies ', 'if ', 'else ', 'not ', 'instanceof ', 'in ', 'exists(', 'forall( ', 'avg(', 'concat(', 'count(', 'max(', 'min(', 'rank(', 'strictconcat(', 'strictcount(', 'strictsum(', 'sum('), (), ()),
+    'CoffeeScript': (('coffee',), ('#',), (('###', '###'),), (('\\"', '\\"', False, False), ("'", "'", False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Cogent': (('cogent',), ('--',), (), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'ColdFusion': (('cfm',), (), (('<!---', '--->'),), (('\\"', '\\"', False, False), ("'", "'", False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'ColdFusion CFScript': (('cfc',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Coq': (('v',), (), (('(*', '*)'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Creole': (('creole',), (), (), (), False, (), (), ()),
+    'Crystal': (('cr',), ('#',), (), (('\\"', '\\"', False, False), ("'", "'", False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Cuda': (('cu',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Cython': (('pyx', 'pxi', 'pxd'), ('#',), (), (('\\"', '\\"', False, False), ("'", "'", False, False), ('\\"\\"\\"', '\\"\\"\\"', False, False), ("'''", "'''", False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', 'and ', 'or ', 'not ', 'in '), (), ()),
+    'D': (('d',), ('//',), (('/*', '*/'), ('/+', '+/')), (('"', '"', False, False), ("'", "'", False, False)), True, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ('rdmd',)),
+    'DAML': (('daml',), ('--',), (('{-', '-}'),), (), False, ('if ', 'then ', 'else ', '|| ', '&& ', '/= ', '== ', 'case ', 'do {', 'forall '), (), ()),
+    'DM': (('dm',), ('//',), (('/*', '*/'),), (('"', '"', False, False), ("'", "'", False, False)), True, ('for ', 'for(', 'if ', 'if(', 'switch ', 'switch(', 'while ', 'while(', 'else ', '||', '&&', '!=', '<>', '==', 'in '), (), ()),
+    'DOT': (('dot', 'gv'), ('//', '#'), (('/*', '*/'),), (), False, (), (), ()),
+    'Dart': (('dart',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Device Tree': (('dts', 'dtsi'), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Dhall': (('dhall',), ('--',), (('{-', '-}'),), (('"', '"', False, False),), False, (), (), ()),
+    'Docker ignore': ((), ('#', '//'), (), (), False, (), ('.dockerignore',), ()),
+    'Dockerfile': (('dockerfile',), ('#',), (), (('\\"', '\\"', False, False), ("'", "'", False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), ('dockerfile',), ()),
+    'Document Type Definition': (('dtd',), (), (), (), False, (), (), ()),
+    'Elixir': (('ex', 'exs'), ('#',), (), (('"""', '"""', False, False), ('"', '"', False, False), ("'''", "'''", False, False), ("'", "'", False, False)), False, ('case ', 'cond ', 'if ', 'for ', 'with ', 'try ', 'catch ', 'rescue ', 'else ', 'and ', 'or ', 'not ', '|| ', '&& ', '!= ', '== ', '|> '), (), ()),
+    'Elixir Template': (('eex',), ('#',), (('<!--', '-->'),), (('"""', '"""', False, False), ('"', '"', False, False), ("'''", "'''", False, False), ("'", "'", False, False)), False, ('case ', 'cond ', 'if ', 'for ', 'with ', 'try ', 'catch ', 'rescue ', 'else ', 'and ', 'or ', 'not ', '|| ', '&& ', '!= ', '== ', '|> ', '<% '), (), ()),
+    'Phoenix LiveView': (('heex', 'leex'), ('#', '<!--'), (('<!--', '-->'),), (('\\"\\"\\"', '\\"\\"\\"', False, False), ('\\"', '\\"', False, False), ("'''", "'''", False, False), ("'", "'", False, False)), False, ('case ', 'cond ', 'if ', 'for ', 'with ', 'try ', 'catch ', 'rescue ', 'else ', 'and ', 'or ', 'not ', '|| ', '&& ', '!= ', '== ', '|> ', '<% ', '<. '), (), ()),
+    'Elm': (('elm',), ('--',), (('{-', '-}'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'case ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Emacs Dev Env': (('ede',), (';',), (), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Emacs Lisp': (('el',), (';',), (), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'EmiT': (('emit',), ('//',), (), (('"', '"', False, False),), False, ('if ', 'if(', 'warp ', 'time ', 'kills ', 'collapse ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Erlang': (('erl', 'hrl'), ('%',), (), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ('escript',)),
+    'Expect': (('exp',), ('#',), (), (('\\"', '\\"', False, False), ("'", "'", False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Extensible Stylesheet Language Transformations': (('xslt', 'xsl'), (), (), (), False, (), (), ()),
+    'F#': (('fs', 'fsi', 'fsx', 'fsscript'), ('//',), (('(*', '*)'),), (), False, ('for ', 'for(', 'if ', 'if(', 'match ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'F*': (('fst',), (), (('(*', '*)'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'FIDL': (('fidl',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'FORTRAN Legacy': (('f', 'for', 'ftn', 'f77', 'pfo'), ('c', 'C', '!', '*'), (), (('\\"', '\\"', False, False), ("'", "'", False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'FSL': (('fsl',), ('//',), (), (), False, ('->', '<-'), (), ()),
+    'FXML': (('fxml',), (), (('<!--', '-->'),), (('"', '"', False, False),), False, (), (), ()),
+    'Factor': (('factor',), ('!',), (('![[', ']]'), ('![=[', ']=]'), ('![==[', ']==]'), ('![===[', ']===]'), ('![====[', ']====]'), ('![=====[', ']=====]'), ('![======[', ']======]'), ('/*', '*/'), ('((', '))')), (('"', '"', False, False), ('STRING:', ';', False, False), ('[======[', ']======]', False, False), ('[=====[', ']====]', False, False), ('[====[', ']====]', False, False), ('[===[', ']===]', False, False), ('[==[', ']==]', False, False), ('[=[', ']=]', False, False), ('[[', ']]', False, False)), False, ('if', 'when', 'unless', 'if*', 'when*', 'unless*', '?if', '?', 'cond', 'case', 'cond>quot', 'case>quot', 'alist>quot', 'while', 'until', 'loop', '0&&', '1&&', '2&&', '3&&', 'n&&', '&&', '0||', '1||', '2||', '3||', 'n||', '||', 'and', 'or', 'xor', 'eq', '=', 'smart-if', 'smart-if*', 'smart-when', 'smart-when*', 'smart-unless', 'smart-unless*'), (), ()),
+    'Fennel': (('fnl',), (';',), (), (('"', '"', False, False), (',', "'", False, False)), False, ('(for', '(each', '(if', '(when', '(while', '(switch', '(do', '(..', '(=', '(and', '(or'), (), ()),
+    'Fish': (('fish',), ('#',), (), (('\\"', '\\"', False, False), ("'", "'", False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ('fish',)),
+    'Flow9': (('flow',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('if ', 'if(', 'else ', 'else{', 'fori ', 'fori(', 'switch ', 'switch(', 'fold ', 'fold(', '|| ', '&& ', '!= ', '== ', '|> '), (), ()),
+    'Forth': (('4th', 'forth', 'fr', 'frt', 'fth', 'f83', 'fb', 'fpm', 'e4', 'rx', 'ft'), ('\\\\',), (('( ', ')'),), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Fortran Modern': (('f03', 'f08', 'f90', 'f95'), ('!',), (), (('\\"', '\\"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Fragment Shader File': (('fsh',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Freemarker Template': (('ftl',), (), (('<#--', '-->'),), (), False, ('<#list ', '<#assign ', '<#if ', '<#elseif ', '<#else>', '<#else> ', '<#switch  ', '<#case ', '<#default>', '<#default> ', '!= ', '== '), (), ()),
+    'Futhark': (('fut',), ('--',), (), (), False, ('if ', 'else ', 'then ', 'for ', 'loop ', 'while ', '|| ', '&& ', '!= ', '>= ', '<= '), (), ()),
+    'GDScript': (('gd',), ('#',), (), (('"', '"', False, False), ("'", "'", False, False), ('"""', '"""', False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'GLSL': (('vert', 'tesc', 'tese', 'geom', 'frag', 'comp', 'glsl'), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'GN': (('gn', 'gni'), ('#',), (), (('"', '"', False, False),), False, ('if(', 'if (', 'else if(', 'else if (', 'else(', 'else (', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Game Maker Language': (('gml',), ('//', '///'), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', 'repeat ', 'repeat(', '|| ', 'or ', '&& ', 'and ', '!= ', '== '), (), ()),
+    'Game Maker Project': (('yyp',), (), (), (), False, (), (), ()),
+    'Gemfile': ((), ('#',), (), (('\\"', '\\"', False, False), ("'", "'", False, False)), False, (), ('gemfile',), ()),
+    'Gherkin Specification': (('feature',), ('#',), (), (), False, ('given', 'when', 'then', 'and'), (), ()),
+    'Gleam': (('gleam',), ('//', '///', '////'), (), (('"', '"', False, False),), False, ('fn ', 'case ', '-> ', 'if '), (), ()),
+    'Go': (('go',), ('//',), (('/*', '*/'),), (('"', '"', False, False), ('`', '`', True, False)), False, ('go ', 'for ', 'for(', 'if ', 'if(', 'switch ', 'select ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Go+': (('gop',), ('//', '#'), (('/*', '*/'),), (('"', '"', False, False), ('`', '`', True, False)), False, ('go ', 'for ', 'for(', 'if ', 'if(', 'switch ', 'select ', 'else ', '|| ', '&& ', '!= ', '== ', '?:'), (), ('gop',)),
+    'Go Template': (('tmpl', 'gohtml', 'gotxt'), (), (('{{/*', '*/}}'),), (), False, ('{{if ', '{{ if ', '{{else', '{{ else', '{{range ', '{{ range ', '{{with', '{{ with'), (), ()),
+    'Godot Scene': (('tscn',), (), (), (), False, (), (), ()),
+    'Gradle': (('gradle',), ('//',), (), (("'", "'", False, False), ('"', '"', False, False)), False, (), (), ()),
+    'GraphQL': (('graphql',), ('#',), (('"""', '"""'),), (('"', '"', False, False), ('"""', '"""', False, True)), False, ('type ', 'input ', 'query ', 'mutation ', 'subscription ', 'directive ', 'scalar ', 'enum ', 'interface ', 'union ', 'fragment '), (), ()),
+    'Groovy': (('groovy', 'grt', 'gtpl', 'gvy'), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Gwion': (('gw',), ('#!',), (), (('"', '"', False, False),), False, ('fun ', 'while(', 'while (', 'repeat(', 'repeat (', 'if (', 'if('), (), ()),
+    'HCL': (('hcl',), ('#',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for_each ', 'for ', 'count ', 'coalesce(', '== ', '!= ', '> ', '< ', '&& ', '|| '), (), ()),
+    'HAML': (('haml',), ('-#',), (), (), False, (), (), ()),
+    'HEEx': (('heex',), (), (('<%!--', '--%>'),), (('"', '"', False, False),), False, ('case ', 'cond ', 'if ', 'for ', 'with ', 'try ', 'catch ', 'rescue ', 'else ', 'and ', 'or ', 'not ', '!= ', '== ', '|| ', '&& ', '|> '), (), ()),
+    'HEX': (('hex',), (), (), (), False, (), (), ()),
+    'HTML': (('html', 'htm'), (), (('<!--', '-->'),), (('"', '"', False, False),), False, (), (), ()),
+    'Hamlet': (('hamlet',), (), (('<!--', '-->'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Handlebars': (('hbs', 'handlebars'), (), (('<!--', '-->'), ('{{!', '}}')), (('\\"', '\\"', False, False), ("'", "'", False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Happy': (('y', 'ly'), (), (), (), False, (), (), ()),
+    'Hare': (('ha',), ('//',), (), (('"', '"', False, False), ('`', '`', False, False)), False, ('for ', 'if ', 'else ', 'match ', 'switch ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Haskell': (('hs',), ('--',), (('{-', '-}'),), (), False, ('if ', 'then ', 'else ', '|| ', '&& ', '/= ', '== ', 'case ', 'do {', 'forall '), (), ()),
+    'Haxe': (('hx',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'IDL': (('idl', 'webidl', 'widl'), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'INI': (('ini',), ('#', ';'), (), (), False, (), (), ()),
+    'Idris': (('idr', 'lidr'), ('--',), (('{-', '-}'),), (('\\"', '\\"', False, False), ('\\"\\"\\"', '\\"\\"\\"', False, False)), True, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Intel HEX': (('ihex',), (), (), (), False, (), (), ()),
+    'Isabelle': (('thy',), ('--',), (('{*', '*}'), ('(*', '*)'), ('‹', '›'), ('\\\\<open>', '\\\\<close>')), (("''", "''", False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'JAI': (('jai',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), True, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'JCL': (('jcl', 'jcls'), ('//*',), (), (("'", "'", False, False),), False, (' IF', ' THEN', ' ELSE', ' PROC=', ' PGM=', ' DD ', ' EXEC ', ' JOB ', ' COND=', ' INCLUDE', ' PEND'), (), ()),
+    'W.I.S.E. Jobfile': (('fgmj',), (), (), (), False, (), (), ()),
+    'JSON': (('json',), (), (), (), False, (), (), ()),
+    'JSON5': (('json5',), ('//',), (), (), False, (), (), ()),
+    'JSONC': (('jsonc',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, (), (), ()),
+    'JSONL': (('jsonl',), (), (), (), False, (), (), ()),
+    'JSX': (('jsx',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Jade': (('jade',), ('//-',), (), (), False, ('if ', 'else if ', 'unless '), (), ()),
+    'Janet': (('janet',), ('#',), (), (('"', '"', False, False), ('``', '``', False, False), ('@"', '"', False, False)), False, ('(if ', '(for ', '(for ', '(cond ', '(switch ', '(when ', '(while ', '(loop ', '(case '), (), ()),
+    'Java': (('java',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'JavaScript': (('js', 'cjs', 'mjs'), ('//',), (('/*', '*/'),), (('"', '"', False, False), ("'", "'", False, False), ('`', '`', False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== ', '?.', '?? ', '??= '), (), ('node',)),
+    'JavaServer Pages': (('jsp',), ('//',), (('/*', '*/'),), (('"', '"', False, False), ("'", "'", False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Jenkins Buildfile': (('jenkinsfile',), (), (), (), False, (), (), ()),
+    'Jinja': (('jinja', 'j2', 'jinja2'), (), (('{#', '#}'),), (), False, ('{% for ', '{%- for ', '{% if ', '{%- if ', '{% else ', '{%- else ', '{% elif ', '{% macro ', '{%- macro ', '{% call ', '{%- call ', '{% filter ', '{%- filter ', '{% set ', '{% include ', '{% from ', '{% extends ', '{% with '), (), ()),
+    'Jsonnet': (('jsonnet', 'libsonnet'), ('#', '//'), (('/*', '*/'),), (('"', '"', False, False), ("'", "'", False, False), ('|||', '|||', False, False), ('@"', '"', False, False), ("@'", "'", False, False)), False, ('for', 'if', 'else', '||', '&&', '!=', '=='), (), ('jsonnet',)),
+    'Julia': (('jl',), ('#',), (('#=', '=#'),), (('\\"', '\\"', False, False), ('\\"\\"\\"', '\\"\\"\\"', False, False)), True, ('for ', 'for(', 'if ', 'if(', 'while ', 'else ', 'elseif ', 'elseif(', 'try ', 'catch ', 'finally ', '|| ', '&& '), (), ()),
+    'Julius': (('julius',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Jupyter': (('ipynb', 'jpynb'), (), (), (), False, (), (), ()),
+    'Just': (('justfile',), ('#',), (), (('\\"', '\\"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'K': (('k',), ('/',), (), (('"', '"', False, False),), False, ("'", '/', '\\', "':", '/:', '\\:', '|', '&', '!', '='), (), ()),
+    'Korn Shell': (('ksh',), ('#',), (), (('\\"', '\\"', False, False), ("'", "'", False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), ('.kshrc',), ('ksh',)),
+    'Kotlin': (('kt', 'kts'), ('//',), (('/*', '*/'),), (('"', '"', False, False),), True, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Koto': (('koto',), ('#',), (('#-', '-#'),), (('"', '"', False, False), ("'", "'", False, False)), True, ('for ', 'while ', 'until ', 'continue ', 'break ', 'loop ', 'if ', 'switch ', 'match ', 'then', 'else ', '|| ', '&& ', '!= ', '== ', 'and ', 'or ', 'not '), (), ()),
+    'LALRPOP': (('lalrpop',), ('//',), (('/*', '*/'),), (('"', '"', False, False), ('\\"', '\\"', False, False), ('\\"#', '#\\"', False, False), ('\\"##', 'r##\\"', False, False), ('\\"#', 'r#\\"', False, False)), True, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== ', 'match '), (), ()),
+    'LD Script': (('lds',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'LESS': (('less',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, (), (), ()),
+    'LEX': (('l',), (), (('/*', '*/'),), (), False, (), (), ()),
+    'LLVM IR': (('ll',), (';',), (), (('"', '"', False, False),), False, ('llvm.loop', 'br ', 'switch ', 'indirectbr ', 'invoke ', 'callbr ', 'resume ', 'catchswitch ', 'catchret ', 'cleanupret ', 'shl ', 'lshr ', 'ashr ', 'and ', 'or ', 'xor '), (), ()),
+    'LOLCODE': (('lol', 'lols'), ('BTW',), (('OBTW', 'TLDR'),), (('"', '"', False, False),), False, ('AWSUM THX ', 'O NOES ', 'PLZ OPEN FILE ', 'IM IN YR ', 'O RLY?', 'O RLY? ', 'WTF?', 'WTF? '), (), ()),
+    'LaTeX': (('tex',), ('%',), (), (), False, (), (), ()),
+    'Lean': (('lean', 'hlean'), ('--',), (('/-', '-/'),), (), True, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'License': ((), (), (), (), False, (), ('license', 'licence', 'copying', 'copying3', 'unlicense', 'unlicence', 'license-apache', 'licence-apache', 'license-mit', 'licence-mit', 'copyright'), ()),
+    'Lisp': (('lisp', 'lsp'), (';',), (('#|', '|#'),), (), True, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ('sbcl',)),
+    'LiveScript': (('ls',), ('#',), (('/*', '*/'),), (('"', '"', False, False), ("'", "'", False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'case ', 'while ', 'when ', 'else ', '|| ', '&& ', '!= ', '!== ', 'xor ', 'and ', 'or ', '|> ', '<< ', '<<< ', '<<<< ', '>> ', '== '), (), ()),
+    'Lua': (('lua',), ('--',), (('--[[', ']]'), ('--[=[', ']=]'), ('--[==[', ']==]'), ('--[===[', ']===]'), ('--[====[', ']====]'), ('--[=====[', ']=====]')), (('"', '"', False, False), ("'", "'", False, False), (']]', '[[', True, False)), False, ('for ', 'for(', 'if ', 'if(', 'while ', 'while(', 'else ', 'else(', 'elseif ', 'elseif(', 'until ', 'until(', 'or ', 'and ', '~= ', '== '), (), ('lua',)),
+    'Luau': (('luau',), ('--',), (('--[[', ']]'), ('--[=[', ']=]'), ('--[==[', ']==]'), ('--[===[', ']===]'), ('--[====[', ']====]'), ('--[=====[', ']=====]')), (('"', '"', False, False), ("'", "'", False, False), ('`', '`', False, False), (']]', '[[', True, False)), False, ('for ', 'for(', 'if ', 'if(', 'while ', 'while(', 'else ', 'else(', 'elseif ', 'elseif(', 'until ', 'until(', 'or ', 'and ', '~= ', '== '), (), ('luau',)),
+    'Lucius': (('lucius',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Luna': (('luna',), ('#',), (), (('\\"', '\\"', False, False), ("'", "'", False, False)), False, (), (), ()),
+    'MATLAB': (('m',), ('%',), (('%{', '}%'),), (("'", "'", False, False),), False, ('if ', 'elseif ', 'case ', 'otherwise ', 'try', 'for ', 'while '), (), ()),
+    'MDX': (('mdx',), (), (), (), False, (), (), ()),
+    'MQL Header': (('mqh',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'MQL4': (('mq4',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'MQL5': (('mq5',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'MSBuild': (('csproj', 'vbproj', 'fsproj', 'vcproj', 'vcxproj', 'vcxproj.filters', 'ilproj', 'myapp', 'props', 'rdlc', 'resx', 'settings', 'sln', 'targets'), (), (('<!--', '-->'),), (('"', '"', False, False),), False, ('Condition',), (), ()),
+    'MUMPS': (('mps',), (';',), (), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Macromedia eXtensible Markup Language': (('mxml',), (), (), (), False, (), (), ()),
+    'Madlang': (('mad',), ('#',), (('{#', '#}'),), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Makefile': (('makefile', 'mak', 'mk', 'bp'), ('#',), (), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), ('makefile', 'gnumakefile'), ()),
+    'Mako': (('mako', 'mao'), ('##',), (('<%doc>', '</%doc>'),), (), False, ('% for ', '% if ', '% else ', '% elif ', '<% include ', '<%def ', '<%page ', '<%def ', '<%block ', '<%namespace ', '<%inherit '), (), ()),
+    'Markdown': (('md', 'markdown'), (), (), (), False, (), (), ()),
+    'Max': (('maxpat',), (), (), (), False, (), (), ()),
+    'Metal': (('metal',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'switch(', 'while ', 'while(', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Meson': (('meson.build', 'meson_options.txt'), ('#',), (), (("'", "'", False, False), ("'''", "'''", False, False)), False, ('foreach ', 'if ', 'elif ', 'unless ', 'and ', 'or ', 'else '), (), ()),
+    'Modula3': (('m3', 'mg', 'ig', 'i3'), ('#',), (('(*', '*)'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Module-Definition': (('def',), (';',), (), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Monkey C': (('mc',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Moonbit': (('mbt',), ('//',), (), (('"', '"', False, False),), False, ('for ', 'if ', 'switch ', 'while ', 'else ', 'loop ', 'guard ', '|| ', '&& ', '!= ', '== ', 'match '), (), ()),
+    'Mustache': (('mustache',), (), (('{{!', '}}'),), (('\\"', '\\"', False, False), ("'", "'", False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Nial': (('ndf',), ('%',), (), (("'", "'", False, False),), False, ('case ', 'for ', 'if ', 'repeat ', 'while ', 'or ', 'and ', '= ', 'equal ', '~= ', 'unequal '), (), ()),
+    'Nim': (('nim',), ('#',), (), (('\\"', '\\"', False, False), ('\\"\\"\\"', '\\"\\"\\"', False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Nix': (('nix',), ('#',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Nushell': (('nu',), ('#',), (), (('"', '"', False, False), ("'", "'", False, False)), False, ('for ', 'do { ', 'each {', 'if ', '|| ', '&& ', '!= ', '== '), (), ('nu',)),
+    'OCaml': (('ml', 'mli'), (), (('(*', '*)'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Objective C': (('m',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Objective C++': (('mm',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Odin': (('odin',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'when ', 'switch ', 'defer ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Opalang': (('opa',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'OpenQASM': (('qasm',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'if ', 'if(', 'switch ', 'switch(', 'while ', 'while(', 'else ', 'else(', '|| ', '&& ', '!= ', '== '), (), ()),
+    'OpenTofu': (('tofu',), ('#', '//'), (('/*', '*/'),), (), False, ('count', 'for', 'for_each', 'if', ': ', '? ', '|| ', '&& ', '!= ', '> ', '>= ', '< ', '<= ', '== '), (), ()),
+    'Org': (('org',), ('# ',), (), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Oz': (('oz',), ('%',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'PHP': (('php',), ('#', '//'), (('/*', '*/'),), (('\\"', '\\"', False, False), ("'", "'", False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ('php', 'php5')),
+    'PKGBUILD': (('pkgbuild',), (), (), (), False, (), (), ()),
+    'PL/SQL': (('fnc', 'pkb', 'pks', 'prc', 'trg', 'vw'), ('--',), (('/*', '*/'),), (("'", "'", False, False),), False, ('and ', 'and(', 'else ', 'else(', 'elseif ', 'elseif(', 'if ', 'if(', 'loop ', 'not ', 'not(', 'or ', 'or(', '<> ', '<>(', '= ', '=('), (), ()),
+    'PRQL': (('prql',), ('#',), (), (('"', '"', False, False), ("'", "'", False, False), ('"""', '"""', False, True), ("'''", "'''", False, True), ('r"""', '"""', False, True), ("r'''", "'''", False, True)), False, ('case ', '&& ', '|| ', '!= ', '== ', '~= '), (), ()),
+    'PSL Assertion': (('psl',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Pascal': (('pas',), ('//',), (('{', '}'), ('(*', '*)')), (("'", "'", False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== ', 'AND ', 'OR ', 'IF ', 'ELSE '), (), ()),
+    'Patch': (('patch',), (), (), (), False, (), (), ()),
+    'Perl': (('pl', 'plx', 'pm'), ('#',), (('=pod', '=cut'),), (('"', '"', False, False), ("'", "'", False, False)), False, ('for ', 'for(', 'foreach ', 'foreach(', 'if ', 'if(', 'elsif ', 'elsif(', 'while ', 'while(', 'until ', 'until(', 'unless ', 'unless(', 'given ', 'given(', 'when ', 'when(', 'catch ', 'catch(', 'eq ', 'ne ', 'else ', 'and ', 'or ', '|| ', '&& ', '!= ', '== '), (), ('perl', 'perl5')),
+    'Picat': (('pi',), ('%',), (('/*', '*/'),), (('"', '"', False, False),), False, ('do ', 'foreach ', 'foreach(', 'if ', 'if(', 'switch ', 'while ', 'while(', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Pkl': (('pkl',), ('//',), (('/*', '*/'),), (('"', '"', False, False), ('"#', '#"', False, False), ('"##', '##"', False, False), ('"""', '"""', True, False)), False, ('function ', '?? ', '?.', 'ifNonNull(', 'if ', ' else ', '.map', 'for ', 'when ', '...'), (), ()),
+    'Plain Text': (('text', 'txt'), (), (), (), False, (), (), ()),
+    'Polly': (('polly',), (), (('<!--', '-->'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Pony': (('pony',), ('//',), (('/*', '*/'),), (('"', '"', False, False), ('\\"\\"\\"', '\\"\\"\\"', False, False)), False, ('for ', 'if ', 'match ', 'repeat', 'while ', 'else ', 'elseif ', '| ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'PostScript': (('ps',), ('%',), (), (('(', ')', False, False), ('<', '>', False, False), ('<~', '~>', False, False)), False, ('if', 'ifelse', 'for', 'repeat', 'loop', 'forall', 'pathforall', 'eq', 'ne', 'not', 'and', 'or'), (), ()),
+    'Powershell': (('ps1', 'psm1'), ('#',), (('<#', '#>'),), (('"', '"', False, False),), False, ('while ', 'while(', 'until ', 'until(', 'for ', 'for(', 'foreach ', 'foreach(', 'if ', 'elseif ', 'else ', 'switch', 'switch(', '-gt', '-lt', '-eq', '-ne', '-ge', '-le', '-in', '-notin', '-contains', '-notcontains'), (), ()),
+    'Processing': (('pde',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Prolog': (('p', 'pro'), ('%',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Properties File': (('properties',), ('#',), (), (), False, (), (), ()),
+    'Protocol Buffers': (('proto',), ('//',), (('/*', '*/'),), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Puppet': (('pp',), ('#',), (('=begin', '=end'),), (('\\"', '\\"', False, False), ("'", "'", False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'PureScript': (('purs',), ('--',), (('{-', '-}'),), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Python': (('py', 'pyw', 'pyi'), ('#',), (), (('"', '"', False, False), ("'", "'", False, False), ("r'", "'", True, False), ('r"', '"', True, False), ('"""', '"""', False, True), ("'''", "'''", False, True), ('r"""', '"""', True, True), ("r'''", "'''", True, True), ('f"""', '"""', False, True), ("f'''", "'''", False, True)), False, ('for ', 'for(', 'while ', 'while(', 'if ', 'if(', 'elif ', 'elif(', 'else ', 'else:', 'match ', 'match(', 'try ', 'try:', 'except ', 'except:', 'finally ', 'finally:', 'with ', 'with (', 'and ', 'and(', 'or ', 'or('), (), ('python', 'python2', 'python3')),
+    'Q#': (('qs',), ('//',), (), (('"', '"', False, False),), False, ('for ', 'for(', 'repeat ', 'repeat{', 'until (', 'until(', 'if ', 'if(', 'elif ', 'elif{', 'else ', 'else{', '||| ', '&&& ', '<<<', '>>>', '^^^', '~~~', '!= ', '== '), (), ()),
+    'QCL': (('qcl',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'QML': (('qml',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'R': (('r',), ('#',), (), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ('Rscript',)),
+    'Racket': (('rkt',), (';',), (('|#', '#|'),), (('"', '"', False, False),), True, ('(if', '(cond', '[else', '(and', '(or', '(for', '#:when', '#:unless', '#:break', '#:final', '(do', '(when', '(unless', '(shared', '(case'), (), ('racket',)),
+    'Rakefile': ((), ('#',), (('=begin', '=end'),), (('\\"', '\\"', False, False), ("'", "'", False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), ('rake', 'rakefile'), ()),
+    'Raku': (('raku', 'rakumod', 'rakutest', 'rakudoc', 't'), ('#',), (('=begin', '=end'), ('#`(', ')'), ('#`[', ']'), ('#`{', '}'), ('#`｢', '｣')), (('\\"', '\\"', False, False), ("'", "'", False, False), ('„', '“', False, False), ('«', '»', False, False), ('<<', '>>', False, False), ('“', '”', False, False), ('’', '‘', False, False), ('｢', '｣', False, False)), False, ('== ', '≡ ', '!= ', '≠ ', '!== ', '≢ ', '< ', '⊂ ', '!< ', '⊄ ', '<= ', '≤ ', '⊆ ', '!<= ', '⊈ ', '> ', '⊃ ', '!> ', '⊅ ', '>= ', '≥ ', '⊇ ', '!>= ', '⊉ ', '=~= ', '≅ ', '=== ', 'eq ', '!eq ', 'eqv ', 'ne ', 'gt ', 'ge ', 'lt ', 'le ', '=:=', 'CATCH ', 'CONTROL ', 'DOC ', 'NEXT ', 'and ', 'default ', 'do {', 'else ', 'elsif ', 'emit ', 'for ', 'gather ', 'given ', 'if ', 'last ', 'loop (', 'next ', 'once ', 'or ', 'orwith ', 'react {', 'redo ', 'repeat ', 'start {', 'supply ', 'unless ', 'until ', 'when ', 'whenever ', 'while ', 'with ', 'without '), (), ('raku',)),
+    'Razor': (('cshtml', 'razor'), (), (('<!--', '-->'), ('@*', '*@')), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'ReScript': (('res', 'resi'), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== ', '=== '), (), ()),
+    'ReStructuredText': (('rst',), (), (), (), False, (), (), ()),
+    'ReasonML': (('re', 'rei'), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Redscript': (('reds',), ('//', '///'), (('/*', '*/'),), (('"', '"', False, False),), True, ('for ', '@if(', 'switch ', 'while ', 'else ', 'func ', '-> '), (), ()),
+    'Report Definition Language': (('rdl',), (), (('<!--', '-->'),), (('"', '"', False, False),), False, (), (), ()),
+    'Robot Framework': (('robot',), (), (), (), False, (), (), ()),
+    'Ruby': (('rb',), ('#',), (('=begin', '=end'),), (('\\"', '\\"', False, False), ("'", "'", False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ('ruby',)),
+    'Ruby HTML': (('rhtml', 'erb'), (), (('<!--', '-->'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Rust': (('rs',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), True, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== ', 'match '), (), ()),
+    'SAS': (('sas',), ('*',), (('/*', '*/'),), (('"', '"', False, False), ("'", "'", False, False)), False, ('do', '%do', 'if', '%if', 'else', '%else', 'case', 'or', 'and', '^=', '¬=', '~=', 'ne', 'eq'), (), ()),
+    'SKILL': (('il',), (';',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'SNOBOL': (('sno',), ('*',), (), (('"', '"', False, False), ("'", "'", False, False)), False, (':(', ':s(', ':f(', 'eq ', 'ne '), (), ()),
+    'SPDX': (('spdx',), (), (), (), False, (), (), ()),
+    'SPL': (('spl',), (), (('"', '";'),), (('"', '"', False, False), ('^', ' ', False, False), ('^', '>', False, False), ('^', ':', False, False)), False, ('construct', 'foreach', 'map', 'while', 'if', 'include', 'catch', 'and', 'or', 'not', 'call', '<|', '<{', 'dup', 'swap'), (), ('spl',)),
+    'SQL': (('sql', 'dml', 'ddl', 'dql'), ('--',), (('/*', '*/'),), (("'", "'", False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'SRecode Template': (('srt',), (';;',), (), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'SVG': (('svg',), (), (('<!--', '-->'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Sass': (('sass', 'scss'), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Scala': (('sc', 'scala'), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== ', '>= ', '> ', '<= ', '< '), (), ()),
+    'Scallop': (('scl',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('rel ', 'count(', 'sum(', 'prod(', 'min(', 'max(', 'exists(', 'forall(', '|| ', '&& ', '!= ', '== ', '>= ', '> ', '<= ', '< '), (), ()),
+    'Scheme': (('scm', 'ss'), (';',), (('#|', '|#'),), (), True, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Scons': (('csig', 'sconstruct', 'sconscript'), ('#',), (), (('\\"', '\\"', False, False), ("'", "'", False, False), ('\\"\\"\\"', '\\"\\"\\"', False, False), ("'''", "'''", False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Shell': (('sh',), ('#',), (), (('\\"', '\\"', False, False), ("'", "'", False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), ('.tcshrc',), ('sh',)),
+    'Sieve': (('sieve',), ('#',), (('/*', '*/'),), (('"', '"', False, False),), False, ('if', 'if ', 'elsif', 'elsif ', 'allof', 'allof ', 'anyof', 'anyof ', 'allof(', 'anyof('), (), ()),
+    'Slang': (('slang',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Slint': (('slint',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'if ', 'if(', 'states ', 'states[', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Smalltalk': (('cs.st', 'pck.st'), (), (('"', '"'),), (("'", "'", False, False),), False, ('bitAnd ', 'bitOr ', 'bitXor ', 'bitInvert ', 'bitShift ', 'bitAt ', 'highbit ', 'allMask ', 'anyMask ', 'noMask ', 'ifTrue ', 'ifFalse ', 'switch ', 'whileTrue ', 'whileFalse ', 'to: '), (), ()),
+    'Smarty Template': (('tpl',), (), (('{*', '*}'),), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== ', 'include '), (), ()),
+    'Snakemake': (('smk', 'rules'), ('#',), (), (('"', '"', False, False), ("'", "'", False, False), ('"""', '"""', False, True), ("'''", "'''", False, True), ('r"""', '"""', False, True), ("r'''", "'''", False, True)), False, ('for ', 'for(', 'while ', 'while(', 'if ', 'if(', 'elif ', 'elif(', 'else ', 'else:', 'match ', 'match(', 'try ', 'try:', 'except ', 'except(', 'finally ', 'finally:', 'with ', 'with (', 'and ', 'and(', 'or ', 'or('), ('snakefile',), ()),
+    'Softbridge Basic': (('sbl',), ("'",), (), (('\\"', '\\"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'elseif ', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Solidity': (('sol',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== ', 'assembly ', 'assembly{', 'unchecked ', 'unchecked{'), (), ()),
+    'Specman e': (('e',), ('--', '//'), (("'>", "<'"),), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Spice Netlist': (('ckt',), ('*',), (), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Stan': (('stan',), ('#', '//'), (('/*', '*/'),), (('"', '"', False, False),), False, (), (), ()),
+    'Standard ML (SML)': (('sml',), (), (('(*', '*)'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Stata': (('do', 'ado'), ('//', '*'), (('/*', '*/'),), (('"', '"', False, False), ('`"', '"\'', False, False)), False, ('foreach', 'forvalues', 'if', 'else', 'while', 'switch', '|', '&', '!=', '=='), (), ()),
+    'Stylus': (('styl',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'if ', 'unless ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Svelte': (('svelte',), ('//',), (('<!--', '-->'), ('/*', '*/')), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Swift': (('swift',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), True, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', 'catch ', 'guard ', '?', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Swig': (('i',), (), (('/*', '*/'),), (('"', '"', False, False),), False, (), (), ()),
+    'SystemVerilog': (('sv', 'svh'), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '| ', '& ', '!= ', '!== ', '== ', 'foreach ', 'foreach(', 'case ', 'case(', 'casex ', 'casex(', 'casez ', 'casez(', 'casexz ', 'casexz(', 'fork ', ' ? ', 'inside', 'with', 'event '), (), ()),
+    'Systemd': (('automount', 'device', 'link', 'mount', 'path', 'scope', 'service', 'slice', 'socket', 'swap', 'target', 'timer'), ('#',), (), (), False, (), (), ()),
+    'TCL': (('tcl',), ('#',), (), (('\\"', '\\"', False, False), ("'", "'", False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ('tcl',)),
+    'TL': (('tl',), ('//', '///'), (('/*', '*/'),), (), False, (), (), ()),
+    'TOML': (('toml',), ('#',), (), (('\\"', '\\"', False, False), ("'", "'", False, False), ('\\"\\"\\"', '\\"\\"\\"', False, False), ("'''", "'''", False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'TTCN-3': (('ttcn', 'ttcn3', 'ttcnpp'), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'from ', 'if ', 'if(', 'select ', 'case ', 'while ', 'do ', 'goto ', 'stop ', 'break ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Tact': (('tact',), ('//', '///'), (('/*', '*/'),), (('"', '"', False, False),), False, ('if ', 'if(', 'else ', 'try ', 'catch ', 'catch(', 'repeat ', 'repeat(', 'while ', 'while(', 'do ', 'until ', 'until(', 'foreach ', 'foreach(', '|| ', '&& ', '!= ', '== '), (), ()),
+    'TaskPaper': (('taskpaper',), (), (), (), False, (), (), ()),
+    'TeX': (('tex', 'sty'), ('%',), (), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Teal': (('teal',), ('//',), (), (), False, ('loop:', 'retsub', 'callsub ', '&&', '==', '||', '<=', '>='), (), ()),
+    'Templ': (('templ',), ('//',), (('/*', '*/'),), (('"', '"', False, False), ('`', '`', True, False)), False, ('if ', ' else ', 'switch ', 'case ', 'default:', 'for ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'TemplateToolkit': (('tt', 'tt2'), (), (('[%#', '%]'),), (), False, ('[% BLOCK', '[% FILTER', '[% FOR', '[% FOREACH', '[% IF', '[% INCLUDE', '[% MACRO', '[% PROCESS', '[% SWITCH', '[% UNLESS', '[% WRAPPER'), (), ()),
+    'Tera': (('tera',), (), (('<!--', '-->'), ('{#', '#}')), (), False, ('{% include ', '{% macro ', '{% block ', '{% extends ', '{% for ', '{% set ', '{% if ', '{% elif ', '{% else '), (), ()),
+    'Terraform': (('tf', 'tfvars', 'tf.json'), ('#', '//'), (('/*', '*/'),), (), False, ('count', 'for', 'for_each', 'if', ': ', '? ', '|| ', '&& ', '!= ', '> ', '>= ', '< ', '<= ', '== '), (), ()),
+    'Textile': (('textile',), ('###. ',), (('###.. ', 'p. '),), (), False, (), (), ()),
+    'Thrift': (('thrift',), ('//', '#'), (('/*', '*/'),), (('"', '"', False, False), ("'", "'", False, False)), False, (), (), ()),
+    'Treetop': (('treetop', 'tt'), ('#',), (), (('"', '"', False, False), ("'", "'", False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Twig Template': (('twig',), (), (), (), False, ('{% for ', '{% if ', '{% else ', '{% elseif '), (), ()),
+    'TypeScript': (('ts', 'tsx'), ('//',), (('/*', '*/'),), (('"', '"', False, False), ("'", "'", False, False), ('`', '`', False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '!== ', '== ', '=== ', 'case ', 'case(', '?.', '?? ', '??= '), (), ()),
+    'TypeScript Typings': (('d.ts',), ('//',), (('/*', '*/'),), (('"', '"', False, False), ("'", "'", False, False), ('`', '`', False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '!== ', '== ', '=== ', 'case ', 'case(', '?.', '?? ', '??= '), (), ()),
+    'TypeSpec': (('tsp',), ('//',), (('/*', '*/'),), (('"', '"', False, False), ('"""', '"""', True, False)), False, (), (), ()),
+    'Typst': (('typ',), ('//',), (('/*', '*/'),), (('\\"', '\\"', False, False),), True, (), (), ()),
+    'Unreal Script': (('uc', 'uci', 'upkg'), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Up': (('up',), ('//',), (), (('"', '"', False, False), ('`', '`', False, False)), False, ('for ', 'if ', 'switch ', 'while ', 'else ', 'try ', 'func ', 'up ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Ur/Web': (('ur', 'urs'), (), (('(*', '*)'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Ur/Web Project': (('urp',), ('#',), (), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'V': (('v',), ('//',), (), (('"', '"', False, False), ('`', '`', False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'VHDL': (('vhd', 'vhdl'), ('--',), (), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Vala': (('vala',), ('//',), (('/*', '*/'),), (('"', '"', False, False), ('@"', '"', False, False), ('"""', '"""', True, False)), False, ('for ', 'for(', 'foreach ', 'foreach(', 'if ', 'if(', 'switch ', 'switch(', 'while ', 'while(', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Varnish Configuration': (('vcl',), ('#', '//'), (('/*', '*/'),), (), False, (), (), ()),
+    'Verilog': (('vg', 'vh', 'v'), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Verilog Args File': (('irunargs', 'xrunargs'), (), (), (), False, (), (), ()),
+    'Vertex Shader File': (('vsh',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Vim Script': (('vim', 'vimrc', 'gvimrc'), ('"', '#'), (), (('\\"', '\\"', False, False), ("'", "'", False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), ('_vimrc', '.vimrc', '_gvimrc', '.gvimrc', 'vimrc', 'gvimrc'), ()),
+    'Visual Basic': (('vb',), ("'",), (), (('\\"', '\\"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'elseif ', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Visual Basic for Applications': (('cls',), ("'",), (), (('\\"', '\\"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'elseif ', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Vue': (('vue',), ('//',), (('<!--', '-->'), ('/*', '*/')), (('"', '"', False, False), ("'", "'", False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Web Services Description Language': (('wsdl',), (), (('<!--', '-->'),), (('"', '"', False, False),), False, (), (), ()),
+    'WebGPU Shading Language': (('wgsl',), ('//',), (('/*', '*/'),), (), False, ('for (', 'for(', 'if ', 'if(', 'switch ', 'while ', 'while(', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Windows Resource-Definition Script': (('rc',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, (), (), ()),
+    'Wolfram': (('nb', 'wl'), (), (('(*', '*)'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Wren': (('wren',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), True, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'XAML': (('xaml',), (), (('<!--', '-->'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'XML': (('xml',), (), (('<!--', '-->'),), (('"', '"', False, False),), False, (), (), ()),
+    'XML Schema': (('xsd',), (), (), (), False, (), (), ()),
+    'Xcode Config': (('xcconfig',), ('//',), (), (), False, (), (), ()),
+    'XMake': ((), ('--',), (('--[[', ']]'), ('--[=[', ']=]'), ('--[==[', ']==]'), ('--[===[', ']===]'), ('--[====[', ']====]'), ('--[=====[', ']=====]')), (('"', '"', False, False), (']]', '[[', True, False)), False, ('for ', 'for(', 'if ', 'if(', 'while ', 'while(', 'else ', 'else(', 'elseif ', 'elseif(', 'until ', 'until(', 'or ', 'and ', '~= ', '== '), ('xmake.lua', 'xpack.lua'), ()),
+    'Xtend': (('xtend',), ('//',), (('/*', '*/'),), (('"', '"', False, False),), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'YAML': (('yaml', 'yml'), ('#',), (), (), False, (), (), ()),
+    'RAML': (('raml', 'rml'), ('#',), (), (), False, (), (), ()),
+    'Yarn': (('yarn',), (), (), (), False, ('<<if ', '<<elseif ', '<<else ', ' eq ', ' == ', ' neq ', ' ! ', ' gt ', ' > ', ' lt ', ' < ', ' lte ', ' <= ', ' gte ', ' >= ', ' xor ', ' ^ ', ' and ', ' && ', ' || ', ' or '), (), ()),
+    'Zig': (('zig',), ('//',), (), (('\\"', '\\"', False, False), ('\\\\', '\n', False, False)), False, ('catch ', 'while ', 'for ', 'if ', 'else ', 'errdefer ', 'try ', 'switch ', 'orelse ', '||', '&&', '!=', '=='), (), ()),
+    'ZoKrates': (('zok',), ('//',), (('/*', '*/'),), (), False, ('for ', 'if ', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), (), ()),
+    'Zsh': (('zsh', 'zshenv', 'zlogin', 'zlogout', 'zprofile', 'zshrc'), ('#',), (), (('\\"', '\\"', False, False), ("'", "'", False, False)), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', '|| ', '&& ', '!= ', '== '), ('.zshenv', '.zlogin', '.zlogout', '.zprofile', '.zshrc'), ('zsh',)),
+    'bait': (('bt',), ('//',), (('/*', '*/'),), (("'", "'", False, False), ('"', '"', False, False), ('`', '`', False, False)), True, ('for ', 'if ', 'else ', ' or ', ' and ', '!= ', '== '), (), ()),
+    'gitignore': ((), ('#',), (), (), False, (), ('.gitignore',), ()),
+    'hoon': (('hoon',), ('::',), (), (('"', '"', False, False), ("'", "'", False, False), ('```', '```', False, False)), False, ('%+  turn', '(turn ', '%+  roll', '(roll ', '%+  reel', '(reel ', '|.  ', '|.(', '|-  ', '|-(', '|?  ', '|?(', '?|  ', '?|(', '|(', '?-  ', '?-(', '?:  ', '?:(', '?.  ', '?.(', '?^  ', '?^(', '?<  ', '?<(', '?>  ', '?>(', '?+  ', '?+(', '?&  ', '?&(', '&(', '?@  ', '?@(', '?~  ', '?~(', '?=  ', '?=(', '.=  ', '=(', '!=('), (), ()),
+    'ignore': ((), ('#',), (), (), False, (), ('.ignore',), ()),
+    'jq': (('jq',), ('#',), (), (('"', '"', False, False),), False, ('.', 'if ', 'elif ', 'else ', '!= ', '== ', '>= ', '<= ', '< ', '> ', 'and ', 'or ', 'not ', '// ', 'try ', 'break '), (), ()),
+    'm4': (('m4',), ('#',), (), (), False, (), (), ()),
+    'nuspec': (('nuspec',), (), (('<!--', '-->'),), (('"', '"', False, False),), False, (), (), ()),
+    'sed': (('sed',), ('#',), (), (), False, ('for ', 'for(', 'if ', 'if(', 'switch ', 'while ', 'else ', 'and ', 'or ', 'not ', 'in '), (), ('sed',)),
+    'wenyan': (('wy',), ('批曰', '注曰', '疏曰'), (), (('」」', '「「', False, False),), False, ('若', '若非', '等於', '不等於', '不大於', '不小於', '大於', '小於', '凡', '為是', '恆為是', '中之', '遍'), (), ()),
+    'RPG': (('rpg', 'rpgle', 'cl', 'mbr'), ('*',), (), (), False, ('if ', 'if(', 'while ', 'else '), (), ()),
+    'EASYTRIEVE': (('ezt', 'ezy', 'ezp', 'etl'), ('*',), (), (("'", "'", False, False), ('"', '"', False, False)), False, ('if ', 'if(', 'else ', 'do ', 'do(', 'while ', 'while(', 'select ', 'when ', 'otherwise ', 'and ', 'or '), (), ()),
+    'PLI': (('pli', 'pl1', 'pl/i'), ('/*',), (('/*', '*/'),), (("'", "'", False, False), ('"', '"', False, False)), False, ('if ', 'if(', 'else ', 'select ', 'when ', 'otherwise ', 'do ', 'do(', 'end ', 'while ', 'while(', 'until ', 'until(', '&& ', '|| ', '!= ', '== '), (), ()),
+}
@@ -0,0 +1,140 @@
+import json
+import struct
+import zlib
+from collections import Counter
+from typing import BinaryIO, Dict, Iterable, List, Optional, Tuple
+
+from pylocc.file_utils import walk_order_key
+from pylocc.store import ReportStore
+
+# A partial result file starts with the magic bytes and the version of its layout
+PARTIAL_MAGIC = b'PYLOCCPR'
+PARTIAL_VERSION = 1
+_HEADER = struct.Struct('<8sH')
+# Each section of the compressed body is prefixed by its size
+_SIZE = struct.Struct('<Q')
+_CHUNK_SIZE = 1024 * 1024
+
+
+class PartialResultError(Exception):
+    """Raised when a partial result file can't be read, or partial results can't be merged."""
+
+
+class PartialResult:
+    """Reports of the files counted by a run, possibly a single shard of a bigger one, to be merged later.
+
+    Args:
+        reports: Report of each counted file.
+        skipped: Number of files skipped for each reason, see FileResult.skipped.
+        options_key: The CountOptions.cache_key of the run, only the partial results counted alike are merged.
+        complexity: Whether the complexity was counted.
+        shards: The 1-based indexes of the shards counted, and the number of shards, when sharded.
+    """
+
+    def __init__(self, reports: ReportStore, skipped: Optional[Dict[str, int]] = None, options_key: str = '',
+                 complexity: bool = False, shards: Optional[Tuple[List[int], int]] = None):
+        self.reports = reports
+        self.skipped = Counter(skipped or {})
+        self.options_key = options_key
+        self.complexity = complexity
+        self.shards = shards
+
+    @property
+    def missing_shards(self) -> List[int]:
+        """The indexes of the shards not counted yet, when sharded."""
+        if self.shards is None:
+            return []
+        indexes, count = self.shards
+        return sorted(set(range(1, count + 1)) - set(indexes))
+
+
+def write_partial(file_path: str, partial: PartialResult):
+    """Writes the partial result to the file: the header, then the zlib compressed metadata and columns of
+    the reports, see ReportStore.serialize."""
+    tables, columns = partial.reports.serialize()
+    metadata = {
+        'options': partial.options_key,
+        'complexity': partial.complexity,
+        'shards': list(partial.shards) if partial.shards else None,
+        'skipped': dict(partial.skipped),
+        'files': len(partial.reports),
+        'tables': tables,
+    }
+    compressor = zlib.compressobj()
+    with open(file_path, 'wb') as f:
+        f.write(_HEADER.pack(PARTIAL_MAGIC, PARTIAL_VERSION))
+        for section in [json.dumps(metadata).encode('utf-8')] + columns:
+            f.write(compressor.compress(_SIZE.pack(len(section))))
+            for start in range(0, len(section), _CHUNK_SIZE):
+                f.write(compressor.compress(section[start:start + _CHUNK_SIZE]))
+        f.write(compressor.flush())
+
+
+def read_partial(file_path: str) -> PartialResult:
+    """Reads a partial result file written by write_partial. Raises PartialResultError when it can't be read."""
+    try:
+        with open(file_path, 'rb') as f:
+            return _read_partial(f)
+    except OSError as e:
+        raise PartialResultError(f"Unable to read {file_path}: {e}") from None
+    except (ValueError, KeyError, TypeError, zlib.error, struct.error) as e:
+        raise PartialResultError(f"{file_path} is not a valid partial result: {e}") from None
+
+
+def _read_partial(f: BinaryIO) -> PartialResult:
+    magic, version = _HEADER.unpack(f.read(_HEADER.size))
+    if magic != PARTIAL_MAGIC:
+        raise ValueError("not a partial result file")
+    if version != PARTIAL_VERSION:
+        raise ValueError(f"unsupported version {version}, this version of pylocc reads version {PARTIAL_VERSION}")
+    body = zlib.decompress(f.read())
+    sections = []
+    position = 0
+    while position < len(body):
+        size, = _SIZE.unpack_from(body, position)
+        position += _SIZE.size
+        if position + size > len(body):
+            raise ValueError("truncated file")
+        sections.append(body[position:position + size])
+        position += size
+    if not sections:
+        raise ValueError("empty file")
+    metadata = json.loads(sections[0])
+    reports = ReportStore.deserialize(metadata['tables'], sections[1:])
+    if len(reports) != metadata['files']:
+        raise ValueError("truncated file")
+    shards = metadata['shards']
+    return PartialResult(reports, metadata['skipped'], metadata['options'], metadata['complexity'],
+                         (list(shards[0]), shards[1]) if shards else None)
+
+
+def merge_partials(partials: Iterable[PartialResult]) -> PartialResult:
+    """Merges partial results into the result of the whole run, the reports being ordered as a single run
+    walking the same folder would order them, so that the aggregate and by file reports are the same.
+
+    Raises PartialResultError when the partial results were not counted with the same options, or don't
+    belong to the same sharded run, or when a shard is given more than once."""
+    merged: Optional[PartialResult] = None
+    for partial in partials:
+        if merged is None:
+            merged = PartialResult(ReportStore(), options_key=partial.options_key, complexity=partial.complexity,
+                                   shards=([], partial.shards[1]) if partial.shards else None)
+        if partial.options_key != merged.options_key:
+            raise PartialResultError(f"Partial results counted with different options: "
+                                     f"{merged.options_key} and {partial.options_key}")
+        if (partial.shards is None) != (merged.shards is None) or \
+                (partial.shards and merged.shards and partial.shards[1] != merged.shards[1]):
+            raise PartialResultError("Partial results of different sharded runs can't be merged")
+        if partial.shards and merged.shards:
+            repeated = set(partial.shards[0]) & set(merged.shards[0])
+            if repeated:
+                raise PartialResultError(f"Shard {min(repeated)}/{merged.shards[1]} given more than once")
+            merged.shards[0].extend(partial.shards[0])
+        merged.reports.extend(partial.reports)
+        merged.skipped.update(partial.skipped)
+    if merged is None:
+        raise PartialResultError("No partial result to merge")
+    if merged.shards:
+        merged.shards[0].sort()
+    merged.reports.sort(walk_order_key)
+    return merged
@@ -1,16 +1,26 @@
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple, Iterable
+import re
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, AnyStr, Dict, Generic, List, Optional, Sequence, Set, Tuple, Iterable, cast
+from pylocc.detection import LanguageIndex
 from pylocc.language import Language
+from pylocc.language_index import EXTENSIONS, FILENAMES, RULES, SHEBANGS
+from pylocc.uloc import collect_lines
 
 
 class Report:
-    __slots__ = ['file_type', 'code', 'comments', 'blanks']
+    """Counts of the lines of a file or of a set of files of the same language.
 
-    def __init__(self, file_type: Language, code: int = 0, comments: int = 0, blanks: int = 0):
+    Reports are values: they compare equal when their counts are, and the reports of the same language
+    add up, so that partial results can be merged, e.g. sum(reports) or aggregated += report."""
+    __slots__ = ['file_type', 'code', 'comments', 'blanks', 'complexity']
+
+    def __init__(self, file_type: Language, code: int = 0, comments: int = 0, blanks: int = 0, complexity: int = 0):
         self.file_type = file_type
         self.code = code
         self.comments = comments
         self.blanks = blanks
+        self.complexity = complexity
 
     def increment_code(self, count: int = 1):
         """Increments the code count by the specified amount."""
@@ -24,11 +34,468 @@ class Report:
         """Increments the blanks count by the specified amount."""
         self.blanks += count
 
+    def increment_complexity(self, count: int = 1):
+        """Increments the complexity by the specified amount."""
+        self.complexity += count
+
     @property
     def total(self) -> int:
         """Returns the total count of code and comments."""
         return self.code + self.comments + self.blanks
 
+    def __add__(self, other: 'Report') -> 'Report':
+        if not isinstance(other, Report):
+            return NotImplemented
+        self._check_same_type(other)
+        return Report(self.file_type, code=self.code + other.code, comments=self.comments + other.comments,
+                      blanks=self.blanks + other.blanks, complexity=self.complexity + other.complexity)
+
+    def __radd__(self, other) -> 'Report':
+        # The start value of sum()
+        if other == 0:
+            return self + Report(self.file_type)
+        return NotImplemented
+
+    def __iadd__(self, other: 'Report') -> 'Report':
+        if not isinstance(other, Report):
+            return NotImplemented
+        self._check_same_type(other)
+        self.code += other.code
+        self.comments += other.comments
+        self.blanks += other.blanks
+        self.complexity += other.complexity
+        return self
+
+    def _check_same_type(self, other: 'Report'):
+        if other.file_type != self.file_type:
+            raise ValueError(f"Can't add a {other.file_type.value} report to a {self.file_type.value} one")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Report):
+            return NotImplemented
+        return (self.file_type, self.code, self.comments, self.blanks, self.complexity) == \
+            (other.file_type, other.code, other.comments, other.blanks, other.complexity)
+
+    # Reports are mutable, they can't be hashed
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (f"Report({self.file_type.value!r}, code={self.code}, comments={self.comments}, "
+                f"blanks={self.blanks}, complexity={self.complexity})")
+
+
+# Tuple of markers of the type of the lines, passed to their startswith method. The type checkers can't match a tuple
+# of the constrained AnyStr with the str and bytes signatures of startswith, so the locals holding them are left untyped
+_Prefixes = Any
+
+
+class LineClassifier(Generic[AnyStr]):
+    """Counts the blank and comment lines of a language.
+
+    A classifier is compiled once per language by compile_classifier, which picks the cheapest
+    specialization able to handle the comment markers the language actually defines.
+    This base class handles the languages without any comment marker."""
+
+    def __init__(self, line_comment: Sequence[AnyStr] = (),
+                 multiline_comment: Sequence[Tuple[AnyStr, AnyStr]] = ()):
+        self.line_comment: Tuple[AnyStr, ...] = tuple(line_comment)
+        # Longest start markers first, so that the most specific pair wins when they share a prefix
+        self.multiline_comment: Tuple[Tuple[AnyStr, AnyStr], ...] = tuple(sorted(
+            ((start, end) for start, end in multiline_comment), key=lambda pair: len(pair[0]), reverse=True))
+        self.multiline_start: Tuple[AnyStr, ...] = tuple(start for start, _ in self.multiline_comment)
+        # Every comment start pattern, dropping those extending a shorter one: a single startswith call tells
+        # apart the code lines, which are the vast majority, from the comment ones
+        markers = sorted(set(self.line_comment + self.multiline_start), key=lambda m: (len(m), m))
+        self.comment_start: Tuple[AnyStr, ...] = tuple(m for i, m in enumerate(markers)
+                                   if not any(m.startswith(shorter) for shorter in markers[:i]))
+
+    def count(self, lines: Iterable[AnyStr]) -> Tuple[int, int, int]:
+        """Returns the number of total, comment and blank lines."""
+        total = blanks = 0
+        for total, line in enumerate(lines, 1):
+            if not line.strip():
+                blanks += 1
+        return total, 0, blanks
+
+    def count_complexity(self, lines: Iterable[AnyStr]) -> Tuple[int, int, int, int]:
+        """Returns the number of total, comment and blank lines, and the complexity of the code.
+        Only the scanning classifier measures the complexity, the others report 0."""
+        return (*self.count(lines), 0)
+
+    def split_states(self) -> Sequence[Any]:
+        """The states, besides None, a line may start in, e.g. inside a multi line comment, that the ranges of a file
+        split in several ranges are counted from, see count_from. The classifiers without state have none."""
+        return ()
+
+    def count_from(self, lines: Iterable[AnyStr], state: Any = None,
+                   complexity: bool = False) -> Tuple[int, int, int, int, Any]:
+        """Counts the lines as count_complexity does, the first line starting in the given state, None being the
+        state of the start of a file. Returns the counts followed by the state the line following them starts in,
+        so that the counts of consecutive ranges of lines add up to the ones of the whole lines."""
+        return (*self.count(lines), 0, None)
+
+
+class LineCommentClassifier(LineClassifier[AnyStr]):
+    """Classifier for the languages with line comments only."""
+
+    def count(self, lines: Iterable[AnyStr]) -> Tuple[int, int, int]:
+        line_comment: _Prefixes = self.line_comment
+        total = comments = blanks = 0
+        for total, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line:
+                blanks += 1
+            elif line.startswith(line_comment):
+                # Only lines beginning with the comment are comment lines, a comment following some code still makes a code line
+                comments += 1
+        return total, comments, blanks
+
+
+class MultilineCommentClassifier(LineClassifier[AnyStr]):
+    """Classifier for the languages with multi line comments, and possibly line comments as well."""
+
+    def count(self, lines: Iterable[AnyStr]) -> Tuple[int, int, int]:
+        return self._count(lines, None)[:3]
+
+    def split_states(self) -> Sequence[Any]:
+        # The state is the end pattern of the comment the line is in
+        return tuple(dict.fromkeys(end for _, end in self.multiline_comment))
+
+    def count_from(self, lines: Iterable[AnyStr], state: Any = None,
+                   complexity: bool = False) -> Tuple[int, int, int, int, Any]:
+        total, comments, blanks, comment_end = self._count(lines, state)
+        return total, comments, blanks, 0, comment_end
+
+    def _count(self, lines: Iterable[AnyStr], comment_end: Optional[AnyStr]) -> Tuple[int, int, int, Optional[AnyStr]]:
+        comment_start: _Prefixes = self.comment_start
+        multiline_start: _Prefixes = self.multiline_start
+        # comment_end is the end pattern of the multi line comment the current line is in, None outside of comments
+        total = comments = blanks = 0
+        for total, line in enumerate(lines, 1):
+            # Stripping both sides also drops the line terminator, which would otherwise hide the end pattern
+            line = line.strip()
+            if not line:
+                blanks += 1
+            elif comment_end is not None:
+                comments += 1
+                if line.endswith(comment_end):
+                    comment_end = None
+            elif line.startswith(comment_start):
+                comments += 1
+                # The multi line start patterns may extend the line comment ones (e.g. -- and --[[ in Lua)
+                if line.startswith(multiline_start):
+                    comment_end = self._opened_comment_end(line)
+        return total, comments, blanks, comment_end
+
+    def _opened_comment_end(self, line: AnyStr) -> Optional[AnyStr]:
+        """Returns the end pattern of the comment opened by the line, or None if the comment is closed on the same line."""
+        for start, end in self.multiline_comment:
+            if line.startswith(start):
+                return None if line[len(start):].endswith(end) else end
+        return None
+
+
+# Kinds of the tokens the scanning classifier stops at
+_LINE_COMMENT, _BLOCK_COMMENT, _QUOTE = range(3)
+
+
+class ScanningClassifier(LineClassifier[AnyStr]):
+    """Accurate classifier, following the strings and the block comments along the lines.
+
+    Comment markers inside strings are ignored, block comments opened or closed in the middle of a line
+    are honored, and so are the nested block comments and the docstrings of the languages having them.
+    A line is code when anything but comments and docstrings is on it, strings included.
+
+    Rather than stepping over every character, the code is skipped up to the next interesting token
+    by a single precompiled pattern, which also skips the whole strings ending on the same line.
+    The lines lacking a character every token has, or starting with a line comment, are classified
+    without scanning them further.
+
+    Given complexity checks, count_complexity also counts their occurrences in the code, outside of the
+    comments and the strings, with a single precompiled alternation of all of them."""
+
+    def __init__(self, line_comment: Sequence[AnyStr] = (),
+                 multiline_comment: Sequence[Tuple[AnyStr, AnyStr]] = (),
+                 quotes: Sequence[Tuple[AnyStr, AnyStr, bool, bool]] = (),
+                 nested_multiline: bool = False,
+                 complexity_checks: Sequence[AnyStr] = ()):
+        super().__init__(line_comment, multiline_comment)
+        self.nested_multiline = nested_multiline
+        # Marker, kind and data of each token: the end marker of the block comments, the end marker, whether
+        # backslashes escape nothing and whether they are docstrings for the strings
+        tokens: List[Tuple[AnyStr, int, Any]] = [(marker, _LINE_COMMENT, None) for marker in self.line_comment]
+        tokens += [(start, _BLOCK_COMMENT, end) for start, end in self.multiline_comment]
+        tokens += [(start, _QUOTE, (end, ignore_escape, docstring)) for start, end, ignore_escape, docstring in quotes]
+        binary = any(isinstance(token[0], bytes) for token in tokens) or \
+            any(isinstance(check, bytes) for check in complexity_checks)
+        # Longest tokens first, so that the most specific one wins when they share a prefix (e.g. /* and /**)
+        tokens.sort(key=lambda token: len(token[0]), reverse=True)
+        self._tokens = {}
+        # Whole strings, closed on the line they are opened on
+        strings = []
+        for marker, kind, data in tokens:
+            if marker in self._tokens:
+                continue
+            if kind == _QUOTE:
+                end, ignore_escape, docstring = data
+                if len(end) == 1 and not docstring:
+                    strings.append((marker, end, ignore_escape))
+                data = (end, None if ignore_escape else _compile(r'\\.|%s', [end], binary), docstring)
+            self._tokens[marker] = (kind, data)
+        whole_strings = self._whole_strings(strings)
+        if self._tokens:
+            self._token_pattern = _compile('|'.join(['%s'] * len(self._tokens)), list(self._tokens), binary)
+            self._skip_pattern = self._compile_skip(whole_strings, binary)
+            # A character of each token, preferably not a letter as letters are in most lines (e.g. the r of r"),
+            # the lines without any of them hold no token
+            triggers = {next((marker[i:i + 1] for i in range(len(marker)) if not marker[i:i + 1].isalnum()),
+                             marker[:1])
+                        for marker, _, _ in tokens}
+            self._trigger_pattern = _compile('[%s]' % ('%s' * len(triggers)), sorted(triggers), binary)
+        else:
+            # Every line is code, only the complexity is measured
+            self._token_pattern = self._skip_pattern = self._trigger_pattern = _compile('(?!)', [], binary)
+        # Start or end of each block comment, to track the depth of the nested ones
+        self._nesting = {end: _compile('%s|%s', [start, end], binary) for start, end in self.multiline_comment}
+        self._complexity_pattern: Optional['re.Pattern[AnyStr]'] = None
+        if complexity_checks:
+            # The checks starting with a letter must start a word, "if " isn't counted in "elif ".
+            # Whole strings are matched as well, but outside of the group, so that the checks in them are not counted
+            words = [check for check in set(complexity_checks) if check[:1].isalnum()]
+            operators = [check for check in set(complexity_checks) if not check[:1].isalnum()]
+            check_templates, markers = [], []
+            for prefix, checks in ((r'\b', words), ('', operators)):
+                if checks:
+                    template, check_markers = _trie_template(checks)
+                    check_templates.append(prefix + template)
+                    markers += check_markers
+            templates = [template for _, template, _ in whole_strings] + ['(' + '|'.join(check_templates) + ')']
+            markers = [marker for _, _, string_markers in whole_strings for marker in string_markers] + markers
+            self._complexity_pattern = _compile('|'.join(templates), markers, binary)
+
+    @staticmethod
+    def _whole_strings(strings: List[Tuple[AnyStr, AnyStr, bool]]) -> List[Tuple[AnyStr, str, List[AnyStr]]]:
+        """Returns the start delimiter, the template and the markers of the patterns matching the given strings
+        as a whole."""
+        return [(start, r'%s[^%s]*%s', [start, end, end]) if ignore_escape else
+                (start, r'%s[^%s\\]*(?:\\.[^%s\\]*)*%s', [start, end, end, end])
+                for start, end, ignore_escape in strings]
+
+    def _compile_skip(self, whole_strings: List[Tuple[AnyStr, str, List[AnyStr]]],
+                      binary: bool) -> 're.Pattern[AnyStr]':
+        """Compiles the pattern matching the code up to the next token, whole strings included,
+        so that a line of code is usually scanned by a single call."""
+        first_chars = sorted({marker[:1] for marker in self._tokens})
+        templates = ['[^' + '%s' * len(first_chars) + ']+']
+        markers = list(first_chars)
+        for char in first_chars:
+            # The first character of a token, when the rest of every token starting with it doesn't follow
+            tails = [marker[1:] for marker in self._tokens if marker.startswith(char)]
+            if all(tails):
+                templates.append('%s(?!' + '|'.join(['%s'] * len(tails)) + ')')
+                markers += [char] + tails
+        for start, template, string_markers in whole_strings:
+            # A whole string doesn't match when a longer token starts with its delimiter (e.g. """ and ")
+            longer = [marker for marker in self._tokens if len(marker) > len(start) and marker.startswith(start)]
+            if longer:
+                template = '(?!' + '|'.join(['%s'] * len(longer)) + ')' + template
+            templates.append(template)
+            markers += longer + string_markers
+        return _compile('(?:' + '|'.join(templates) + ')*', markers, binary)
+
+    def count(self, lines: Iterable[AnyStr]) -> Tuple[int, int, int]:
+        return self._count(lines, None)[:3]
+
+    def count_complexity(self, lines: Iterable[AnyStr]) -> Tuple[int, int, int, int]:
+        return self._count(lines, self._complexity_pattern)[:4]
+
+    def split_states(self) -> Sequence[Any]:
+        # Inside a block comment, not nested. The strings spanning several lines are rare enough to be left out
+        return tuple((end, None, 1, False) for end in dict.fromkeys(end for _, end in self.multiline_comment))
+
+    def count_from(self, lines: Iterable[AnyStr], state: Any = None,
+                   complexity: bool = False) -> Tuple[int, int, int, int, Any]:
+        return self._count(lines, self._complexity_pattern if complexity else None, state)
+
+    def _count(self, lines: Iterable[AnyStr], complexity_pattern: Optional['re.Pattern[AnyStr]'],
+               state: Optional[tuple] = None) -> Tuple[int, int, int, int, Optional[tuple]]:
+        line_comment: _Prefixes = self.line_comment
+        multiline_start: _Prefixes = self.multiline_start
+        has_trigger = self._trigger_pattern.search
+        nested_multiline = self.nested_multiline
+        scan = self._scan
+        # State at the start of the line: end marker of the block comment, or of the string, it is in
+        block_end, string_end, depth, docstring = state or (None, None, 0, False)
+        total = comments = blanks = complexity = 0
+        for total, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line:
+                blanks += 1
+                continue
+            if block_end is None:
+                if string_end is None:
+                    # Fast paths: a line without any token is code, a line opening with a line comment is a comment
+                    if has_trigger(line) is None:
+                        if complexity_pattern is not None:
+                            complexity += _count_checks(complexity_pattern, line, 0, len(line))
+                        continue
+                    # The multi line start patterns may extend the line comment ones (e.g. -- and --[[ in Lua)
+                    if line_comment and line.startswith(line_comment) and not line.startswith(multiline_start):
+                        comments += 1
+                        continue
+            elif not nested_multiline and line.find(block_end) < 0:
+                comments += 1
+                continue
+            code, checks, block_end, string_end, depth, docstring = scan(line, block_end, string_end, depth,
+                                                                         docstring, complexity_pattern)
+            complexity += checks
+            if not code:
+                comments += 1
+        if block_end is None and string_end is None:
+            return total, comments, blanks, complexity, None
+        # Whether a string is a docstring only matters inside of it
+        return total, comments, blanks, complexity, (block_end, string_end, depth, string_end is not None and docstring)
+
+    def _scan(self, line: AnyStr, block_end: Optional[AnyStr], string_end: Optional[tuple],
+              depth: int, docstring: bool, complexity_pattern: Optional['re.Pattern[AnyStr]']) -> tuple:
+        """Scans a stripped line starting in the given state.
+        Returns whether the line holds some code and the complexity checks found in it,
+        followed by the state the next line starts in."""
+        tokens = self._tokens
+        code = False
+        checks = 0
+        pos = 0
+        length = len(line)
+        while pos < length:
+            if block_end is not None:
+                if self.nested_multiline:
+                    match = self._nesting[block_end].search(line, pos)
+                    if match is None:
+                        break
+                    depth += -1 if match.group() == block_end else 1
+                    pos = match.end()
+                else:
+                    found = line.find(block_end, pos)
+                    if found < 0:
+                        break
+                    depth = 0
+                    pos = found + len(block_end)
+                if depth == 0:
+                    block_end = None
+            elif string_end is not None:
+                code = code or not docstring
+                end, escaped_end, _ = string_end
+                if escaped_end is None:
+                    found = line.find(end, pos)
+                    if found < 0:
+                        break
+                    pos = found + len(end)
+                    string_end = None
+                else:
+                    match = escaped_end.search(line, pos)
+                    if match is None:
+                        break
+                    pos = match.end()
+                    # Otherwise an escaped character, skipped
+                    if match.group() == end:
+                        string_end = None
+            else:
+                skip = self._skip_pattern.match(line, pos)
+                # The skip pattern matches the empty code as well
+                assert skip is not None
+                skipped = skip.end()
+                if skipped > pos:
+                    if not code and not line[pos:skipped].isspace():
+                        code = True
+                    if complexity_pattern is not None:
+                        checks += _count_checks(complexity_pattern, line, pos, skipped)
+                if skipped == length:
+                    break
+                match = self._token_pattern.match(line, skipped)
+                if match is None:
+                    # Not expected, as the code is only skipped up to a token
+                    code = True
+                    pos = skipped + 1
+                    continue
+                pos = match.end()
+                kind, data = tokens[match.group()]
+                if kind == _LINE_COMMENT:
+                    break
+                if kind == _BLOCK_COMMENT:
+                    block_end, depth = data, 1
+                else:
+                    string_end = data
+                    # Only the strings opening a line are docstrings, the others are values
+                    docstring = data[2] and not code
+        return code or (string_end is not None and not docstring), checks, block_end, string_end, depth, docstring
+
+
+def _count_checks(complexity_pattern: 're.Pattern[AnyStr]', line: AnyStr, start: int, end: int) -> int:
+    # The whole strings match with an empty group
+    return len([check for check in complexity_pattern.findall(line, start, end) if check])
+
+
+def _trie_template(words: Iterable[AnyStr]) -> Tuple[str, List[AnyStr]]:
+    """Returns the template and the markers of a pattern matching any of the words, the longest one when
+    several match. The words are factored by their common prefixes, so that a failing position is rejected
+    after a character or two instead of trying each word in turn."""
+    # Each node maps the next character to its node, and None to True when a word ends at the node
+    trie: Dict[Optional[AnyStr], Any] = {}
+    for word in words:
+        node = trie
+        for i in range(len(word)):
+            node = node.setdefault(word[i:i + 1], {})
+        node[None] = True
+    markers: List[AnyStr] = []
+
+    def branches(node: Dict[Optional[AnyStr], Any]) -> str:
+        alternatives = []
+        for char in sorted(char for char in node if char is not None):
+            markers.append(char)
+            alternatives.append('%s' + branches(node[char]))
+        if not alternatives:
+            return ''
+        if len(alternatives) == 1 and None not in node:
+            return alternatives[0]
+        # Greedy, the longer words are tried before the shorter ones ending at the node
+        return '(?:' + '|'.join(alternatives) + (')?' if None in node else ')')
+
+    return branches(trie), markers
+
+
+def _compile(template: str, markers: Sequence[AnyStr], binary: bool) -> 're.Pattern[AnyStr]':
+    """Compiles the regular expression template filled with the escaped markers,
+    as a bytes pattern if binary is set and a str pattern otherwise."""
+    escaped = tuple(re.escape(marker) for marker in markers)
+    # The markers are bytes when binary is set, but there may be none to tell the type of the pattern from
+    if binary:
+        return cast('re.Pattern[AnyStr]', re.compile(template.encode('ascii') % escaped))
+    return cast('re.Pattern[AnyStr]', re.compile(template % escaped))
+
+
+def compile_classifier(line_comment: Sequence[AnyStr],
+                       multiline_comment: Sequence[Tuple[AnyStr, AnyStr]],
+                       quotes: Optional[Sequence[Tuple[AnyStr, AnyStr, bool, bool]]] = None,
+                       nested_multiline: bool = False,
+                       accurate: bool = False,
+                       complexity_checks: Optional[Sequence[AnyStr]] = None) -> LineClassifier[AnyStr]:
+    """Returns the cheapest classifier handling the given comment markers.
+    The classifier works on str or bytes lines, depending on the type of the markers.
+
+    The quotes and the nesting of the multi line comments are only honored by the accurate classifier,
+    picked when accurate is set and the language has strings or multi line comments to follow.
+    The complexity checks are only counted by the accurate classifier as well, which tells the code
+    apart from the comments and the strings, so it is always picked when they are given."""
+    if complexity_checks or (accurate and (quotes or multiline_comment)):
+        return ScanningClassifier(line_comment, multiline_comment, quotes or [], nested_multiline,
+                                  complexity_checks or [])
+    if multiline_comment:
+        return MultilineCommentClassifier(line_comment, multiline_comment)
+    if line_comment:
+        return LineCommentClassifier(line_comment)
+    # Given the empty markers, so that the classifier is of their type
+    return LineClassifier(line_comment, multiline_comment)
+
 
 @dataclass
 class ProcessorConfiguration:
@@ -39,6 +506,15 @@ class ProcessorConfiguration:
     file_extensions: List[str]
     line_comment: List[str]
     multiline_comment: List[Tuple[str, str]]
+    # Start and end markers of the strings, whether backslashes escape nothing in them and whether they are docstrings
+    quotes: List[Tuple[str, str, bool, bool]] = field(default_factory=list)
+    nested_multiline: bool = False
+    # Keywords and operators adding a branch to the code, counted as its cyclomatic complexity
+    complexity_checks: List[str] = field(default_factory=list)
+    # Exact names of the files of the language without a known extension, such as Makefile
+    file_names: List[str] = field(default_factory=list)
+    # Interpreters named by the shebang of the scripts of the language, such as python3
+    shebangs: List[str] = field(default_factory=list)
 
     @staticmethod
     def load_from_dict(configs) -> List['ProcessorConfiguration']:
@@ -49,9 +525,90 @@ class ProcessorConfiguration:
                                        line_comment=lang_config['line_comment'] if 'line_comment' in lang_config else [
         ],
             multiline_comment=lang_config['multi_line'] if 'multi_line' in lang_config else [
-        ]
+        ],
+            quotes=[parse_quote(quote) for quote in lang_config.get('quotes', [])],
+            nested_multiline=lang_config.get('nestedmultiline', False),
+            complexity_checks=lang_config.get('complexitychecks', []),
+            file_names=lang_config.get('filenames', []),
+            shebangs=lang_config.get('shebangs', [])
         ) for lang, lang_config in configs.items()]
 
+    @cached_property
+    def binary_line_comment(self) -> List[bytes]:
+        """The line comment markers encoded as UTF-8, to match them against undecoded lines."""
+        return [marker.encode('utf-8') for marker in self.line_comment]
+
+    @cached_property
+    def binary_multiline_comment(self) -> List[Tuple[bytes, bytes]]:
+        """The multi line comment markers encoded as UTF-8, to match them against undecoded lines."""
+        return [(start.encode('utf-8'), end.encode('utf-8')) for start, end in self.multiline_comment]
+
+    @cached_property
+    def binary_quotes(self) -> List[Tuple[bytes, bytes, bool, bool]]:
+        """The string markers encoded as UTF-8, to match them against undecoded lines."""
+        return [(start.encode('utf-8'), end.encode('utf-8'), ignore_escape, docstring)
+                for start, end, ignore_escape, docstring in self.quotes]
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """A digest of the configuration, stable across runs, changing whenever the counting rules change."""
+        import hashlib
+        import json
+        rules = [self.file_type.value, self.line_comment, self.multiline_comment, self.quotes, self.nested_multiline,
+                 self.complexity_checks]
+        return hashlib.sha1(json.dumps(rules).encode('utf-8')).hexdigest()
+
+    def get_classifier(self, binary: bool = False, accurate: bool = False,
+                       complexity: bool = False) -> LineClassifier:
+        """Returns the classifier counting the lines as count_locs, or count_locs_bytes when binary, does."""
+        if complexity:
+            return self.binary_complexity_classifier if binary else self.complexity_classifier
+        if accurate:
+            return self.binary_accurate_classifier if binary else self.accurate_classifier
+        return self.binary_classifier if binary else self.classifier
+
+    @cached_property
+    def classifier(self) -> LineClassifier[str]:
+        """The classifier for decoded lines, compiled on first use."""
+        return compile_classifier(self.line_comment, self.multiline_comment)
+
+    @cached_property
+    def binary_classifier(self) -> LineClassifier[bytes]:
+        """The classifier for undecoded lines, compiled on first use."""
+        return compile_classifier(self.binary_line_comment, self.binary_multiline_comment)
+
+    @cached_property
+    def accurate_classifier(self) -> LineClassifier[str]:
+        """The classifier for decoded lines following the strings and the nested comments, compiled on first use."""
+        return compile_classifier(self.line_comment, self.multiline_comment, self.quotes, self.nested_multiline,
+                                  accurate=True)
+
+    @cached_property
+    def binary_accurate_classifier(self) -> LineClassifier[bytes]:
+        """The classifier for undecoded lines following the strings and the nested comments, compiled on first use."""
+        return compile_classifier(self.binary_line_comment, self.binary_multiline_comment, self.binary_quotes,
+                                  self.nested_multiline, accurate=True)
+
+    @cached_property
+    def complexity_classifier(self) -> LineClassifier[str]:
+        """The accurate classifier for decoded lines also counting the complexity checks, compiled on first use."""
+        return compile_classifier(self.line_comment, self.multiline_comment, self.quotes, self.nested_multiline,
+                                  accurate=True, complexity_checks=self.complexity_checks)
+
+    @cached_property
+    def binary_complexity_classifier(self) -> LineClassifier[bytes]:
+        """The accurate classifier for undecoded lines also counting the complexity checks, compiled on first use."""
+        return compile_classifier(self.binary_line_comment, self.binary_multiline_comment, self.binary_quotes,
+                                  self.nested_multiline, accurate=True,
+                                  complexity_checks=[check.encode('utf-8') for check in self.complexity_checks])
+
+
+def parse_quote(quote) -> Tuple[str, str, bool, bool]:
+    """Parses a string definition of language.json, either a mapping or the delimiter of both ends."""
+    if isinstance(quote, str):
+        return quote, quote, False, False
+    return quote['start'], quote['end'], quote.get('ignoreEscape', False), quote.get('docString', False)
+
 
 def load_default_language_config() -> List[ProcessorConfiguration]:
     """Load language configurations from the packaged JSON file."""
@@ -78,22 +635,44 @@ class ProcessorConfigurationFactory:
                 if c:
                     self.configs_per_language[Language(c.file_type)] = c
 
-    def get_configuration(self, file_type: Optional[Language] = None, file_extension: Optional[str] = None, or_default: Optional[str] = None) -> Optional[ProcessorConfiguration]:
-        """Returns the configuration for the given language or file extension if it exists.
+    @property
+    def supported_extensions(self) -> List[str]:
+        """The file extensions having a configuration."""
+        return list(self.configs_per_extension)
+
+    @cached_property
+    def language_index(self) -> LanguageIndex:
+        """The index resolving the language of the files from their name or shebang, built on first use."""
+        extensions, filenames, shebangs = {}, {}, {}
+        for c in self.configs_per_language.values():
+            extensions.update(dict.fromkeys(c.file_extensions, c.file_type.value))
+            filenames.update(dict.fromkeys(c.file_names, c.file_type.value))
+            shebangs.update(dict.fromkeys(c.shebangs, c.file_type.value))
+        # Extensions shared by several languages are mapped as in configs_per_extension
+        extensions.update((extension, c.file_type.value) for extension, c in self.configs_per_extension.items())
+        return LanguageIndex(extensions, filenames, shebangs)
+
+    def get_configuration(self, file_type: Optional[Language] = None, file_extension: Optional[str] = None, or_default: Optional[str] = None,
+                          file_name: Optional[str] = None) -> Optional[ProcessorConfiguration]:
+        """Returns the configuration for the given language, file extension or file name if it exists.
         Fallback to the default configuration provided or None otherwise.
 
-        Only one of the parameters must be provided, if both are provided, an assertion error will be raised.
+        Only one of the language, file_extension and file_name parameters must be provided, if several are provided,
+        an assertion error will be raised.
 
         Args:
             language: Language to look for in the configurations.
             file_extension (str): The file extension to look for.
             or_default (Optional[str]): The default configuration to return if the file extension is not found.
+            file_name (str): The base name of a file, resolved by the language index, see LanguageIndex.language_of_name.
         Returns:
             Optional[ProcessorConfiguration]: The configuration for the file extension or the default configuration if provided. None otherwise.
 
         """
-        assert (file_type is not None) ^ (
-            file_extension is not None), "Either language or file_extension must be provided, but not both"
+        assert (file_type is not None) + (file_extension is not None) + (file_name is not None) == 1, \
+            "Only one of language, file_extension and file_name must be provided"
+        if file_name is not None:
+            return self._get_language_configuration(self.language_index.language_of_name(file_name))
         config = None
         if file_type in self.configs_per_language:
             config = self.configs_per_language[file_type]
@@ -103,38 +682,105 @@ class ProcessorConfigurationFactory:
             config = self.configs_per_extension.get(or_default, None)
         return config
 
+    def get_shebang_configuration(self, head: bytes) -> Optional[ProcessorConfiguration]:
+        """Returns the configuration for the interpreter named by the shebang of the given file beginning, if any."""
+        return self._get_language_configuration(self.language_index.language_of_shebang(head))
+
+    def _get_language_configuration(self, language: Optional[str]) -> Optional[ProcessorConfiguration]:
+        return self.get_configuration(file_type=Language(language)) if language is not None else None
+
     @staticmethod
     def get_default_factory() -> 'ProcessorConfigurationFactory':
         """Returns a default configuration factory with the built-in language configurations."""
-        return ProcessorConfigurationFactory(load_default_language_config())
+        return IndexedConfigurationFactory()
+
+
+class IndexedConfigurationFactory(ProcessorConfigurationFactory):
+    """Factory of the built-in language configurations, backed by the language index generated at build time.
+
+    The index is a compiled module, so it is loaded without parsing language.json,
+    and the configuration of each language is only built the first time it is requested."""
 
+    def __init__(self):
+        super().__init__([])
 
-def count_locs(text: Iterable[str], file_configuration: ProcessorConfiguration) -> Report:
-    """Counts the number of lines in the given text according to the provide configuration."""
+    @property
+    def supported_extensions(self) -> List[str]:
+        return list(EXTENSIONS)
+
+    @cached_property
+    def language_index(self) -> LanguageIndex:
+        return LanguageIndex(EXTENSIONS, FILENAMES, SHEBANGS)
+
+    def get_configuration(self, file_type: Optional[Language] = None, file_extension: Optional[str] = None, or_default: Optional[str] = None,
+                          file_name: Optional[str] = None) -> Optional[ProcessorConfiguration]:
+        if file_name is not None:
+            return super().get_configuration(file_name=file_name)
+        if file_type is not None:
+            self._load(file_type.value)
+        else:
+            if file_extension is not None:
+                self._load(EXTENSIONS.get(file_extension))
+            if or_default is not None:
+                self._load(EXTENSIONS.get(or_default))
+        return super().get_configuration(file_type=file_type, file_extension=file_extension, or_default=or_default)
+
+    def _load(self, language: Optional[str]):
+        if language is None or language not in RULES or Language(language) in self.configs_per_language:
+            return
+        extensions, line_comment, multiline_comment, quotes, nested_multiline, complexity_checks, file_names, \
+            shebangs = RULES[language]
+        config = ProcessorConfiguration(file_type=Language(language),
+                                        file_extensions=list(extensions),
+                                        line_comment=list(line_comment),
+                                        # Lists, as the pairs loaded from language.json are, so that both
+                                        # loaders give equal configurations
+                                        multiline_comment=[list(markers)  # type: ignore[misc]
+                                                           for markers in multiline_comment],
+                                        quotes=list(quotes),
+                                        nested_multiline=nested_multiline,
+                                        complexity_checks=list(complexity_checks),
+                                        file_names=list(file_names),
+                                        shebangs=list(shebangs))
+        self.configs_per_language[config.file_type] = config
+        # Extensions shared with other languages are only mapped to the one winning in the index
+        for extension in extensions:
+            if EXTENSIONS[extension] == language:
+                self.configs_per_extension[extension] = config
+
+
+def count_locs(text: Iterable[str], file_configuration: ProcessorConfiguration, accurate: bool = False,
+               complexity: bool = False, unique_lines: Optional[Set[str]] = None) -> Report:
+    """Counts the number of lines in the given text according to the provide configuration.
+    When accurate is set, the strings and the comments are followed along the lines, see ScanningClassifier.
+    When complexity is set, the complexity checks are counted as well, which implies accurate.
+    When unique_lines is given, the stripped lines that are not blank are added to it, see collect_lines."""
     assert file_configuration is not None, "File Configuration can't be null"
-    report = Report(file_configuration.file_type)
-    in_multi_line_comment = False
-    max = 0
-    for i, line in enumerate(text):
-        stripped_line = line.lstrip()
-        if not stripped_line:
-            # If the line is blank it's easy
-            report.increment_blanks()
-        elif file_configuration.line_comment and stripped_line.startswith(file_configuration.line_comment[0]):
-            # If the line is not blank, it can contains code, comments or both, if the comment is after a valid code block,
-            # therefore we only check for the comment line pattern at the beginning of the line.
-            # Even if the line may contains the line comment pattern after the code block, we still want to count this line as a code one.
-            report.increment_comments()
-        elif file_configuration.multiline_comment and \
-                (in_multi_line_comment or
-                 stripped_line.startswith(file_configuration.multiline_comment[0][0])):
-            # If the line begins with the multiline comment start pattern, we are entering a commented block and until the termination
-            # pattern, we will continue incrementing the commented line counter
-            in_multi_line_comment = not stripped_line.endswith(
-                file_configuration.multiline_comment[0][1])
-            report.increment_comments()
-        max = i
-    # Since we incremented the counters only for blanks and comments, the difference between the total number of lines and comments+blanks will be the code.
-    # Doing so we avoid to increment every time the code lines and we can do it only once
-    report.increment_code(max + 1 - report.total)
-    return report
+    classifier = file_configuration.get_classifier(accurate=accurate, complexity=complexity)
+    if unique_lines is not None:
+        text = collect_lines(text, unique_lines)
+    if complexity:
+        return _to_report(file_configuration.file_type, *classifier.count_complexity(text))
+    return _to_report(file_configuration.file_type, *classifier.count(text))
+
+
+def count_locs_bytes(lines: Iterable[bytes], file_configuration: ProcessorConfiguration,
+                     accurate: bool = False, complexity: bool = False,
+                     unique_lines: Optional[Set[bytes]] = None) -> Report:
+    """Counts the number of lines in the given undecoded lines according to the provide configuration.
+    The comment markers are matched on the raw bytes, so the content never needs to be decoded.
+    When accurate is set, the strings and the comments are followed along the lines, see ScanningClassifier.
+    When complexity is set, the complexity checks are counted as well, which implies accurate.
+    When unique_lines is given, the stripped lines that are not blank are added to it, see collect_lines."""
+    assert file_configuration is not None, "File Configuration can't be null"
+    classifier = file_configuration.get_classifier(binary=True, accurate=accurate, complexity=complexity)
+    if unique_lines is not None:
+        lines = collect_lines(lines, unique_lines)
+    if complexity:
+        return _to_report(file_configuration.file_type, *classifier.count_complexity(lines))
+    return _to_report(file_configuration.file_type, *classifier.count(lines))
+
+
+def _to_report(file_type: Language, total: int, comments: int, blanks: int, complexity: int = 0) -> Report:
+    # The classifiers only count blanks and comments, every other line is code
+    return Report(file_type, code=total - comments - blanks, comments=comments, blanks=blanks, complexity=complexity)
@@ -1,8 +1,17 @@
 import os
-from typing import Dict, List
+import struct
+import sys
+from typing import IO, TYPE_CHECKING, Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from pylocc.language import Language
 from pylocc.processor import Report
-from rich.table import Table
+from pylocc.store import ReportStore
+from pylocc.uloc import ApproximateUniqueLines, UniqueLines, new_unique_lines
 import csv
+import json
+
+if TYPE_CHECKING:
+    # rich is slow to import, it's only imported when a table is printed
+    from rich.table import Table
 
 # Headers
 FILE_TYPE_HEADER = "Language"
@@ -13,6 +22,44 @@ TOTAL_LINE_HEADER = "Lines"
 CODE_LINE_HEADER = "Code"
 COMMENT_LINE_HEADER = "Comments"
 BLANK_LINE_HEADER = "Blanks"
+COMPLEXITY_HEADER = "Complexity"
+COMMIT_HEADER = "Commit"
+DATE_HEADER = "Date"
+DUPLICATES_HEADER = "Duplicates"
+ULOC_HEADER = "ULOC"
+
+BY_FILE_HEADERS = [FILE_TYPE_HEADER, FILE_PATH_HEADER, FILE_NAME_HEADER, TOTAL_LINE_HEADER, CODE_LINE_HEADER, COMMENT_LINE_HEADER, BLANK_LINE_HEADER]
+AGGREGATE_HEADERS = [FILE_TYPE_HEADER, NUM_FILE_HEADER, TOTAL_LINE_HEADER, CODE_LINE_HEADER, COMMENT_LINE_HEADER, BLANK_LINE_HEADER]
+HISTORY_HEADERS = [COMMIT_HEADER, DATE_HEADER] + AGGREGATE_HEADERS
+# Formats of the machine readable reports
+CSV_FORMAT = 'csv'
+JSON_FORMAT = 'json'
+JSON_LINES_FORMAT = 'jsonl'
+BINARY_FORMAT = 'binary'
+OUTPUT_FORMATS = [CSV_FORMAT, JSON_FORMAT, JSON_LINES_FORMAT, BINARY_FORMAT]
+# Extensions of the output files written as JSON Lines and JSON when no format is given, the others are written as CSV
+JSON_LINES_EXTENSIONS = {'.jsonl', '.ndjson'}
+JSON_EXTENSIONS = {'.json'}
+# Binary reports: a header, then a record per language, file or aggregate, each starting with its tag.
+# The language records come before the first record using their id.
+BINARY_MAGIC = b'PYLOCCRP'
+BINARY_VERSION = 1
+BINARY_BY_FILE = 0
+BINARY_AGGREGATE = 1
+BINARY_COMPLEXITY_FLAG = 1
+BINARY_DUPLICATES_FLAG = 2
+BINARY_ULOC_FLAG = 4
+LANGUAGE_TAG = 1
+FILE_TAG = 2
+AGGREGATE_TAG = 3
+# magic, version, kind of report, flags
+BINARY_HEADER = struct.Struct('<8sHBB')
+# tag, language id, size of the UTF-8 language name following the record
+LANGUAGE_RECORD = struct.Struct('<BHH')
+# tag, language id, code, comments, blanks, complexity, size of the UTF-8 path following the record
+FILE_RECORD = struct.Struct('<BHQQQQI')
+# tag, language id, files, code, comments, blanks, complexity
+AGGREGATE_RECORD = struct.Struct('<BHQQQQQ')
 
 class ReportData:
     def __init__(self, headers: List[str], rows: List[List[str]]):
@@ -25,23 +72,63 @@ class ReportData:
             writer.writerow(self.headers)
             writer.writerows(self.rows)
 
-def prepare_by_file_report(processed: Dict[str, Report]) -> ReportData:
-    headers = [FILE_TYPE_HEADER, FILE_PATH_HEADER, FILE_NAME_HEADER, TOTAL_LINE_HEADER, CODE_LINE_HEADER, COMMENT_LINE_HEADER, BLANK_LINE_HEADER]
-    rows = []
-    for file_path, report_data in processed.items():
-        file_name = os.path.basename(os.path.splitext(file_path)[0])
-        rows.append([
-            report_data.file_type.value,
-            file_path,
-            file_name,
-            str(report_data.total),
-            str(report_data.code),
-            str(report_data.comments),
-            str(report_data.blanks),
-        ])
-    return ReportData(headers, rows)
-
-def create_by_file_table(report_data: ReportData) -> Table:
+def by_file_headers(complexity: bool = False) -> List[str]:
+    """Returns the headers of the by file report, with the complexity column if the complexity is counted."""
+    return BY_FILE_HEADERS + [COMPLEXITY_HEADER] if complexity else list(BY_FILE_HEADERS)
+
+def aggregate_headers(complexity: bool = False, duplicates: bool = False, uloc: bool = False) -> List[str]:
+    """Returns the headers of the aggregate report, with the complexity column if the complexity is counted,
+    the duplicates column if the duplicate files are counted and the ULOC column if the unique lines are."""
+    return AGGREGATE_HEADERS + [COMPLEXITY_HEADER] * complexity + [DUPLICATES_HEADER] * duplicates + \
+        [ULOC_HEADER] * uloc
+
+def aggregate_record(duplicates: bool = False, uloc: bool = False) -> struct.Struct:
+    """Returns the layout of the aggregate records of a binary report: AGGREGATE_RECORD followed by the number of
+    duplicate files and of unique lines, when they are counted."""
+    return struct.Struct(AGGREGATE_RECORD.format + 'Q' * (duplicates + uloc))
+
+def history_headers(complexity: bool = False) -> List[str]:
+    """Returns the headers of the history report, with the complexity column if the complexity is counted."""
+    return HISTORY_HEADERS + [COMPLEXITY_HEADER] if complexity else list(HISTORY_HEADERS)
+
+def history_values(commit: str, date: str, reports: Dict[Language, Tuple[int, Report]],
+                   complexity: bool = False) -> Iterator[List[Union[str, int]]]:
+    """Yields the values of the history report of a commit, a row per language then the total, as the aggregate
+    report does, prefixed by the commit and its date."""
+    aggregator = ReportAggregator(complexity)
+    for files, report_data in reports.values():
+        aggregator.add(report_data, files)
+    for values in aggregator.values():
+        yield [commit, date] + values
+
+def by_file_values(file_path: str, report_data: Report, complexity: bool = False) -> List[Union[str, int]]:
+    """Returns the values of the by file report of a file, the counts being numbers."""
+    file_name = os.path.basename(os.path.splitext(file_path)[0])
+    values: List[Union[str, int]] = [
+        report_data.file_type.value,
+        file_path,
+        file_name,
+        report_data.total,
+        report_data.code,
+        report_data.comments,
+        report_data.blanks,
+    ]
+    if complexity:
+        values.append(report_data.complexity)
+    return values
+
+def by_file_row(file_path: str, report_data: Report, complexity: bool = False) -> List[str]:
+    return [str(value) for value in by_file_values(file_path, report_data, complexity)]
+
+def prepare_by_file_report(processed: Union[Dict[str, Report], ReportStore], complexity: bool = False) -> ReportData:
+    if isinstance(processed, ReportStore):
+        rows = list(processed.by_file_rows(complexity))
+    else:
+        rows = [by_file_row(file_path, report_data, complexity) for file_path, report_data in processed.items()]
+    return ReportData(by_file_headers(complexity), rows)
+
+def create_by_file_table(report_data: ReportData) -> 'Table':
+    from rich.table import Table
     report = Table(show_header=True, header_style="bold magenta")
     for header in report_data.headers:
         report.add_column(header, justify="right" if header not in [FILE_PATH_HEADER, FILE_NAME_HEADER] else "dim")
@@ -50,59 +137,307 @@ def create_by_file_table(report_data: ReportData) -> Table:
         report.add_row(*row)
     return report
 
-def aggregate_reports(processed: Dict[str, Report]) -> ReportData:
-    aggregated_report = {}
-    files_per_type = {}
-    for report_data in processed.values():
-        if report_data.file_type not in aggregated_report:
-            aggregated_report[report_data.file_type] = Report(file_type=report_data.file_type)
-            files_per_type[report_data.file_type] = 0
-
-        aggregated_report[report_data.file_type].increment_code(report_data.code)
-        aggregated_report[report_data.file_type].increment_comments(report_data.comments)
-        aggregated_report[report_data.file_type].increment_blanks(report_data.blanks)
-        files_per_type[report_data.file_type] += 1
-
-    headers = [FILE_TYPE_HEADER, NUM_FILE_HEADER, TOTAL_LINE_HEADER, CODE_LINE_HEADER, COMMENT_LINE_HEADER, BLANK_LINE_HEADER]
-    rows = []
-    total_files = 0
-    total_lines = 0
-    code_lines = 0
-    comment_lines = 0
-    blank_lines = 0
-
-    for file_type, report_data in aggregated_report.items():
-        rows.append([
-            file_type.value,
-            f"{files_per_type[file_type]:,}",
-            f"{report_data.total:,}",
-            f"{report_data.code:,}",
-            f"{report_data.comments:,}",
-            f"{report_data.blanks:,}",
-        ])
-        total_files += files_per_type[file_type]
-        total_lines += report_data.total
-        code_lines += report_data.code
-        comment_lines += report_data.comments
-        blank_lines += report_data.blanks
-    
-    rows.append([
-        "Total",
-        f"{total_files:,}",
-        f"{total_lines:,}",
-        f"{code_lines:,}",
-        f"{comment_lines:,}",
-        f"{blank_lines:,}",
-    ])
-
-    return ReportData(headers, rows)
-
-def create_aggregate_table(report_data: ReportData) -> Table:
+class ReportAggregator:
+    """Sums the reports per language as they are added, without keeping them.
+    The complexity is always summed, but only reported when complexity is set. The duplicate files are reported when
+    duplicates is set, and the unique lines, in a column named ULOC, when uloc is set: the unique lines of each
+    language, and of every language in the total, the lines found in several languages counting once.
+
+    Args:
+        complexity: Whether to report the complexity.
+        duplicates: Whether to report the duplicate files, see add_duplicate.
+        uloc: Whether to report the unique lines, from the fingerprints of the lines given to add.
+        approximate_uloc: Whether to estimate the unique lines in a fixed memory, see ApproximateUniqueLines.
+    """
+
+    def __init__(self, complexity: bool = False, duplicates: bool = False, uloc: bool = False,
+                 approximate_uloc: bool = False):
+        self.complexity = complexity
+        self.duplicates = duplicates
+        self.uloc = uloc
+        self.approximate_uloc = approximate_uloc
+        self.reports: Dict[Language, Report] = {}
+        self.files_per_type: Dict[Language, int] = {}
+        self.duplicates_per_type: Dict[Language, int] = {}
+        self.unique_lines: Dict[Language, Union[UniqueLines, ApproximateUniqueLines]] = {}
+
+    def add(self, report_data: Report, files: int = 1, fingerprints: Optional[Iterable[int]] = None):
+        """Adds the report of a file, or the sum of the reports of the given number of files, along with the
+        fingerprints of their lines, see FileResult.fingerprints."""
+        aggregated = self.reports.get(report_data.file_type)
+        if aggregated is None:
+            aggregated = self.reports[report_data.file_type] = Report(file_type=report_data.file_type)
+            self.files_per_type[report_data.file_type] = 0
+        aggregated += report_data
+        self.files_per_type[report_data.file_type] += files
+        if fingerprints is not None:
+            unique_lines = self.unique_lines.get(report_data.file_type)
+            if unique_lines is None:
+                unique_lines = self.unique_lines[report_data.file_type] = new_unique_lines(self.approximate_uloc)
+            unique_lines.add(fingerprints)
+
+    def unique_line_count(self, language: Language) -> int:
+        """Returns the number of unique lines of the language, 0 when no fingerprint was added for it."""
+        unique_lines = self.unique_lines.get(language)
+        return len(unique_lines) if unique_lines is not None else 0
+
+    def add_duplicate(self, report_data: Report):
+        """Counts a duplicate file of the language of the report, whether or not the report is added as well.
+        The duplicates are only reported for the languages some report is added for."""
+        self.duplicates_per_type[report_data.file_type] = self.duplicates_per_type.get(report_data.file_type, 0) + 1
+
+    def remove(self, report_data: Report):
+        """Takes back a report previously added, e.g. when its file changes or is deleted."""
+        aggregated = self.reports[report_data.file_type]
+        aggregated.increment_code(-report_data.code)
+        aggregated.increment_comments(-report_data.comments)
+        aggregated.increment_blanks(-report_data.blanks)
+        aggregated.increment_complexity(-report_data.complexity)
+        self.files_per_type[report_data.file_type] -= 1
+        if not self.files_per_type[report_data.file_type]:
+            del self.reports[report_data.file_type]
+            del self.files_per_type[report_data.file_type]
+
+    def __len__(self) -> int:
+        return sum(self.files_per_type.values())
+
+    def values(self) -> Iterator[List[Union[str, int]]]:
+        """Yields the values of the aggregate report, a row per language then the total, the counts being numbers."""
+        totals = [0] * 7
+        for file_type, report_data in self.reports.items():
+            counts = [self.files_per_type[file_type], report_data.total, report_data.code, report_data.comments,
+                      report_data.blanks, report_data.complexity, self.duplicates_per_type.get(file_type, 0)]
+            totals = [total + count for total, count in zip(totals, counts)]
+            yield [file_type.value, *self._reported(counts, self.unique_line_count(file_type))]
+        yield ["Total", *self._reported(totals, self._total_unique_lines())]
+
+    def _reported(self, counts: List[int], unique_lines: int) -> List[int]:
+        return counts[:5] + counts[5:6] * self.complexity + counts[6:] * self.duplicates + [unique_lines] * self.uloc
+
+    def _total_unique_lines(self) -> int:
+        if not self.uloc:
+            return 0
+        unique_lines = new_unique_lines(self.approximate_uloc)
+        for language_lines in self.unique_lines.values():
+            # Made by new_unique_lines as well, hence of the same kind
+            unique_lines.update(language_lines)  # type: ignore[arg-type]
+        return len(unique_lines)
+
+    def to_report_data(self) -> ReportData:
+        rows = [[str(name)] + [f"{count:,}" for count in counts] for name, *counts in self.values()]
+        return ReportData(aggregate_headers(self.complexity, self.duplicates, self.uloc), rows)
+
+def aggregate_reports(processed: Union[Dict[str, Report], ReportStore], complexity: bool = False) -> ReportData:
+    aggregator = ReportAggregator(complexity)
+    if isinstance(processed, ReportStore):
+        # Summed column by column, rather than report by report
+        for files, report_data in processed.aggregate().values():
+            aggregator.add(report_data, files)
+    else:
+        for report_data in processed.values():
+            aggregator.add(report_data)
+    return aggregator.to_report_data()
+
+def create_aggregate_table(report_data: ReportData) -> 'Table':
+    from rich.table import Table
     report = Table(show_header=True, header_style="bold magenta")
     for header in report_data.headers:
-        report.add_column(header, justify="right" if header != FILE_TYPE_HEADER else "dim")
+        report.add_column(header, justify="right" if header not in [FILE_TYPE_HEADER, COMMIT_HEADER, DATE_HEADER] else "dim")
 
     for row in report_data.rows:
         report.add_row(*row)
         
     return report
+
+class CsvReportWriter:
+    """Writes a report in csv format. The by file report is written one row at a time, as the files are counted,
+    the aggregate one at once by write_aggregate. The counts are written as plain numbers.
+
+    Args:
+        stream: Stream to write the report to.
+        complexity: Whether to write the complexity column.
+        by_file: Whether the by file or the aggregate report is written.
+        close_stream: Whether closing the writer closes the stream, e.g. not the standard output.
+        headers: Headers of the rows of another report written by write_row, e.g. history_headers.
+        duplicates: Whether the aggregate report has the duplicates column, see ReportAggregator.
+        uloc: Whether the aggregate report has the ULOC column, see ReportAggregator.
+    """
+
+    def __init__(self, stream: IO, complexity: bool = False, by_file: bool = True, close_stream: bool = True,
+                 headers: Optional[List[str]] = None, duplicates: bool = False, uloc: bool = False):
+        self._stream = stream
+        self._complexity = complexity
+        self._duplicates = duplicates
+        self._uloc = uloc
+        self._headers = headers or (by_file_headers(complexity) if by_file else
+                                    aggregate_headers(complexity, duplicates, uloc))
+        self._close_stream = close_stream
+        self._start()
+
+    def _start(self):
+        self._writer = csv.writer(self._stream)
+        self._writer.writerow(self._headers)
+
+    def write_row(self, values: List[Union[str, int]]):
+        """Writes a row of values, matching the headers."""
+        self._writer.writerow(values)
+
+    def write(self, file_path: str, report_data: Report):
+        self.write_row(by_file_values(file_path, report_data, self._complexity))
+
+    def write_aggregate(self, aggregator: 'ReportAggregator'):
+        """Writes the aggregate report, a row per language then the total."""
+        for values in aggregator.values():
+            self.write_row(values)
+
+    def close(self):
+        if self._close_stream:
+            self._stream.close()
+        else:
+            self._stream.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class JsonLinesReportWriter(CsvReportWriter):
+    """Writes a report as JSON Lines, one object per file or language with the counts as numbers."""
+
+    def _start(self):
+        pass
+
+    def write_row(self, values: List[Union[str, int]]):
+        self._stream.write(json.dumps(dict(zip(self._headers, values))) + '\n')
+
+class JsonReportWriter(CsvReportWriter):
+    """Writes a report as a JSON array of objects, one per file or language with the counts as numbers.
+    The array is streamed, one line per object, and only ends when the writer is closed."""
+
+    def _start(self):
+        self._separator = '[\n'
+
+    def write_row(self, values: List[Union[str, int]]):
+        self._stream.write(self._separator + json.dumps(dict(zip(self._headers, values))))
+        self._separator = ',\n'
+
+    def close(self):
+        self._stream.write('[]\n' if self._separator == '[\n' else '\n]\n')
+        super().close()
+
+class BinaryReportWriter(CsvReportWriter):
+    """Writes a report in a compact binary format, read back by read_binary_report: fixed size little endian
+    records packed with struct, followed by the UTF-8 strings they give the size of. The aggregate report
+    only holds the languages, not the total, which can't be summed back for the unique lines."""
+
+    def __init__(self, stream: BinaryIO, complexity: bool = False, by_file: bool = True, close_stream: bool = True,
+                 duplicates: bool = False, uloc: bool = False):
+        self._by_file = by_file
+        self._language_ids: Dict[Language, int] = {}
+        super().__init__(stream, complexity, by_file, close_stream, duplicates=duplicates, uloc=uloc)
+
+    def write_row(self, values: List[Union[str, int]]):
+        raise TypeError("The binary format only holds the by file and aggregate reports")
+
+    def _start(self):
+        self._stream.write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION,
+                                              BINARY_BY_FILE if self._by_file else BINARY_AGGREGATE,
+                                              (BINARY_COMPLEXITY_FLAG if self._complexity else 0) |
+                                              (BINARY_DUPLICATES_FLAG if self._duplicates else 0) |
+                                              (BINARY_ULOC_FLAG if self._uloc else 0)))
+
+    def _language_id(self, language: Language) -> int:
+        language_id = self._language_ids.get(language)
+        if language_id is None:
+            language_id = self._language_ids[language] = len(self._language_ids)
+            name = language.value.encode('utf-8')
+            self._stream.write(LANGUAGE_RECORD.pack(LANGUAGE_TAG, language_id, len(name)) + name)
+        return language_id
+
+    def write(self, file_path: str, report_data: Report):
+        path = file_path.encode('utf-8', 'surrogateescape')
+        self._stream.write(FILE_RECORD.pack(FILE_TAG, self._language_id(report_data.file_type), report_data.code,
+                                            report_data.comments, report_data.blanks, report_data.complexity,
+                                            len(path)) + path)
+
+    def write_aggregate(self, aggregator: 'ReportAggregator'):
+        record = aggregate_record(self._duplicates, self._uloc)
+        for language, report_data in aggregator.reports.items():
+            counts = [AGGREGATE_TAG, self._language_id(language), aggregator.files_per_type[language],
+                      report_data.code, report_data.comments, report_data.blanks, report_data.complexity]
+            if self._duplicates:
+                counts.append(aggregator.duplicates_per_type.get(language, 0))
+            if self._uloc:
+                counts.append(aggregator.unique_line_count(language))
+            self._stream.write(record.pack(*counts))
+
+def read_binary_report(stream: BinaryIO) -> Iterator[Dict[str, Any]]:
+    """Yields the records of a report written by BinaryReportWriter, as the JSON writers write them.
+    Raises ValueError when the stream doesn't hold a binary report."""
+    header = stream.read(BINARY_HEADER.size)
+    if len(header) < BINARY_HEADER.size:
+        raise ValueError("Not a pylocc binary report")
+    magic, version, kind, flags = BINARY_HEADER.unpack(header)
+    if magic != BINARY_MAGIC or version != BINARY_VERSION:
+        raise ValueError(f"Not a pylocc binary report of version {BINARY_VERSION}")
+    complexity = bool(flags & BINARY_COMPLEXITY_FLAG)
+    duplicates = bool(flags & BINARY_DUPLICATES_FLAG)
+    uloc = bool(flags & BINARY_ULOC_FLAG)
+    headers = by_file_headers(complexity) if kind == BINARY_BY_FILE else aggregate_headers(complexity, duplicates, uloc)
+    record = aggregate_record(duplicates, uloc)
+    languages: Dict[int, Report] = {}
+    while True:
+        tag = stream.read(1)
+        if not tag:
+            return
+        if tag[0] == LANGUAGE_TAG:
+            _, language_id, size = LANGUAGE_RECORD.unpack(tag + stream.read(LANGUAGE_RECORD.size - 1))
+            languages[language_id] = Report(Language(stream.read(size).decode('utf-8')))
+        elif tag[0] == FILE_TAG:
+            _, language_id, code, comments, blanks, file_complexity, size = \
+                FILE_RECORD.unpack(tag + stream.read(FILE_RECORD.size - 1))
+            report_data = Report(languages[language_id].file_type, code, comments, blanks, file_complexity)
+            path = stream.read(size).decode('utf-8', 'surrogateescape')
+            yield dict(zip(headers, by_file_values(path, report_data, complexity)))
+        elif tag[0] == AGGREGATE_TAG:
+            _, language_id, files, code, comments, blanks, file_complexity, *counts = \
+                record.unpack(tag + stream.read(record.size - 1))
+            values = [languages[language_id].file_type.value, files, code + comments + blanks, code, comments, blanks]
+            yield dict(zip(headers, values + [file_complexity] * complexity + counts))
+        else:
+            raise ValueError(f"Unknown record tag {tag[0]}")
+
+def format_of_path(file_path: str) -> str:
+    """Returns the format of a report written to the given path when no format is given, from its extension."""
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension in JSON_LINES_EXTENSIONS:
+        return JSON_LINES_FORMAT
+    if extension in JSON_EXTENSIONS:
+        return JSON_FORMAT
+    return CSV_FORMAT
+
+def open_report_writer(file_path: Optional[str], complexity: bool = False, output_format: Optional[str] = None,
+                       by_file: bool = True, headers: Optional[List[str]] = None,
+                       duplicates: bool = False, uloc: bool = False) -> CsvReportWriter:
+    """Opens a writer of the by file or aggregate report, or of the report with the given headers, in the given format,
+    writing to the standard output when no path is given. The format defaults to the one of the extension of the path,
+    see format_of_path."""
+    if output_format is None:
+        output_format = format_of_path(file_path) if file_path else CSV_FORMAT
+    if output_format == BINARY_FORMAT:
+        if file_path:
+            return BinaryReportWriter(open(file_path, 'wb'), complexity, by_file, duplicates=duplicates, uloc=uloc)
+        sys.stdout.flush()
+        return BinaryReportWriter(sys.stdout.buffer, complexity, by_file, close_stream=False, duplicates=duplicates,
+                                  uloc=uloc)
+    writer_class = {CSV_FORMAT: CsvReportWriter, JSON_FORMAT: JsonReportWriter,
+                    JSON_LINES_FORMAT: JsonLinesReportWriter}[output_format]
+    if not file_path:
+        return writer_class(sys.stdout, complexity, by_file, close_stream=False, headers=headers,
+                            duplicates=duplicates, uloc=uloc)
+    if output_format == CSV_FORMAT:
+        return writer_class(open(file_path, 'w', newline=''), complexity, by_file, headers=headers,
+                            duplicates=duplicates, uloc=uloc)
+    return writer_class(open(file_path, 'w', encoding='utf-8'), complexity, by_file, headers=headers,
+                        duplicates=duplicates, uloc=uloc)
@@ -0,0 +1,859 @@
+import io
+import mmap
+import os
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from itertools import chain, islice
+from time import perf_counter
+from typing import (TYPE_CHECKING, Any, Callable, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set,
+                    Tuple, Union)
+
+from pylocc.archive_utils import MEMBER_SEPARATOR
+from pylocc.cache import ReportCache
+from pylocc.dedup import DuplicateEntry, DuplicateFinder
+from pylocc.file_utils import (FileEntry, LONG_LINES, SHEBANG_SIZE, SNIFF_SIZE, TOO_LARGE, binary_lines,
+                               has_long_line, open_binary_content, sniff_content)
+from pylocc.language import Language
+from pylocc.processor import ProcessorConfigurationFactory, Report, count_locs, count_locs_bytes
+from pylocc.uloc import FINGERPRINT_TYPECODE, collect_lines, fingerprint_array
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+# Below this number of files, spawning the worker processes costs more than the counting itself
+SERIAL_THRESHOLD = 256
+# Maximum number of files sent to a worker in a single task, to keep the inter process communication low
+CHUNK_SIZE = 128
+# Maximum size of the contents sent to a worker in a single task, when the files are already read, see count_contents
+CHUNK_BYTES = 8 * 1024 * 1024
+
+# Files at least this big are split in ranges of about RANGE_SIZE bytes counted by several workers, see count_files
+SPLIT_SIZE = 64 * 1024 * 1024
+RANGE_SIZE = 16 * 1024 * 1024
+
+# Default number of threads reading the files ahead of their counting, and maximum size of the contents read ahead
+READ_AHEAD_THREADS = 8
+READ_AHEAD_BYTES = 64 * 1024 * 1024
+# Maximum number of files read ahead per thread, whatever their size
+READ_AHEAD_FILES = 32
+
+# Counting engines: "bytes" classifies the raw lines, "text" decodes them as UTF-8 first
+BYTES_ENGINE = 'bytes'
+TEXT_ENGINE = 'text'
+ENGINES = [BYTES_ENGINE, TEXT_ENGINE]
+
+
+@dataclass(frozen=True)
+class CountOptions:
+    """Settings of a counting run, shared with the worker processes.
+
+    Attributes:
+        engine: Counting engine, one of ENGINES.
+        sniff: Whether to skip the binary, minified and generated files, see sniff_content.
+        max_file_size: Files bigger than this number of bytes are skipped.
+        max_line_length: Files with a line longer than this number of bytes are skipped.
+        timed: Whether to measure the size and the read and count times of each file, see FileStats.
+        accurate: Whether to follow the strings and the nested comments along the lines, see ScanningClassifier.
+        complexity: Whether to count the complexity of the code as well, which implies accurate.
+        uloc: Whether to fingerprint the unique lines of each file as well, see FileResult.fingerprints.
+            The cached reports are not used then, since they don't hold the fingerprints.
+    """
+    engine: str = BYTES_ENGINE
+    sniff: bool = True
+    max_file_size: Optional[int] = None
+    max_line_length: Optional[int] = None
+    timed: bool = False
+    accurate: bool = False
+    complexity: bool = False
+    uloc: bool = False
+
+    def __post_init__(self):
+        assert self.engine in ENGINES, f"Unknown engine {self.engine}"
+
+    @property
+    def inspects_content(self) -> bool:
+        """Whether the raw content of the files is needed before counting it."""
+        return self.engine == BYTES_ENGINE or self.sniff or \
+            self.max_file_size is not None or self.max_line_length is not None
+
+    @property
+    def cache_key(self) -> str:
+        """The settings affecting which files get counted and how, cached reports are only valid for the same key."""
+        key = f"{self.engine}:{int(self.sniff)}:{self.max_file_size}:{self.max_line_length}"
+        # Only appended when set, so that the reports cached by the default counting stay valid
+        if self.accurate or self.complexity:
+            key += ":accurate"
+        if self.complexity:
+            key += ":complexity"
+        return key
+
+
+DEFAULT_OPTIONS = CountOptions()
+
+
+@dataclass(frozen=True)
+class ReadAhead:
+    """Settings of the reading of the files ahead of their counting, see count_files.
+
+    A pool of threads reads the files while the previous ones are counted, so that the latency of a network file
+    system overlaps with the counting instead of adding to it. Each thread holds a single open file at a time.
+
+    Attributes:
+        threads: Number of threads reading the files, which bounds the number of files open at once.
+        max_bytes: Maximum size of the contents read and not counted yet. Bigger files are not read ahead.
+    """
+    threads: int = READ_AHEAD_THREADS
+    max_bytes: int = READ_AHEAD_BYTES
+
+    def __post_init__(self):
+        assert self.threads > 0, "At least one thread is needed to read ahead"
+
+
+class FileStats(NamedTuple):
+    """Measures of the counting of a single file, taken when CountOptions.timed is set.
+    The read time covers opening the file and reading what's needed to sniff it, the count time covers
+    classifying its lines, including reading them when the file is mapped in memory."""
+    size: int
+    read_time: float
+    count_time: float
+
+
+class FileResult(NamedTuple):
+    """Outcome of the processing of a single file.
+    When the file can't be counted, report is None and either message explains why, or skipped tells
+    the reason, such as BINARY or TOO_LARGE, for which the file has been deliberately left out.
+    When duplicates are looked for, duplicate_of is the path of the first file of the same content, whose result
+    the file shares. When CountOptions.uloc is set, fingerprints holds the fingerprints of the distinct lines of the
+    file, see UniqueLines."""
+    path: str
+    report: Optional[Report]
+    message: Optional[str] = None
+    skipped: Optional[str] = None
+    stats: Optional[FileStats] = None
+    duplicate_of: Optional[str] = None
+    fingerprints: Optional[array] = None
+
+
+def process_file(file_path: str, configuration_factory: ProcessorConfigurationFactory,
+                 options: CountOptions = DEFAULT_OPTIONS) -> FileResult:
+    """Counts the lines of a single file, using the configuration matching its name, or its shebang when
+    it has no extension."""
+    try:
+        file_name = os.path.basename(file_path)
+        file_configuration = configuration_factory.get_configuration(file_name=file_name)
+        # The shebang is read along with the content, without opening the file once more
+        shebang = not file_configuration and configuration_factory.language_index.is_shebang_candidate(file_name)
+
+        if not file_configuration and not shebang:
+            file_extension = os.path.splitext(file_path)[1][1:]
+            return FileResult(file_path, None,
+                              f"No configuration found for file type '{file_extension}' in file {file_path}. Skipping...")
+
+        # The clock is only read when timing, to keep the cost of the default runs unchanged
+        start = perf_counter() if options.timed else 0.0
+        if options.inspects_content or shebang:
+            with open_binary_content(file_path) as content:
+                if shebang:
+                    file_configuration = configuration_factory.get_shebang_configuration(content[:SHEBANG_SIZE])
+                    if not file_configuration:
+                        return FileResult(file_path, None,
+                                          f"No configuration found for the file {file_path}. Skipping...")
+                skipped = _skip_reason(content, options)
+                if skipped:
+                    return FileResult(file_path, None, skipped=skipped)
+                if options.engine == BYTES_ENGINE:
+                    return _count_bytes(file_path, content, file_configuration, options, start)
+        assert file_configuration is not None, "Configuration found from the name or the shebang"
+        with open(file_path, 'r', encoding='utf-8', errors='ignore', buffering=8192) as f_handle:
+            read = perf_counter() if options.timed else 0.0
+            unique_lines: Optional[Set[str]] = set() if options.uloc else None
+            report = count_locs(f_handle, file_configuration=file_configuration, accurate=options.accurate,
+                                complexity=options.complexity, unique_lines=unique_lines)
+            fingerprints = fingerprint_array(unique_lines) if unique_lines is not None else None
+            if options.timed:
+                return FileResult(file_path, report,
+                                  stats=_file_stats(os.fstat(f_handle.fileno()).st_size, start, read),
+                                  fingerprints=fingerprints)
+            return FileResult(file_path, report, fingerprints=fingerprints)
+    except Exception as e:
+        return FileResult(file_path, None, f"Error processing file {file_path}: {e} Skipping...")
+
+
+def count_content(file_path: str, content: bytes, configuration_factory: ProcessorConfigurationFactory,
+                  options: CountOptions = DEFAULT_OPTIONS) -> FileResult:
+    """Counts the lines of a file whose content is already read, e.g. a member of an archive, as process_file counts
+    a file on disk. The configuration matches the name ending file_path, or the shebang of the content."""
+    try:
+        # The members at the root of an archive have no directory, their name follows the archive path
+        file_name = os.path.basename(file_path).rpartition(MEMBER_SEPARATOR)[2]
+        file_configuration = configuration_factory.get_configuration(file_name=file_name)
+        if not file_configuration and configuration_factory.language_index.is_shebang_candidate(file_name):
+            file_configuration = configuration_factory.get_shebang_configuration(content[:SHEBANG_SIZE])
+        if not file_configuration:
+            return FileResult(file_path, None, f"No configuration found for the file {file_path}. Skipping...")
+
+        start = perf_counter() if options.timed else 0.0
+        skipped = _skip_reason(content, options)
+        if skipped:
+            return FileResult(file_path, None, skipped=skipped)
+        if options.engine == BYTES_ENGINE:
+            return _count_bytes(file_path, content, file_configuration, options, start)
+        read = perf_counter() if options.timed else 0.0
+        # Decoded and split in lines as a file opened in text mode would be
+        lines = io.StringIO(content.decode('utf-8', errors='ignore'), newline=None)
+        unique_lines: Optional[Set[str]] = set() if options.uloc else None
+        report = count_locs(lines, file_configuration=file_configuration, accurate=options.accurate,
+                            complexity=options.complexity, unique_lines=unique_lines)
+        fingerprints = fingerprint_array(unique_lines) if unique_lines is not None else None
+        if options.timed:
+            return FileResult(file_path, report, stats=_file_stats(len(content), start, read),
+                              fingerprints=fingerprints)
+        return FileResult(file_path, report, fingerprints=fingerprints)
+    except Exception as e:
+        return FileResult(file_path, None, f"Error processing file {file_path}: {e} Skipping...")
+
+
+def _count_bytes(file_path: str, content, file_configuration, options: CountOptions, start: float) -> FileResult:
+    read = perf_counter() if options.timed else 0.0
+    unique_lines: Optional[Set[bytes]] = set() if options.uloc else None
+    report = count_locs_bytes(binary_lines(content), file_configuration=file_configuration,
+                              accurate=options.accurate, complexity=options.complexity, unique_lines=unique_lines)
+    fingerprints = fingerprint_array(unique_lines) if unique_lines is not None else None
+    if options.timed:
+        return FileResult(file_path, report, stats=_file_stats(len(content), start, read), fingerprints=fingerprints)
+    return FileResult(file_path, report, fingerprints=fingerprints)
+
+
+def _file_stats(size: int, start: float, read: float) -> FileStats:
+    return FileStats(size, read - start, perf_counter() - read)
+
+
+def _skip_reason(content, options: CountOptions) -> Optional[str]:
+    if options.max_file_size is not None and len(content) > options.max_file_size:
+        return TOO_LARGE
+    if options.sniff:
+        skipped = sniff_content(content[:SNIFF_SIZE])
+        if skipped:
+            return skipped
+    if options.max_line_length is not None and has_long_line(content, options.max_line_length):
+        return LONG_LINES
+    return None
+
+
+# Configuration factory and options of the worker process, set once by the pool initializer
+_worker_factory: Optional[ProcessorConfigurationFactory] = None
+_worker_options: CountOptions = DEFAULT_OPTIONS
+
+
+def _init_worker(configuration_factory: ProcessorConfigurationFactory, options: CountOptions):
+    global _worker_factory, _worker_options
+    _worker_factory = configuration_factory
+    _worker_options = options
+
+
+def _process_chunk(file_paths: List[str]) -> List[FileResult]:
+    assert _worker_factory is not None, "Worker not initialized"
+    return [process_file(f, _worker_factory, _worker_options) for f in file_paths]
+
+
+def _process_contents(contents: List[Tuple[str, bytes]]) -> List[FileResult]:
+    assert _worker_factory is not None
+    return [count_content(f, content, _worker_factory, _worker_options) for f, content in contents]
+
+
+def _process_read_ahead(files: List[Tuple[str, Optional[bytes]]]) -> List[FileResult]:
+    assert _worker_factory is not None
+    return [_count_read_ahead(f, content, _worker_factory, _worker_options) for f, content in files]
+
+
+def _count_read_ahead(file_path: str, content: Optional[bytes], configuration_factory: ProcessorConfigurationFactory,
+                      options: CountOptions) -> FileResult:
+    # The files that were not read ahead are opened as usual, which reports why they can't be read
+    if content is None:
+        return process_file(file_path, configuration_factory, options)
+    return count_content(file_path, content, configuration_factory, options)
+
+
+class _RangeResult(NamedTuple):
+    """Counts of a range of the lines of a file, see _count_range: the total, comment and blank lines, the complexity
+    and the state of the line following the range, for each state the first line of the range was assumed to start in.
+    When the range can't be counted, message or skipped tell why, as for FileResult.
+    The distinct lines of the range, which don't depend on the state, are fingerprinted once when CountOptions.uloc
+    is set."""
+    file_type: Optional[Language]
+    counts: List[Tuple[Any, Tuple[int, int, int, int, Any]]]
+    message: Optional[str] = None
+    skipped: Optional[str] = None
+    read_time: float = 0.0
+    count_time: float = 0.0
+    fingerprints: Optional[array] = None
+
+
+def _count_range(file_path: str, start: int, end: int, configuration_factory: ProcessorConfigurationFactory,
+                 options: CountOptions, states: Optional[List[Any]] = None) -> _RangeResult:
+    """Counts the lines of the given range of a file, the range starting and ending on a line boundary.
+
+    As the range may start in a multi line comment, it is counted from each of the states given, defaulting to the
+    start of a file for the first range and to the split states of the classifier for the others, see
+    LineClassifier.split_states. The lines are split and classified as process_file would, so that the counts of the
+    ranges add up to the counts of the whole file."""
+    try:
+        start_time = perf_counter() if options.timed else 0.0
+        file_name = os.path.basename(file_path)
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            file_configuration = configuration_factory.get_configuration(file_name=file_name)
+            if not file_configuration:
+                file_configuration = configuration_factory.get_shebang_configuration(mm[:SHEBANG_SIZE])
+            if not file_configuration:
+                return _RangeResult(None, [], f"No configuration found for the file {file_path}. Skipping...")
+            content = mm[start:end]
+        # Only the first range holds the start of the file, which tells the binary or generated files
+        skipped = sniff_content(content[:SNIFF_SIZE]) if options.sniff and start == 0 else None
+        if not skipped and options.max_line_length is not None and has_long_line(content, options.max_line_length):
+            skipped = LONG_LINES
+        if skipped:
+            return _RangeResult(file_configuration.file_type, [], skipped=skipped)
+        read = perf_counter() if options.timed else 0.0
+        classifier = file_configuration.get_classifier(binary=options.engine == BYTES_ENGINE,
+                                                       accurate=options.accurate, complexity=options.complexity)
+        if options.engine == BYTES_ENGINE:
+            # Split as the lines of a memory mapped file are, see binary_lines. The range ends after a LF, so it
+            # doesn't split a CRLF.
+            lines: List[Any] = content.splitlines()
+        else:
+            lines = list(io.StringIO(content.decode('utf-8', errors='ignore'), newline=None))
+        if states is None:
+            states = [None] if start == 0 else [None, *classifier.split_states()]
+        unique_lines: Optional[Set[Any]] = set() if options.uloc else None
+        counts = []
+        for state in states:
+            # The lines are gathered along the first counting only
+            counted = lines if unique_lines is None or counts else collect_lines(lines, unique_lines)
+            counts.append((state, classifier.count_from(counted, state, options.complexity)))
+        fingerprints = fingerprint_array(unique_lines) if unique_lines is not None else None
+        if options.timed:
+            return _RangeResult(file_configuration.file_type, counts, read_time=read - start_time,
+                                count_time=perf_counter() - read, fingerprints=fingerprints)
+        return _RangeResult(file_configuration.file_type, counts, fingerprints=fingerprints)
+    except Exception as e:
+        return _RangeResult(None, [], f"Error processing file {file_path}: {e} Skipping...")
+
+
+def _process_range(file_path: str, start: int, end: int) -> _RangeResult:
+    assert _worker_factory is not None
+    return _count_range(file_path, start, end, _worker_factory, _worker_options)
+
+
+class _SplitCount:
+    """Counting of a file split in ranges of lines, each range being counted by a worker process. Its result is
+    stitched from the counts of the ranges, following the state of the last line of each range into the next one."""
+
+    def __init__(self, file_path: str, ranges: List[Tuple[int, int]], size: int, executor,
+                 configuration_factory: ProcessorConfigurationFactory, options: CountOptions):
+        self.file_path = file_path
+        self.ranges = ranges
+        self.size = size
+        self.configuration_factory = configuration_factory
+        self.options = options
+        self.futures = [executor.submit(_process_range, file_path, start, end) for start, end in ranges]
+
+    def result(self) -> List[FileResult]:
+        """Returns the result of the file, as a list like the results of a chunk of files."""
+        return [self._stitch([future.result() for future in self.futures])]
+
+    def _stitch(self, results: List[_RangeResult]) -> FileResult:
+        # The reasons to skip the first range, the start of the file, come first as they come first in process_file
+        for result in results:
+            if result.message or result.skipped:
+                return FileResult(self.file_path, None, result.message, result.skipped)
+        totals = [0, 0, 0, 0]
+        state = None
+        for (start, end), result in zip(self.ranges, results):
+            counts = next((counts for counted, counts in result.counts if counted == state), None)
+            if counts is None:
+                # The range starts in a state it was not counted from, e.g. in a string, it is counted again from it
+                result = _count_range(self.file_path, start, end, self.configuration_factory, self.options, [state])
+                if result.message:
+                    return FileResult(self.file_path, None, result.message)
+                counts = result.counts[0][1]
+            totals = [total + count for total, count in zip(totals, counts)]
+            state = counts[4]
+        total, comments, blanks, complexity = totals
+        file_type = results[0].file_type
+        assert file_type is not None, "Only the ranges that can't be counted have no language"
+        report = Report(file_type, code=total - comments - blanks, comments=comments, blanks=blanks,
+                        complexity=complexity)
+        fingerprints = None
+        if self.options.uloc:
+            # The lines of the ranges are fingerprinted apart, a line found in several ranges is dropped here
+            fingerprints = array(FINGERPRINT_TYPECODE, set().union(
+                *(result.fingerprints for result in results if result.fingerprints is not None)))
+        if self.options.timed:
+            # Summed over the workers, as the times of the files counted in parallel are
+            return FileResult(self.file_path, report,
+                              stats=FileStats(self.size, sum(result.read_time for result in results),
+                                              sum(result.count_time for result in results)),
+                              fingerprints=fingerprints)
+        return FileResult(self.file_path, report, fingerprints=fingerprints)
+
+
+def _split_ranges(file_path: str) -> Tuple[List[Tuple[int, int]], int]:
+    """Returns the ranges of about RANGE_SIZE bytes the file is split in, each ending after a line feed, along with
+    the size of the file."""
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            ranges = []
+            start = 0
+            while start < size:
+                found = mm.find(b'\n', start + RANGE_SIZE - 1) if start + RANGE_SIZE < size else -1
+                end = size if found < 0 else found + 1
+                ranges.append((start, end))
+                start = end
+    return ranges, size
+
+
+def _count_split(file_path: str, executor, configuration_factory: ProcessorConfigurationFactory,
+                 options: CountOptions) -> Union['Future', _SplitCount]:
+    """Submits the counting of the ranges of the file, returning the object providing its result."""
+    try:
+        ranges, size = _split_ranges(file_path)
+    except (OSError, ValueError):
+        # Counted as usual, which reports why the file can't be read
+        return executor.submit(_process_chunk, [file_path])
+    return _SplitCount(file_path, ranges, size, executor, configuration_factory, options)
+
+
+class _Item(NamedTuple):
+    """A file to count, along with its cached result if any and the key to cache its result with.
+    The size is known when the file was stat-ed while walking or looking up the cache, the content when it was read
+    ahead. When duplicates are looked for, entry is the entry of the file, or of the first file of the same content
+    when the file is a duplicate, which is then not counted."""
+    path: str
+    hit: Optional[FileResult] = None
+    cache_key: Optional[Tuple[os.stat_result, str]] = None
+    size: Optional[int] = None
+    content: Optional[bytes] = None
+    entry: Optional[DuplicateEntry[FileResult]] = None
+    duplicate: bool = False
+
+
+def count_files(files: Iterable[Union[str, FileEntry]],
+                configuration_factory: ProcessorConfigurationFactory,
+                jobs: Optional[int] = None,
+                serial_threshold: int = SERIAL_THRESHOLD,
+                options: CountOptions = DEFAULT_OPTIONS,
+                cache: Optional[ReportCache] = None,
+                read_ahead: Optional[ReadAhead] = None,
+                duplicates: bool = False) -> Iterator[FileResult]:
+    """Counts the given files, yielding the results in the same order as the input.
+
+    Files are consumed lazily and only a bounded number of them is in flight at any time,
+    so memory doesn't grow with the number of files. With several jobs, the files of SPLIT_SIZE bytes or more
+    are split in ranges of lines counted by several workers, whose counts are stitched in the report of the file.
+
+    Args:
+        files: Paths of the files to count, or the entries found by walk_files, whose stat is reused.
+        configuration_factory: Factory used to retrieve the configuration of each file.
+        jobs: Number of worker processes, defaults to the number of CPUs. With 1 job the files are counted in process.
+        serial_threshold: Minimum number of files to count required to start the worker pool.
+        options: Settings of the counting.
+        cache: Cache of the reports, the files found in it are only stat-ed and not read. Unused with options.uloc.
+        read_ahead: When given, the files are read by a pool of threads ahead of their counting, see ReadAhead.
+            The budget of bytes read ahead relies on the sizes of the FileEntry, or of the cache lookups.
+        duplicates: Whether to look for the files of the same content and language, see DuplicateFinder. Only the
+            first of them is counted, the others share its result, with the path of the first as duplicate_of.
+    """
+    if options.uloc:
+        # The cached reports don't hold the fingerprints of the lines
+        cache = None
+    if cache is None:
+        items = (_Item(f) if isinstance(f, str) else _Item(f.path, size=f.stat.st_size) for f in files)
+    else:
+        items = (_lookup(f, configuration_factory, options, cache) for f in files)
+    if duplicates:
+        items = _find_duplicates(items, configuration_factory)
+    for item, result in _count_items(items, configuration_factory, jobs, serial_threshold, options, read_ahead):
+        if item.entry is not None:
+            if not item.duplicate:
+                # The first file of its content is always yielded before its duplicates
+                item.entry.value = result
+            elif item.hit is not None and (item.hit.report is not None or item.hit.skipped is not None):
+                result = item.hit._replace(duplicate_of=item.entry.path)
+            else:
+                first = item.entry.value
+                assert first is not None, "The first file of its content is yielded first"
+                result = first._replace(path=item.path, stats=None, duplicate_of=item.entry.path)
+        if cache is not None and item.cache_key is not None:
+            if result.report is not None:
+                cache.put(result.path, item.cache_key[0], item.cache_key[1], result.report)
+            elif result.skipped is not None:
+                cache.put_skipped(result.path, item.cache_key[0], item.cache_key[1], result.skipped)
+        yield result
+
+
+def _lookup(entry: Union[str, FileEntry], configuration_factory: ProcessorConfigurationFactory,
+            options: CountOptions, cache: ReportCache) -> _Item:
+    f = entry if isinstance(entry, str) else entry.path
+    file_configuration = configuration_factory.get_configuration(file_name=os.path.basename(f))
+    try:
+        stat = os.stat(f) if isinstance(entry, str) else entry.stat
+    except OSError:
+        # Left to process_file, which reports the reason
+        return _Item(f, size=None)
+    if not file_configuration or \
+            (options.max_file_size is not None and stat.st_size > options.max_file_size):
+        # Unsupported or too large files, as well as the ones only known from their shebang,
+        # are left to process_file, which reports the reason
+        return _Item(f, size=stat.st_size if file_configuration else None)
+    config_hash = ReportCache.config_hash(file_configuration.fingerprint, options.cache_key)
+    cached = cache.get(f, stat, config_hash)
+    if cached is None:
+        return _Item(f, cache_key=(stat, config_hash), size=stat.st_size)
+    if isinstance(cached, str):
+        return _Item(f, hit=FileResult(f, None, skipped=cached), size=stat.st_size)
+    return _Item(f, hit=FileResult(f, cached), size=stat.st_size)
+
+
+def _find_duplicates(items: Iterator[_Item], configuration_factory: ProcessorConfigurationFactory) -> Iterator[_Item]:
+    """Sets the duplicate entry of each item, the duplicates not found in the cache getting an empty result so that
+    they are not counted. The files that can't be stat-ed are left to process_file, which reports why."""
+    finder: DuplicateFinder[FileResult] = DuplicateFinder()
+    language_index = configuration_factory.language_index
+    for item in items:
+        size = item.size
+        if size is None:
+            try:
+                size = os.stat(item.path).st_size
+            except OSError:
+                yield item
+                continue
+        # The files only known from their shebang have no language yet, their content tells it
+        entry, duplicate = finder.add(item.path, size, language_index.language_of_name(os.path.basename(item.path)))
+        yield item._replace(size=size, entry=entry, duplicate=duplicate,
+                            hit=item.hit or (FileResult(item.path, None) if duplicate else None))
+
+
+def _count_items(items: Iterator[_Item],
+                 configuration_factory: ProcessorConfigurationFactory,
+                 jobs: Optional[int],
+                 serial_threshold: int,
+                 options: CountOptions,
+                 read_ahead: Optional[ReadAhead] = None) -> Iterator[Tuple[_Item, FileResult]]:
+    """Counts the items not found in the cache, yielding every item with its result in the input order."""
+    jobs = jobs or os.cpu_count() or 1
+    # Look ahead enough files to tell whether the worker pool is worth starting and how to chunk the files
+    head_size = max(serial_threshold, 2, CHUNK_SIZE * jobs * 4) if jobs > 1 else 0
+    head: List[_Item] = []
+    misses = 0
+    for item in items:
+        head.append(item)
+        misses += item.hit is None
+        if misses >= head_size:
+            break
+    items = chain(head, items)
+    if jobs > 1:
+        items = (_sized(item) for item in items)
+    if read_ahead is not None:
+        items = _read_items(items, read_ahead, options)
+
+    def splits(item: _Item) -> bool:
+        return jobs > 1 and _splits(item, configuration_factory, options)
+
+    if jobs <= 1 or misses < max(serial_threshold, 2):
+        executor = None
+        try:
+            for item in items:
+                if splits(item):
+                    # Even a single big file is worth the worker pool
+                    from concurrent.futures import ProcessPoolExecutor
+                    executor = executor or ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                                               initargs=(configuration_factory, options))
+                    yield item, _count_split(item.path, executor, configuration_factory, options).result()[0]
+                else:
+                    yield item, item.hit or _count_read_ahead(item.path, item.content, configuration_factory, options)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        return
+
+    # The process pool is slow to import, small runs never need it
+    from concurrent.futures import ProcessPoolExecutor
+    # Give each worker several chunks so that a slow chunk does not leave the others idle
+    chunk_size = CHUNK_SIZE if misses >= head_size else max(1, misses // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs,
+                             initializer=_init_worker,
+                             initargs=(configuration_factory, options)) as executor:
+        # Chunks submitted and not yet yielded, bounded to keep the memory flat
+        window: Deque[Tuple[List[_Item], Union['Future', _SplitCount, None]]] = deque()
+        for batch in _batches(items, chunk_size, splits):
+            if len(batch) == 1 and splits(batch[0]):
+                future = _count_split(batch[0].path, executor, configuration_factory, options)
+            elif read_ahead is not None:
+                files = [(item.path, item.content) for item in batch if item.hit is None]
+                future = executor.submit(_process_read_ahead, files) if files else None
+            else:
+                paths = [item.path for item in batch if item.hit is None]
+                future = executor.submit(_process_chunk, paths) if paths else None
+            window.append((batch, future))
+            if len(window) > jobs * 4:
+                yield from _merge(*window.popleft())
+        while window:
+            yield from _merge(*window.popleft())
+
+
+def _sized(item: _Item) -> _Item:
+    """Fills the size of the file to count when it was not stat-ed yet, to tell whether to split it."""
+    if item.hit is not None or item.size is not None:
+        return item
+    try:
+        return item._replace(size=os.stat(item.path).st_size)
+    except OSError:
+        return item
+
+
+def _splits(item: _Item, configuration_factory: ProcessorConfigurationFactory, options: CountOptions) -> bool:
+    """Tells whether the file is big enough to be split in ranges counted in parallel, see SPLIT_SIZE.
+    The files left out of the counting from their size or name are left to process_file, which reports why."""
+    if item.hit is not None or item.size is None or item.size < SPLIT_SIZE or \
+            (options.max_file_size is not None and item.size > options.max_file_size):
+        return False
+    file_name = os.path.basename(item.path)
+    return bool(configuration_factory.get_configuration(file_name=file_name)) or \
+        configuration_factory.language_index.is_shebang_candidate(file_name)
+
+
+def _batches(items: Iterator[_Item], chunk_size: int,
+             alone: Optional[Callable[[_Item], bool]] = None) -> Iterator[List[_Item]]:
+    """Groups the items in batches holding at most chunk_size files to count, plus a bounded number of cache hits,
+    and at most about CHUNK_BYTES of contents read ahead. The items for which alone is true get a batch of their
+    own."""
+    batch: List[_Item] = []
+    misses = 0
+    size = 0
+    for item in items:
+        if alone is not None and alone(item):
+            if batch:
+                yield batch
+            yield [item]
+            batch = []
+            misses = 0
+            size = 0
+            continue
+        batch.append(item)
+        misses += item.hit is None
+        size += len(item.content) if item.content is not None else 0
+        if misses >= chunk_size or len(batch) >= chunk_size * 8 or size >= CHUNK_BYTES:
+            yield batch
+            batch = []
+            misses = 0
+            size = 0
+    if batch:
+        yield batch
+
+
+def _read_items(items: Iterator[_Item], read_ahead: ReadAhead, options: CountOptions) -> Iterator[_Item]:
+    """Reads the content of the items to count with a pool of threads, yielding the items in the input order as soon
+    as their content is read.
+
+    The items are pulled from the input only while the contents read and not yielded yet fit in
+    read_ahead.max_bytes, and at most READ_AHEAD_FILES per thread are ahead, so a slow consumer holds the readers
+    back. The files bigger than the budget or than options.max_file_size, and the ones failing to be read, are
+    yielded without content and left to process_file."""
+    from concurrent.futures import ThreadPoolExecutor
+    max_size = read_ahead.max_bytes if options.max_file_size is None else \
+        min(read_ahead.max_bytes, options.max_file_size)
+    max_files = read_ahead.threads * READ_AHEAD_FILES
+    # Items not yielded yet, along with the reading of their content and the bytes reserved for it
+    window: Deque[Tuple[_Item, Optional['Future'], int]] = deque()
+    in_flight = 0
+    with ThreadPoolExecutor(max_workers=read_ahead.threads, thread_name_prefix='pylocc-read') as executor:
+        try:
+            for item in items:
+                size = _item_size(item) if item.hit is None else None
+                if size is not None and size > max_size:
+                    size = None
+                while window and (len(window) >= max_files or
+                                  (size is not None and in_flight + size > read_ahead.max_bytes)):
+                    in_flight -= window[0][2]
+                    yield _read_result(*window.popleft()[:2])
+                if size is not None:
+                    window.append((item, executor.submit(_read_file, item.path, max_size), size))
+                    in_flight += size
+                else:
+                    window.append((item, None, 0))
+            while window:
+                yield _read_result(*window.popleft()[:2])
+        finally:
+            # The pending readings are dropped when the consumer stops early
+            for _, future, _ in window:
+                if future is not None:
+                    future.cancel()
+
+
+def _item_size(item: _Item) -> Optional[int]:
+    """Returns the size of the file of the item, stat-ing the files only known by their path so that they count
+    against the budget too, or None if it can't be stat-ed."""
+    if item.size is not None:
+        return item.size
+    try:
+        return os.stat(item.path).st_size
+    except OSError:
+        return None
+
+
+def _read_file(file_path: str, max_size: int) -> Optional[bytes]:
+    try:
+        with open(file_path, 'rb') as f:
+            # The size of the files only known by their path is checked once open
+            if os.fstat(f.fileno()).st_size > max_size:
+                return None
+            return f.read()
+    except OSError:
+        return None
+
+
+def _read_result(item: _Item, future: Optional['Future']) -> _Item:
+    if future is None:
+        return item
+    return item._replace(content=future.result())
+
+
+def _merge(batch: List[_Item], future: Union['Future', _SplitCount, None]) -> Iterator[Tuple[_Item, FileResult]]:
+    results = iter(future.result() if future is not None else [])
+    for item in batch:
+        yield item, item.hit or next(results)
+
+
+def count_contents(contents: Iterable[Tuple[str, Optional[bytes]]],
+                   configuration_factory: ProcessorConfigurationFactory,
+                   jobs: Optional[int] = None,
+                   serial_threshold: int = SERIAL_THRESHOLD,
+                   options: CountOptions = DEFAULT_OPTIONS) -> Iterator[FileResult]:
+    """Counts files whose content is already read, such as the members of an archive, yielding the results in the
+    same order as the input.
+
+    The contents are consumed lazily and sent to the worker processes in chunks of at most CHUNK_BYTES, with a bounded
+    number of chunks in flight, so that the memory stays flat whatever the number and size of the files.
+
+    Args:
+        contents: Path and content of the files to count, see count_content. A None content stands for a file
+            left unread because it is bigger than options.max_file_size.
+        See count_files for the others.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    contents = iter(contents)
+    head = list(islice(contents, max(serial_threshold, 2))) if jobs > 1 else []
+    if jobs <= 1 or len(head) < max(serial_threshold, 2):
+        for f, content in chain(head, contents):
+            yield _count_read_content(f, content, configuration_factory, options)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=jobs,
+                             initializer=_init_worker,
+                             initargs=(configuration_factory, options)) as executor:
+        window: Deque[Tuple[List[Tuple[str, Optional[bytes]]], 'Future']] = deque()
+        for batch in _content_batches(chain(head, contents)):
+            window.append((batch, executor.submit(_process_contents, [(f, c) for f, c in batch if c is not None])))
+            if len(window) > jobs * 2:
+                yield from _merge_contents(*window.popleft())
+        while window:
+            yield from _merge_contents(*window.popleft())
+
+
+def _count_read_content(file_path: str, content: Optional[bytes], configuration_factory: ProcessorConfigurationFactory,
+                        options: CountOptions) -> FileResult:
+    if content is None:
+        return FileResult(file_path, None, skipped=TOO_LARGE)
+    return count_content(file_path, content, configuration_factory, options)
+
+
+def _content_batches(contents: Iterator[Tuple[str, Optional[bytes]]]) -> Iterator[List[Tuple[str, Optional[bytes]]]]:
+    batch: List[Tuple[str, Optional[bytes]]] = []
+    size = 0
+    for f, content in contents:
+        batch.append((f, content))
+        size += len(content) if content is not None else 0
+        if len(batch) >= CHUNK_SIZE or size >= CHUNK_BYTES:
+            yield batch
+            batch = []
+            size = 0
+    if batch:
+        yield batch
+
+
+def _merge_contents(batch: List[Tuple[str, Optional[bytes]]], future: 'Future') -> Iterator[FileResult]:
+    results = iter(future.result())
+    for f, content in batch:
+        yield FileResult(f, None, skipped=TOO_LARGE) if content is None else next(results)
+
+
+def count_blobs(entries: List[Tuple[str, str]],
+                configuration_factory: ProcessorConfigurationFactory,
+                jobs: Optional[int] = None,
+                serial_threshold: int = SERIAL_THRESHOLD,
+                options: CountOptions = DEFAULT_OPTIONS,
+                cache: Optional[ReportCache] = None,
+                duplicates: bool = False) -> Iterator[FileResult]:
+    """Counts the given git tracked files, yielding the results in the same order as the input.
+
+    Files sharing the same blob id and configuration have the same content and are counted only once,
+    the blob reports are reused across runs through the cache as well.
+
+    Args:
+        entries: Paths of the files to count, along with their blob id.
+        duplicates: Whether to tell the files of the same blob id and configuration as a previous one apart, with
+            the path of the first one as duplicate_of.
+        See count_files for the others.
+    """
+    if options.uloc:
+        # The cached reports don't hold the fingerprints of the lines
+        cache = None
+    # Key of each entry, None when the file has no configuration
+    keys: List[Optional[Tuple[str, str]]] = []
+    reports: Dict[Tuple[str, str], Report] = {}
+    representatives: Dict[Tuple[str, str], str] = {}
+    for f, blob_id in entries:
+        file_configuration = configuration_factory.get_configuration(file_name=os.path.basename(f))
+        if not file_configuration:
+            keys.append(None)
+            continue
+        key = (blob_id, ReportCache.config_hash(file_configuration.fingerprint, options.cache_key))
+        keys.append(key)
+        if key in reports or key in representatives:
+            continue
+        report = cache.get_blob(*key) if cache else None
+        if report is None:
+            representatives[key] = f
+        else:
+            reports[key] = report
+
+    counted = dict(zip(representatives, count_files(
+        list(representatives.values()), configuration_factory, jobs, serial_threshold, options)))
+    for key, result in counted.items():
+        if result.report is not None:
+            reports[key] = result.report
+            if cache:
+                cache.put_blob(*key, result.report)
+
+    # First file of each key, when looking for duplicates
+    firsts: Dict[Tuple[str, str], str] = {}
+    for (f, _), key in zip(entries, keys):
+        if key is None:
+            yield process_file(f, configuration_factory, options)
+            continue
+        if key not in counted:
+            result = FileResult(f, reports[key])
+        elif counted[key].message is not None and f != representatives[key]:
+            # A failure belongs to the file counted, e.g. missing from the working tree, the others are counted apart
+            result = process_file(f, configuration_factory, options)
+        else:
+            # The counted results keep their fingerprints, the cached reports have none
+            result = counted[key]._replace(path=f)
+        if duplicates:
+            first = firsts.setdefault(key, f)
+            if first != f:
+                result = result._replace(duplicate_of=first)
+        yield result
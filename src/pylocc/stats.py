@@ -0,0 +1,147 @@
+import heapq
+from contextlib import contextmanager
+from time import perf_counter
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Tuple, TypeVar
+
+from pylocc.language import Language
+from pylocc.runner import FileResult
+
+if TYPE_CHECKING:
+    from rich.table import Table
+
+T = TypeVar('T')
+
+# Stages of a run, in pipeline order
+WALK_STAGE = 'walk'
+READ_STAGE = 'read'
+COUNT_STAGE = 'count'
+REPORT_STAGE = 'report'
+RENDER_STAGE = 'render'
+STAGES = [WALK_STAGE, READ_STAGE, COUNT_STAGE, REPORT_STAGE, RENDER_STAGE]
+# Stages measured in each file, their time is summed over the worker processes
+FILE_STAGES = {READ_STAGE, COUNT_STAGE}
+DEFAULT_SLOWEST_FILES = 10
+
+
+class RunStats:
+    """Timings and throughput of a counting run.
+
+    The walk, report and render stages are timed in the main process, the read and count stages are
+    summed from the FileStats of the counted files, so with several jobs they can exceed the wall time.
+    Files served by the cache have no FileStats: they add to the totals but not to the timings."""
+
+    def __init__(self, slowest_files: int = DEFAULT_SLOWEST_FILES):
+        self.slowest_files = slowest_files
+        self.started = perf_counter()
+        self.elapsed = 0.0
+        self.stages: Dict[str, float] = dict.fromkeys(STAGES, 0.0)
+        self.files = 0
+        self.cached_files = 0
+        self.bytes = 0
+        self.lines = 0
+        # Files, bytes, lines and seconds of each language
+        self.languages: Dict[Language, List[float]] = {}
+        self._slowest: List[Tuple[float, str]] = []
+
+    @contextmanager
+    def stage(self, name: str):
+        """Adds the time spent in the block to the given stage."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] += perf_counter() - start
+
+    def timed(self, iterable: Iterable[T], name: str) -> Iterator[T]:
+        """Yields the items of the iterable, adding the time spent producing them to the given stage."""
+        iterator = iter(iterable)
+        while True:
+            start = perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.stages[name] += perf_counter() - start
+                return
+            self.stages[name] += perf_counter() - start
+            yield item
+
+    def track(self, results: Iterable[FileResult]) -> Iterator[FileResult]:
+        """Yields the results, accounting for each of them and adding the time the consumer spends
+        handling them to the report stage."""
+        for result in results:
+            self.add(result)
+            start = perf_counter()
+            yield result
+            self.stages[REPORT_STAGE] += perf_counter() - start
+
+    def add(self, result: FileResult):
+        """Accounts for a counted file."""
+        if result.report is None:
+            return
+        self.files += 1
+        self.lines += result.report.total
+        language = self.languages.get(result.report.file_type)
+        if language is None:
+            language = self.languages[result.report.file_type] = [0, 0, 0, 0.0]
+        language[0] += 1
+        language[2] += result.report.total
+        if result.stats is None:
+            self.cached_files += 1
+            return
+        elapsed = result.stats.read_time + result.stats.count_time
+        self.bytes += result.stats.size
+        self.stages[READ_STAGE] += result.stats.read_time
+        self.stages[COUNT_STAGE] += result.stats.count_time
+        language[1] += result.stats.size
+        language[3] += elapsed
+        if len(self._slowest) < self.slowest_files:
+            heapq.heappush(self._slowest, (elapsed, result.path))
+        elif self._slowest and elapsed > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, (elapsed, result.path))
+
+    def stop(self):
+        """Marks the end of the run."""
+        self.elapsed = perf_counter() - self.started
+
+    @property
+    def slowest(self) -> List[Tuple[float, str]]:
+        """The slowest files with their read and count time, slowest first."""
+        return sorted(self._slowest, reverse=True)
+
+    def create_tables(self) -> List['Table']:
+        from rich.table import Table
+
+        elapsed = self.elapsed or perf_counter() - self.started
+        stages = Table(title="Stages", show_header=True, header_style="bold magenta")
+        stages.add_column("Stage", justify="left")
+        stages.add_column("Seconds", justify="right")
+        stages.add_column("Share", justify="right")
+        for name in STAGES:
+            label = f"{name} (all jobs)" if name in FILE_STAGES else name
+            stages.add_row(label, f"{self.stages[name]:.3f}", f"{self.stages[name] / elapsed:.0%}" if elapsed else "-")
+        stages.add_row("Total (wall)", f"{elapsed:.3f}", "100%")
+
+        throughput = Table(title="Throughput", show_header=True, header_style="bold magenta")
+        for header in ["Files", "Cached", "Files/s", "MB/s", "Lines/s"]:
+            throughput.add_column(header, justify="right")
+        throughput.add_row(f"{self.files:,}", f"{self.cached_files:,}", _rate(self.files, elapsed),
+                           _rate(self.bytes / 1e6, elapsed, ".1f"), _rate(self.lines, elapsed))
+
+        languages = Table(title="Languages", show_header=True, header_style="bold magenta")
+        languages.add_column("Language", justify="left")
+        for header in ["Files", "MB", "Lines", "Seconds", "Lines/s"]:
+            languages.add_column(header, justify="right")
+        for language, (files, size, lines, seconds) in sorted(self.languages.items(), key=lambda l: -l[1][3]):
+            languages.add_row(language.value, f"{files:,}", f"{size / 1e6:.1f}", f"{lines:,}", f"{seconds:.3f}",
+                              _rate(lines, seconds))
+
+        slowest = Table(title=f"Slowest {self.slowest_files} files", show_header=True, header_style="bold magenta")
+        slowest.add_column("Seconds", justify="right")
+        slowest.add_column("File", justify="left")
+        for elapsed_file, path in self.slowest:
+            slowest.add_row(f"{elapsed_file:.4f}", path)
+        return [stages, throughput, languages, slowest]
+
+
+def _rate(amount: float, seconds: float, spec: str = ",.0f") -> str:
+    return format(amount / seconds, spec) if seconds > 0 else "-"
@@ -0,0 +1,246 @@
+import os
+import sys
+from array import array
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from pylocc.language import Language
+from pylocc.processor import Report
+
+# Type codes of the columns: 16 bits language ids, 32 bits directory ids, offsets and counts
+LANGUAGE_TYPECODE = 'H'
+DIRECTORY_TYPECODE = 'I'
+OFFSET_TYPECODE = 'Q'
+COUNT_TYPECODE = 'I'
+# File names are stored as os.fsencode would encode them, so that any name can be decoded back
+_ENCODING = sys.getfilesystemencoding()
+_ERRORS = sys.getfilesystemencodeerrors()
+
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """Returns the numpy module when it is installed, None otherwise. It is optional and slow to import,
+    so it is only imported when a store is first aggregated."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class ReportStore:
+    """Compact, append only store of the reports of many files, a memory efficient alternative to Dict[str, Report].
+
+    Instead of a Report object and a full path string per file, the reports are stored in columns:
+    the language id, the directory id and the counts are machine integers in arrays, the directories are
+    interned, so that files of the same directory share their prefix, and the file names are encoded
+    in a single buffer. A file costs about 30 bytes plus the length of its name, against about 250
+    bytes for a dictionary entry holding a Report.
+
+    Aggregating the store sums the columns per language at once, with numpy when it is installed.
+    The store supports len, iteration over the paths and items and values like a dictionary,
+    the reports it returns being rebuilt from the columns."""
+
+    def __init__(self):
+        self._languages: List[Language] = []
+        self._language_ids: Dict[Language, int] = {}
+        self._directories: List[str] = []
+        self._directory_ids: Dict[str, int] = {}
+        self._language = array(LANGUAGE_TYPECODE)
+        self._directory = array(DIRECTORY_TYPECODE)
+        self._names = bytearray()
+        # End offset of the name of each file in _names
+        self._name_ends = array(OFFSET_TYPECODE)
+        self._code = array(COUNT_TYPECODE)
+        self._comments = array(COUNT_TYPECODE)
+        self._blanks = array(COUNT_TYPECODE)
+        self._complexity = array(COUNT_TYPECODE)
+
+    def add(self, file_path: str, report: Report):
+        """Appends the report of a file. The same path may be added twice, it is then stored twice."""
+        language_id = self._language_ids.get(report.file_type)
+        if language_id is None:
+            language_id = self._language_ids[report.file_type] = len(self._languages)
+            self._languages.append(report.file_type)
+        # The directory keeps its trailing separator, so that joining it with the name gives back the path
+        cut = max(file_path.rfind('/'), file_path.rfind(os.sep)) + 1
+        directory = file_path[:cut]
+        directory_id = self._directory_ids.get(directory)
+        if directory_id is None:
+            directory_id = self._directory_ids[directory] = len(self._directories)
+            self._directories.append(directory)
+        self._language.append(language_id)
+        self._directory.append(directory_id)
+        self._names += file_path[cut:].encode(_ENCODING, _ERRORS)
+        self._name_ends.append(len(self._names))
+        self._code.append(report.code)
+        self._comments.append(report.comments)
+        self._blanks.append(report.blanks)
+        self._complexity.append(report.complexity)
+
+    def extend(self, other: 'ReportStore'):
+        """Appends the reports of another store, e.g. to merge the partial results of several runs."""
+        language_ids = []
+        for language in other._languages:
+            if language not in self._language_ids:
+                self._language_ids[language] = len(self._languages)
+                self._languages.append(language)
+            language_ids.append(self._language_ids[language])
+        directory_ids = []
+        for directory in other._directories:
+            if directory not in self._directory_ids:
+                self._directory_ids[directory] = len(self._directories)
+                self._directories.append(directory)
+            directory_ids.append(self._directory_ids[directory])
+        self._language.extend(language_ids[language_id] for language_id in other._language)
+        self._directory.extend(directory_ids[directory_id] for directory_id in other._directory)
+        offset = len(self._names)
+        self._names += other._names
+        self._name_ends.extend(end + offset for end in other._name_ends)
+        for column, other_column in zip(self._counts, other._counts):
+            column.extend(other_column)
+
+    def sort(self, key: Callable[[str], Any]):
+        """Sorts the reports in place by the key of their path, e.g. walk_order_key."""
+        paths = list(self.paths())
+        order = sorted(range(len(paths)), key=lambda i: key(paths[i]))
+        names = self._names
+        starts = [0] + self._name_ends[:-1].tolist()
+        self._names = bytearray().join(names[starts[i]:self._name_ends[i]] for i in order)
+        lengths = [self._name_ends[i] - starts[i] for i in order]
+        self._name_ends = array(OFFSET_TYPECODE)
+        end = 0
+        for length in lengths:
+            end += length
+            self._name_ends.append(end)
+        # The languages are numbered again in order of appearance, the order of the rows of the aggregate
+        language_ids: Dict[int, int] = {}
+        for i in order:
+            language_ids.setdefault(self._language[i], len(language_ids))
+        self._languages = [self._languages[language_id] for language_id in language_ids]
+        self._language_ids = {language: i for i, language in enumerate(self._languages)}
+        self._language = array(LANGUAGE_TYPECODE, [language_ids[self._language[i]] for i in order])
+        self._directory = array(DIRECTORY_TYPECODE, [self._directory[i] for i in order])
+        self._code, self._comments, self._blanks, self._complexity = \
+            [array(COUNT_TYPECODE, [column[i] for i in order]) for column in self._counts]
+
+    @property
+    def _counts(self) -> List[array]:
+        return [self._code, self._comments, self._blanks, self._complexity]
+
+    def serialize(self) -> Tuple[Dict[str, Any], List[bytes]]:
+        """Returns the tables of the store, to be stored as JSON, and its columns as little endian bytes.
+        The store is rebuilt from them by deserialize."""
+        tables = {
+            'languages': [language.value for language in self._languages],
+            'directories': self._directories,
+            'typecodes': [column.typecode for column in self._columns],
+            'itemsizes': [column.itemsize for column in self._columns],
+        }
+        columns = []
+        for column in self._columns:
+            if sys.byteorder == 'big':
+                column = array(column.typecode, column)
+                column.byteswap()
+            columns.append(column.tobytes())
+        return tables, columns + [bytes(self._names)]
+
+    @classmethod
+    def deserialize(cls, tables: Dict[str, Any], columns: List[bytes]) -> 'ReportStore':
+        """Rebuilds a store from the tables and the columns returned by serialize.
+        Raises ValueError when they don't describe a valid store."""
+        report_store = cls()
+        try:
+            report_store._languages = [Language(language) for language in tables['languages']]
+            report_store._directories = list(tables['directories'])
+            layout = list(zip(tables['typecodes'], tables['itemsizes']))
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid report store tables: {e}") from None
+        if layout != [(column.typecode, column.itemsize) for column in report_store._columns] or \
+                len(columns) != len(layout) + 1:
+            raise ValueError("Unsupported report store layout")
+        for column, data in zip(report_store._columns, columns):
+            column.frombytes(data)
+            if sys.byteorder == 'big':
+                column.byteswap()
+        report_store._names = bytearray(columns[-1])
+        report_store._language_ids = {language: i for i, language in enumerate(report_store._languages)}
+        report_store._directory_ids = {directory: i for i, directory in enumerate(report_store._directories)}
+        size = len(report_store._language)
+        if any(len(column) != size for column in report_store._columns) or \
+                (size and report_store._name_ends[-1] != len(report_store._names)) or \
+                (size and (max(report_store._language) >= len(report_store._languages) or
+                           max(report_store._directory) >= len(report_store._directories))):
+            raise ValueError("Inconsistent report store columns")
+        return report_store
+
+    @property
+    def _columns(self) -> List[array]:
+        return [self._language, self._directory, self._name_ends] + self._counts
+
+    def __len__(self) -> int:
+        return len(self._language)
+
+    def __bool__(self) -> bool:
+        return len(self._language) > 0
+
+    def __iter__(self) -> Iterator[str]:
+        return self.paths()
+
+    def paths(self) -> Iterator[str]:
+        """Yields the path of each file, in the order they were added."""
+        directories = self._directories
+        names = self._names
+        start = 0
+        for directory_id, end in zip(self._directory, self._name_ends):
+            yield directories[directory_id] + names[start:end].decode(_ENCODING, _ERRORS)
+            start = end
+
+    def values(self) -> Iterator[Report]:
+        """Yields the report of each file, in the order they were added."""
+        languages = self._languages
+        for language_id, code, comments, blanks, complexity in zip(self._language, self._code, self._comments,
+                                                                  self._blanks, self._complexity):
+            yield Report(languages[language_id], code=code, comments=comments, blanks=blanks, complexity=complexity)
+
+    def items(self) -> Iterator[Tuple[str, Report]]:
+        """Yields the path and the report of each file, in the order they were added."""
+        return zip(self.paths(), self.values())
+
+    def aggregate(self) -> Dict[Language, Tuple[int, Report]]:
+        """Sums the reports per language, column by column, returning the number of files and the summed report
+        of each language."""
+        numpy = _numpy()
+        columns = self._counts
+        count = len(self._languages)
+        if numpy is not None:
+            ids = numpy.frombuffer(self._language, dtype=self._language.typecode)
+            files = numpy.bincount(ids, minlength=count).tolist()
+            # The sums of the weights are floats, exact up to 2**53 lines
+            sums = [numpy.bincount(ids, weights=numpy.frombuffer(column, dtype=column.typecode),
+                                   minlength=count).astype(numpy.int64).tolist()
+                    for column in columns]
+        else:
+            files = [0] * count
+            sums = [[0] * count for _ in columns]
+            code, comments, blanks, complexity = sums
+            for language_id, file_code, file_comments, file_blanks, file_complexity in zip(self._language, *columns):
+                files[language_id] += 1
+                code[language_id] += file_code
+                comments[language_id] += file_comments
+                blanks[language_id] += file_blanks
+                complexity[language_id] += file_complexity
+        return {language: (files[i], Report(language, code=sums[0][i], comments=sums[1][i], blanks=sums[2][i],
+                                            complexity=sums[3][i]))
+                for i, language in enumerate(self._languages) if files[i]}
+
+    def by_file_rows(self, complexity: bool = False) -> Iterator[List[str]]:
+        """Yields the rows of the by file report, as by_file_row does, straight from the columns."""
+        languages = [language.value for language in self._languages]
+        for path, language_id, code, comments, blanks, file_complexity in zip(
+                self.paths(), self._language, self._code, self._comments, self._blanks, self._complexity):
+            row = [languages[language_id], path, os.path.basename(os.path.splitext(path)[0]),
+                   str(code + comments + blanks), str(code), str(comments), str(blanks)]
+            if complexity:
+                row.append(str(file_complexity))
+            yield row
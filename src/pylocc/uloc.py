@@ -0,0 +1,138 @@
+import math
+from array import array
+from hashlib import blake2b
+from heapq import merge
+from typing import AnyStr, Iterable, Iterator, List, Set, Union
+
+# Type code of the arrays of 64 bits fingerprints
+FINGERPRINT_TYPECODE = 'Q'
+# Number of fingerprints gathered in a set before they are sorted in a run, see UniqueLines
+RUN_SIZE = 64 * 1024
+# Default number of bits of the fingerprints indexing the registers of ApproximateUniqueLines, 2**14 registers of
+# a byte, for a standard error of about 0.8%
+DEFAULT_PRECISION = 14
+
+
+def line_fingerprint(line: Union[str, bytes]) -> int:
+    """Returns the 64 bits fingerprint of a stripped line. The text lines are fingerprinted as their UTF-8 encoding,
+    so that both counting engines agree, and the fingerprints are the same in every process and on every machine."""
+    if isinstance(line, str):
+        line = line.encode('utf-8', 'surrogateescape')
+    return int.from_bytes(blake2b(line, digest_size=8).digest(), 'little')
+
+
+def collect_lines(lines: Iterable[AnyStr], unique_lines: Set[AnyStr]) -> Iterator[AnyStr]:
+    """Yields the lines, adding each of them that is not blank to unique_lines, so that they are gathered in the same
+    pass that counts them. The lines are stripped first: only their indentation and line terminator differ from a
+    copy of the same line. The copies within a file are dropped by the set, before the lines are fingerprinted."""
+    add = unique_lines.add
+    for line in lines:
+        stripped = line.strip()
+        if stripped:
+            add(stripped)
+        yield line
+
+
+def fingerprint_array(lines: Iterable[Union[str, bytes]]) -> array:
+    """Returns the fingerprints of the stripped lines in a compact array, e.g. to send them from a worker process."""
+    return array(FINGERPRINT_TYPECODE, map(line_fingerprint, lines))
+
+
+class UniqueLines:
+    """Exact set of line fingerprints, counting the unique lines of many files in about 8 bytes per unique line,
+    exact but for the collisions of the 64 bits fingerprints, about one in a few billions of lines.
+
+    The fingerprints are gathered in a set of at most RUN_SIZE items, then sorted in an array, a run. A run is merged
+    with the previous one as long as the previous one is not more than twice its size, so that there are only a few
+    runs and each fingerprint is merged a logarithmic number of times. Merging the runs drops the fingerprints found
+    in several files. Sets add up, e.g. the sets of the files counted by several workers, or of several languages."""
+
+    def __init__(self):
+        self._runs: List[array] = []
+        self._pending: Set[int] = set()
+
+    def add(self, fingerprints: Iterable[int]):
+        """Adds the fingerprints of the lines of a file, see fingerprint_array."""
+        self._pending.update(fingerprints)
+        if len(self._pending) >= RUN_SIZE:
+            self._flush()
+
+    def update(self, other: 'UniqueLines'):
+        """Adds the fingerprints of another set."""
+        for run in other._runs:
+            self._push(run)
+        self.add(other._pending)
+
+    def _flush(self):
+        if self._pending:
+            run = array(FINGERPRINT_TYPECODE, sorted(self._pending))
+            self._pending.clear()
+            self._push(run)
+
+    def _push(self, run: array):
+        while self._runs and len(self._runs[-1]) <= 2 * len(run):
+            run = _merge_runs(self._runs.pop(), run)
+        self._runs.append(run)
+
+    def __len__(self) -> int:
+        self._flush()
+        while len(self._runs) > 1:
+            run = self._runs.pop()
+            self._runs[-1] = _merge_runs(self._runs[-1], run)
+        return len(self._runs[0]) if self._runs else 0
+
+
+def _merge_runs(first: array, second: array) -> array:
+    merged = array(FINGERPRINT_TYPECODE)
+    append = merged.append
+    last = None
+    for fingerprint in merge(first, second):
+        if fingerprint != last:
+            append(fingerprint)
+            last = fingerprint
+    return merged
+
+
+class ApproximateUniqueLines:
+    """HyperLogLog estimate of the number of unique line fingerprints, using a fixed 2**precision bytes whatever the
+    number of lines, for the trees whose unique lines don't fit in memory.
+
+    The first precision bits of a fingerprint pick a register, which keeps the highest rank of the first set bit of
+    the other bits among its fingerprints. Sets add up as UniqueLines do, by keeping the highest rank of each
+    register, so the estimate of merged sets is the one of a single set holding every fingerprint."""
+
+    def __init__(self, precision: int = DEFAULT_PRECISION):
+        assert 7 <= precision <= 18, "The precision ranges from 7 to 18 bits"
+        self.precision = precision
+        self._registers = bytearray(1 << precision)
+
+    def add(self, fingerprints: Iterable[int]):
+        """Adds the fingerprints of the lines of a file, see fingerprint_array."""
+        registers = self._registers
+        shift = 64 - self.precision
+        mask = (1 << shift) - 1
+        for fingerprint in fingerprints:
+            index = fingerprint >> shift
+            rank = shift - (fingerprint & mask).bit_length() + 1
+            if rank > registers[index]:
+                registers[index] = rank
+
+    def update(self, other: 'ApproximateUniqueLines'):
+        """Adds the fingerprints of another set of the same precision."""
+        if other.precision != self.precision:
+            raise ValueError(f"Can't merge sets of precisions {self.precision} and {other.precision}")
+        self._registers = bytearray(map(max, self._registers, other._registers))
+
+    def __len__(self) -> int:
+        size = len(self._registers)
+        estimate = 0.7213 / (1 + 1.079 / size) * size * size / sum(2.0 ** -rank for rank in self._registers)
+        empty = self._registers.count(0)
+        if estimate <= 2.5 * size and empty:
+            # Linear counting, more accurate for the small sets
+            estimate = size * math.log(size / empty)
+        return round(estimate)
+
+
+def new_unique_lines(approximate: bool = False) -> Union[UniqueLines, ApproximateUniqueLines]:
+    """Returns an empty set of line fingerprints, exact unless approximate is set."""
+    return ApproximateUniqueLines() if approximate else UniqueLines()
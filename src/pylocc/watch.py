@@ -0,0 +1,352 @@
+import errno
+import json
+import os
+import select
+import struct
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from pylocc.file_utils import IGNORE_FILES, DirectoryScanner, IgnoreRules, PathFilter
+from pylocc.processor import ProcessorConfigurationFactory, Report
+from pylocc.reporter import ReportAggregator
+from pylocc.runner import DEFAULT_OPTIONS, CountOptions, count_files
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+DEFAULT_PORT = 8765
+DEFAULT_INTERVAL = 1.0
+# Time waited after a change for the following ones, so that a burst of changes is handled at once
+SETTLE_TIME = 0.1
+
+# Identity of the content of a file: a file whose key didn't change is not counted again
+StatKey = Tuple[int, int, int]
+
+
+def _stat_key(stat: os.stat_result) -> StatKey:
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+class _Directory(NamedTuple):
+    relative_dir: str
+    # Ignore rules defined by the parent directories
+    ignore_rules: List[Tuple[str, IgnoreRules]]
+    # Key of the files of the directory, including the skipped ones, and of its ignore files
+    files: Dict[str, StatKey]
+    subdirs: Set[str]
+    ignore_files: Tuple[Optional[StatKey], ...]
+
+
+class PollingWatcher:
+    """Finds the changed directories by polling: the directories whose entries changed, and those of the files
+    whose stat changed. Each poll costs a stat per directory and per counted file, but no read."""
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL):
+        self.interval = interval
+        self.directories: Dict[str, Optional[int]] = {}
+        self.live_counts: Optional['LiveCounts'] = None
+
+    def watch(self, directory: str):
+        self.directories[directory] = _mtime(directory)
+
+    def unwatch(self, directory: str):
+        self.directories.pop(directory, None)
+
+    def wait(self) -> Set[str]:
+        """Waits for the next poll and returns the directories that changed since the previous one."""
+        assert self.live_counts is not None, "Watcher not attached to the live counts"
+        time.sleep(self.interval)
+        changed = set()
+        for directory, mtime in list(self.directories.items()):
+            current = _mtime(directory)
+            if current != mtime:
+                self.directories[directory] = current
+                changed.add(directory)
+                continue
+            watched = self.live_counts.directories.get(directory)
+            if watched is None:
+                continue
+            for path, key in watched.files.items():
+                try:
+                    if _stat_key(os.stat(path)) != key:
+                        changed.add(directory)
+                        break
+                except OSError:
+                    changed.add(directory)
+                    break
+        return changed
+
+    def close(self):
+        pass
+
+
+def _mtime(directory: str) -> Optional[int]:
+    try:
+        return os.stat(directory).st_mtime_ns
+    except OSError:
+        return None
+
+
+# inotify constants, from sys/inotify.h
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | \
+    IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+EVENT_HEADER = struct.Struct('iIII')
+
+
+class InotifyWatcher:
+    """Finds the changed directories with the Linux inotify API, so that idle repositories cost nothing.
+    Raises OSError when inotify is not available, see create_watcher, or when a directory can't be watched, e.g. once
+    the inotify watches of the user are exhausted."""
+
+    def __init__(self):
+        import ctypes
+        import ctypes.util
+        self._get_errno = ctypes.get_errno
+        library = ctypes.util.find_library('c')
+        self._libc = ctypes.CDLL(library, use_errno=True)
+        if not hasattr(self._libc, 'inotify_init1'):
+            raise OSError("inotify is not available")
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "Unable to initialize inotify")
+        self._directories: Dict[int, str] = {}
+        self._descriptors: Dict[str, int] = {}
+
+    def watch(self, directory: str):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            error = self._get_errno()
+            if error in (errno.ENOENT, errno.ENOTDIR):
+                # The directory is gone already, its parent reports the change
+                return
+            raise OSError(error, f"Unable to watch {directory}: {os.strerror(error)}")
+        self._directories[wd] = directory
+        self._descriptors[directory] = wd
+
+    def unwatch(self, directory: str):
+        wd = self._descriptors.pop(directory, None)
+        if wd is not None:
+            self._directories.pop(wd, None)
+            self._libc.inotify_rm_watch(self._fd, wd)
+
+    def wait(self) -> Set[str]:
+        """Blocks until some watched directory changes and returns the changed directories."""
+        changed: Set[str] = set()
+        timeout = None
+        while True:
+            readable, _, _ = select.select([self._fd], [], [], timeout)
+            if not readable:
+                return changed
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size + length
+                if mask & IN_Q_OVERFLOW:
+                    # Events were lost, every directory has to be checked
+                    changed.update(self._descriptors)
+                    continue
+                directory = self._directories.get(wd)
+                if directory is None:
+                    continue
+                changed.add(directory)
+                if mask & IN_IGNORED:
+                    self._directories.pop(wd, None)
+                    self._descriptors.pop(directory, None)
+            # Keeps collecting the events of the same burst of changes
+            timeout = SETTLE_TIME
+
+    def close(self):
+        os.close(self._fd)
+
+
+def create_watcher(polling: bool = False, interval: float = DEFAULT_INTERVAL):
+    """Returns an inotify watcher where available, or a polling one."""
+    if not polling:
+        try:
+            return InotifyWatcher()
+        except (OSError, AttributeError, TypeError):
+            pass
+    return PollingWatcher(interval)
+
+
+class LiveCounts:
+    """Reports of the files of a directory and their aggregate per language, kept up to date.
+
+    After the initial count, refresh only rescans the given directories and only counts the files whose
+    stat changed, updating the aggregate by taking back their previous reports: an update costs
+    O(changed files), regardless of the size of the directory."""
+
+    def __init__(self, folder: str,
+                 configuration_factory: ProcessorConfigurationFactory,
+                 watcher,
+                 options: CountOptions = DEFAULT_OPTIONS,
+                 path_filter: Optional[PathFilter] = None,
+                 use_ignore_rules: bool = True,
+                 jobs: Optional[int] = None):
+        self.folder = os.path.normpath(folder)
+        self.configuration_factory = configuration_factory
+        self.watcher = watcher
+        self.options = options
+        self.jobs = jobs
+        self.scanner = DirectoryScanner(path_filter=path_filter, use_ignore_rules=use_ignore_rules,
+                                        language_index=configuration_factory.language_index)
+        self.reports: Dict[str, Report] = {}
+        self.aggregator = ReportAggregator(complexity=options.complexity)
+        self.directories: Dict[str, _Directory] = {}
+        self.updated = 0.0
+        # Held while updating, so that the aggregate is never read half updated
+        self.lock = threading.Lock()
+        if isinstance(watcher, PollingWatcher):
+            watcher.live_counts = self
+
+    def count(self):
+        """Counts the whole directory."""
+        self._count(self._add_tree(self.folder, '', []))
+
+    def refresh(self, directories: Set[str]) -> int:
+        """Rescans the given directories, counting the changed files. Returns the number of files counted."""
+        to_count: List[str] = []
+        with self.lock:
+            for directory in directories:
+                if directory not in self.directories:
+                    continue
+                if not os.path.isdir(directory):
+                    self._drop_tree(directory)
+                    continue
+                to_count.extend(self._rescan(directory))
+        self._count(to_count)
+        return len(to_count)
+
+    def _rescan(self, directory: str) -> List[str]:
+        watched = self.directories[directory]
+        ignore_files = self._ignore_files(directory)
+        if ignore_files != watched.ignore_files:
+            # The ignore rules changed, the rules of the whole subtree have to be rebuilt
+            self._drop_tree(directory)
+            return self._add_tree(directory, watched.relative_dir, watched.ignore_rules)
+        scan = self.scanner.scan(directory, watched.relative_dir, watched.ignore_rules)
+        files = {entry.path: _stat_key(entry.stat) for entry in scan.files}
+        for path in watched.files.keys() - files.keys():
+            self._drop_file(path)
+        to_count = [path for path, key in files.items() if watched.files.get(path) != key]
+        subdirs = {path for path, _, _ in scan.subdirs}
+        for path in watched.subdirs - subdirs:
+            self._drop_tree(path)
+        for path, relative_dir, _ in scan.subdirs:
+            if path not in watched.subdirs:
+                to_count.extend(self._add_tree(path, relative_dir, scan.ignore_rules))
+        self.directories[directory] = watched._replace(files=files, subdirs=subdirs)
+        return to_count
+
+    def _add_tree(self, folder: str, relative_dir: str, ignore_rules: List[Tuple[str, IgnoreRules]]) -> List[str]:
+        """Starts watching the directory and its subdirectories, returning the files to count."""
+        to_count = []
+        stack = [(folder, relative_dir, ignore_rules)]
+        while stack:
+            directory, relative, rules = stack.pop()
+            if directory in self.directories:
+                continue
+            # Watched before scanning, so that no change happening meanwhile is missed
+            self.watcher.watch(directory)
+            ignore_files = self._ignore_files(directory)
+            scan = self.scanner.scan(directory, relative, rules)
+            files = {entry.path: _stat_key(entry.stat) for entry in scan.files}
+            self.directories[directory] = _Directory(relative, rules, files, {path for path, _, _ in scan.subdirs},
+                                                     ignore_files)
+            to_count.extend(files)
+            stack.extend((path, relative_path, scan.ignore_rules) for path, relative_path, _ in scan.subdirs)
+        return to_count
+
+    def _drop_tree(self, folder: str):
+        watched = self.directories.pop(folder, None)
+        if watched is None:
+            return
+        self.watcher.unwatch(folder)
+        for path in watched.files:
+            self._drop_file(path)
+        for path in watched.subdirs:
+            self._drop_tree(path)
+
+    def _drop_file(self, path: str):
+        report = self.reports.pop(path, None)
+        if report is not None:
+            self.aggregator.remove(report)
+
+    def _count(self, paths: List[str]):
+        results = list(count_files(paths, self.configuration_factory, jobs=self.jobs, options=self.options))
+        with self.lock:
+            for result in results:
+                self._drop_file(result.path)
+                if result.report is not None and os.path.dirname(result.path) in self.directories:
+                    self.reports[result.path] = result.report
+                    self.aggregator.add(result.report)
+            self.updated = time.time()
+
+    @staticmethod
+    def _ignore_files(directory: str) -> Tuple[Optional[StatKey], ...]:
+        keys = []
+        for name in IGNORE_FILES:
+            try:
+                keys.append(_stat_key(os.stat(os.path.join(directory, name))))
+            except OSError:
+                keys.append(None)
+        return tuple(keys)
+
+    def snapshot(self) -> Dict:
+        """Returns the current aggregate per language, with numeric counts."""
+        with self.lock:
+            languages = [{
+                'language': language.value,
+                'files': self.aggregator.files_per_type[language],
+                'lines': report.total,
+                'code': report.code,
+                'comments': report.comments,
+                'blanks': report.blanks,
+                **({'complexity': report.complexity} if self.options.complexity else {}),
+            } for language, report in sorted(self.aggregator.reports.items(), key=lambda item: item[0].value)]
+            updated = self.updated
+        keys = ['files', 'lines', 'code', 'comments', 'blanks'] + (['complexity'] if self.options.complexity else [])
+        total = {key: sum(language[key] for language in languages) for key in keys}
+        return {'path': self.folder, 'updated': updated, 'languages': languages, 'total': total}
+
+
+def serve(live_counts: LiveCounts, port: int = DEFAULT_PORT, host: str = '127.0.0.1') -> 'ThreadingHTTPServer':
+    """Serves the aggregate of the live counts as JSON over HTTP, from a background thread.
+    The caller is in charge of shutting the returned server down."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] not in ('/', '/counts'):
+                self.send_error(404)
+                return
+            body = json.dumps(live_counts.snapshot()).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+import pylocc
+from pylocc.api import default_configuration_factory, list_files
+from pylocc.file_utils import PathFilter
+from pylocc.runner import CountOptions
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "main.py").write_text("# comment\n\nprint('hello')\n")
+    (tmp_path / "src" / "lib.py").write_text("print('lib')\n")
+    (tmp_path / "README.md").write_text("# Title\n")
+    (tmp_path / "data.bin").write_bytes(b"\x00\x01")
+    return tmp_path
+
+
+def test_count_path_yields_a_result_per_file(project):
+    results = {r.path: r for r in pylocc.count_path(str(project), jobs=1)}
+
+    main = results[str(project / "src" / "main.py")]
+    assert (main.report.code, main.report.comments, main.report.blanks) == (1, 1, 1)
+    assert set(results) == {str(project / "src" / "main.py"), str(project / "src" / "lib.py"),
+                            str(project / "README.md")}
+
+
+def test_count_path_is_lazy(project, monkeypatch):
+    walked = []
+    original = list_files
+
+    def spy(*args, **kwargs):
+        walked.append(args[0])
+        return original(*args, **kwargs)
+    monkeypatch.setattr("pylocc.api.list_files", spy)
+
+    results = pylocc.count_path(str(project), jobs=1)
+
+    assert walked == []
+    next(results)
+    assert walked == [str(project)]
+    results.close()
+
+
+def test_count_path_applies_filters_and_options(project):
+    results = list(pylocc.count_path(str(project), jobs=1, filters=PathFilter(exclude=["*.md"]),
+                                     options=CountOptions(timed=True)))
+
+    assert sorted(r.path for r in results) == [str(project / "src" / "lib.py"), str(project / "src" / "main.py")]
+    assert all(r.stats is not None for r in results)
+
+
+def test_count_path_counts_a_single_file(project):
+    results = list(pylocc.count_path(str(project / "src" / "lib.py")))
+
+    assert [r.report.code for r in results] == [1]
+
+
+def test_count_path_git_requires_a_directory(project):
+    with pytest.raises(ValueError):
+        list(pylocc.count_path(str(project / "README.md"), git=True))
+
+
+def test_count_path_async_matches_count_path(project):
+    async def collect():
+        return [r async for r in pylocc.count_path_async(str(project), jobs=1)]
+
+    results = asyncio.run(collect())
+
+    assert [(r.path, r.report.total) for r in results] == \
+        [(r.path, r.report.total) for r in pylocc.count_path(str(project), jobs=1)]
+
+
+def test_default_configuration_factory_is_shared():
+    assert default_configuration_factory() is default_configuration_factory()
@@ -0,0 +1,111 @@
+import io
+import tarfile
+import zipfile
+
+import pytest
+
+from pylocc.archive_utils import ArchiveError, is_archive, iter_archive_members
+from pylocc.file_utils import PathFilter
+from pylocc.processor import ProcessorConfigurationFactory
+from pylocc.runner import TEXT_ENGINE, CountOptions, count_contents, count_files
+
+FILES = {
+    "project/main.py": b"# comment\n\nprint('main')\n",
+    "project/src/lib.py": b"print('lib')\n" * 3,
+    "project/src/run": b"#!/usr/bin/env python3\nprint('run')\n",
+    "project/src/data": b"1,2,3\n",
+    "project/notes.unknown": b"notes\n",
+    "project/node_modules/pkg/index.js": b"var a = 1;\n",
+    "project/Makefile": b"all:\n\techo\n",
+}
+
+
+@pytest.fixture
+def factory():
+    return ProcessorConfigurationFactory.get_default_factory()
+
+
+@pytest.fixture(params=["tar", "tar.gz", "tar.xz", "tar.bz2", "zip"])
+def archive(request, tmp_path):
+    path = tmp_path / f"project.{request.param}"
+    if request.param == "zip":
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.mkdir("project/")
+            for name, content in FILES.items():
+                archive.writestr(name, content)
+    else:
+        compression = request.param.partition(".")[2]
+        with tarfile.open(path, f"w:{compression}") as archive:
+            directory = tarfile.TarInfo("./project")
+            directory.type = tarfile.DIRTYPE
+            archive.addfile(directory)
+            for name, content in FILES.items():
+                info = tarfile.TarInfo("./" + name)
+                info.size = len(content)
+                archive.addfile(info, io.BytesIO(content))
+            link = tarfile.TarInfo("./project/link.py")
+            link.type = tarfile.SYMTYPE
+            link.linkname = "main.py"
+            archive.addfile(link)
+    return str(path)
+
+
+def member_names(members):
+    return [member.path.split("!", 1)[1] for member in members]
+
+
+def test_is_archive(archive, tmp_path):
+    assert is_archive(archive)
+    assert not is_archive(str(tmp_path / "missing.zip"))
+    assert not is_archive(str(tmp_path))
+
+
+def test_iter_archive_members_selects_as_the_walk(archive, factory):
+    members = list(iter_archive_members(archive, language_index=factory.language_index))
+
+    assert member_names(members) == ["project/main.py", "project/src/lib.py", "project/src/run", "project/Makefile"]
+    assert members[0].path == archive + "!project/main.py"
+    assert members[0].content == FILES["project/main.py"]
+
+
+def test_iter_archive_members_applies_the_filters(archive, factory):
+    path_filter = PathFilter(exclude_dir=["src"])
+
+    members = list(iter_archive_members(archive, path_filter, use_ignore_rules=False,
+                                        language_index=factory.language_index, max_size=20))
+
+    assert [(name, member.content is None) for name, member in zip(member_names(members), members)] == \
+        [("project/main.py", True), ("project/node_modules/pkg/index.js", False), ("project/Makefile", False)]
+
+
+def test_iter_archive_members_rejects_invalid_archives(tmp_path):
+    path = tmp_path / "broken.tar.gz"
+    path.write_bytes(b"not an archive")
+
+    with pytest.raises(ArchiveError):
+        list(iter_archive_members(str(path)))
+
+
+@pytest.mark.parametrize("options", [CountOptions(), CountOptions(engine=TEXT_ENGINE)])
+def test_count_contents_matches_the_files(archive, factory, tmp_path, options):
+    members = list(iter_archive_members(archive, language_index=factory.language_index))
+    for name, content in FILES.items():
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_bytes(content)
+
+    serial = list(count_contents([(m.path, m.content) for m in members], factory, jobs=1, options=options))
+    parallel = list(count_contents(iter([(m.path, m.content) for m in members]), factory, jobs=2,
+                                   serial_threshold=0, options=options))
+    files = list(count_files([str(tmp_path / name) for name in member_names(members)], factory, jobs=1,
+                             options=options))
+
+    assert [r.path for r in serial] == [r.path for r in parallel] == [m.path for m in members]
+    assert [r.report for r in serial] == [r.report for r in parallel] == [r.report for r in files]
+
+
+def test_count_contents_skips_the_unread_contents(factory):
+    results = list(count_contents([("archive.zip!big.py", None), ("archive.zip!small.py", b"x = 1\n")], factory,
+                                  jobs=1))
+
+    assert [result.skipped for result in results] == ["too large", None]
+    assert results[1].report.code == 1
@@ -0,0 +1,164 @@
+import os
+
+import pytest
+
+from pylocc.cache import ReportCache
+from pylocc.language import Language
+from pylocc.processor import ProcessorConfigurationFactory, Report
+from pylocc.runner import count_files
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    path = tmp_path / "test.py"
+    path.write_text("# comment\n\nprint('hello')\n")
+    return str(path)
+
+
+def test_should_return_stored_reports(tmp_path, source_file):
+    stat = os.stat(source_file)
+    with ReportCache(str(tmp_path / "cache")) as cache:
+        cache.put(source_file, stat, "hash", Report(Language.PYTHON, code=1, comments=1, blanks=1))
+
+    with ReportCache(str(tmp_path / "cache")) as cache:
+        report = cache.get(source_file, stat, "hash")
+
+    assert report is not None
+    assert (report.file_type, report.code, report.comments, report.blanks) == (Language.PYTHON, 1, 1, 1)
+
+
+def test_should_store_the_complexity(tmp_path, source_file):
+    stat = os.stat(source_file)
+    with ReportCache(str(tmp_path / "cache")) as cache:
+        cache.put(source_file, stat, "hash", Report(Language.PYTHON, code=1, complexity=3))
+        cache.put_blob("blob", "hash", Report(Language.PYTHON, code=1, complexity=2))
+
+    with ReportCache(str(tmp_path / "cache")) as cache:
+        assert cache.get(source_file, stat, "hash").complexity == 3
+        assert cache.get_blob("blob", "hash").complexity == 2
+
+
+def test_should_drop_the_tables_of_an_older_layout(tmp_path, source_file):
+    import sqlite3
+    os.makedirs(tmp_path / "cache")
+    connection = sqlite3.connect(str(tmp_path / "cache" / "reports.sqlite3"))
+    connection.execute('CREATE TABLE reports (path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, inode INTEGER, '
+                       'config_hash TEXT, language TEXT, code INTEGER, comments INTEGER, blanks INTEGER, '
+                       'last_used INTEGER)')
+    connection.commit()
+    connection.close()
+
+    stat = os.stat(source_file)
+    with ReportCache(str(tmp_path / "cache")) as cache:
+        cache.put(source_file, stat, "hash", Report(Language.PYTHON, code=1))
+    with ReportCache(str(tmp_path / "cache")) as cache:
+        assert cache.get(source_file, stat, "hash").code == 1
+
+
+def test_should_miss_when_the_file_or_configuration_changes(tmp_path, source_file):
+    stat = os.stat(source_file)
+    with ReportCache(str(tmp_path / "cache")) as cache:
+        cache.put(source_file, stat, "hash", Report(Language.PYTHON, code=1))
+
+    with open(source_file, 'a') as f:
+        f.write("print('more code')\n")
+
+    with ReportCache(str(tmp_path / "cache")) as cache:
+        assert cache.get(source_file, os.stat(source_file), "hash") is None
+        assert cache.get(source_file, stat, "other hash") is None
+
+
+def test_should_evict_the_least_recently_used_entries(tmp_path):
+    stats = {}
+    for name in ["old.py", "recent.py"]:
+        path = tmp_path / name
+        path.write_text("code\n")
+        stats[str(path)] = os.stat(path)
+
+    with ReportCache(str(tmp_path / "cache")) as cache:
+        cache.put(str(tmp_path / "old.py"), stats[str(tmp_path / "old.py")], "hash", Report(Language.PYTHON, code=1))
+        for i in range(2000):
+            cache.put_blob(f"old blob {i}", "hash", Report(Language.PYTHON, code=1))
+    with ReportCache(str(tmp_path / "cache")) as cache:
+        max_size = cache.size() // 2
+    with ReportCache(str(tmp_path / "cache"), max_size=max_size) as cache:
+        cache.put(str(tmp_path / "recent.py"), stats[str(tmp_path / "recent.py")], "hash", Report(Language.PYTHON, code=1))
+
+    assert os.path.getsize(tmp_path / "cache" / "reports.sqlite3") <= max_size
+    with ReportCache(str(tmp_path / "cache")) as cache:
+        assert cache.get(str(tmp_path / "old.py"), stats[str(tmp_path / "old.py")], "hash") is None
+        assert cache.get(str(tmp_path / "recent.py"), stats[str(tmp_path / "recent.py")], "hash") is not None
+
+
+def test_should_return_the_stored_skip_reasons(tmp_path, source_file):
+    stat = os.stat(source_file)
+    with ReportCache(str(tmp_path / "cache")) as cache:
+        cache.put_skipped(source_file, stat, "hash", "binary")
+
+    with ReportCache(str(tmp_path / "cache")) as cache:
+        assert cache.get(source_file, stat, "hash") == "binary"
+
+
+def test_warm_runs_should_not_read_the_files(tmp_path, source_file, monkeypatch):
+    factory = ProcessorConfigurationFactory.get_default_factory()
+    with ReportCache(str(tmp_path / "cache")) as cache:
+        cold = list(count_files([source_file], factory, jobs=1, cache=cache))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Cached files should not be read")
+    monkeypatch.setattr("pylocc.runner.process_file", fail)
+
+    with ReportCache(str(tmp_path / "cache")) as cache:
+        warm = list(count_files([source_file], factory, jobs=1, cache=cache))
+
+    assert [(r.path, r.report.code, r.report.comments, r.report.blanks) for r in warm] == \
+        [(r.path, r.report.code, r.report.comments, r.report.blanks) for r in cold]
+
+
+def test_warm_runs_should_not_read_the_skipped_files(tmp_path, monkeypatch):
+    factory = ProcessorConfigurationFactory.get_default_factory()
+    binary_file = tmp_path / "data.py"
+    binary_file.write_bytes(b"\x00\x01\x02\n")
+    with ReportCache(str(tmp_path / "cache")) as cache:
+        cold = list(count_files([str(binary_file)], factory, jobs=1, cache=cache))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Cached files should not be read")
+    monkeypatch.setattr("pylocc.runner.process_file", fail)
+
+    with ReportCache(str(tmp_path / "cache")) as cache:
+        warm = list(count_files([str(binary_file)], factory, jobs=1, cache=cache))
+
+    assert cold[0].skipped is not None
+    assert [(r.path, r.report, r.skipped) for r in warm] == [(r.path, r.report, r.skipped) for r in cold]
+
+
+def test_should_keep_the_input_order_mixing_hits_and_misses(tmp_path, source_file):
+    factory = ProcessorConfigurationFactory.get_default_factory()
+    unsupported = tmp_path / "notes.unknown"
+    unsupported.write_text("text\n")
+    new_file = tmp_path / "new.py"
+    new_file.write_text("code\n")
+    files = [source_file, str(unsupported), str(new_file)]
+    with ReportCache(str(tmp_path / "cache")) as cache:
+        list(count_files([source_file], factory, jobs=1, cache=cache))
+
+    with ReportCache(str(tmp_path / "cache")) as cache:
+        results = list(count_files(files, factory, jobs=1, cache=cache))
+
+    assert [r.path for r in results] == files
+    assert results[1].report is None
+    assert results[2].report.code == 1
+
+
+def test_cached_files_still_honor_the_size_guard(tmp_path, source_file):
+    from pylocc.runner import CountOptions
+    factory = ProcessorConfigurationFactory.get_default_factory()
+    with ReportCache(str(tmp_path / "cache")) as cache:
+        list(count_files([source_file], factory, jobs=1, cache=cache))
+
+    with ReportCache(str(tmp_path / "cache")) as cache:
+        results = list(count_files([source_file], factory, jobs=1, cache=cache,
+                                   options=CountOptions(max_file_size=1)))
+
+    assert results[0].skipped == "too large"
@@ -1,10 +1,33 @@
 import unittest
+import json
 import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import zipfile
+from unittest import mock
 from click.testing import CliRunner
 from pylocc.cli import pylocc
 
 class TestCli(unittest.TestCase):
 
+    def setUp(self):
+        # The cache is on by default, keep it out of the user cache directory
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        environ = mock.patch.dict(os.environ, {'PYLOCC_CACHE_DIR': cache_dir.name})
+        environ.start()
+        self.addCleanup(environ.stop)
+
+    def test_pylocc_defers_the_import_of_sqlite3_to_the_cache(self):
+        # Act
+        loaded = subprocess.run([sys.executable, '-c', 'import sys, pylocc.cli; print("sqlite3" in sys.modules)'],
+                                capture_output=True, text=True, check=True)
+
+        # Assert
+        self.assertEqual(loaded.stdout.strip(), 'False')
+
     def test_pylocc_single_file(self):
         # Arrange
         runner = CliRunner()
@@ -48,5 +71,377 @@ class TestCli(unittest.TestCase):
             self.assertEqual(result.exit_code, 0)
             self.assertIn('Provider', result.output)
 
+    def test_pylocc_jobs(self):
+        # Arrange
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            os.makedirs('test_dir')
+            for i in range(3):
+                with open(f'test_dir/test{i}.py', 'w') as f:
+                    f.write('print("hello world")')
+
+            # Act
+            result = runner.invoke(pylocc, ['--jobs', '2', 'test_dir'])
+
+            # Assert
+            self.assertEqual(result.exit_code, 0)
+            self.assertIn('Total', result.output)
+
+    def test_pylocc_cache(self):
+        # Arrange
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            with open('test.py', 'w') as f:
+                f.write('print("hello world")')
+
+            # Act
+            cold = runner.invoke(pylocc, ['--cache-dir', 'cache', 'test.py'])
+            warm = runner.invoke(pylocc, ['--cache-dir', 'cache', 'test.py'])
+            uncached = runner.invoke(pylocc, ['--no-cache', 'test.py'])
+
+            # Assert
+            self.assertEqual(cold.exit_code, 0)
+            self.assertTrue(os.path.exists(os.path.join('cache', 'reports.sqlite3')))
+            self.assertEqual(warm.output, cold.output)
+            self.assertEqual(uncached.output, cold.output)
+
+    def test_pylocc_git_requires_a_repository(self):
+        # Arrange
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            os.makedirs('test_dir')
+
+            # Act
+            result = runner.invoke(pylocc, ['--git', '--no-cache', 'test_dir'])
+
+            # Assert
+            self.assertNotEqual(result.exit_code, 0)
+            self.assertIn('Unable to list the files tracked by git', result.output)
+
+    def test_pylocc_exclude(self):
+        # Arrange
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            os.makedirs('test_dir/vendor')
+            with open('test_dir/test.py', 'w') as f:
+                f.write('print("hello world")')
+            with open('test_dir/vendor/lib.py', 'w') as f:
+                f.write('print("hello world")')
+
+            # Act
+            result = runner.invoke(pylocc, ['--no-cache', '--by-file', '--exclude-dir', 'vendor', 'test_dir'])
+
+            # Assert
+            self.assertEqual(result.exit_code, 0)
+            self.assertIn('test.py', result.output)
+            self.assertNotIn('lib.py', result.output)
+
+    def test_pylocc_reports_skipped_files(self):
+        # Arrange
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            os.makedirs('test_dir')
+            with open('test_dir/test.py', 'w') as f:
+                f.write('print("hello world")')
+            with open('test_dir/data.c', 'wb') as f:
+                f.write(b'\x00\x01\x02')
+
+            # Act
+            result = runner.invoke(pylocc, ['--no-cache', 'test_dir'])
+
+            # Assert
+            self.assertEqual(result.exit_code, 0)
+            self.assertIn('Skipped 1 files: 1 binary', result.output)
+
+    def test_pylocc_streams_by_file_report_as_json_lines(self):
+        # Arrange
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            os.makedirs('test_dir')
+            with open('test_dir/test.py', 'w') as f:
+                f.write('# comment\nprint("hello world")\n')
+
+            # Act
+            result = runner.invoke(pylocc, ['--no-cache', '--by-file', '--output', 'report.jsonl', 'test_dir'])
+
+            # Assert
+            self.assertEqual(result.exit_code, 0)
+            self.assertIn('Report saved to report.jsonl', result.output)
+            with open('report.jsonl') as f:
+                records = [json.loads(line) for line in f]
+            self.assertEqual(records, [{'Language': 'Python', 'Provider': os.path.join('test_dir', 'test.py'),
+                                        'File Name': 'test', 'Lines': 2, 'Code': 1, 'Comments': 1, 'Blanks': 0}])
+
+    def test_pylocc_prints_stats_and_saves_profile(self):
+        # Arrange
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            with open('test.py', 'w') as f:
+                f.write('print("hello world")')
+
+            # Act
+            result = runner.invoke(pylocc, ['--no-cache', '--stats', '--profile', 'run.prof', 'test.py'])
+
+            # Assert
+            self.assertEqual(result.exit_code, 0)
+            self.assertIn('Stages', result.output)
+            self.assertIn('Slowest 10 files', result.output)
+            self.assertTrue(os.path.exists('run.prof'))
+
+    def test_pylocc_complexity(self):
+        # Arrange
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            with open('test.py', 'w') as f:
+                f.write('if x and y:  # if\n    print("for")\n')
+
+            # Act
+            result = runner.invoke(pylocc, ['--no-cache', '--complexity', '--by-file', '--output', 'report.jsonl',
+                                            'test.py'])
+
+            # Assert
+            self.assertEqual(result.exit_code, 0)
+            with open('report.jsonl') as f:
+                self.assertEqual(json.loads(f.readline())['Complexity'], 2)
+
+    def test_pylocc_count_command(self):
+        # Arrange
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            with open('test.py', 'w') as f:
+                f.write('print("hello world")')
+
+            # Act
+            result = runner.invoke(pylocc, ['count', '--no-cache', 'test.py'])
+
+            # Assert
+            self.assertEqual(result.exit_code, 0)
+            self.assertIn('Total', result.output)
+
+    def test_pylocc_help_and_version_are_the_ones_of_the_group(self):
+        # Arrange
+        runner = CliRunner()
+
+        # Act
+        help_result = runner.invoke(pylocc, ['--help'])
+        version_result = runner.invoke(pylocc, ['--version'])
+
+        # Assert
+        self.assertEqual(help_result.exit_code, 0)
+        self.assertIn('Commands:', help_result.output)
+        self.assertIn('history', help_result.output)
+        self.assertEqual(version_result.exit_code, 0)
+        self.assertIn('pylocc, version', version_result.output)
+
+    def test_pylocc_merges_the_partial_results_of_the_shards(self):
+        # Arrange
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            os.makedirs(os.path.join('project', 'src'))
+            for i in range(6):
+                with open(os.path.join('project', 'src' if i % 2 else '', f'file{i}.py'), 'w') as f:
+                    f.write('# comment\n' + 'x = 1\n' * i)
+
+            # Act
+            single = runner.invoke(pylocc, ['--no-cache', '--by-file', 'project'])
+            shards = [runner.invoke(pylocc, ['--no-cache', '--shard', f'{i}/2', '--partial', f'shard{i}.partial',
+                                             'project']) for i in (1, 2)]
+            merged = runner.invoke(pylocc, ['merge', '--by-file', 'shard2.partial', 'shard1.partial'])
+            incomplete = runner.invoke(pylocc, ['merge', 'shard1.partial'])
+            repeated = runner.invoke(pylocc, ['merge', 'shard1.partial', 'shard1.partial'])
+
+            # Assert
+            for result in shards:
+                self.assertEqual(result.exit_code, 0)
+                self.assertIn('Partial result of', result.output)
+            self.assertEqual(merged.exit_code, 0)
+            self.assertEqual(merged.output, single.output)
+            self.assertIn('Missing shards 2/2', incomplete.output)
+            self.assertNotEqual(repeated.exit_code, 0)
+            self.assertIn('given more than once', repeated.output)
+
+    def test_pylocc_rejects_invalid_shards(self):
+        # Arrange
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            with open('test.py', 'w') as f:
+                f.write('print("hello world")')
+
+            # Act
+            result = runner.invoke(pylocc, ['--no-cache', '--shard', '3/2', 'test.py'])
+
+            # Assert
+            self.assertEqual(result.exit_code, 2)
+            self.assertIn('not a valid shard', result.output)
+
+    def test_pylocc_writes_the_report_format_to_the_standard_output(self):
+        # Arrange
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            with open('test.py', 'w') as f:
+                f.write('# comment\nprint("hello world")\n')
+            with open('data.py', 'wb') as f:
+                f.write(b'\x00\x01')
+
+            # Act
+            result = runner.invoke(pylocc, ['--no-cache', '--format', 'json', '.'])
+
+            # Assert
+            self.assertEqual(result.exit_code, 0)
+            self.assertEqual(json.loads(result.stdout)[0],
+                             {'Language': 'Python', 'Files': 1, 'Lines': 2, 'Code': 1, 'Comments': 1, 'Blanks': 0})
+            self.assertIn('Skipped 1 files', result.stderr)
+
+    def test_pylocc_read_ahead_matches_the_default_count(self):
+        # Arrange
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            os.makedirs('test_dir/sub')
+            for i, path in enumerate(['test_dir/a.py', 'test_dir/sub/b.py', 'test_dir/sub/c.md']):
+                with open(path, 'w') as f:
+                    f.write('# comment\nprint("hello world")\n' * (i + 1))
+
+            # Act
+            expected = runner.invoke(pylocc, ['--no-cache', '--by-file', '--format', 'csv', 'test_dir'])
+            result = runner.invoke(pylocc, ['--no-cache', '--by-file', '--format', 'csv', '--read-ahead', '2',
+                                            '--read-ahead-size', '1K', 'test_dir'])
+
+            # Assert
+            self.assertEqual(result.exit_code, 0)
+            self.assertEqual(result.stdout, expected.stdout)
+
+    def test_pylocc_counts_duplicates_once(self):
+        # Arrange
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            os.makedirs('test_dir/vendor')
+            for path in ['test_dir/a.py', 'test_dir/vendor/a.py', 'test_dir/vendor/b.py']:
+                with open(path, 'w') as f:
+                    f.write('# comment\nprint("hello world")\n')
+            with open('test_dir/c.py', 'w') as f:
+                f.write('print("hello world")\n')
+
+            # Act
+            counted = runner.invoke(pylocc, ['--no-cache', '--format', 'jsonl', '--duplicates', 'count', 'test_dir'])
+            excluded = runner.invoke(pylocc, ['--no-cache', '--format', 'jsonl', '--duplicates', 'exclude',
+                                              'test_dir'])
+
+            # Assert
+            self.assertEqual(counted.exit_code, 0)
+            self.assertEqual(json.loads(counted.stdout.splitlines()[0]),
+                             {'Language': 'Python', 'Files': 4, 'Lines': 7, 'Code': 4, 'Comments': 3, 'Blanks': 0,
+                              'Duplicates': 2})
+            self.assertEqual(excluded.exit_code, 0)
+            self.assertEqual(json.loads(excluded.stdout.splitlines()[0]),
+                             {'Language': 'Python', 'Files': 2, 'Lines': 3, 'Code': 2, 'Comments': 1, 'Blanks': 0,
+                              'Duplicates': 2})
+
+    def test_pylocc_rejects_the_options_the_partial_results_dont_keep(self):
+        # Arrange
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            os.makedirs('test_dir')
+            with open('test_dir/a.py', 'w') as f:
+                f.write('print("hello world")\n')
+
+            # Act
+            results = [runner.invoke(pylocc, ['--partial', 'out.partial', *options, 'test_dir'])
+                       for options in [['--duplicates', 'count'], ['--uloc']]]
+
+            # Assert
+            self.assertEqual([result.exit_code for result in results], [2, 2])
+            self.assertIn("it can't be used with --duplicates", results[0].output)
+            self.assertIn("it can't be used with --uloc", results[1].output)
+            self.assertFalse(os.path.exists('out.partial'))
+
+    def test_pylocc_counts_the_unique_lines(self):
+        # Arrange
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            os.makedirs('test_dir')
+            with open('test_dir/a.py', 'w') as f:
+                f.write('# comment\nprint("hello world")\n\nprint("hello world")\n')
+            with open('test_dir/b.py', 'w') as f:
+                f.write('if True:\n    print("hello world")\n')
+            with open('test_dir/c.c', 'w') as f:
+                f.write('# comment\n')
+
+            # Act
+            exact = runner.invoke(pylocc, ['--no-cache', '--format', 'jsonl', '--uloc', 'test_dir'])
+            approximate = runner.invoke(pylocc, ['--no-cache', '--format', 'jsonl', '--approximate-uloc', 'test_dir'])
+
+            # Assert
+            self.assertEqual(exact.exit_code, 0)
+            self.assertEqual(exact.stdout, approximate.stdout)
+            records = [json.loads(line) for line in exact.stdout.splitlines()]
+            self.assertEqual([(record['Language'], record['ULOC']) for record in records],
+                             [('Python', 3), ('C', 1), ('Total', 3)])
+
+    def test_pylocc_counts_inside_archives(self):
+        # Arrange
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            with zipfile.ZipFile('release.zip', 'w') as archive:
+                archive.writestr('release/main.py', '# comment\nprint("hello world")\n')
+                archive.writestr('release/README.md', '# Release\n')
+
+            # Act
+            result = runner.invoke(pylocc, ['--no-cache', '--by-file', '--format', 'jsonl', 'release.zip'])
+
+            # Assert
+            self.assertEqual(result.exit_code, 0)
+            records = [json.loads(line) for line in result.stdout.splitlines()]
+            self.assertEqual([record['Provider'] for record in records],
+                             ['release.zip!release/main.py', 'release.zip!release/README.md'])
+            self.assertEqual(records[0]['Code'], 1)
+
+    @unittest.skipIf(shutil.which('git') is None, "git is not installed")
+    def test_pylocc_requires_a_file(self):
+        # Arrange
+        runner = CliRunner()
+
+        # Act
+        result = runner.invoke(pylocc, ['count', '--no-cache'])
+
+        # Assert
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn("Missing argument 'FILE'", result.output)
+
+    def test_pylocc_history(self):
+        # Arrange
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            os.makedirs('repo')
+            git = ['git', '-C', 'repo', '-c', 'user.name=test', '-c', 'user.email=test@example.com']
+            subprocess.run(git + ['init', '-q'], check=True)
+            for content in ['print("hello")\n', 'print("hello")\nprint("world")\n']:
+                with open('repo/main.py', 'w') as f:
+                    f.write(content)
+                subprocess.run(git + ['add', '.'], check=True)
+                subprocess.run(git + ['commit', '-q', '-m', 'commit'], check=True)
+
+            # Act
+            result = runner.invoke(pylocc, ['history', '--no-cache', '--format', 'jsonl', 'repo'])
+
+            # Assert
+            self.assertEqual(result.exit_code, 0)
+            records = [json.loads(line) for line in result.stdout.splitlines()]
+            self.assertEqual([(record['Language'], record['Code']) for record in records],
+                             [('Python', 1), ('Total', 1), ('Python', 2), ('Total', 2)])
+            self.assertNotEqual(records[0]['Commit'], records[2]['Commit'])
+
+    def test_pylocc_history_requires_a_repository(self):
+        # Arrange
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            os.makedirs('test_dir')
+
+            # Act
+            result = runner.invoke(pylocc, ['history', '--no-cache', 'test_dir'])
+
+            # Assert
+            self.assertNotEqual(result.exit_code, 0)
+            self.assertIn('Unable to read the history of the repository', result.output)
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,7 +1,7 @@
 from unittest import TestCase
 
 from pylocc.language import Language
-from pylocc.processor import ProcessorConfiguration, ProcessorConfigurationFactory
+from pylocc.processor import ProcessorConfiguration, ProcessorConfigurationFactory, load_default_language_config
 
 
 class TestProcessorConfigurationFactory(TestCase):
@@ -39,3 +39,47 @@ class TestProcessorConfigurationFactory(TestCase):
         config = self.factory.get_configuration(file_type=Language.SQL)
         assert config is not None
         self.assertEqual(config.file_type, Language.SQL)
+
+    def test_should_return_configuration_per_file_name(self):
+        makefile_config = ProcessorConfiguration(file_type=Language.MAKEFILE, file_extensions=['mk'],
+                                                 line_comment=['#'], multiline_comment=[], file_names=['makefile'],
+                                                 shebangs=['make'])
+        factory = ProcessorConfigurationFactory([self.sql_config, makefile_config])
+
+        self.assertEqual(factory.get_configuration(file_name='Makefile'), makefile_config)
+        self.assertEqual(factory.get_configuration(file_name='rules.mk'), makefile_config)
+        self.assertEqual(factory.get_configuration(file_name='query.SQL'), self.sql_config)
+        self.assertIsNone(factory.get_configuration(file_name='notes.txt'))
+        self.assertEqual(factory.get_shebang_configuration(b'#!/usr/bin/make -f\n'), makefile_config)
+        self.assertIsNone(factory.get_shebang_configuration(b'#!/bin/sh\n'))
+
+
+class TestIndexedConfigurationFactory(TestCase):
+
+    def setUp(self):
+        self.json_factory = ProcessorConfigurationFactory(load_default_language_config())
+        self.factory = ProcessorConfigurationFactory.get_default_factory()
+
+    def test_should_support_the_same_extensions_as_language_json(self):
+        self.assertEqual(sorted(self.factory.supported_extensions), sorted(self.json_factory.supported_extensions))
+
+    def test_should_return_the_same_configurations_as_language_json(self):
+        for extension in self.json_factory.supported_extensions:
+            self.assertEqual(self.factory.get_configuration(file_extension=extension),
+                             self.json_factory.get_configuration(file_extension=extension))
+        for language in self.json_factory.configs_per_language:
+            self.assertEqual(self.factory.get_configuration(file_type=language),
+                             self.json_factory.get_configuration(file_type=language))
+
+    def test_should_resolve_the_same_file_names_as_language_json(self):
+        self.assertEqual(self.factory.language_index.names, self.json_factory.language_index.names)
+        self.assertEqual(self.factory.language_index.shebangs, self.json_factory.language_index.shebangs)
+
+    def test_should_build_configurations_on_first_use(self):
+        self.assertEqual(self.factory.configs_per_language, {})
+
+        config = self.factory.get_configuration(file_extension='py')
+
+        assert config is not None
+        self.assertEqual(list(self.factory.configs_per_language), [Language.PYTHON])
+        self.assertIsNone(self.factory.get_configuration(file_extension='unknown'))
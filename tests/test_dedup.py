@@ -0,0 +1,78 @@
+import pytest
+
+from pylocc import dedup
+from pylocc.dedup import PARTIAL_HASH_SIZE, DuplicateFinder
+
+
+@pytest.fixture
+def hashed(monkeypatch):
+    # The files read by the finder, along with the size read
+    reads = []
+    original = dedup._hash_file
+
+    def spy(path, size=None):
+        reads.append((path, size))
+        return original(path, size)
+    monkeypatch.setattr(dedup, "_hash_file", spy)
+    return reads
+
+
+def write(path, content: bytes) -> str:
+    path.write_bytes(content)
+    return str(path)
+
+
+def test_finds_the_files_of_the_same_content(tmp_path, hashed):
+    first = write(tmp_path / "a.py", b"print('hello')\n")
+    copy = write(tmp_path / "b.py", b"print('hello')\n")
+    other = write(tmp_path / "c.py", b"print('world')\n")
+    finder = DuplicateFinder()
+
+    results = [finder.add(f, 15) for f in [first, copy, other]]
+
+    assert [(entry.path, duplicate) for entry, duplicate in results] == [(first, False), (first, True),
+                                                                         (other, False)]
+    # Small files are only hashed once, their start being the whole file
+    assert sorted(hashed) == sorted([(first, PARTIAL_HASH_SIZE), (copy, PARTIAL_HASH_SIZE),
+                                     (other, PARTIAL_HASH_SIZE)])
+    assert len(finder) == 2
+
+
+def test_only_reads_the_files_of_the_same_size(tmp_path, hashed):
+    finder = DuplicateFinder()
+
+    for i in range(5):
+        finder.add(write(tmp_path / f"{i}.py", b"x = 1\n" * (i + 1)), 6 * (i + 1))
+
+    assert hashed == []
+
+
+def test_hashes_whole_files_only_when_their_starts_match(tmp_path, hashed):
+    start = b"#" * PARTIAL_HASH_SIZE
+    first = write(tmp_path / "a.py", start + b"1\n")
+    other = write(tmp_path / "b.py", start + b"2\n")
+    different = write(tmp_path / "c.py", b"2\n" + start)
+    finder = DuplicateFinder()
+
+    results = [finder.add(f, PARTIAL_HASH_SIZE + 2) for f in [first, other, different]]
+
+    assert [duplicate for _, duplicate in results] == [False, False, False]
+    assert (first, None) in hashed and (other, None) in hashed and (different, None) not in hashed
+
+
+def test_only_compares_the_files_of_the_same_key(tmp_path):
+    first = write(tmp_path / "a.h", b"int x;\n")
+    copy = write(tmp_path / "b.c", b"int x;\n")
+    finder = DuplicateFinder()
+
+    assert not finder.add(first, 7, "C Header")[1]
+    assert not finder.add(copy, 7, "C")[1]
+
+
+def test_unreadable_files_are_not_duplicates(tmp_path):
+    missing = str(tmp_path / "missing.py")
+    finder = DuplicateFinder()
+
+    finder.add(missing, 7)
+
+    assert not finder.add(missing, 7)[1]
@@ -0,0 +1,76 @@
+import pytest
+
+from pylocc.detection import LanguageIndex
+from pylocc.processor import ProcessorConfigurationFactory
+
+
+@pytest.fixture
+def index():
+    return LanguageIndex(extensions={'py': 'Python', 'ts': 'TypeScript', 'd.ts': 'TypeScript Typings',
+                                     'txt': 'Plain Text', 'cmakelists.txt': 'CMake', 'build': 'Bazel'},
+                         filenames={'makefile': 'Makefile', '.bashrc': 'BASH'},
+                         shebangs={'python': 'Python', 'python3': 'Python', 'bash': 'BASH', 'Rscript': 'R'})
+
+
+@pytest.mark.parametrize("file_name, expected", [
+    ("main.py", 'Python'),
+    ("MAIN.PY", 'Python'),
+    ("Makefile", 'Makefile'),
+    ("BUILD", 'Bazel'),
+    ("CMakeLists.txt", 'CMake'),
+    ("notes.txt", 'Plain Text'),
+    ("index.d.ts", 'TypeScript Typings'),
+    ("index.ts", 'TypeScript'),
+    ("app.spec.ts", 'TypeScript'),
+    (".bashrc", 'BASH'),
+    (".py", None),
+    ("script", None),
+    ("archive.tar.gz", None),
+    ("trailing.", None),
+])
+def test_language_of_name(index, file_name, expected):
+    assert index.language_of_name(file_name) == expected
+
+
+@pytest.mark.parametrize("head, expected", [
+    (b"#!/usr/bin/python3\nprint()\n", 'Python'),
+    (b"#!/usr/bin/env python3.12\n", 'Python'),
+    (b"#! /bin/bash -e\n", 'BASH'),
+    (b"#!/usr/bin/env -S PYTHONPATH=. python -u\n", 'Python'),
+    (b"#!/usr/bin/env Rscript\n", 'R'),
+    (b"#!/usr/bin/env\n", None),
+    (b"#!/usr/bin/unknown\n", None),
+    (b"# not a shebang\n", None),
+    (b"\x7fELF\x02\x01\x01\x00", None),
+    (b"", None),
+])
+def test_language_of_shebang(index, head, expected):
+    assert index.language_of_shebang(head) == expected
+
+
+def test_is_shebang_candidate(index):
+    assert index.is_shebang_candidate("script")
+    assert index.is_shebang_candidate(".profile")
+    assert not index.is_shebang_candidate("script.sh")
+    assert not LanguageIndex({}, {}, {}).is_shebang_candidate("script")
+
+
+def test_language_of_file_only_reads_extensionless_files(tmp_path, index):
+    (tmp_path / "run").write_text("#!/usr/bin/env python3\nprint()\n")
+    (tmp_path / "data").write_text("1,2,3\n")
+
+    assert index.language_of_file(str(tmp_path / "run")) == 'Python'
+    assert index.language_of_file(str(tmp_path / "data")) is None
+    # Resolved from its name without being read
+    assert index.language_of_file(str(tmp_path / "missing.py")) == 'Python'
+    assert index.language_of_file(str(tmp_path / "missing")) is None
+
+
+def test_default_index_resolves_the_file_names_of_language_json():
+    index = ProcessorConfigurationFactory.get_default_factory().language_index
+
+    assert index.language_of_name("Makefile") == 'Makefile'
+    assert index.language_of_name("Dockerfile") == 'Dockerfile'
+    assert index.language_of_name("CMakeLists.txt") == 'CMake'
+    assert index.language_of_name("types.d.ts") == 'TypeScript Typings'
+    assert index.language_of_shebang(b"#!/bin/sh\n") == 'Shell'
@@ -2,7 +2,9 @@ import pytest
 from pathlib import Path
 import os
 
-from pylocc.file_utils import get_all_file_paths
+from pylocc.file_utils import (BINARY, GENERATED, MINIFIED, PathFilter, get_all_file_paths, has_long_line,
+                               open_binary_lines, sniff_content, walk_files, walk_order_key)
+from pylocc.processor import ProcessorConfigurationFactory
 
 @pytest.fixture
 def create_test_files(tmp_path):
@@ -91,3 +93,136 @@ def test_get_all_file_paths_no_matching_extensions(create_test_files):
     # Test with extensions that don't match any files
     files = list(get_all_file_paths(test_dir, supported_extensions=["java", "cpp"]))
     assert len(files) == 0
+
+@pytest.mark.parametrize("mmap_threshold", [0, 1024])
+def test_open_binary_lines(tmp_path, mmap_threshold):
+    file_path = tmp_path / "file.txt"
+    file_path.write_bytes(b"line 1\nline 2\r\n\nline 4")
+
+    with open_binary_lines(str(file_path), mmap_threshold=mmap_threshold) as lines:
+        stripped = [line.strip() for line in lines]
+
+    assert stripped == [b"line 1", b"line 2", b"", b"line 4"]
+
+@pytest.mark.parametrize("mmap_threshold", [0, 1024 * 1024])
+def test_open_binary_lines_splits_on_bare_cr_whatever_the_size(tmp_path, monkeypatch, mmap_threshold):
+    # Blocks of a few bytes, so that they end in the middle of the lines and between a CR and its LF
+    monkeypatch.setattr("pylocc.file_utils.LINES_BLOCK_SIZE", 5)
+    file_path = tmp_path / "file.c"
+    file_path.write_bytes(b"int x;\rint y;\r// c\r\n\r\n" * 3 + b"last\r")
+
+    with open_binary_lines(str(file_path), mmap_threshold=mmap_threshold) as lines:
+        split = list(lines)
+
+    assert split == [b"int x;", b"int y;", b"// c", b""] * 3 + [b"last"]
+
+def test_open_binary_lines_empty_file(tmp_path):
+    file_path = tmp_path / "empty.txt"
+    file_path.touch()
+
+    with open_binary_lines(str(file_path), mmap_threshold=0) as lines:
+        assert list(lines) == []
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "project"
+    for path in ["main.py", "app.log", "keep.log", "build/out.py", "src/lib.py", "src/gen/auto.py",
+                 "src/sub/.gitignore", "src/sub/ignored.py", "src/sub/kept.py",
+                 ".git/config.py", "node_modules/pkg/index.js"]:
+        (root / path).parent.mkdir(parents=True, exist_ok=True)
+        (root / path).write_text("code\n")
+    (root / ".gitignore").write_text("*.log\n!keep.log\n/build/\n")
+    (root / ".ignore").write_text("gen/\n")
+    (root / "src" / "sub" / ".gitignore").write_text("ignored.py\n")
+    return root
+
+def relative_paths(root, entries):
+    return sorted(os.path.relpath(e.path, root).replace(os.sep, '/') for e in entries)
+
+def test_walk_files_honors_ignore_rules(project):
+    files = relative_paths(project, walk_files(str(project)))
+
+    assert files == [".gitignore", ".ignore", "keep.log", "main.py", "src/lib.py", "src/sub/.gitignore", "src/sub/kept.py"]
+
+def test_walk_files_without_ignore_rules(project):
+    files = relative_paths(project, walk_files(str(project), supported_extensions=["py"], use_ignore_rules=False))
+
+    assert files == [".git/config.py", "build/out.py", "main.py", "src/gen/auto.py", "src/lib.py",
+                     "src/sub/ignored.py", "src/sub/kept.py"]
+
+def test_walk_files_applies_the_path_filter(project):
+    path_filter = PathFilter(include=["*.py"], exclude=["src/lib.py"], exclude_dir=["sub"])
+
+    files = relative_paths(project, walk_files(str(project), path_filter=path_filter))
+
+    assert files == ["main.py"]
+
+def test_walk_files_provides_the_stat(project):
+    entries = list(walk_files(str(project), supported_extensions=["py"]))
+
+    assert entries
+    for entry in entries:
+        assert entry.stat.st_size == os.stat(entry.path).st_size
+
+@pytest.mark.skipif(not hasattr(os, "symlink") or not hasattr(os, "link"), reason="links not supported")
+def test_walk_files_visits_linked_files_once(tmp_path):
+    root = tmp_path / "linked"
+    (root / "dir").mkdir(parents=True)
+    (root / "dir" / "file.py").write_text("code\n")
+    os.link(root / "dir" / "file.py", root / "hardlink.py")
+    os.symlink(root, root / "dir" / "cycle")
+
+    files = list(walk_files(str(root)))
+
+    assert len(files) == 1
+
+def test_path_filter_accepts_path():
+    path_filter = PathFilter(exclude_dir=["vendor"])
+
+    assert path_filter.accepts_path("src/main.py")
+    assert not path_filter.accepts_path("src/vendor/lib/main.py")
+
+def test_walk_files_spreads_the_files_over_the_shards(project):
+    all_files = relative_paths(project, walk_files(str(project), use_ignore_rules=False))
+
+    shards = [relative_paths(project, walk_files(str(project), path_filter=PathFilter(shard=(index, 3)),
+                                                 use_ignore_rules=False))
+              for index in (1, 2, 3)]
+
+    assert sorted(sum(shards, [])) == all_files
+    assert sum(1 for files in shards if files) > 1
+
+def test_walk_order_key_sorts_as_the_walk(project):
+    files = [entry.path for entry in walk_files(str(project), use_ignore_rules=False)]
+
+    assert sorted(reversed(files), key=walk_order_key) == files
+
+@pytest.mark.parametrize("head,expected", [
+    (b"int main() {\n  return 0;\n}\n", None),
+    (b"\x7fELF\x02\x01\x01\x00\x00", BINARY),
+    (b"var a=1;" * 500, MINIFIED),
+    (b"// Code generated by protoc-gen-go. DO NOT EDIT.\npackage foo\n", GENERATED),
+    (b"# @generated by a tool\nx = 1\n", GENERATED),
+    (b"/*\n * This file is generated by a tool, do not edit.\n */\n", GENERATED),
+    (b"// <auto-generated />\nclass Foo {}\n", GENERATED),
+    (b"# Settings, do not edit by hand\nx = 1\n", None),
+    (b'print("do not edit")\nmarker = "@generated"\n', None),
+])
+def test_sniff_content(head, expected):
+    assert sniff_content(head) == expected
+
+def test_has_long_line():
+    content = b"short\n" + b"x" * 100 + b"\nshort\n"
+
+    assert has_long_line(content, 99)
+    assert not has_long_line(content, 100)
+
+def test_walk_files_detects_file_names_and_shebangs(tmp_path):
+    for name, content in [("Makefile", "all:\n"), ("types.d.ts", "x\n"), ("run", "#!/bin/bash\necho\n"),
+                          ("data", "1,2\n"), ("notes.unknown", "x\n"), ("main.PY", "x\n")]:
+        (tmp_path / name).write_text(content)
+    language_index = ProcessorConfigurationFactory.get_default_factory().language_index
+
+    files = relative_paths(tmp_path, walk_files(str(tmp_path), language_index=language_index))
+
+    assert files == ["Makefile", "main.PY", "run", "types.d.ts"]
@@ -0,0 +1,210 @@
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from pylocc.cache import ReportCache
+from pylocc.git_utils import GitError, iter_commit_changes, list_tracked_files, list_tree_files, read_blobs
+from pylocc.history import count_history
+from pylocc.language import Language
+from pylocc.processor import ProcessorConfigurationFactory
+from pylocc.runner import count_blobs
+
+pytestmark = pytest.mark.skipif(shutil.which('git') is None, reason="git is not installed")
+
+
+def git(repo, *args):
+    subprocess.run(['git', '-C', str(repo), '-c', 'user.name=test', '-c', 'user.email=test@example.com', *args],
+                   check=True, capture_output=True)
+
+
+def blob_id(repo, path):
+    return subprocess.run(['git', '-C', str(repo), 'hash-object', path],
+                          check=True, capture_output=True).stdout.decode().strip()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = tmp_path / "repo"
+    (repo / "vendor").mkdir(parents=True)
+    (repo / "main.py").write_text("# comment\nprint('main')\n")
+    (repo / "vendor" / "copy.py").write_text("# comment\nprint('main')\n")
+    (repo / "modified.py").write_text("print('before')\n")
+    (repo / "deleted.py").write_text("print('deleted')\n")
+    git(repo, 'init', '-q')
+    git(repo, 'add', '.')
+    git(repo, 'commit', '-q', '-m', 'initial')
+    (repo / "modified.py").write_text("print('after')\nprint('after')\n")
+    (repo / "deleted.py").unlink()
+    (repo / "untracked.py").write_text("print('untracked')\n")
+    return str(repo)
+
+
+def test_list_tracked_files(repo):
+    tracked = dict(list_tracked_files(repo))
+
+    assert sorted(tracked) == sorted(os.path.join(repo, p) for p in ["main.py", os.path.join("vendor", "copy.py"),
+                                                                     "modified.py"])
+    assert tracked[os.path.join(repo, "main.py")] == tracked[os.path.join(repo, "vendor", "copy.py")]
+    assert tracked[os.path.join(repo, "modified.py")] == blob_id(repo, "modified.py")
+
+
+def test_list_tracked_files_outside_of_a_repository(tmp_path):
+    with pytest.raises(GitError):
+        list_tracked_files(str(tmp_path))
+
+
+def test_count_blobs_counts_identical_blobs_once(repo, monkeypatch):
+    factory = ProcessorConfigurationFactory.get_default_factory()
+    counted = []
+    import pylocc.runner
+    original = pylocc.runner.count_files
+
+    def spy(files, *args):
+        counted.extend(files)
+        return original(files, *args)
+    monkeypatch.setattr(pylocc.runner, "count_files", spy)
+
+    tracked = sorted(list_tracked_files(repo))
+    results = list(count_blobs(tracked, factory, jobs=1))
+
+    assert [r.path for r in results] == [f for f, _ in tracked]
+    assert len(counted) == 2
+    reports = {os.path.relpath(r.path, repo): (r.report.code, r.report.comments) for r in results}
+    assert reports == {"main.py": (1, 1), os.path.join("vendor", "copy.py"): (1, 1), "modified.py": (2, 0)}
+
+
+
+def test_count_blobs_tells_duplicate_blobs_apart(repo):
+    factory = ProcessorConfigurationFactory.get_default_factory()
+    tracked = sorted(list_tracked_files(repo))
+
+    results = list(count_blobs(tracked, factory, jobs=1, duplicates=True))
+
+    duplicates = {os.path.relpath(r.path, repo): r.duplicate_of for r in results if r.duplicate_of}
+    assert duplicates == {os.path.join("vendor", "copy.py"): os.path.join(repo, "main.py")}
+    assert all(r.duplicate_of is None for r in count_blobs(tracked, factory, jobs=1))
+
+def test_count_blobs_reports_the_failures_of_each_path(repo):
+    factory = ProcessorConfigurationFactory.get_default_factory()
+    main = os.path.join(repo, "main.py")
+    missing = os.path.join(repo, "missing.py")
+    tracked = [(missing, blob_id(repo, "main.py")), (main, blob_id(repo, "main.py"))]
+
+    results = list(count_blobs(tracked, factory, jobs=1))
+
+    assert results[0].report is None and missing in results[0].message
+    assert results[1].report.code == 1
+
+def test_count_blobs_reuses_cached_blobs(repo, tmp_path, monkeypatch):
+    factory = ProcessorConfigurationFactory.get_default_factory()
+    tracked = list_tracked_files(repo)
+    with ReportCache(str(tmp_path / "cache")) as cache:
+        cold = [(r.path, r.report.code) for r in count_blobs(tracked, factory, jobs=1, cache=cache)]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Cached blobs should not be counted")
+    monkeypatch.setattr("pylocc.runner.process_file", fail)
+
+    with ReportCache(str(tmp_path / "cache")) as cache:
+        warm = [(r.path, r.report.code) for r in count_blobs(tracked, factory, jobs=1, cache=cache)]
+
+    assert warm == cold
+
+
+@pytest.fixture
+def history_repo(repo):
+    """The repository with a second commit modifying, deleting and adding files, and a third adding a text file."""
+    git(repo, 'add', '-A')
+    git(repo, 'commit', '-q', '-m', 'second')
+    with open(os.path.join(repo, "notes.txt"), 'w') as f:
+        f.write("some notes\n")
+    git(repo, 'add', '-A')
+    git(repo, 'commit', '-q', '-m', 'third')
+    return repo
+
+
+def test_iter_commit_changes(history_repo):
+    commits = list(iter_commit_changes(history_repo))
+
+    assert [commit.parent is None for commit in commits] == [True, False, False]
+    assert [commit.parent for commit in commits[1:]] == [commit.commit for commit in commits[:-1]]
+    assert sorted(path for path, _ in commits[0].changes) == ["deleted.py", "main.py", "modified.py", "vendor/copy.py"]
+    assert sorted(commits[1].changes, key=lambda change: change[0]) == [
+        ("deleted.py", None), ("modified.py", blob_id(history_repo, "modified.py")),
+        ("untracked.py", blob_id(history_repo, "untracked.py"))]
+    assert [path for path, _ in commits[2].changes] == ["notes.txt"]
+    assert dict(list_tree_files(history_repo, 'HEAD~1'))["modified.py"] == blob_id(history_repo, "modified.py")
+
+
+def test_read_blobs(history_repo):
+    ids = [blob_id(history_repo, "main.py"), blob_id(history_repo, "notes.txt")]
+
+    blobs = list(read_blobs(history_repo, ids))
+
+    assert blobs == [(ids[0], b"# comment\nprint('main')\n"), (ids[1], b"some notes\n")]
+    with pytest.raises(GitError):
+        list(read_blobs(history_repo, ["0" * 40]))
+
+
+def test_count_history(history_repo):
+    history = list(count_history(history_repo, jobs=1))
+
+    assert len(history) == 3
+    first, second, third = [commit.reports for commit in history]
+    assert first[Language.PYTHON][0] == 4
+    assert first[Language.PYTHON][1].code == 4
+    assert second[Language.PYTHON][0] == 4
+    assert second[Language.PYTHON][1].code == 5
+    assert Language.PLAIN_TEXT not in second
+    assert third[Language.PLAIN_TEXT][0] == 1
+    # The totals of the last commit are the ones of counting its tracked files
+    factory = ProcessorConfigurationFactory.get_default_factory()
+    tracked = list_tracked_files(history_repo)
+    assert third[Language.PYTHON][1].code == sum(r.report.code for r in count_blobs(tracked, factory, jobs=1)
+                                                 if r.report.file_type == Language.PYTHON)
+
+
+def test_count_history_of_a_range(history_repo):
+    history = list(count_history(history_repo, 'HEAD~1..HEAD', jobs=1))
+
+    assert len(history) == 1
+    assert history[0].reports[Language.PYTHON][0] == 4
+    assert history[0].reports[Language.PLAIN_TEXT][0] == 1
+
+
+def test_count_history_counts_each_blob_once(history_repo, monkeypatch):
+    counted = []
+    import pylocc.history
+    original = pylocc.history.count_contents
+
+    def spy(contents, *args, **kwargs):
+        contents = list(contents)
+        counted.extend(path for path, _ in contents)
+        return original(contents, *args, **kwargs)
+    monkeypatch.setattr(pylocc.history, "count_contents", spy)
+
+    list(count_history(history_repo, jobs=1))
+
+    # main.py and vendor/copy.py share their blob, the unchanged blobs are not counted again by the later commits
+    assert sorted(counted) == ["deleted.py", "main.py", "modified.py", "modified.py", "notes.txt", "untracked.py"]
+
+
+def test_count_history_reuses_cached_blobs(history_repo, tmp_path, monkeypatch):
+    with ReportCache(str(tmp_path / "cache")) as cache:
+        cold = list(count_history(history_repo, jobs=1, cache=cache))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Cached blobs should not be counted")
+    monkeypatch.setattr("pylocc.history.read_blobs", fail)
+
+    with ReportCache(str(tmp_path / "cache")) as cache:
+        warm = list(count_history(history_repo, jobs=1, cache=cache))
+
+    assert warm == cold
+
+
+def test_count_history_outside_of_a_repository(tmp_path):
+    with pytest.raises(GitError):
+        list(count_history(str(tmp_path)))
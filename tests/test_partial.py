@@ -0,0 +1,83 @@
+import os
+
+import pytest
+
+from pylocc.language import Language
+from pylocc.partial import (PARTIAL_MAGIC, PartialResult, PartialResultError, merge_partials, read_partial,
+                            write_partial)
+from pylocc.processor import Report
+from pylocc.store import ReportStore
+
+
+def make_partial(reports, shard=None, options_key='bytes:1:None:None', skipped=None):
+    report_store = ReportStore()
+    for path, report in reports.items():
+        report_store.add(path, report)
+    return PartialResult(report_store, skipped, options_key, shards=([shard[0]], shard[1]) if shard else None)
+
+
+@pytest.fixture
+def first_shard():
+    return make_partial({
+        os.path.join("src", "sub", "b.py"): Report(Language.PYTHON, code=3, blanks=1),
+        "main.py": Report(Language.PYTHON, code=10, comments=2),
+    }, shard=(1, 2), skipped={'binary': 1})
+
+
+@pytest.fixture
+def second_shard():
+    return make_partial({
+        os.path.join("src", "a.md"): Report(Language.MARKDOWN, code=5),
+    }, shard=(2, 2), skipped={'binary': 2, 'minified': 1})
+
+
+def test_partial_round_trip(tmp_path, first_shard):
+    path = str(tmp_path / "shard1.partial")
+
+    write_partial(path, first_shard)
+    partial = read_partial(path)
+
+    assert list(partial.reports.items()) == list(first_shard.reports.items())
+    assert partial.skipped == first_shard.skipped
+    assert partial.options_key == first_shard.options_key
+    assert partial.shards == ([1], 2)
+    assert not partial.complexity
+
+
+@pytest.mark.parametrize("content", [b"", b"not a partial result", PARTIAL_MAGIC + b"\x02\x00",
+                                     PARTIAL_MAGIC + b"\x01\x00garbage"])
+def test_read_partial_rejects_invalid_files(tmp_path, content):
+    path = tmp_path / "invalid.partial"
+    path.write_bytes(content)
+
+    with pytest.raises(PartialResultError):
+        read_partial(str(path))
+
+
+def test_merge_partials_orders_the_reports_as_the_walk(first_shard, second_shard):
+    merged = merge_partials([second_shard, first_shard])
+
+    assert list(merged.reports) == ["main.py", os.path.join("src", "a.md"), os.path.join("src", "sub", "b.py")]
+    assert merged.skipped == {'binary': 3, 'minified': 1}
+    assert merged.shards == ([1, 2], 2)
+    assert merged.missing_shards == []
+
+
+def test_merge_partials_reports_the_missing_shards(first_shard):
+    assert merge_partials([first_shard]).missing_shards == [2]
+
+
+@pytest.mark.parametrize("other", [
+    make_partial({}, shard=(1, 2)),
+    make_partial({}, shard=(2, 3)),
+    make_partial({}),
+    make_partial({}, shard=(2, 2), options_key='text:1:None:None'),
+])
+def test_merge_partials_rejects_mismatching_partials(first_shard, other):
+    with pytest.raises(PartialResultError):
+        merge_partials([first_shard, other])
+
+
+def test_merge_partials_requires_a_partial():
+    with pytest.raises(PartialResultError):
+        merge_partials([])
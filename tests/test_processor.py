@@ -2,7 +2,9 @@ from unittest import TestCase
 from typing import Dict
 
 from pylocc.language import Language
-from pylocc.processor import ProcessorConfiguration, count_locs
+from pylocc.processor import (ProcessorConfiguration, Report, count_locs, count_locs_bytes, compile_classifier,
+                              LineClassifier, LineCommentClassifier, MultilineCommentClassifier,
+                              ScanningClassifier, parse_quote)
 
 
 class TestProcessor(TestCase):
@@ -19,6 +21,12 @@ class TestProcessor(TestCase):
             line_comment=["--"],
             multiline_comment=[]
         )
+        self.java_config = ProcessorConfiguration(
+            file_type=Language.JAVA,
+            file_extensions=['java'],
+            line_comment=["//"],
+            multiline_comment=[("/*", "*/")]
+        )
 
     def test_should_count_code_lines(self):
         text = ["line 1", "line 2", "line 3"]
@@ -78,6 +86,202 @@ class TestProcessor(TestCase):
         self.assertEqual(report.code, 4)
         self.assertEqual(report.comments, 0)
 
+    def test_should_end_multi_lines_comments_on_terminated_lines(self):
+        text = ["/* the comment begins\n",
+                "   and ends */\n",
+                "code\n"]
+        report = count_locs(text, file_configuration=self.java_config)
+        self.assertEqual(report.comments, 2)
+        self.assertEqual(report.code, 1)
+
+    def test_should_count_nothing_in_empty_text(self):
+        report = count_locs([], file_configuration=self.java_config)
+        self.assertEqual(report.total, 0)
+
+    def test_should_honor_every_comment_marker(self):
+        lua_config = ProcessorConfiguration(
+            file_type=Language.LUA,
+            file_extensions=['lua'],
+            line_comment=["--", "#!"],
+            multiline_comment=[("--[[", "]]"), ("--[==[", "]==]")]
+        )
+        text = ["#!/usr/bin/lua",
+                "-- line comment",
+                "--[[ first block",
+                "]]",
+                "--[==[ second block",
+                "]] still in the second block",
+                "]==]",
+                "print('code')"]
+        report = count_locs(text, file_configuration=lua_config)
+        self.assertEqual(report.comments, 7)
+        self.assertEqual(report.code, 1)
+
+    def test_should_close_multi_lines_comments_on_the_same_line(self):
+        text = ["/** closed */",
+                "code",
+                "/*",
+                "*/",
+                "code"]
+        report = count_locs(text, file_configuration=self.java_config)
+        self.assertEqual(report.comments, 3)
+        self.assertEqual(report.code, 2)
+
+    def test_should_cache_the_compiled_classifiers(self):
+        self.assertIs(self.java_config.classifier, self.java_config.classifier)
+        self.assertIs(self.java_config.binary_classifier, self.java_config.binary_classifier)
+
+
+class TestCompileClassifier(TestCase):
+    def test_should_pick_the_cheapest_classifier(self):
+        self.assertIs(type(compile_classifier([], [])), LineClassifier)
+        self.assertIs(type(compile_classifier(["#"], [])), LineCommentClassifier)
+        self.assertIs(type(compile_classifier([], [("/*", "*/")])), MultilineCommentClassifier)
+
+    def test_should_count_total_comments_and_blanks(self):
+        classifier = compile_classifier([b"//"], [(b"/*", b"*/")])
+        self.assertEqual(classifier.count([b"code", b"", b"// c", b"/* c", b"c */"]), (5, 3, 1))
+
+    def test_should_only_check_the_shortest_comment_start_patterns(self):
+        classifier = compile_classifier(["--"], [("--[[", "]]"), ("{-", "-}")])
+        self.assertEqual(classifier.comment_start, ("--", "{-"))
+
+    def test_should_only_scan_when_accurate(self):
+        quotes = [('"', '"', False, False)]
+        self.assertIs(type(compile_classifier(["//"], [("/*", "*/")], quotes)), MultilineCommentClassifier)
+        self.assertIs(type(compile_classifier(["//"], [("/*", "*/")], quotes, accurate=True)), ScanningClassifier)
+        self.assertIs(type(compile_classifier(["//"], [], quotes, accurate=True)), ScanningClassifier)
+        # Without strings nor block comments to follow, the cheap classifier is as accurate
+        self.assertIs(type(compile_classifier(["#"], [], accurate=True)), LineCommentClassifier)
+
+
+class TestScanningClassifier(TestCase):
+    def setUp(self):
+        self.c = ScanningClassifier(["//"], [("/*", "*/")], [('"', '"', False, False)])
+        self.rust = ScanningClassifier(["//"], [("/*", "*/")], [('"', '"', False, False)], nested_multiline=True)
+        self.python = ScanningClassifier(["#"], [], [('"', '"', False, False), ("'", "'", False, False),
+                                                     ('r"', '"', True, False), ('"""', '"""', False, True)])
+
+    def test_should_ignore_comment_markers_in_strings(self):
+        self.assertEqual(self.c.count(['x = "/* not a comment";', 'y = 1;', '"// neither" + x;']), (3, 0, 0))
+        self.assertEqual(self.python.count(['x = "# no"', "'#'", '# yes']), (3, 1, 0))
+
+    def test_should_honor_escaped_string_ends(self):
+        self.assertEqual(self.c.count(['x = "\\" /* c', 'c */', 'y = "\\"" // c"', 'z;']), (4, 0, 0))
+        # Backslashes escape nothing in raw strings
+        self.assertEqual(self.python.count(['x = r"\\"  # c', '# c']), (2, 1, 0))
+
+    def test_should_follow_block_comments_opened_in_the_middle_of_a_line(self):
+        lines = ['int x; /* starts here', 'still a comment', 'ends here */ int y;', '/* a */ /* b */', 'z; /* c */']
+        self.assertEqual(self.c.count(lines), (5, 2, 0))
+
+    def test_should_follow_nested_block_comments(self):
+        lines = ['/* outer /* inner */', 'still a comment */', 'fn main() {}']
+        self.assertEqual(self.rust.count(lines), (3, 2, 0))
+        self.assertEqual(self.c.count(lines), (3, 1, 0))
+
+    def test_should_open_block_comments_extending_line_comments(self):
+        lua = ScanningClassifier(["--"], [("--[[", "]]")], [('"', '"', False, False)])
+        self.assertEqual(lua.count(['--[[ block', 'comment ]]', '-- line', 'x = 1']), (4, 3, 0))
+
+    def test_should_count_docstrings_as_comments(self):
+        lines = ['def f():', '    """Documents', '', '    the function."""', '    x = """not', 'a docstring"""']
+        self.assertEqual(self.python.count(lines), (6, 2, 1))
+
+    def test_should_count_multi_line_strings_as_code(self):
+        self.assertEqual(self.c.count(['x = "multi \\', '// line string";']), (2, 0, 0))
+
+    def test_should_work_on_bytes(self):
+        classifier = ScanningClassifier([b"//"], [(b"/*", b"*/")], [(b'"', b'"', False, False)])
+        self.assertEqual(classifier.count([b'x = "/*";\n', b'y; /* c\n', b'c */\n', b'\n']), (4, 1, 1))
+
+    def test_should_match_the_default_classifier_on_simple_sources(self):
+        lines = ["code", "", "// c", "/* c", " * c", "*/", "/* one line */", "code // trailing", "   "]
+        default = compile_classifier(["//"], [("/*", "*/")])
+        self.assertEqual(self.c.count(lines), default.count(lines))
+
+
+class TestCountFrom(TestCase):
+    def setUp(self):
+        self.classifiers = {
+            'sql': compile_classifier(["--"], [("/*", "*/")]),
+            'c': ScanningClassifier(["//"], [("/*", "*/")], [('"', '"', False, False)]),
+            'rust': ScanningClassifier(["//"], [("/*", "*/")], [('"', '"', False, False)], nested_multiline=True),
+            'python': ScanningClassifier(["#"], [], [('"', '"', False, False), ('"""', '"""', False, True)]),
+        }
+        self.lines = ['/* a', '/* b */ c */', 'x = "s\\', '// t";', '"""doc', '"""', '', '-- c', 'y; /* d', 'e */']
+
+    def assertSplitCountsAddUp(self, classifier, lines):
+        expected = classifier.count_complexity(lines)
+        for i in range(len(lines) + 1):
+            *head, state = classifier.count_from(lines[:i], None, complexity=True)
+            *tail, _ = classifier.count_from(lines[i:], state, complexity=True)
+            self.assertEqual(tuple(a + b for a, b in zip(head, tail)), expected, f"split at line {i}")
+
+    def test_should_add_up_the_counts_of_consecutive_ranges(self):
+        for name, classifier in self.classifiers.items():
+            with self.subTest(name):
+                self.assertSplitCountsAddUp(classifier, self.lines)
+
+    def test_should_return_the_state_of_the_next_line(self):
+        self.assertEqual(self.classifiers['sql'].count_from(['x', '/* a'])[-1], "*/")
+        self.assertIsNone(self.classifiers['sql'].count_from(['/* a', 'b */'])[-1])
+        self.assertEqual(self.classifiers['c'].count_from(['x; /* a']), (1, 0, 0, 0, ("*/", None, 1, False)))
+        self.assertEqual(self.classifiers['c'].count_from(['b */ y;'], ("*/", None, 1, False)), (1, 0, 0, 0, None))
+
+    def test_should_list_the_block_comment_states(self):
+        self.assertEqual(self.classifiers['sql'].split_states(), ("*/",))
+        self.assertEqual(self.classifiers['c'].split_states(), (("*/", None, 1, False),))
+        self.assertEqual(self.classifiers['python'].split_states(), ())
+        self.assertEqual(compile_classifier(["#"], []).split_states(), ())
+
+
+class TestProcessorBytes(TestCase):
+    CORPUS = [
+        "",
+        "line 1\nline 2\n",
+        "no trailing newline",
+        "// comment\n\n   \ncode // trailing\n",
+        "/* block\n * still block\n */\nint x;\r\n// windows\r\n\r\n",
+        "/** one line */\ncode\n/*\n\n*/\n",
+        "mac\rline endings\r// comment\r",
+        "unicode \u00e8 text\n// commento \u00e0\n",
+    ]
+
+    def setUp(self):
+        self.java_config = ProcessorConfiguration(
+            file_type=Language.JAVA,
+            file_extensions=['java'],
+            line_comment=["//"],
+            multiline_comment=[("/*", "*/")]
+        )
+
+    def test_should_match_the_text_engine(self):
+        import io
+        for content in self.CORPUS:
+            with self.subTest(content=content):
+                expected = count_locs(io.StringIO(content, newline=None), file_configuration=self.java_config)
+                actual = count_locs_bytes(content.encode('utf-8').splitlines(), file_configuration=self.java_config)
+                self.assertEqual((actual.code, actual.comments, actual.blanks),
+                                 (expected.code, expected.comments, expected.blanks))
+
+    def test_should_collect_the_same_unique_lines_as_the_text_engine(self):
+        import io
+        for content in self.CORPUS:
+            with self.subTest(content=content):
+                text_lines, byte_lines = set(), set()
+                expected = count_locs(io.StringIO(content, newline=None), file_configuration=self.java_config,
+                                      accurate=True, unique_lines=text_lines)
+                actual = count_locs_bytes(content.encode('utf-8').splitlines(), file_configuration=self.java_config,
+                                          accurate=True, unique_lines=byte_lines)
+                self.assertEqual(actual, expected)
+                self.assertEqual({line.encode('utf-8') for line in text_lines}, byte_lines)
+                self.assertNotIn(b"", byte_lines)
+
+    def test_should_use_encoded_markers(self):
+        self.assertEqual(self.java_config.binary_line_comment, [b"//"])
+        self.assertEqual(self.java_config.binary_multiline_comment, [(b"/*", b"*/")])
+
 
 class TestProcessorConfiguration(TestCase):
     def setUp(self):
@@ -94,9 +298,91 @@ class TestProcessorConfiguration(TestCase):
         self.assertEqual(java_config.file_extensions, ['java'])
         self.assertEqual(java_config.line_comment, ['//'])
         self.assertEqual(java_config.multiline_comment, [[ "/*", "*/" ]])
+        self.assertEqual(java_config.quotes, [('"', '"', False, False)])
+        self.assertFalse(java_config.nested_multiline)
+        self.assertIn("if(", java_config.complexity_checks)
         javascript_config = next((c for c in configs if c.file_type == Language.JAVASCRIPT), None)
         self.assertIsNotNone(javascript_config)
         self.assertEqual(javascript_config.file_type, Language.JAVASCRIPT)
         self.assertEqual(javascript_config.file_extensions, ["js", "cjs", "mjs"])
         self.assertEqual(javascript_config.line_comment, ['//'])
         self.assertEqual(javascript_config.multiline_comment, [[ "/*", "*/" ]])
+
+
+class TestParseQuote(TestCase):
+    def test_should_parse_the_quote_definitions(self):
+        self.assertEqual(parse_quote({"start": "r\"\"\"", "end": "\"\"\"", "ignoreEscape": True, "docString": True}),
+                         ('r"""', '"""', True, True))
+        self.assertEqual(parse_quote({"start": "`", "end": "`"}), ("`", "`", False, False))
+        # Some languages only give the delimiter of both ends
+        self.assertEqual(parse_quote("'"), ("'", "'", False, False))
+
+
+class TestComplexity(TestCase):
+    def setUp(self):
+        self.python = ScanningClassifier(["#"], [], [('"', '"', False, False), ('"""', '"""', False, True)],
+                                         complexity_checks=["if ", "elif ", "for ", "and ", "while("])
+        self.c = ScanningClassifier(["//"], [("/*", "*/")], [('"', '"', False, False)],
+                                    complexity_checks=["if ", "if(", "== ", "!= ", "|| "])
+
+    def test_should_count_the_complexity_checks_of_the_code(self):
+        lines = ['def f(x):', '    if x and y:', '        pass', '    elif x:', '        for i in x:',
+                 '            while(i): pass']
+        self.assertEqual(self.python.count_complexity(lines), (6, 0, 0, 5))
+
+    def test_should_skip_the_checks_in_comments_and_strings(self):
+        lines = ['x = 1  # if x', '# for x', 'y = "if z"', '"""', 'if y and x', '"""']
+        self.assertEqual(self.python.count_complexity(lines)[3], 0)
+        lines = ['if (a == b || c) { /* if ( */ }', '// if (x)', 's = "if (x)";', '/* while', 'if ( */ if(a != b)']
+        self.assertEqual(self.c.count_complexity(lines), (5, 2, 0, 5))
+
+    def test_should_only_count_the_checks_starting_a_word(self):
+        self.assertEqual(self.python.count_complexity(['elif x:', 'motif = 1', 'glif (x)'])[3], 1)
+
+    def test_should_count_the_same_lines_with_or_without_complexity(self):
+        lines = ['if (a == b) { /* c', 'c */ }', '', '"// if " + x;']
+        self.assertEqual(self.c.count_complexity(lines)[:3], self.c.count(lines))
+
+    def test_should_count_without_any_comment_nor_string(self):
+        classifier = compile_classifier([], [], complexity_checks=["+", "-"])
+        self.assertIs(type(classifier), ScanningClassifier)
+        self.assertEqual(classifier.count_complexity(["+-+", "", "."]), (3, 0, 1, 3))
+
+    def test_should_report_no_complexity_without_checks(self):
+        self.assertEqual(compile_classifier(["#"], []).count_complexity(["# c", "x"]), (2, 1, 0, 0))
+
+    def test_should_count_the_complexity_of_reports(self):
+        config = ProcessorConfiguration(file_type=Language.PYTHON, file_extensions=['py'], line_comment=['#'],
+                                        multiline_comment=[], quotes=[('"', '"', False, False)],
+                                        complexity_checks=['if '])
+        lines = ['if x:  # if', '    y = "if"']
+        self.assertEqual(count_locs(lines, config, complexity=True).complexity, 1)
+        self.assertEqual(count_locs_bytes([line.encode() for line in lines], config, complexity=True).complexity, 1)
+        self.assertEqual(count_locs(lines, config).complexity, 0)
+
+
+class TestReport(TestCase):
+    def test_should_add_reports_of_the_same_language(self):
+        first = Report(Language.PYTHON, code=1, comments=2, blanks=3, complexity=4)
+        second = Report(Language.PYTHON, code=10, comments=20, blanks=30, complexity=40)
+
+        self.assertEqual(first + second, Report(Language.PYTHON, code=11, comments=22, blanks=33, complexity=44))
+        self.assertEqual(sum([first, second]), first + second)
+        self.assertEqual(first.code, 1)
+
+    def test_should_add_in_place(self):
+        report = Report(Language.PYTHON, code=1)
+        aggregated = report
+        aggregated += Report(Language.PYTHON, code=2, blanks=1)
+
+        self.assertIs(aggregated, report)
+        self.assertEqual(report, Report(Language.PYTHON, code=3, blanks=1))
+
+    def test_should_not_add_reports_of_different_languages(self):
+        with self.assertRaises(ValueError):
+            Report(Language.PYTHON) + Report(Language.JAVA)
+
+    def test_should_compare_the_counts(self):
+        self.assertEqual(Report(Language.PYTHON, code=1), Report(Language.PYTHON, code=1))
+        self.assertNotEqual(Report(Language.PYTHON, code=1), Report(Language.PYTHON, code=1, complexity=1))
+        self.assertNotEqual(Report(Language.PYTHON), Report(Language.JAVA))
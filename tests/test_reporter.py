@@ -5,11 +5,20 @@ from pylocc.reporter import (
     create_by_file_table,
     aggregate_reports,
     create_aggregate_table,
+    open_report_writer,
+    read_binary_report,
+    BinaryReportWriter,
+    ReportAggregator,
+    history_headers,
+    history_values,
     ReportData
 )
 from pylocc.processor import Report
+from pylocc.uloc import fingerprint_array
+import io
 import os
 import csv
+import json
 
 @pytest.fixture
 def sample_reports():
@@ -55,3 +64,170 @@ def test_report_data_to_csv(tmp_path, sample_reports):
         rows = list(reader)
         assert len(rows) == 3
         assert rows[0] == ["Python", "file1.py", "file1", "15", "10", "2", "3"]
+
+def test_report_aggregator_matches_aggregate_reports(sample_reports):
+    aggregator = ReportAggregator()
+    for report in sample_reports.values():
+        aggregator.add(report)
+
+    assert len(aggregator) == 3
+    assert aggregator.to_report_data().rows == aggregate_reports(sample_reports).rows
+
+def test_csv_report_writer_matches_to_csv(tmp_path, sample_reports):
+    expected_path = tmp_path / "expected.csv"
+    prepare_by_file_report(sample_reports).to_csv(expected_path)
+
+    with open_report_writer(str(tmp_path / "report.csv")) as writer:
+        for file_path, report in sample_reports.items():
+            writer.write(file_path, report)
+
+    assert (tmp_path / "report.csv").read_text() == expected_path.read_text()
+
+def test_json_lines_report_writer(tmp_path, sample_reports):
+    with open_report_writer(str(tmp_path / "report.jsonl")) as writer:
+        for file_path, report in sample_reports.items():
+            writer.write(file_path, report)
+
+    with open(tmp_path / "report.jsonl") as f:
+        records = [json.loads(line) for line in f]
+    assert len(records) == 3
+    assert records[0] == {"Language": "Python", "Provider": "file1.py", "File Name": "file1",
+                          "Lines": 15, "Code": 10, "Comments": 2, "Blanks": 3}
+
+def test_writes_the_history_rows(tmp_path, sample_reports):
+    reports = {Language("Python"): (2, sample_reports["file1.py"] + sample_reports["file2.py"]),
+               Language("Plain Text"): (1, sample_reports["file3.txt"])}
+
+    with open_report_writer(str(tmp_path / "history.csv"), headers=history_headers(False)) as writer:
+        for values in history_values("abc123", "2024-01-01T00:00:00+00:00", reports):
+            writer.write_row(values)
+
+    with open(tmp_path / "history.csv") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["Commit", "Date", "Language", "Files", "Lines", "Code", "Comments", "Blanks"]
+    assert rows[1] == ["abc123", "2024-01-01T00:00:00+00:00", "Python", "2", "40", "25", "7", "8"]
+    assert rows[-1] == ["abc123", "2024-01-01T00:00:00+00:00", "Total", "3", "62", "45", "7", "10"]
+
+def test_reports_the_complexity_when_asked(tmp_path):
+    reports = {
+        "file1.py": Report(file_type=Language("Python"), code=10, comments=2, blanks=3, complexity=4),
+        "file2.py": Report(file_type=Language("Python"), code=15, comments=5, blanks=5, complexity=6),
+    }
+    aggregator = ReportAggregator(complexity=True)
+    for report in reports.values():
+        aggregator.add(report)
+
+    report_data = aggregator.to_report_data()
+    assert report_data.headers[-1] == "Complexity"
+    assert report_data.rows == [["Python", "2", "40", "25", "7", "8", "10"], ["Total", "2", "40", "25", "7", "8", "10"]]
+    assert prepare_by_file_report(reports, complexity=True).rows[0][-1] == "4"
+    assert "Complexity" not in aggregate_reports(reports).headers
+
+    with open_report_writer(str(tmp_path / "report.jsonl"), complexity=True) as writer:
+        writer.write("file1.py", reports["file1.py"])
+    with open(tmp_path / "report.jsonl") as f:
+        assert json.loads(f.readline())["Complexity"] == 4
+
+@pytest.fixture
+def sample_aggregator(sample_reports):
+    aggregator = ReportAggregator()
+    for report in sample_reports.values():
+        aggregator.add(report)
+    return aggregator
+
+def test_writes_the_aggregate_counts_as_numbers(tmp_path, sample_aggregator):
+    with open_report_writer(str(tmp_path / "report.csv"), by_file=False) as writer:
+        writer.write_aggregate(sample_aggregator)
+    with open_report_writer(str(tmp_path / "report.json"), by_file=False) as writer:
+        writer.write_aggregate(sample_aggregator)
+
+    with open(tmp_path / "report.csv", newline='') as f:
+        rows = list(csv.reader(f))
+    assert rows == [["Language", "Files", "Lines", "Code", "Comments", "Blanks"], ["Python", "2", "40", "25", "7", "8"],
+                    ["Plain Text", "1", "22", "20", "0", "2"], ["Total", "3", "62", "45", "7", "10"]]
+    with open(tmp_path / "report.json") as f:
+        records = json.load(f)
+    assert records[0] == {"Language": "Python", "Files": 2, "Lines": 40, "Code": 25, "Comments": 7, "Blanks": 8}
+    assert records[-1]["Language"] == "Total"
+
+@pytest.mark.parametrize("output_format", ["json", "jsonl", "binary"])
+def test_by_file_formats_hold_the_same_records(tmp_path, sample_reports, output_format):
+    path = tmp_path / "report"
+    with open_report_writer(str(path), complexity=True, output_format=output_format) as writer:
+        for file_path, report in sample_reports.items():
+            writer.write(file_path, report)
+
+    if output_format == "json":
+        records = json.loads(path.read_text())
+    elif output_format == "jsonl":
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+    else:
+        with open(path, "rb") as f:
+            records = list(read_binary_report(f))
+    assert records == [dict(zip(["Language", "Provider", "File Name", "Lines", "Code", "Comments", "Blanks",
+                                 "Complexity"], [report.file_type.value, file_path,
+                                                 os.path.splitext(file_path)[0], report.total, report.code,
+                                                 report.comments, report.blanks, report.complexity]))
+                       for file_path, report in sample_reports.items()]
+
+def test_json_report_writer_writes_an_empty_array(tmp_path):
+    open_report_writer(str(tmp_path / "report.json")).close()
+
+    assert json.loads((tmp_path / "report.json").read_text()) == []
+
+def test_binary_report_holds_the_aggregate_without_the_total(sample_aggregator):
+    stream = io.BytesIO()
+    with BinaryReportWriter(stream, by_file=False, close_stream=False) as writer:
+        writer.write_aggregate(sample_aggregator)
+
+    stream.seek(0)
+    assert list(read_binary_report(stream)) == [
+        {"Language": "Python", "Files": 2, "Lines": 40, "Code": 25, "Comments": 7, "Blanks": 8},
+        {"Language": "Plain Text", "Files": 1, "Lines": 22, "Code": 20, "Comments": 0, "Blanks": 2},
+    ]
+
+@pytest.mark.parametrize("output_format", ["csv", "binary"])
+def test_reports_the_duplicates_per_language(tmp_path, sample_reports, output_format):
+    aggregator = ReportAggregator(duplicates=True)
+    for report in sample_reports.values():
+        aggregator.add(report)
+    aggregator.add_duplicate(sample_reports["file1.py"])
+    aggregator.add_duplicate(sample_reports["file1.py"])
+
+    path = tmp_path / "report"
+    with open_report_writer(str(path), output_format=output_format, by_file=False, duplicates=True) as writer:
+        writer.write_aggregate(aggregator)
+
+    assert aggregator.to_report_data().headers[-1] == "Duplicates"
+    assert [row[-1] for row in aggregator.to_report_data().rows] == ["2", "0", "2"]
+    if output_format == "csv":
+        with open(path, newline='') as f:
+            records = list(csv.DictReader(f))
+        assert [record["Duplicates"] for record in records] == ["2", "0", "2"]
+    else:
+        with open(path, "rb") as f:
+            records = list(read_binary_report(f))
+        assert records[0] == {"Language": "Python", "Files": 2, "Lines": 40, "Code": 25, "Comments": 7, "Blanks": 8,
+                              "Duplicates": 2}
+
+@pytest.mark.parametrize("approximate", [False, True])
+def test_reports_the_unique_lines_per_language_and_in_total(tmp_path, sample_reports, approximate):
+    aggregator = ReportAggregator(duplicates=True, uloc=True, approximate_uloc=approximate)
+    aggregator.add(sample_reports["file1.py"], fingerprints=fingerprint_array("abc"))
+    aggregator.add(sample_reports["file2.py"], fingerprints=fingerprint_array("bcd"))
+    aggregator.add(sample_reports["file3.txt"], fingerprints=fingerprint_array("ce"))
+
+    path = tmp_path / "report"
+    with open_report_writer(str(path), output_format="binary", by_file=False, duplicates=True, uloc=True) as writer:
+        writer.write_aggregate(aggregator)
+
+    assert aggregator.to_report_data().headers[-2:] == ["Duplicates", "ULOC"]
+    assert [row[-1] for row in aggregator.to_report_data().rows] == ["4", "2", "5"]
+    with open(path, "rb") as f:
+        records = list(read_binary_report(f))
+    assert records[1] == {"Language": "Plain Text", "Files": 1, "Lines": 22, "Code": 20, "Comments": 0, "Blanks": 2,
+                          "Duplicates": 0, "ULOC": 2}
+
+def test_read_binary_report_rejects_other_files():
+    with pytest.raises(ValueError):
+        list(read_binary_report(io.BytesIO(b"Language,Files\n")))
@@ -0,0 +1,328 @@
+import os
+
+import pytest
+
+import pylocc.runner
+from pylocc.cache import ReportCache
+from pylocc.file_utils import FileEntry
+from pylocc.processor import ProcessorConfigurationFactory
+from pylocc.runner import TEXT_ENGINE, CountOptions, ReadAhead, count_files, process_file
+
+
+@pytest.fixture
+def factory():
+    return ProcessorConfigurationFactory.get_default_factory()
+
+
+@pytest.fixture
+def source_files(tmp_path):
+    files = []
+    for i in range(40):
+        path = tmp_path / f"file{i}.py"
+        path.write_text("# comment\n" * (i % 3) + "\n" * (i % 2) + "print('hello')\n" * i)
+        files.append(str(path))
+    return files
+
+
+def test_process_file_counts_lines(tmp_path, factory):
+    path = tmp_path / "test.py"
+    path.write_text("# comment\n\nprint('hello')\n")
+
+    result = process_file(str(path), factory)
+
+    assert result.report is not None
+    assert (result.report.code, result.report.comments, result.report.blanks) == (1, 1, 1)
+    assert result.message is None
+
+
+def test_process_file_measures_timed_files(tmp_path, factory):
+    path = tmp_path / "test.py"
+    path.write_text("# comment\n\nprint('hello')\n")
+
+    untimed = process_file(str(path), factory)
+    timed = process_file(str(path), factory, CountOptions(timed=True))
+    timed_text = process_file(str(path), factory, CountOptions(engine=TEXT_ENGINE, timed=True))
+
+    assert untimed.stats is None
+    assert timed.stats.size == timed_text.stats.size == path.stat().st_size
+    assert timed.stats.read_time >= 0 and timed.stats.count_time >= 0
+
+
+def test_process_file_skips_unknown_extension(tmp_path, factory):
+    path = tmp_path / "test.unknown"
+    path.write_text("whatever")
+
+    result = process_file(str(path), factory)
+
+    assert result.report is None
+    assert "No configuration found for file type 'unknown'" in result.message
+
+
+@pytest.mark.parametrize("engine", ['bytes', TEXT_ENGINE])
+def test_process_file_detects_file_names_and_shebangs(tmp_path, factory, engine):
+    options = CountOptions(engine=engine, sniff=False)
+    (tmp_path / "Makefile").write_text("# build\nall:\n\techo done\n")
+    (tmp_path / "run").write_text("#!/usr/bin/env python3\n# comment\nprint('hello')\n")
+    (tmp_path / "data").write_text("1,2,3\n")
+
+    makefile = process_file(str(tmp_path / "Makefile"), factory, options)
+    script = process_file(str(tmp_path / "run"), factory, options)
+    data = process_file(str(tmp_path / "data"), factory, options)
+
+    assert makefile.report.file_type.value == 'Makefile'
+    assert (makefile.report.code, makefile.report.comments) == (2, 1)
+    assert script.report.file_type.value == 'Python'
+    assert (script.report.code, script.report.comments) == (1, 2)
+    assert data.report is None
+    assert "No configuration found" in data.message
+
+
+def test_process_file_reports_errors(tmp_path, factory):
+    result = process_file(str(tmp_path / "missing.py"), factory)
+
+    assert result.report is None
+    assert result.message.startswith("Error processing file")
+
+
+def test_parallel_count_matches_serial(source_files, factory):
+    serial = list(count_files(source_files, factory, jobs=1))
+    parallel = list(count_files(source_files, factory, jobs=2, serial_threshold=0))
+
+    assert [r.path for r in parallel] == source_files
+    assert [(r.path, r.report.code, r.report.comments, r.report.blanks) for r in parallel] == \
+        [(r.path, r.report.code, r.report.comments, r.report.blanks) for r in serial]
+
+
+def test_small_inputs_are_counted_serially(source_files, factory, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("The worker pool should not be started")
+    monkeypatch.setattr("concurrent.futures.ProcessPoolExecutor", fail)
+
+    results = list(count_files(source_files, factory, jobs=4))
+
+    assert len(results) == len(source_files)
+
+
+def test_parallel_count_consumes_iterators_in_order(source_files, factory, monkeypatch):
+    # Small chunks to go through more chunks than the ones kept in flight
+    monkeypatch.setattr("pylocc.runner.CHUNK_SIZE", 2)
+
+    results = list(count_files(iter(source_files), factory, jobs=2, serial_threshold=0))
+
+    assert [r.path for r in results] == source_files
+    assert all(r.report is not None for r in results)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_read_ahead_matches_the_default_count(source_files, factory, jobs):
+    entries = [FileEntry(f, os.stat(f)) for f in source_files]
+    expected = [(r.path, r.report) for r in count_files(source_files, factory, jobs=1)]
+
+    # A budget of a few files, so that the readers wait for the counting
+    read_ahead = ReadAhead(threads=2, max_bytes=1024)
+    results = list(count_files(entries, factory, jobs=jobs, serial_threshold=0, read_ahead=read_ahead))
+
+    assert [(r.path, r.report) for r in results] == expected
+
+
+@pytest.mark.parametrize("stat", [True, False])
+def test_read_ahead_is_bounded_by_the_budget(source_files, factory, stat):
+    # The files only known by their path are stat-ed to count against the budget
+    entries = [FileEntry(f, os.stat(f)) if stat else f for f in source_files]
+    pulled = []
+
+    def files():
+        for entry in entries:
+            pulled.append(entry)
+            yield entry
+
+    read_ahead = ReadAhead(threads=2, max_bytes=2 * os.path.getsize(source_files[-1]))
+    results = count_files(files(), factory, jobs=1, read_ahead=read_ahead)
+    first = next(results)
+
+    assert first.path == source_files[0]
+    assert len(pulled) < len(source_files)
+    assert len(list(results)) == len(source_files) - 1
+
+
+def test_read_ahead_matches_the_default_count_of_memory_mapped_files(tmp_path, factory):
+    # Bigger than MMAP_THRESHOLD, with lines ending on a bare CR
+    path = tmp_path / "big.c"
+    path.write_bytes(b"int x;\rint y;\r// c\r\n" * 100000)
+    expected = process_file(str(path), factory)
+
+    result, = count_files([str(path)], factory, jobs=1, read_ahead=ReadAhead(max_bytes=4 * 1024 * 1024))
+
+    assert result.report == expected.report
+    assert (result.report.code, result.report.comments) == (200000, 100000)
+
+
+def test_read_ahead_reports_unreadable_files(source_files, factory):
+    missing = source_files[0] + ".missing.py"
+
+    results = list(count_files([missing] + source_files, factory, jobs=1, read_ahead=ReadAhead()))
+
+    assert results[0].report is None
+    assert results[0].message.startswith("Error processing file")
+    assert all(r.report is not None for r in results[1:])
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_duplicates_are_counted_once(source_files, factory, jobs, monkeypatch):
+    copies = []
+    for f in source_files[:10]:
+        copy = f.replace("file", "copy")
+        with open(f, "rb") as original, open(copy, "wb") as duplicate:
+            duplicate.write(original.read())
+        copies.append(copy)
+    files = source_files + copies
+    expected = [(r.path, r.report) for r in count_files(files, factory, jobs=1)]
+    # The files counted in this process, the worker processes have their own copy of the list
+    counted = []
+    original = pylocc.runner.process_file
+
+    def spy(file_path, *args):
+        counted.append(file_path)
+        return original(file_path, *args)
+    monkeypatch.setattr(pylocc.runner, "process_file", spy)
+
+    results = list(count_files(files, factory, jobs=jobs, serial_threshold=0, duplicates=True))
+
+    assert [(r.path, r.report) for r in results] == expected
+    assert [r.duplicate_of for r in results] == [None] * len(source_files) + source_files[:10]
+    assert counted == (source_files if jobs == 1 else [])
+
+
+def test_duplicates_are_found_among_cached_files(source_files, factory, tmp_path):
+    copy = source_files[5].replace("file", "copy")
+    with open(source_files[5], "rb") as original, open(copy, "wb") as duplicate:
+        duplicate.write(original.read())
+    files = source_files + [copy]
+
+    with ReportCache(str(tmp_path / "cache")) as cache:
+        cold = list(count_files(files, factory, jobs=1, cache=cache, duplicates=True))
+    with ReportCache(str(tmp_path / "cache")) as cache:
+        warm = list(count_files(files, factory, jobs=1, cache=cache, duplicates=True))
+
+    assert cold == warm
+    assert [r.path for r in warm if r.duplicate_of] == [copy]
+    assert warm[-1].report == warm[5].report
+
+
+@pytest.fixture
+def big_file(tmp_path, monkeypatch):
+    # Tiny ranges, so that they start in comments and strings
+    monkeypatch.setattr("pylocc.runner.SPLIT_SIZE", 1)
+    monkeypatch.setattr("pylocc.runner.RANGE_SIZE", 10)
+    path = tmp_path / "big.c"
+    path.write_text('/* comment\nstill */\nint x; // c\n\nchar *s = "multi \\\nline";\n/* a */ b();\n' * 20)
+    return str(path)
+
+
+@pytest.mark.parametrize("options", [CountOptions(), CountOptions(engine=TEXT_ENGINE),
+                                     CountOptions(accurate=True), CountOptions(complexity=True)])
+def test_split_files_match_the_sequential_count(big_file, factory, options, monkeypatch):
+    import pylocc.runner
+    split = []
+    original = pylocc.runner._split_ranges
+
+    def spy(file_path):
+        ranges, size = original(file_path)
+        split.append(len(ranges))
+        return ranges, size
+    monkeypatch.setattr(pylocc.runner, "_split_ranges", spy)
+    expected = process_file(big_file, factory, options)
+
+    result, = count_files([big_file], factory, jobs=2, options=options)
+
+    assert split[0] > 10
+    assert result.report == expected.report
+
+
+@pytest.mark.parametrize("options", [CountOptions(uloc=True), CountOptions(engine=TEXT_ENGINE, uloc=True)])
+def test_split_files_fingerprint_the_lines_of_the_sequential_count(big_file, factory, options):
+    expected = process_file(big_file, factory, options)
+
+    result, = count_files([big_file], factory, jobs=2, options=options)
+
+    assert result.report == expected.report
+    assert sorted(result.fingerprints) == sorted(expected.fingerprints)
+    assert len(expected.fingerprints) == 6
+
+
+def test_split_files_are_skipped_as_the_sequential_count_skips_them(big_file, factory):
+    with open(big_file, 'a') as f:
+        f.write("x" * 100 + "\n")
+
+    result, = count_files([big_file], factory, jobs=2, options=CountOptions(max_line_length=50))
+
+    assert result.report is None
+    assert result.skipped == process_file(big_file, factory, CountOptions(max_line_length=50)).skipped
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_fingerprints_the_unique_lines_without_the_cache(source_files, factory, tmp_path, jobs):
+    options = CountOptions(uloc=True)
+    expected = [process_file(file_path, factory, options) for file_path in source_files]
+
+    with ReportCache(str(tmp_path / "cache")) as cache:
+        list(count_files(source_files, factory, jobs=jobs, options=options, serial_threshold=0, cache=cache))
+    with ReportCache(str(tmp_path / "cache")) as cache:
+        results = list(count_files(source_files, factory, jobs=jobs, options=options, serial_threshold=0,
+                                   cache=cache))
+
+    assert [(r.path, r.report, sorted(r.fingerprints)) for r in results] == \
+        [(r.path, r.report, sorted(r.fingerprints)) for r in expected]
+    # The first file is empty, the others have lines that a cached report would have dropped
+    assert all(r.fingerprints for r in results[1:])
+
+
+def test_engines_produce_the_same_reports(source_files, factory):
+    binary = list(count_files(source_files, factory, jobs=1))
+    text = list(count_files(source_files, factory, jobs=1, options=CountOptions(engine=TEXT_ENGINE)))
+
+    assert [(r.report.code, r.report.comments, r.report.blanks) for r in binary] == \
+        [(r.report.code, r.report.comments, r.report.blanks) for r in text]
+
+
+@pytest.mark.parametrize("content,options,reason", [
+    (b"print('hello')\x00\x01", CountOptions(), "binary"),
+    (b"print('hello')\n" * 100, CountOptions(max_file_size=100), "too large"),
+    (b"x = '" + b"a" * 200 + b"'\n", CountOptions(max_line_length=100), "long lines"),
+])
+def test_process_file_skips_unwanted_files(tmp_path, factory, content, options, reason):
+    path = tmp_path / "test.py"
+    path.write_bytes(content)
+
+    result = process_file(str(path), factory, options)
+
+    assert result.report is None
+    assert result.skipped == reason
+
+
+def test_process_file_without_sniffing_counts_everything(tmp_path, factory):
+    path = tmp_path / "test.py"
+    path.write_bytes(b"print('hello')\x00\n")
+
+    result = process_file(str(path), factory, CountOptions(sniff=False))
+
+    assert result.report is not None
+    assert result.report.code == 1
+
+
+@pytest.mark.parametrize("engine", ["bytes", TEXT_ENGINE])
+def test_process_file_counts_accurately_when_asked(tmp_path, factory, engine):
+    path = tmp_path / "test.py"
+    path.write_text('def f():\n    """Documents\n    the function."""\n    return "# not a comment"\n')
+
+    default = process_file(str(path), factory, CountOptions(engine=engine))
+    accurate = process_file(str(path), factory, CountOptions(engine=engine, accurate=True))
+
+    assert (default.report.code, default.report.comments) == (4, 0)
+    assert (accurate.report.code, accurate.report.comments) == (2, 2)
+
+
+def test_accurate_counts_are_cached_apart():
+    assert CountOptions(accurate=True).cache_key != CountOptions().cache_key
+    # The key of the default counting is unchanged, so the reports already cached stay valid
+    assert CountOptions().cache_key == "bytes:1:None:None"
@@ -0,0 +1,33 @@
+from pylocc.language import Language
+from pylocc.processor import Report
+from pylocc.runner import FileResult, FileStats
+from pylocc.stats import COUNT_STAGE, READ_STAGE, REPORT_STAGE, WALK_STAGE, RunStats
+
+
+def test_run_stats_accounts_for_counted_files():
+    stats = RunStats(slowest_files=2)
+
+    stats.add(FileResult("a.py", Report(Language.PYTHON, code=10), stats=FileStats(100, 0.1, 0.5)))
+    stats.add(FileResult("b.py", Report(Language.PYTHON, code=5), stats=FileStats(50, 0.1, 0.1)))
+    stats.add(FileResult("c.py", Report(Language.PYTHON, code=5), stats=FileStats(50, 0.1, 0.3)))
+    stats.add(FileResult("d.py", Report(Language.PYTHON, code=1)))
+    stats.add(FileResult("e.bin", None, skipped="binary"))
+
+    assert (stats.files, stats.cached_files, stats.bytes, stats.lines) == (4, 1, 200, 21)
+    assert round(stats.stages[READ_STAGE], 6) == 0.3
+    assert round(stats.stages[COUNT_STAGE], 6) == 0.9
+    assert [path for _, path in stats.slowest] == ["a.py", "c.py"]
+    assert stats.languages[Language.PYTHON][:3] == [4, 200, 21]
+
+
+def test_run_stats_times_iterables():
+    stats = RunStats()
+
+    items = list(stats.timed(range(3), WALK_STAGE))
+    results = list(stats.track([FileResult("a.py", Report(Language.PYTHON, code=1))]))
+
+    assert items == [0, 1, 2]
+    assert stats.stages[WALK_STAGE] > 0
+    assert len(results) == 1 and stats.files == 1
+    assert stats.stages[REPORT_STAGE] >= 0
+    assert len(stats.create_tables()) == 4
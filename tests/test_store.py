@@ -0,0 +1,113 @@
+import os
+
+import pytest
+
+from pylocc import store
+from pylocc.language import Language
+from pylocc.processor import Report
+from pylocc.reporter import aggregate_reports, prepare_by_file_report
+from pylocc.store import ReportStore
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def aggregation(request, monkeypatch):
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(store, '_numpy', lambda: None)
+    return request.param
+
+
+@pytest.fixture
+def sample_reports():
+    return {
+        os.path.join("src", "file1.py"): Report(Language.PYTHON, code=10, comments=2, blanks=3, complexity=4),
+        os.path.join("src", "file2.py"): Report(Language.PYTHON, code=15, comments=5, blanks=5, complexity=1),
+        os.path.join("docs", "notes.txt"): Report(Language.PLAIN_TEXT, code=20, comments=0, blanks=2),
+        "README.md": Report(Language.MARKDOWN, code=7, comments=0, blanks=1),
+    }
+
+
+@pytest.fixture
+def sample_store(sample_reports):
+    report_store = ReportStore()
+    for path, report in sample_reports.items():
+        report_store.add(path, report)
+    return report_store
+
+
+def test_store_gives_back_the_paths_and_reports(sample_reports, sample_store):
+    assert len(sample_store) == 4
+    assert list(sample_store) == list(sample_reports)
+    assert [(path, report.file_type, report.code, report.comments, report.blanks, report.complexity)
+            for path, report in sample_store.items()] == \
+           [(path, report.file_type, report.code, report.comments, report.blanks, report.complexity)
+            for path, report in sample_reports.items()]
+
+
+def test_store_keeps_undecodable_names():
+    report_store = ReportStore()
+    path = os.path.join("dir", os.fsdecode(b"caf\xe9.py"))
+    report_store.add(path, Report(Language.PYTHON, code=1))
+
+    assert list(report_store) == [path]
+
+
+def test_store_aggregates_like_the_reports(aggregation, sample_reports, sample_store):
+    assert aggregate_reports(sample_store).rows == aggregate_reports(sample_reports).rows
+    assert aggregate_reports(sample_store, complexity=True).rows == \
+        aggregate_reports(sample_reports, complexity=True).rows
+    assert aggregate_reports(ReportStore()).rows == aggregate_reports({}).rows
+
+
+def test_store_sums_the_columns_per_language(aggregation, sample_store):
+    aggregated = sample_store.aggregate()
+
+    files, python = aggregated[Language.PYTHON]
+    assert files == 2
+    assert (python.code, python.comments, python.blanks, python.complexity) == (25, 7, 8, 5)
+    assert sorted(language.value for language in aggregated) == ["Markdown", "Plain Text", "Python"]
+
+
+def test_store_prepares_the_by_file_report_like_the_reports(sample_reports, sample_store):
+    for complexity in (False, True):
+        expected = prepare_by_file_report(sample_reports, complexity)
+        report_data = prepare_by_file_report(sample_store, complexity)
+        assert report_data.headers == expected.headers
+        assert report_data.rows == expected.rows
+
+
+def test_store_extends_with_another_store(sample_reports, sample_store):
+    other = ReportStore()
+    other.add(os.path.join("lib", "util.py"), Report(Language.PYTHON, code=3))
+    other.add(os.path.join("lib", "Main.java"), Report(Language.JAVA, code=4, complexity=2))
+
+    sample_store.extend(other)
+
+    assert dict(sample_store.items()) == {**sample_reports, **dict(other.items())}
+
+
+def test_store_sorts_by_the_key_of_the_paths(sample_reports, sample_store):
+    sample_store.sort(len)
+
+    expected = sorted(sample_reports, key=len)
+    assert list(sample_store) == expected
+    assert list(sample_store.values()) == [sample_reports[path] for path in expected]
+    assert list(sample_store.aggregate()) == [Language.MARKDOWN, Language.PYTHON, Language.PLAIN_TEXT]
+
+
+def test_store_serialization_round_trip(sample_store):
+    tables, columns = sample_store.serialize()
+
+    report_store = ReportStore.deserialize(tables, columns)
+
+    assert list(report_store.items()) == list(sample_store.items())
+
+
+def test_store_rejects_inconsistent_columns(sample_store):
+    tables, columns = sample_store.serialize()
+
+    with pytest.raises(ValueError):
+        ReportStore.deserialize(tables, columns[:-2] + [columns[-2][:-4], columns[-1]])
+    with pytest.raises(ValueError):
+        ReportStore.deserialize({**tables, 'typecodes': ['b'] * len(tables['typecodes'])}, columns)
@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from pylocc import uloc
+from pylocc.uloc import (ApproximateUniqueLines, UniqueLines, collect_lines, fingerprint_array, line_fingerprint,
+                         new_unique_lines)
+
+
+@pytest.fixture
+def fingerprints():
+    # The fingerprints of the lines of 200 files, drawn from a pool so that the files share some lines
+    rng = random.Random(42)
+    pool = [rng.getrandbits(64) for _ in range(20000)]
+    return [{rng.choice(pool) for _ in range(500)} for _ in range(200)]
+
+
+def test_fingerprints_are_the_same_for_text_and_bytes():
+    assert line_fingerprint("print('hèllo')") == line_fingerprint("print('hèllo')".encode('utf-8'))
+    assert line_fingerprint(b"a") != line_fingerprint(b"b")
+    assert 0 <= line_fingerprint(b"a") < 2 ** 64
+
+
+def test_collect_lines_yields_the_lines_and_keeps_the_stripped_ones():
+    lines = ["  x = 1\n", "\n", "x = 1\n", "# comment\n", "   \n"]
+    unique_lines = set()
+
+    assert list(collect_lines(lines, unique_lines)) == lines
+    assert unique_lines == {"x = 1", "# comment"}
+    assert sorted(fingerprint_array(unique_lines)) == sorted(line_fingerprint(line) for line in unique_lines)
+
+
+def test_unique_lines_are_exact(fingerprints, monkeypatch):
+    # Small runs, so that they get merged
+    monkeypatch.setattr(uloc, "RUN_SIZE", 1000)
+    unique_lines = UniqueLines()
+
+    for file_fingerprints in fingerprints:
+        unique_lines.add(sorted(file_fingerprints))
+
+    assert len(unique_lines) == len(set().union(*fingerprints))
+
+
+@pytest.mark.parametrize("approximate", [False, True])
+def test_merged_sets_count_as_a_single_set(fingerprints, monkeypatch, approximate):
+    monkeypatch.setattr(uloc, "RUN_SIZE", 1000)
+    single = new_unique_lines(approximate)
+    workers = [new_unique_lines(approximate) for _ in range(3)]
+
+    for i, file_fingerprints in enumerate(fingerprints):
+        single.add(file_fingerprints)
+        workers[i % 3].add(file_fingerprints)
+    merged = new_unique_lines(approximate)
+    for worker in workers:
+        merged.update(worker)
+
+    assert len(merged) == len(single)
+
+
+def test_approximate_unique_lines_are_close(fingerprints):
+    unique_lines = ApproximateUniqueLines()
+
+    for file_fingerprints in fingerprints:
+        unique_lines.add(file_fingerprints)
+
+    expected = len(set().union(*fingerprints))
+    assert abs(len(unique_lines) - expected) < expected * 0.03
+    assert len(ApproximateUniqueLines()) == len(UniqueLines()) == 0
+
+
+def test_approximate_sets_of_different_precisions_are_not_merged():
+    with pytest.raises(ValueError):
+        ApproximateUniqueLines(12).update(ApproximateUniqueLines(14))
@@ -0,0 +1,139 @@
+import ctypes
+import errno
+import json
+import os
+import sys
+import urllib.request
+
+import pytest
+
+from pylocc.processor import ProcessorConfigurationFactory
+from pylocc.watch import InotifyWatcher, LiveCounts, PollingWatcher, serve
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "main.py").write_text("# comment\n\nprint('hello')\n")
+    (tmp_path / "src" / "lib.py").write_text("print('lib')\n")
+    (tmp_path / ".gitignore").write_text("build/\n")
+    return tmp_path
+
+
+@pytest.fixture
+def live_counts(project):
+    live_counts = LiveCounts(str(project), ProcessorConfigurationFactory.get_default_factory(),
+                             PollingWatcher(interval=0.01), jobs=1)
+    live_counts.count()
+    return live_counts
+
+
+def python_total(live_counts):
+    python = [language for language in live_counts.snapshot()['languages'] if language['language'] == 'Python']
+    return python[0] if python else None
+
+
+def touch(path, content):
+    # Moves the modification time forward, as a later write would
+    stat = os.stat(path) if os.path.exists(path) else None
+    path.write_text(content)
+    if stat is not None:
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_live_counts_initial_count(live_counts):
+    python = python_total(live_counts)
+
+    assert (python['files'], python['code'], python['comments'], python['blanks']) == (2, 2, 1, 1)
+
+
+def test_live_counts_recounts_only_the_changed_files(project, live_counts):
+    touch(project / "src" / "lib.py", "print('lib')\nprint('more')\n")
+
+    counted = live_counts.refresh({str(project / "src")})
+
+    assert counted == 1
+    assert python_total(live_counts)['code'] == 3
+
+
+def test_live_counts_tracks_added_and_deleted_files(project, live_counts):
+    (project / "src" / "pkg").mkdir()
+    (project / "src" / "pkg" / "new.py").write_text("x = 1\n")
+    (project / "build").mkdir()
+    (project / "build" / "ignored.py").write_text("x = 1\n")
+    os.remove(project / "src" / "main.py")
+
+    live_counts.refresh({str(project / "src"), str(project)})
+
+    python = python_total(live_counts)
+    assert (python['files'], python['code'], python['comments']) == (2, 2, 0)
+    # The .gitignore file is counted as well, as a language of its own
+    assert sorted(live_counts.reports) == [str(project / ".gitignore"), str(project / "src" / "lib.py"),
+                                           str(project / "src" / "pkg" / "new.py")]
+
+
+def test_live_counts_drops_deleted_directories(project, live_counts):
+    for name in os.listdir(project / "src"):
+        os.remove(project / "src" / name)
+    os.rmdir(project / "src")
+
+    live_counts.refresh({str(project / "src")})
+
+    assert python_total(live_counts) is None
+    assert live_counts.snapshot()['total']['files'] == 1
+
+
+def test_polling_watcher_reports_changed_directories(project, live_counts):
+    touch(project / "src" / "lib.py", "print('changed')\n")
+
+    changed = live_counts.watcher.wait()
+
+    assert changed == {str(project / "src")}
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason="inotify is only available on Linux")
+def test_inotify_watcher_reports_changed_directories(project):
+    watcher = InotifyWatcher()
+    try:
+        live_counts = LiveCounts(str(project), ProcessorConfigurationFactory.get_default_factory(), watcher, jobs=1)
+        live_counts.count()
+        (project / "src" / "new.py").write_text("x = 1\n")
+
+        changed = watcher.wait()
+        live_counts.refresh(changed)
+
+        assert changed == {str(project / "src")}
+        assert python_total(live_counts)['files'] == 3
+    finally:
+        watcher.close()
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason="inotify is only available on Linux")
+def test_inotify_watcher_raises_when_a_directory_cant_be_watched(project, monkeypatch):
+    def add_watch(fd, path, mask):
+        ctypes.set_errno(errno.ENOSPC)
+        return -1
+
+    watcher = InotifyWatcher()
+    try:
+        monkeypatch.setattr(watcher._libc, "inotify_add_watch", add_watch)
+        live_counts = LiveCounts(str(project), ProcessorConfigurationFactory.get_default_factory(), watcher, jobs=1)
+
+        with pytest.raises(OSError) as raised:
+            live_counts.count()
+
+        assert raised.value.errno == errno.ENOSPC
+    finally:
+        watcher.close()
+
+
+def test_serve_returns_the_counts_as_json(live_counts):
+    server = serve(live_counts, port=0)
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.server_address[1]}/") as response:
+            counts = json.load(response)
+    finally:
+        server.shutdown()
+
+    assert counts['total']['files'] == 3
+    assert counts['languages'][0]['language'] == 'Python'